@@ -34,6 +34,11 @@ pattern)::
         conflict_columns=["timestamp", "asset_id", "granularity"],
     )
 
+Both ``bulk_upsert`` and the tuple-based :func:`copy_upsert` (used by the price
+ingesters and the Layer 2 signal repository) stream rows with ``COPY`` into a
+temporary staging table and merge them with one set-based statement, returning
+exact insert/update counts computed in SQL.
+
 Canonical DSN convention
 ------------------------
 Built once from ``.env``:
@@ -51,6 +56,8 @@ documented no-op for backwards compatibility and may be removed.
 
 from __future__ import annotations
 
+import io
+import json
 import logging
 import os
 from functools import lru_cache
@@ -61,7 +68,6 @@ import psycopg2
 import psycopg2.extensions
 import sqlalchemy as sa
 from dotenv import load_dotenv
-from psycopg2.extras import execute_values
 from sqlalchemy.engine import Engine
 
 logger = logging.getLogger(__name__)
@@ -192,80 +198,154 @@ def _quote_ident(identifier: str) -> str:
     return '"' + identifier.replace('"', '""') + '"'
 
 
-def bulk_upsert(
+# Rows per COPY round trip into the staging table. Large enough that a decade
+# of H1 bars for one instrument is a handful of COPY calls.
+_COPY_CHUNK_ROWS = 100_000
+
+_STAGE_SEQ = "_stage_seq"
+
+
+def _copy_field(value: Any) -> str:
+    """Encode one value as a ``COPY ... (FORMAT csv)`` field.
+
+    ``None`` becomes an unquoted empty field (CSV ``NULL``); every other value
+    is quoted, so an empty string stays an empty string. Dicts/lists are
+    JSON-encoded (for ``json``/``jsonb`` columns).
+    """
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _copy_chunks(
+    rows: Iterable[Sequence[Any]], chunk_rows: int
+) -> Iterable[tuple[io.StringIO, int]]:
+    """Yield ``(csv_buffer, row_count)`` with at most ``chunk_rows`` rows each."""
+    buf = io.StringIO()
+    n = 0
+    for row in rows:
+        buf.write(",".join(_copy_field(v) for v in row))
+        buf.write("\n")
+        n += 1
+        if n == chunk_rows:
+            buf.seek(0)
+            yield buf, n
+            buf = io.StringIO()
+            n = 0
+    if n:
+        buf.seek(0)
+        yield buf, n
+
+
+def copy_upsert(
     table: str,
-    rows: Sequence[Mapping[str, Any]],
+    rows: Iterable[Sequence[Any]],
+    columns: Sequence[str],
     conflict_columns: Sequence[str],
     update_columns: Iterable[str] | None = None,
     *,
-    columns: Sequence[str] | None = None,
+    computed_columns: Mapping[str, str] | None = None,
     do_nothing: bool = False,
-    page_size: int = 1000,
     conn: psycopg2.extensions.connection | None = None,
-) -> int:
-    """Idempotent bulk upsert via ``INSERT ... ON CONFLICT`` + ``execute_values``.
-
-    This is the PostgreSQL replacement for the SQL Server temp-table + ``MERGE``
-    pattern. Re-running with the same rows must not create duplicates.
+    chunk_rows: int = _COPY_CHUNK_ROWS,
+) -> tuple[int, int]:
+    """Idempotent bulk upsert via ``COPY`` into a staging table + one merge.
+
+    Rows are streamed with ``COPY ... FROM STDIN (FORMAT csv)`` into a
+    temporary staging table shaped like the target's staged columns (temporary
+    tables are never WAL-logged, so staging costs no WAL), then merged with a
+    single ``INSERT ... SELECT ... ON CONFLICT`` whose ``RETURNING (xmax = 0)``
+    flags are aggregated server-side — one result row instead of one per
+    input row. Duplicate conflict keys within ``rows`` collapse to the last
+    occurrence instead of failing the statement.
 
     Args:
         table: Target table name (unquoted unless it needs quoting).
-        rows: Sequence of dict-like records. Keys are column names.
+        rows: Iterable of row tuples in ``columns`` order.
+        columns: Staged column names.
         conflict_columns: Columns forming the conflict target (the table's
-            PRIMARY KEY or a UNIQUE constraint).
-        update_columns: Columns to overwrite on conflict. Defaults to every
-            inserted column not in ``conflict_columns``. Ignored when
+            PRIMARY KEY or a UNIQUE constraint); must be a subset of
+            ``columns``.
+        update_columns: Staged columns to overwrite on conflict. Defaults to
+            every column not in ``conflict_columns``. Ignored when
             ``do_nothing`` is True.
-        columns: Explicit column ordering. Defaults to the keys of the first
-            row (all rows must share the same keys).
-        do_nothing: If True, emit ``ON CONFLICT DO NOTHING`` instead of an
-            update (insert-or-ignore semantics).
-        page_size: ``execute_values`` batch size.
+        computed_columns: Extra target columns set from a SQL expression on
+            both insert and update (e.g. ``{"created_at": "now()"}``).
+        do_nothing: If True, emit ``ON CONFLICT DO NOTHING`` (insert-or-ignore).
         conn: Optional existing connection. If provided, the caller owns the
             transaction (no commit/close here). If omitted, a connection is
-            opened, committed, and closed internally.
+            opened, committed, and closed internally. The staging table is
+            dropped at commit, so ``conn`` must not be in autocommit mode.
+        chunk_rows: Rows per ``COPY`` round trip.
 
     Returns:
-        Number of rows submitted (``len(rows)``). Note PostgreSQL does not
-        cheaply report affected-row breakdown for ``execute_values``.
+        Tuple of (inserted count, updated count). Rows skipped by
+        ``DO NOTHING`` are in neither count.
     """
-    rows = list(rows)
-    if not rows:
-        return 0
+    columns = list(columns)
+    conflict_columns = list(conflict_columns)
+    computed_columns = dict(computed_columns or {})
+    stage = _quote_ident("_stage_" + table.replace('"', "").split(".")[-1])
 
-    if columns is None:
-        columns = list(rows[0].keys())
     col_idents = ", ".join(_quote_ident(c) for c in columns)
     conflict_idents = ", ".join(_quote_ident(c) for c in conflict_columns)
+    target_idents = ", ".join(
+        [col_idents] + [_quote_ident(c) for c in computed_columns]
+    )
+    select_exprs = ", ".join([col_idents] + list(computed_columns.values()))
 
     if do_nothing:
         conflict_clause = "DO NOTHING"
     else:
         if update_columns is None:
             update_columns = [c for c in columns if c not in set(conflict_columns)]
-        update_columns = list(update_columns)
-        if update_columns:
-            assignments = ", ".join(
-                f"{_quote_ident(c)} = EXCLUDED.{_quote_ident(c)}"
-                for c in update_columns
-            )
-            conflict_clause = f"DO UPDATE SET {assignments}"
-        else:
-            conflict_clause = "DO NOTHING"
-
-    sql = (
-        f"INSERT INTO {table} ({col_idents}) VALUES %s "
-        f"ON CONFLICT ({conflict_idents}) {conflict_clause}"
-    )
-
-    values = [tuple(row.get(col) for col in columns) for row in rows]
+        assignments = [
+            f"{_quote_ident(c)} = EXCLUDED.{_quote_ident(c)}" for c in update_columns
+        ] + [f"{_quote_ident(c)} = {expr}" for c, expr in computed_columns.items()]
+        conflict_clause = (
+            f"DO UPDATE SET {', '.join(assignments)}" if assignments else "DO NOTHING"
+        )
+
+    merge_sql = f"""
+        WITH src AS (
+            SELECT DISTINCT ON ({conflict_idents}) {col_idents}
+            FROM {stage}
+            ORDER BY {conflict_idents}, {_STAGE_SEQ} DESC
+        ), merged AS (
+            INSERT INTO {table} ({target_idents})
+            SELECT {select_exprs} FROM src
+            ON CONFLICT ({conflict_idents}) {conflict_clause}
+            RETURNING (xmax = 0) AS inserted
+        )
+        SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted)
+        FROM merged
+    """
 
     own_conn = conn is None
     if conn is None:
         conn = get_psycopg2_connection()
     try:
         with conn.cursor() as cur:
-            execute_values(cur, sql, values, page_size=page_size)
+            cur.execute(
+                f"CREATE TEMP TABLE {stage} ON COMMIT DROP AS "
+                f"SELECT {col_idents} FROM {table} WITH NO DATA"
+            )
+            cur.execute(f"ALTER TABLE {stage} ADD COLUMN {_STAGE_SEQ} bigserial")
+            staged = 0
+            for buf, n in _copy_chunks(rows, chunk_rows):
+                cur.copy_expert(
+                    f"COPY {stage} ({col_idents}) FROM STDIN WITH (FORMAT csv)", buf
+                )
+                staged += n
+            inserted = updated = 0
+            if staged:
+                cur.execute(merge_sql)
+                inserted, updated = cur.fetchone()
+            # Dropped now (not just at commit) so a caller-owned transaction can
+            # stage the same table again.
+            cur.execute(f"DROP TABLE pg_temp.{stage}")
         if own_conn:
             conn.commit()
     except Exception:
@@ -276,4 +356,64 @@ def bulk_upsert(
         if own_conn:
             conn.close()
 
+    logger.debug(
+        "copy_upsert %s: %d staged, %d inserted, %d updated",
+        table, staged, inserted, updated,
+    )
+    return int(inserted), int(updated)
+
+
+def bulk_upsert(
+    table: str,
+    rows: Sequence[Mapping[str, Any]],
+    conflict_columns: Sequence[str],
+    update_columns: Iterable[str] | None = None,
+    *,
+    columns: Sequence[str] | None = None,
+    do_nothing: bool = False,
+    page_size: int = _COPY_CHUNK_ROWS,
+    conn: psycopg2.extensions.connection | None = None,
+) -> int:
+    """Idempotent bulk upsert of dict records (see :func:`copy_upsert`).
+
+    This is the PostgreSQL replacement for the SQL Server temp-table + ``MERGE``
+    pattern. Re-running with the same rows must not create duplicates.
+
+    Args:
+        table: Target table name (unquoted unless it needs quoting).
+        rows: Sequence of dict-like records. Keys are column names.
+        conflict_columns: Columns forming the conflict target (the table's
+            PRIMARY KEY or a UNIQUE constraint).
+        update_columns: Columns to overwrite on conflict. Defaults to every
+            inserted column not in ``conflict_columns``. Ignored when
+            ``do_nothing`` is True.
+        columns: Explicit column ordering. Defaults to the keys of the first
+            row (all rows must share the same keys).
+        do_nothing: If True, emit ``ON CONFLICT DO NOTHING`` instead of an
+            update (insert-or-ignore semantics).
+        page_size: Rows per ``COPY`` round trip.
+        conn: Optional existing connection. If provided, the caller owns the
+            transaction (no commit/close here). If omitted, a connection is
+            opened, committed, and closed internally.
+
+    Returns:
+        Number of rows submitted (``len(rows)``).
+    """
+    rows = list(rows)
+    if not rows:
+        return 0
+
+    if columns is None:
+        columns = list(rows[0].keys())
+
+    copy_upsert(
+        table,
+        (tuple(row.get(col) for col in columns) for row in rows),
+        columns,
+        conflict_columns,
+        update_columns,
+        do_nothing=do_nothing,
+        conn=conn,
+        chunk_rows=page_size,
+    )
     return len(rows)
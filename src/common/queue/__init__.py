@@ -18,3 +18,14 @@ def build_queue():
         return LocalDurableBackend(root=os.environ.get("QUEUE_LOCAL_ROOT", "results/state/queue"))
     # redis / rabbitmq adapters attach later via QUEUE_PROVIDER + QUEUE_URL.
     raise ValueError(f"Unknown QUEUE_PROVIDER={provider!r}")
+
+
+def build_consumer(group: str, queue: str | None = None):
+    """Construct a QueueConsumer for ``group`` on ``queue`` (default SCORED_SIGNAL_QUEUE)."""
+    provider = os.environ.get("QUEUE_PROVIDER", "local").lower()
+    queue = queue or os.environ.get("SCORED_SIGNAL_QUEUE", "scored_signal_queue")
+    if provider == "local":
+        from .local_consumer import LocalDurableConsumer
+
+        return LocalDurableConsumer(build_queue(), queue, group)
+    raise ValueError(f"Unknown QUEUE_PROVIDER={provider!r}")
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Dict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Sequence
 
 
 class QueueBackend(ABC):
@@ -14,6 +15,29 @@ class QueueBackend(ABC):
         producer is safe to retry; exactly-once effect comes from consumer dedupe.
         """
 
+    def publish_batch(
+        self, queue: str, messages: Sequence[dict], keys: Sequence[str]
+    ) -> "PublishReceipt":
+        """Publish ``messages[i]`` under ``keys[i]``; returns one confirm per message.
+
+        Same idempotency rules as :meth:`publish`. Backends that can group-commit a
+        whole batch (one durable write for N messages) override this; the default
+        publishes one message at a time and, since :meth:`publish` confirms a
+        duplicate like a new message, counts every confirm as published.
+        """
+        if len(messages) != len(keys):
+            raise ValueError(f"publish_batch: {len(messages)} messages but {len(keys)} keys")
+        confirms = [self.publish(queue, m, idempotency_key=k) for m, k in zip(messages, keys)]
+        return PublishReceipt(confirms=confirms, published=sum(confirms), deduped=0)
+
+    def remaining_capacity(self, queue: str) -> int:
+        """Messages that can be published before ``at_capacity`` trips.
+
+        The default is conservative (0 or 1) so batching producers degrade to
+        one-at-a-time backpressure on backends that cannot report headroom.
+        """
+        return 0 if self.at_capacity(queue) else 1
+
     @abstractmethod
     def depth(self, queue: str) -> int:
         """Current number of messages in the queue."""
@@ -29,3 +53,48 @@ class QueueBackend(ABC):
     @abstractmethod
     def stats(self, queue: str) -> Dict[str, int]:
         """{published, depth, dlq} counters for observability."""
+
+
+@dataclass(frozen=True)
+class PublishReceipt:
+    """Outcome of :meth:`QueueBackend.publish_batch`, counted by the backend itself."""
+
+    confirms: List[bool]  # one publisher confirm per message, in input order
+    published: int        # messages appended to the queue by this call
+    deduped: int          # confirmed no-ops: key already published or repeated in the batch
+
+
+@dataclass(frozen=True)
+class Delivery:
+    """One leased message handed to a consumer by :meth:`QueueConsumer.poll`."""
+
+    offset: int
+    idempotency_key: str
+    message: dict
+    attempt: int  # 1 on first delivery, +1 on every redelivery
+
+
+class QueueConsumer(ABC):
+    """Consumer-group side of a queue: leased delivery, ack/nack, bounded redelivery.
+
+    At-least-once: a polled message stays invisible to the group for the visibility
+    timeout; if it is neither acked nor nacked in time it is redelivered. After
+    ``max_attempts`` deliveries it is routed to the DLQ instead. Consumers dedupe on
+    ``message_id`` for exactly-once effect.
+    """
+
+    @abstractmethod
+    def poll(self, max_messages: int = 100, timeout: float = 0.0) -> List[Delivery]:
+        """Lease up to ``max_messages``, waiting up to ``timeout`` seconds for the first."""
+
+    @abstractmethod
+    def ack(self, deliveries: Iterable[Delivery]) -> None:
+        """Settle deliveries; the group's committed offset advances past contiguous acks."""
+
+    @abstractmethod
+    def nack(self, deliveries: Iterable[Delivery], *, delay: float = 0.0) -> None:
+        """Release deliveries for redelivery after ``delay`` seconds (or DLQ if exhausted)."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, float]:
+        """{lag, in_flight, acked, redelivered, dead_lettered, latency_ms_*} for observability."""
@@ -0,0 +1,79 @@
+"""End-to-end latency benchmark: producer process → LocalDurableBackend → consumer group.
+
+A producer process, with its own backend on the same queue directory as the
+consumer's (as in deployment), publishes ``--messages`` messages at ``--rate`` msgs/s in
+``--batch-size`` group commits, stamping ``produced_at_utc`` the way
+``build_message`` does; the consumer polls, runs a no-op gate and acks. Reports
+consume throughput and ``produced_at_utc`` → ack latency percentiles.
+
+    python -m src.common.queue.bench_consume --messages 20000 --rate 2000 --batch-size 50
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from .local_consumer import LocalDurableConsumer
+from .local_durable import LocalDurableBackend
+
+QUEUE = "bench_queue"
+
+
+def _produce(root: str, messages: int, rate: float, batch_size: int) -> None:
+    backend = LocalDurableBackend(root=root, max_queue_size=messages * 10)
+    interval = batch_size / rate if rate > 0 else 0.0
+    next_at = time.monotonic()
+    for start in range(0, messages, batch_size):
+        ids = range(start, min(messages, start + batch_size))
+        now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        backend.publish_batch(
+            QUEUE,
+            [{"message_id": f"m{i}", "produced_at_utc": now} for i in ids],
+            [f"m{i}" for i in ids],
+        )
+        next_at += interval
+        time.sleep(max(0.0, next_at - time.monotonic()))
+
+
+def bench(messages: int, rate: float, batch_size: int, poll_size: int) -> dict:
+    with tempfile.TemporaryDirectory(prefix="qbench-") as root:
+        backend = LocalDurableBackend(root=root, max_queue_size=messages * 10)
+        consumer = LocalDurableConsumer(backend, QUEUE, "bench-gate")
+        producer = multiprocessing.get_context("spawn").Process(
+            target=_produce, args=(root, messages, rate, batch_size)
+        )
+        t0 = time.perf_counter()
+        producer.start()
+        done = 0
+        while done < messages:
+            batch = consumer.poll(max_messages=poll_size, timeout=1.0)
+            consumer.ack(batch)
+            done += len(batch)
+        elapsed = time.perf_counter() - t0
+        producer.join()
+        stats = consumer.stats()
+    return {
+        "messages": messages,
+        "target_rate": rate,
+        "consume_msgs_per_s": round(messages / elapsed, 1),
+        **{k: v for k, v in stats.items() if k.startswith("latency_ms")},
+    }
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--messages", type=int, default=20000)
+    ap.add_argument("--rate", type=float, default=2000.0, help="producer msgs/s (0 = unthrottled)")
+    ap.add_argument("--batch-size", type=int, default=50, help="producer group-commit size")
+    ap.add_argument("--poll-size", type=int, default=500)
+    args = ap.parse_args(argv)
+    print(json.dumps(bench(args.messages, args.rate, args.batch_size, args.poll_size)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,147 @@
+"""Publish-throughput benchmark for LocalDurableBackend.
+
+Depth sweep: replays the per-message call pattern of a single-message producer
+(``at_capacity`` → ``depth`` → ``publish`` → ``depth``) against a queue pre-seeded to
+1k / 100k / 1M messages, and reports msgs/s next to what the pre-segmentation
+full-log line scan would have cost for the same three depth reads.
+
+Batch sweep: times ``publish_batch`` group commits at increasing batch sizes, showing
+throughput scale with batch size rather than fsync latency.
+
+Dedupe sweep: builds a dedupe index from N weekly scoring runs of history and reports
+reopen time and traced memory, which stay flat because retention bounds the index.
+
+    python -m src.common.queue.bench_publish --depths 1000 100000 1000000 --messages 200
+    python -m src.common.queue.bench_publish --depths --batch-sizes 1 10 100 1000 --messages 5000
+    python -m src.common.queue.bench_publish --depths --dedupe-runs 4 16 64 --messages 20000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+
+from .dedupe_index import DedupeIndex
+from .local_durable import _INDEX_ENTRY, LocalDurableBackend
+
+QUEUE = "bench_queue"
+
+
+def _seed(root: str, depth: int, segment_max_messages: int) -> None:
+    """Write ``depth`` messages straight into the segment layout (no per-message fsync)."""
+    backend = LocalDurableBackend(root=root, max_queue_size=depth * 10, segment_max_messages=segment_max_messages)
+    segments = []
+    seen = backend._seen(QUEUE)
+    for base in range(0, max(depth, 1), segment_max_messages):
+        segments.append(base)
+        n = min(segment_max_messages, depth - base)
+        ends, pos = [], 0
+        with open(backend._segment(QUEUE, base), "wb") as fh:
+            for i in range(base, base + n):
+                line = (
+                    json.dumps({"idempotency_key": f"seed-{i}", "message": {"seq": i}}, sort_keys=True) + "\n"
+                ).encode("utf-8")
+                fh.write(line)
+                pos += len(line)
+                ends.append(pos)
+        with open(backend._index(QUEUE, base), "wb") as fh:
+            fh.write(b"".join(_INDEX_ENTRY.pack(e) for e in ends))
+        seen.add_many([f"seed-{i}" for i in range(base, base + n)])
+    with open(backend._meta_file(QUEUE), "w", encoding="utf-8") as fh:
+        json.dump({"segments": segments, "acked_offset": 0}, fh)
+
+
+def _legacy_depth_scan(backend: LocalDurableBackend) -> int:
+    """What the old ``depth()`` did: count every line of the whole log."""
+    total = 0
+    for base in backend._state(QUEUE).segments:
+        with open(backend._segment(QUEUE, base), encoding="utf-8") as fh:
+            total += sum(1 for _ in fh)
+    return total
+
+
+def bench(depth: int, messages: int, segment_max_messages: int) -> dict:
+    with tempfile.TemporaryDirectory(prefix="qbench-") as root:
+        _seed(root, depth, segment_max_messages)
+        t0 = time.perf_counter()
+        backend = LocalDurableBackend(root=root, max_queue_size=depth * 10, segment_max_messages=segment_max_messages)
+        backend.depth(QUEUE)
+        backend._seen(QUEUE)
+        open_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for i in range(messages):
+            backend.at_capacity(QUEUE)
+            before = backend.depth(QUEUE)
+            backend.publish(QUEUE, {"seq": depth + i}, idempotency_key=f"bench-{i}")
+            assert backend.depth(QUEUE) == before + 1
+        publish_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        _legacy_depth_scan(backend)
+        scan_s = time.perf_counter() - t0
+    legacy_per_msg = publish_s / messages + 3 * scan_s
+    return {
+        "depth": depth,
+        "open_s": round(open_s, 4),
+        "publish_msgs_per_s": round(messages / publish_s, 1),
+        "legacy_est_msgs_per_s": round(1.0 / legacy_per_msg, 1),
+        "legacy_depth_scan_ms": round(scan_s * 1000, 3),
+    }
+
+
+def bench_batch(batch_size: int, messages: int) -> dict:
+    with tempfile.TemporaryDirectory(prefix="qbench-") as root:
+        backend = LocalDurableBackend(root=root, max_queue_size=messages * 10)
+        t0 = time.perf_counter()
+        for start in range(0, messages, batch_size):
+            ids = range(start, min(messages, start + batch_size))
+            backend.publish_batch(QUEUE, [{"seq": i} for i in ids], [f"bench-{i}" for i in ids])
+        elapsed = time.perf_counter() - t0
+        assert backend.depth(QUEUE) == messages
+    return {"batch_size": batch_size, "publish_msgs_per_s": round(messages / elapsed, 1)}
+
+
+def bench_dedupe(runs: int, signals_per_run: int) -> dict:
+    with tempfile.TemporaryDirectory(prefix="qbench-") as root:
+        index = DedupeIndex(root, retain_seconds=0)
+        for r in range(runs):
+            index.add_many([f"sig-{i}:run-{r:04d}" for i in range(signals_per_run)])
+        index.close()
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        reopened = DedupeIndex(root, retain_seconds=0)
+        open_s = time.perf_counter() - t0
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        stats = reopened.stats()
+        reopened.close()
+    return {
+        "history_keys": runs * signals_per_run,
+        "retained_keys": stats["keys"],
+        "open_s": round(open_s, 4),
+        "open_peak_mib": round(peak / 2**20, 2),
+    }
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--depths", type=int, nargs="*", default=[1000, 100000, 1000000])
+    ap.add_argument("--batch-sizes", type=int, nargs="*", default=[])
+    ap.add_argument("--dedupe-runs", type=int, nargs="*", default=[], help="--messages = signals per run")
+    ap.add_argument("--messages", type=int, default=200, help="publishes timed per depth")
+    ap.add_argument("--segment-max-messages", type=int, default=50000)
+    args = ap.parse_args(argv)
+    for depth in args.depths:
+        print(json.dumps(bench(depth, args.messages, args.segment_max_messages)))
+    for batch_size in args.batch_sizes:
+        print(json.dumps(bench_batch(batch_size, args.messages)))
+    for runs in args.dedupe_runs:
+        print(json.dumps(bench_dedupe(runs, args.messages)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
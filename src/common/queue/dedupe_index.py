@@ -0,0 +1,273 @@
+"""DedupeIndex — memory-bounded, generational idempotency index for the local queue.
+
+Replaces the grow-forever ``seen.txt`` + in-memory ``set``. Keys are reduced to
+128-bit BLAKE2b fingerprints and stored in *generations* under ``{queue}/dedupe/``::
+
+    gen-{n:08d}.keys    active generation: raw keys, append-only, fsync'd per group commit
+    gen-{n:08d}.idx     sealed generation: sorted fingerprints (16 bytes each), mmap'd
+    gen-{n:08d}.bloom   sealed generation: bloom filter over the fingerprints
+    gen-{n:08d}.json    sealed generation: {count, sealed_at, runs}
+
+Lookups hit the in-memory active set, then each sealed generation's bloom filter;
+only a bloom positive touches the ``.idx`` (binary search over the mmap). Memory is
+the active generation plus ~``BLOOM_BITS_PER_KEY`` bits per retained key.
+
+Retention is tied to the message-id format ``signal_id:score_run_id``: a key can only
+be re-published while its scoring run is retried, so a sealed generation is dropped
+once none of its score runs is among the newest ``retain_runs`` runs *and* it was
+sealed more than ``retain_seconds`` ago. Keys that do not follow the format (DLQ keys)
+are covered by the time window alone. Startup reads only retained generations, so
+it does not scale with history length.
+"""
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+BLOOM_BITS_PER_KEY = 10
+BLOOM_HASHES = 7
+_FP_SIZE = 16
+
+
+def fingerprint(key: str) -> bytes:
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=_FP_SIZE).digest()
+
+
+def score_run_id(key: str) -> Optional[str]:
+    """``signal_id:score_run_id`` → ``score_run_id``; None for keys in any other shape."""
+    parts = key.split(":")
+    return parts[1] if len(parts) == 2 and all(parts) else None
+
+
+class _Bloom:
+    __slots__ = ("bits", "m")
+
+    def __init__(self, bits: bytearray):
+        self.bits = bits
+        self.m = len(bits) * 8
+
+    @classmethod
+    def build(cls, fps: List[bytes]) -> "_Bloom":
+        bloom = cls(bytearray(max(8, (len(fps) * BLOOM_BITS_PER_KEY + 7) // 8)))
+        for fp in fps:
+            for pos in bloom._positions(fp):
+                bloom.bits[pos >> 3] |= 1 << (pos & 7)
+        return bloom
+
+    def _positions(self, fp: bytes):
+        # Kirsch–Mitzenmacher double hashing from the two 64-bit halves of the fingerprint.
+        h1 = int.from_bytes(fp[:8], "little")
+        h2 = int.from_bytes(fp[8:], "little") | 1
+        return [(h1 + i * h2) % self.m for i in range(BLOOM_HASHES)]
+
+    def __contains__(self, fp: bytes) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(fp))
+
+
+class _SortedFingerprints:
+    """Read-only sequence view over a sorted ``.idx`` file so ``bisect`` can search it."""
+
+    def __init__(self, path: str):
+        self._fh = open(path, "rb")
+        size = os.path.getsize(path)
+        self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._n = size // _FP_SIZE
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, i: int) -> bytes:
+        return self._mm[i * _FP_SIZE : (i + 1) * _FP_SIZE]
+
+    def __contains__(self, fp: bytes) -> bool:
+        i = bisect.bisect_left(self, fp)
+        return i < self._n and self[i] == fp
+
+    def close(self) -> None:
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._fh.close()
+
+
+class _Generation:
+    __slots__ = ("n", "meta", "bloom", "idx")
+
+    def __init__(self, n: int, meta: dict, bloom: _Bloom, idx: _SortedFingerprints):
+        self.n, self.meta, self.bloom, self.idx = n, meta, bloom, idx
+
+    def __contains__(self, fp: bytes) -> bool:
+        return fp in self.bloom and fp in self.idx
+
+
+class DedupeIndex:
+    def __init__(
+        self,
+        directory: str,
+        generation_max_keys: int | None = None,
+        retain_runs: int | None = None,
+        retain_seconds: float | None = None,
+    ):
+        self.dir = directory
+        self.generation_max_keys = int(
+            generation_max_keys
+            if generation_max_keys is not None
+            else os.environ.get("QUEUE_DEDUPE_GENERATION_KEYS", 50000)
+        )
+        self.retain_runs = int(
+            retain_runs if retain_runs is not None else os.environ.get("QUEUE_DEDUPE_RETAIN_RUNS", 4)
+        )
+        self.retain_seconds = float(
+            retain_seconds
+            if retain_seconds is not None
+            else float(os.environ.get("QUEUE_DEDUPE_RETAIN_DAYS", 35)) * 86400
+        )
+        os.makedirs(self.dir, exist_ok=True)
+        self._sealed: List[_Generation] = []
+        self._active_n = 0
+        self._active: Set[bytes] = set()
+        self._active_runs: List[str] = []
+        self._load()
+
+    # ----- paths -----
+    def _path(self, n: int, ext: str) -> str:
+        return os.path.join(self.dir, f"gen-{n:08d}.{ext}")
+
+    # ----- load / seal / retention -----
+    def _load(self) -> None:
+        gens = sorted(
+            int(name[4:12]) for name in os.listdir(self.dir) if name.startswith("gen-") and name.endswith(".json")
+        )
+        for n in gens:
+            if not os.path.exists(self._path(n, "idx")) or not os.path.exists(self._path(n, "bloom")):
+                continue  # torn seal: the .keys file is still authoritative
+            with open(self._path(n, "json"), encoding="utf-8") as fh:
+                meta = json.load(fh)
+            with open(self._path(n, "bloom"), "rb") as fh:
+                bloom = _Bloom(bytearray(fh.read()))
+            self._sealed.append(_Generation(n, meta, bloom, _SortedFingerprints(self._path(n, "idx"))))
+        sealed_ns = {g.n for g in self._sealed}
+        pending = sorted(
+            int(name[4:12]) for name in os.listdir(self.dir) if name.startswith("gen-") and name.endswith(".keys")
+        )
+        for n in pending:
+            if n in sealed_ns:
+                os.remove(self._path(n, "keys"))  # sealed before the crash; keys file is leftover
+        pending = [n for n in pending if n not in sealed_ns]
+        self._active_n = pending[0] if pending else max((g.n for g in self._sealed), default=-1) + 1
+        for n in pending:
+            keys = self._read_keys(self._path(n, "keys"))
+            self._absorb(keys)
+            if n != self._active_n:  # more than one unsealed generation: fold into the first
+                with open(self._path(self._active_n, "keys"), "a", encoding="utf-8") as fh:
+                    fh.write("".join(k + "\n" for k in keys))
+                os.remove(self._path(n, "keys"))
+        if len(self._active) >= self.generation_max_keys:
+            self._seal()
+        self._expire()
+
+    @staticmethod
+    def _read_keys(path: str) -> List[str]:
+        """Read an active ``.keys`` file, truncating a torn (un-fsync'd) trailing line."""
+        with open(path, "rb") as fh:
+            data = fh.read()
+        cut = data.rfind(b"\n") + 1
+        if cut != len(data):
+            with open(path, "r+b") as fh:
+                fh.truncate(cut)
+        return data[:cut].decode("utf-8").splitlines()
+
+    def _absorb(self, keys: Iterable[str]) -> None:
+        runs = self._active_runs
+        for k in keys:
+            self._active.add(fingerprint(k))
+            run = score_run_id(k)
+            if run is not None and (not runs or runs[-1] != run) and run not in runs:
+                runs.append(run)
+
+    def _seal(self) -> None:
+        n = self._active_n
+        fps = sorted(self._active)
+        meta = {"count": len(fps), "sealed_at": time.time(), "runs": self._active_runs}
+        for ext, payload in (
+            ("idx", b"".join(fps)),
+            ("bloom", bytes(_Bloom.build(fps).bits)),
+            ("json", json.dumps(meta, sort_keys=True).encode("utf-8")),
+        ):
+            tmp = self._path(n, ext) + ".tmp"
+            with open(tmp, "wb") as fh:
+                fh.write(payload)
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp, self._path(n, ext))  # .json last: it marks the seal complete
+        keys_path = self._path(n, "keys")
+        if os.path.exists(keys_path):
+            os.remove(keys_path)
+        with open(self._path(n, "bloom"), "rb") as fh:
+            bloom = _Bloom(bytearray(fh.read()))
+        self._sealed.append(_Generation(n, meta, bloom, _SortedFingerprints(self._path(n, "idx"))))
+        self._active_n = n + 1
+        self._active = set()
+        self._active_runs = []
+
+    def recent_runs(self) -> List[str]:
+        """Newest ``retain_runs`` distinct score runs, oldest first."""
+        ordered: List[str] = []
+        for runs in [g.meta.get("runs", []) for g in self._sealed] + [self._active_runs]:
+            for r in runs:
+                if r in ordered:
+                    ordered.remove(r)
+                ordered.append(r)
+        return ordered[-self.retain_runs :] if self.retain_runs > 0 else []
+
+    def _expire(self) -> int:
+        keep_runs = set(self.recent_runs())
+        cutoff = time.time() - self.retain_seconds
+        dropped = 0
+        for g in list(self._sealed):
+            if g.meta.get("sealed_at", 0) >= cutoff or keep_runs.intersection(g.meta.get("runs", [])):
+                continue
+            self._sealed.remove(g)
+            g.idx.close()
+            for ext in ("json", "idx", "bloom"):  # .json first: an interrupted drop is never half-live
+                p = self._path(g.n, ext)
+                if os.path.exists(p):
+                    os.remove(p)
+            dropped += 1
+        return dropped
+
+    # ----- interface -----
+    def __contains__(self, key: str) -> bool:
+        fp = fingerprint(key)
+        if fp in self._active:
+            return True
+        return any(fp in g for g in reversed(self._sealed))
+
+    def add_many(self, keys: List[str]) -> None:
+        """Durably record ``keys`` (one append + fsync), sealing the generation when full."""
+        if not keys:
+            return
+        with open(self._path(self._active_n, "keys"), "a", encoding="utf-8") as fh:
+            fh.write("".join(k + "\n" for k in keys))
+            fh.flush()
+            os.fsync(fh.fileno())
+        self._absorb(keys)
+        if len(self._active) >= self.generation_max_keys:
+            self._seal()
+            self._expire()
+
+    def close(self) -> None:
+        for g in self._sealed:
+            g.idx.close()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "generations": len(self._sealed) + 1,
+            "keys": sum(g.meta["count"] for g in self._sealed) + len(self._active),
+            "active_keys": len(self._active),
+            "bloom_bytes": sum(len(g.bloom.bits) for g in self._sealed),
+        }
@@ -0,0 +1,230 @@
+"""LocalDurableConsumer — consumer groups over the LocalDurableBackend segment log (FND-002).
+
+Reads the same ``{root}/{queue}/segments`` files the producer writes; nothing is
+copied. Per-group state lives in ``{root}/{queue}/consumers/{group}.json``::
+
+    committed   every offset below this is acked by the group
+    acked       offsets >= committed acked out of order (folded into committed when contiguous)
+    attempts    delivery count per un-acked offset (survives restart → poison pills still hit the DLQ)
+    delayed     nack'ed offsets and the epoch second they become visible again
+
+Leases (visibility timeouts) are in-memory only: after a consumer crash every
+un-acked message becomes visible again, exactly as if its lease had expired. When a
+group's committed offset advances, the backend's acknowledged watermark moves to the
+minimum committed offset across all groups so ``depth`` and ``compact`` follow the
+slowest group. Single process per group; thread-safe within it. The producer (and
+other groups) may run in other processes with their own backend on the same
+directory: the backend re-reads the queue state under its file lock on every call.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, Iterable, List, Optional
+
+from .base import Delivery, QueueConsumer
+from .local_durable import LocalDurableBackend
+
+_POLL_INTERVAL_S = 0.05
+_LATENCY_WINDOW = 100000
+
+
+def _parse_utc(ts: str) -> Optional[float]:
+    try:
+        return datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp()
+    except (AttributeError, ValueError):
+        return None
+
+
+def _percentile(sorted_vals: List[float], q: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    return sorted_vals[min(len(sorted_vals) - 1, int(q * (len(sorted_vals) - 1) + 0.5))]
+
+
+class LocalDurableConsumer(QueueConsumer):
+    def __init__(
+        self,
+        backend: LocalDurableBackend,
+        queue: str,
+        group: str,
+        visibility_timeout_s: float | None = None,
+        max_attempts: int | None = None,
+    ):
+        self.backend = backend
+        self.queue = queue
+        self.group = group
+        self.visibility_timeout_s = float(
+            visibility_timeout_s
+            if visibility_timeout_s is not None
+            else os.environ.get("CONSUMER_VISIBILITY_TIMEOUT_S", 30)
+        )
+        self.max_attempts = int(
+            max_attempts if max_attempts is not None else os.environ.get("CONSUMER_MAX_DELIVERY_ATTEMPTS", 5)
+        )
+        self._lock = threading.RLock()
+        self._leases: Dict[int, float] = {}  # offset -> lease expiry (monotonic)
+        self._latencies_ms: Deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self._counters = {"delivered": 0, "acked": 0, "nacked": 0, "redelivered": 0, "dead_lettered": 0}
+        self._load()
+
+    # ----- persisted group state -----
+    def _groups_dir(self) -> str:
+        d = os.path.join(self.backend._qdir(self.queue), "consumers")
+        os.makedirs(d, exist_ok=True)
+        return d
+
+    def _state_file(self, group: Optional[str] = None) -> str:
+        return os.path.join(self._groups_dir(), f"{group or self.group}.json")
+
+    def _load(self) -> None:
+        p = self._state_file()
+        state: dict = {}
+        if os.path.exists(p):
+            with open(p, encoding="utf-8") as fh:
+                state = json.load(fh)
+        # A new group starts at the backend's acknowledged watermark (older data may be compacted).
+        self.committed = int(state.get("committed", self.backend.acked_offset(self.queue)))
+        self.acked = {int(o) for o in state.get("acked", [])}
+        self.attempts = {int(o): int(n) for o, n in state.get("attempts", {}).items()}
+        self.delayed = {int(o): float(t) for o, t in state.get("delayed", {}).items()}
+        self.cursor = self.committed  # next never-delivered offset (rebuilt, not persisted)
+        self._save()
+
+    def _save(self) -> None:
+        dst = self._state_file()
+        tmp = dst + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(
+                {
+                    "committed": self.committed,
+                    "acked": sorted(self.acked),
+                    "attempts": {str(o): n for o, n in sorted(self.attempts.items())},
+                    "delayed": {str(o): t for o, t in sorted(self.delayed.items())},
+                },
+                fh,
+                sort_keys=True,
+            )
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, dst)
+
+    def _settle(self, offset: int) -> None:
+        """Mark ``offset`` done for this group and fold contiguous acks into ``committed``."""
+        self._leases.pop(offset, None)
+        self.attempts.pop(offset, None)
+        self.delayed.pop(offset, None)
+        if offset >= self.committed:
+            self.acked.add(offset)
+        while self.committed in self.acked:
+            self.acked.discard(self.committed)
+            self.committed += 1
+
+    def _sync_backend_watermark(self) -> None:
+        floor = self.committed
+        for name in os.listdir(self._groups_dir()):
+            if not name.endswith(".json") or name == f"{self.group}.json":
+                continue
+            with open(os.path.join(self._groups_dir(), name), encoding="utf-8") as fh:
+                floor = min(floor, int(json.load(fh).get("committed", 0)))
+        self.backend.acknowledge(self.queue, floor)
+
+    # ----- interface -----
+    def poll(self, max_messages: int = 100, timeout: float = 0.0) -> List[Delivery]:
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            with self._lock:
+                out = self._lease_batch(max_messages)
+            if out or time.monotonic() >= deadline:
+                return out
+            time.sleep(min(_POLL_INTERVAL_S, max(0.0, deadline - time.monotonic())))
+
+    def _lease_batch(self, max_messages: int) -> List[Delivery]:
+        now_mono, now_wall = time.monotonic(), time.time()
+        # Redeliveries first (expired leases, due nacks), oldest offset first.
+        due = sorted(
+            [o for o, exp in self._leases.items() if exp <= now_mono]
+            + [o for o, t in self.delayed.items() if t <= now_wall and o not in self._leases]
+        )
+        candidates: List[tuple] = []
+        for o in due[:max_messages]:
+            for rec in self.backend.iter_messages(self.queue, start_offset=o, limit=1):
+                candidates.append(rec)
+            self.delayed.pop(o, None)
+        if len(candidates) < max_messages:
+            end = self.backend.end_offset(self.queue)
+            while self.cursor < end and len(candidates) < max_messages:
+                want = max_messages - len(candidates)
+                start = self.cursor
+                for rec in self.backend.iter_messages(self.queue, start_offset=start, limit=want):
+                    self.cursor = rec[0] + 1
+                    if rec[0] not in self.acked and rec[0] not in self._leases and rec[0] not in self.delayed:
+                        candidates.append(rec)
+                if self.cursor == start:  # compacted away below the log start
+                    self.cursor = end
+        if not candidates:
+            return []
+
+        before = self.committed
+        out: List[Delivery] = []
+        for offset, key, message in candidates:
+            attempt = self.attempts.get(offset, 0) + 1
+            if attempt > self.max_attempts:
+                self.backend.dead_letter(message, f"MAX_DELIVERY_ATTEMPTS: {self.max_attempts} ({self.group})")
+                self._counters["dead_lettered"] += 1
+                self._settle(offset)
+                continue
+            self.attempts[offset] = attempt
+            self._leases[offset] = now_mono + self.visibility_timeout_s
+            if attempt > 1:
+                self._counters["redelivered"] += 1
+            self._counters["delivered"] += 1
+            out.append(Delivery(offset, key, message, attempt))
+        self._save()  # attempts are durable before the consumer sees the message
+        if self.committed != before:
+            self._sync_backend_watermark()
+        return out
+
+    def ack(self, deliveries: Iterable[Delivery]) -> None:
+        now = time.time()
+        with self._lock:
+            before = self.committed
+            for d in deliveries:
+                if d.offset not in self._leases:
+                    continue  # lease expired and was re-leased/settled elsewhere — ignore stale ack
+                produced = _parse_utc(d.message.get("produced_at_utc", "")) if isinstance(d.message, dict) else None
+                if produced is not None:
+                    self._latencies_ms.append((now - produced) * 1000.0)
+                self._counters["acked"] += 1
+                self._settle(d.offset)
+            self._save()
+            if self.committed != before:
+                self._sync_backend_watermark()
+
+    def nack(self, deliveries: Iterable[Delivery], *, delay: float = 0.0) -> None:
+        now = time.time()
+        with self._lock:
+            for d in deliveries:
+                if d.offset not in self._leases:
+                    continue
+                self._leases.pop(d.offset)
+                self._counters["nacked"] += 1
+                self.delayed[d.offset] = now + max(0.0, delay)
+            self._save()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lat = sorted(self._latencies_ms)
+            return {
+                **self._counters,
+                "committed": self.committed,
+                "lag": self.backend.end_offset(self.queue) - self.committed,
+                "in_flight": len(self._leases),
+                "latency_ms_p50": round(_percentile(lat, 0.50), 3),
+                "latency_ms_p95": round(_percentile(lat, 0.95), 3),
+                "latency_ms_max": round(lat[-1], 3) if lat else 0.0,
+            }
@@ -1,32 +1,97 @@
 """LocalDurableBackend — durable, idempotent local-filesystem queue (FND-002 default).
 
 Reproduces the production semantics MODEL-008 needs without a broker:
-  * Durable: append-only JSONL log per queue (survives process restart).
-  * Idempotency: a ``seen`` index dedupes re-publishes (same idempotency_key = no-op).
+  * Durable: append-only, segmented JSONL log per queue (survives process restart).
+  * Idempotency: a generational dedupe index (``dedupe_index.DedupeIndex``) dedupes
+    re-publishes (same idempotency_key = no-op) in bounded memory.
   * Bounded depth + backpressure: ``at_capacity`` compares depth to MAX_QUEUE_SIZE.
   * DLQ: ``dead_letter`` writes to a separate DLQ queue with reason + timestamp.
   * Publisher confirm: ``publish`` returns only after the message is durably written.
+  * Group commit: ``publish_batch`` writes N messages with one fsync per file touched.
+
+On-disk layout per queue (``{root}/{queue}/``)::
+
+    meta.json                          segment base offsets + acknowledged offset
+    meta.lock                          flock guarding meta.json and the active index
+    segments/{base:020d}.jsonl         one JSON line per message, offsets base..base+n-1
+    segments/{base:020d}.index         fixed-width end-byte position of every line
+    dedupe/gen-*                       idempotency index generations (see dedupe_index)
+
+Counters are derived from ``meta.json`` plus the size of the active segment's index,
+so ``depth`` / ``at_capacity`` / ``stats`` are O(1) regardless of how many messages the
+queue holds. Producer and consumers may run in separate processes, each with its own
+backend: every read and write takes an exclusive ``flock`` on ``meta.lock`` and
+re-reads both files first, and ``meta.json`` is only ever merged (union of segments,
+max of the acknowledged offset), never overwritten from a stale copy. The segment
+file is the source of truth: the index is repaired by scanning only the unindexed
+tail of the active segment. Segments wholly below the acknowledged offset can be
+removed with ``compact``. Idempotency keys are indexed by the publishing process, so
+run one producer per queue.
 """
 from __future__ import annotations
 
+import bisect
 import json
 import os
+import struct
 import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Dict, Set
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .base import PublishReceipt, QueueBackend
+from .dedupe_index import DedupeIndex
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX: only threads of one process are serialised
+    fcntl = None
+
+_INDEX_ENTRY = struct.Struct("<Q")  # end byte position of one record in its segment
+_LEGACY_LOG = "log.jsonl"
+
+
+class _QueueState:
+    """Counters for one queue, refreshed from disk under the queue's file lock."""
+
+    __slots__ = ("segments", "next_offset", "acked_offset", "active_end")
+
+    def __init__(self, segments: List[int], next_offset: int, acked_offset: int, active_end: int):
+        self.segments = segments          # sorted base offsets; last one is active
+        self.next_offset = next_offset    # offset the next published message gets
+        self.acked_offset = acked_offset  # every offset < this is acknowledged
+        self.active_end = active_end      # byte size of the active segment
 
-from .base import QueueBackend
+    @property
+    def active_count(self) -> int:
+        return self.next_offset - self.segments[-1]
 
 
 class LocalDurableBackend(QueueBackend):
-    def __init__(self, root: str, max_queue_size: int | None = None, dlq_name: str | None = None):
+    def __init__(
+        self,
+        root: str,
+        max_queue_size: int | None = None,
+        dlq_name: str | None = None,
+        segment_max_messages: int | None = None,
+    ):
         self.root = root
         self.max_queue_size = int(
             max_queue_size if max_queue_size is not None else os.environ.get("MAX_QUEUE_SIZE", 100000)
         )
         self.dlq_name = dlq_name or os.environ.get("DLQ_NAME", "scored_signal_dlq")
-        self._lock = threading.Lock()
-        self._seen_cache: Dict[str, Set[str]] = {}
+        self.segment_max_messages = int(
+            segment_max_messages
+            if segment_max_messages is not None
+            else os.environ.get("QUEUE_SEGMENT_MAX_MESSAGES", 50000)
+        )
+        if self.segment_max_messages < 1:
+            raise ValueError("segment_max_messages must be >= 1")
+        self._lock = threading.RLock()
+        self._dedupe: Dict[str, DedupeIndex] = {}
+        self._states: Dict[str, _QueueState] = {}
+        self._lock_fds: Dict[str, int] = {}
+        self._lock_depth: Dict[str, int] = {}
         os.makedirs(self.root, exist_ok=True)
 
     # ----- paths -----
@@ -35,51 +100,247 @@ class LocalDurableBackend(QueueBackend):
         os.makedirs(d, exist_ok=True)
         return d
 
-    def _log(self, queue: str) -> str:
-        return os.path.join(self._qdir(queue), "log.jsonl")
+    def _segdir(self, queue: str) -> str:
+        d = os.path.join(self._qdir(queue), "segments")
+        os.makedirs(d, exist_ok=True)
+        return d
+
+    def _segment(self, queue: str, base: int) -> str:
+        return os.path.join(self._segdir(queue), f"{base:020d}.jsonl")
+
+    def _index(self, queue: str, base: int) -> str:
+        return os.path.join(self._segdir(queue), f"{base:020d}.index")
 
-    def _seen_file(self, queue: str) -> str:
+    def _meta_file(self, queue: str) -> str:
+        return os.path.join(self._qdir(queue), "meta.json")
+
+    def _lock_file(self, queue: str) -> str:
+        return os.path.join(self._qdir(queue), "meta.lock")
+
+    def _legacy_seen_file(self, queue: str) -> str:
         return os.path.join(self._qdir(queue), "seen.txt")
 
-    def _load_seen(self, queue: str) -> Set[str]:
-        if queue in self._seen_cache:
-            return self._seen_cache[queue]
-        seen: Set[str] = set()
-        p = self._seen_file(queue)
-        if os.path.exists(p):
-            with open(p, encoding="utf-8") as fh:
-                seen = {line.strip() for line in fh if line.strip()}
-        self._seen_cache[queue] = seen
-        return seen
+    def _seen(self, queue: str) -> DedupeIndex:
+        index = self._dedupe.get(queue)
+        if index is not None:
+            return index
+        index = DedupeIndex(os.path.join(self._qdir(queue), "dedupe"))
+        legacy = self._legacy_seen_file(queue)
+        if os.path.exists(legacy):
+            # One-time import of the pre-index seen.txt, streamed in generation-sized chunks.
+            with open(legacy, encoding="utf-8") as fh:
+                chunk: List[str] = []
+                for line in fh:
+                    if line.strip():
+                        chunk.append(line.strip())
+                    if len(chunk) >= index.generation_max_keys:
+                        index.add_many(chunk)
+                        chunk = []
+                index.add_many(chunk)
+            os.remove(legacy)
+        self._dedupe[queue] = index
+        return index
+
+    # ----- cross-process locking -----
+    @contextmanager
+    def _locked(self, queue: str):
+        """Hold the queue's file lock (re-entrant within this backend instance)."""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            fd = self._lock_fds.get(queue)
+            if fd is None:
+                fd = self._lock_fds[queue] = os.open(self._lock_file(queue), os.O_RDWR | os.O_CREAT, 0o644)
+            depth = self._lock_depth.get(queue, 0)
+            if not depth:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            self._lock_depth[queue] = depth + 1
+            try:
+                yield
+            finally:
+                self._lock_depth[queue] = depth
+                if not depth:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+
+    # ----- segment bookkeeping -----
+    def _read_meta(self, queue: str) -> Optional[Tuple[List[int], int]]:
+        meta_path = self._meta_file(queue)
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, encoding="utf-8") as fh:
+            meta = json.load(fh)
+        return [int(b) for b in meta["segments"]], int(meta.get("acked_offset", 0))
+
+    def _write_meta(self, queue: str, state: _QueueState, dropped: Sequence[int] = ()) -> None:
+        """Merge ``state`` into meta.json and persist it atomically (write-temp + os.replace).
+
+        Caller holds the queue lock. Segments are the union of ours and the file's
+        (minus ``dropped`` by ``compact``) and the acknowledged offset is the max of
+        both, so a writer can never roll back another process's roll or ack.
+        """
+        disk = self._read_meta(queue)
+        if disk is not None:
+            state.segments[:] = sorted((set(disk[0]) | set(state.segments)) - set(dropped))
+            state.acked_offset = max(state.acked_offset, disk[1])
+        dst = self._meta_file(queue)
+        tmp = dst + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"segments": state.segments, "acked_offset": state.acked_offset}, fh, sort_keys=True)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, dst)
+
+    def _repair_segment(self, queue: str, base: int) -> Tuple[int, int, List[str]]:
+        """Reconcile a segment with its index; return (count, end_byte, recovered_keys).
+
+        Lines durably written after the last index entry (crash between the log fsync
+        and the index append) are re-indexed; a torn trailing line without a newline
+        was never confirmed and is truncated away.
+        """
+        seg, idx = self._segment(queue, base), self._index(queue, base)
+        for p in (seg, idx):
+            if not os.path.exists(p):
+                open(p, "ab").close()
+        idx_size = os.path.getsize(idx)
+        count = idx_size // _INDEX_ENTRY.size
+        if idx_size % _INDEX_ENTRY.size:
+            with open(idx, "r+b") as fh:
+                fh.truncate(count * _INDEX_ENTRY.size)
+        end = 0
+        if count:
+            with open(idx, "rb") as fh:
+                fh.seek((count - 1) * _INDEX_ENTRY.size)
+                (end,) = _INDEX_ENTRY.unpack(fh.read(_INDEX_ENTRY.size))
+        recovered: List[str] = []
+        if os.path.getsize(seg) != end:
+            new_ends: List[int] = []
+            with open(seg, "rb") as fh:
+                fh.seek(end)
+                pos = end
+                for raw in fh:
+                    if not raw.endswith(b"\n"):
+                        break
+                    pos += len(raw)
+                    new_ends.append(pos)
+                    recovered.append(json.loads(raw)["idempotency_key"])
+            with open(seg, "r+b") as fh:
+                fh.truncate(pos)
+            if new_ends:
+                with open(idx, "ab") as fh:
+                    fh.write(b"".join(_INDEX_ENTRY.pack(e) for e in new_ends))
+            count += len(new_ends)
+            end = pos
+        return count, end, recovered
+
+    def _migrate_legacy(self, queue: str) -> None:
+        """Adopt a pre-segmentation ``log.jsonl`` as segment 0 (index rebuilt on repair)."""
+        legacy = os.path.join(self._qdir(queue), _LEGACY_LOG)
+        if os.path.exists(legacy) and not os.path.exists(self._meta_file(queue)):
+            os.replace(legacy, self._segment(queue, 0))
+
+    def _state(self, queue: str) -> _QueueState:
+        """Current counters, re-read from meta.json and the active index (caller holds the lock).
+
+        Another process may have published, rolled, acknowledged or compacted since
+        the last call; both files are small, so this stays O(1) in queue length.
+        """
+        state = self._states.get(queue)
+        if state is None:
+            self._migrate_legacy(queue)
+        disk = self._read_meta(queue)
+        segments, acked = disk if disk is not None else ([0], 0)
+        count, end, recovered = self._repair_segment(queue, segments[-1])
+        if state is None:
+            state = self._states[queue] = _QueueState(segments, segments[-1] + count, acked, end)
+        else:
+            state.segments, state.acked_offset = segments, acked
+            state.next_offset, state.active_end = segments[-1] + count, end
+        if disk is None:
+            self._write_meta(queue, state)
+        if recovered:
+            seen = self._seen(queue)
+            seen.add_many([k for k in recovered if k not in seen])
+        return state
+
+    def _roll_if_full(self, queue: str, state: _QueueState) -> None:
+        if state.active_count < self.segment_max_messages:
+            return
+        base = state.next_offset
+        open(self._segment(queue, base), "ab").close()
+        open(self._index(queue, base), "ab").close()
+        state.segments.append(base)
+        state.active_end = 0
+        self._write_meta(queue, state)
 
     # ----- interface -----
     def publish(self, queue: str, message: dict, *, idempotency_key: str) -> bool:
-        with self._lock:
-            seen = self._load_seen(queue)
-            if idempotency_key in seen:
-                return True  # dedupe: already durably published → no-op confirm
-            line = json.dumps(
-                {"idempotency_key": idempotency_key, "message": message}, sort_keys=True
+        return self.publish_batch(queue, [message], [idempotency_key]).confirms[0]
+
+    def publish_batch(self, queue: str, messages: Sequence[dict], keys: Sequence[str]) -> PublishReceipt:
+        """Group commit: dedupe the batch, then one fsync'd write per touched segment
+        plus one for the dedupe index.
+
+        The whole batch is validated and serialized before anything touches disk, so a
+        bad message rejects the batch without a partial write. Keys already seen (or
+        repeated within the batch) are no-op confirms.
+        """
+        if len(messages) != len(keys):
+            raise ValueError(f"publish_batch: {len(messages)} messages but {len(keys)} keys")
+        for k, m in zip(keys, messages):
+            if not isinstance(k, str) or not k or "\n" in k:
+                raise ValueError(f"publish_batch: invalid idempotency_key {k!r}")
+            if not isinstance(m, dict):
+                raise TypeError(f"publish_batch: message for {k!r} is not a dict")
+        with self._locked(queue):
+            seen = self._seen(queue)
+            fresh: Dict[str, bytes] = {}
+            for k, m in zip(keys, messages):
+                if k not in seen and k not in fresh:
+                    fresh[k] = (
+                        json.dumps({"idempotency_key": k, "message": m}, sort_keys=True) + "\n"
+                    ).encode("utf-8")
+            if fresh:
+                self._append(queue, list(fresh.values()))
+                seen.add_many(list(fresh))
+            # dedupe: already durably published → no-op confirm
+            return PublishReceipt(
+                confirms=[True] * len(messages), published=len(fresh), deduped=len(messages) - len(fresh)
             )
-            with open(self._log(queue), "a", encoding="utf-8") as fh:
-                fh.write(line + "\n")
+
+    def _append(self, queue: str, lines: List[bytes]) -> None:
+        """Append encoded records, rolling segments as they fill; one fsync per segment."""
+        state = self._state(queue)
+        i = 0
+        while i < len(lines):
+            self._roll_if_full(queue, state)
+            base = state.segments[-1]
+            chunk = lines[i : i + self.segment_max_messages - state.active_count]
+            with open(self._segment(queue, base), "ab") as fh:
+                fh.write(b"".join(chunk))
                 fh.flush()
                 os.fsync(fh.fileno())  # durable confirm
-            with open(self._seen_file(queue), "a", encoding="utf-8") as fh:
-                fh.write(idempotency_key + "\n")
-            seen.add(idempotency_key)
-            return True
+            ends, end = [], state.active_end
+            for line in chunk:
+                end += len(line)
+                ends.append(_INDEX_ENTRY.pack(end))
+            with open(self._index(queue, base), "ab") as fh:
+                fh.write(b"".join(ends))
+            state.active_end = end
+            state.next_offset += len(chunk)
+            i += len(chunk)
 
     def depth(self, queue: str) -> int:
-        p = self._log(queue)
-        if not os.path.exists(p):
-            return 0
-        with open(p, encoding="utf-8") as fh:
-            return sum(1 for _ in fh)
+        with self._locked(queue):
+            state = self._state(queue)
+            return state.next_offset - state.acked_offset
 
     def at_capacity(self, queue: str) -> bool:
         return self.depth(queue) >= self.max_queue_size
 
+    def remaining_capacity(self, queue: str) -> int:
+        return max(0, self.max_queue_size - self.depth(queue))
+
     def dead_letter(self, message: dict, reason: str) -> None:
         wrapped = {
             "original_message": message,
@@ -91,8 +352,84 @@ class LocalDurableBackend(QueueBackend):
         self.publish(self.dlq_name, wrapped, idempotency_key=key)
 
     def stats(self, queue: str) -> Dict[str, int]:
-        return {
-            "published": self.depth(queue),
-            "depth": self.depth(queue),
-            "dlq": self.depth(self.dlq_name),
-        }
+        with self._locked(queue):
+            state = self._state(queue)
+            return {
+                "published": state.next_offset,
+                "depth": state.next_offset - state.acked_offset,
+                "dlq": self.depth(self.dlq_name),
+                "segments": len(state.segments),
+            }
+
+    # ----- offsets, reads and compaction (local backend only) -----
+    def end_offset(self, queue: str) -> int:
+        """Offset the next published message will get (= messages ever published)."""
+        with self._locked(queue):
+            return self._state(queue).next_offset
+
+    def acked_offset(self, queue: str) -> int:
+        """Low watermark: every offset below it is acknowledged (see ``acknowledge``)."""
+        with self._locked(queue):
+            return self._state(queue).acked_offset
+
+    def acknowledge(self, queue: str, offset: int) -> int:
+        """Mark every message below ``offset`` as acknowledged; returns the new low watermark.
+
+        The watermark only moves forward and never past the end of the log.
+        """
+        with self._locked(queue):
+            state = self._state(queue)
+            new = min(max(int(offset), state.acked_offset), state.next_offset)
+            if new != state.acked_offset:
+                state.acked_offset = new
+                self._write_meta(queue, state)
+            return state.acked_offset
+
+    def compact(self, queue: str) -> int:
+        """Delete rotated segments whose messages are all acknowledged. Returns segments removed."""
+        with self._locked(queue):
+            state = self._state(queue)
+            removable = 0
+            # A segment is fully acked when the *next* segment starts at or below the watermark;
+            # the active (last) segment is never removed.
+            while removable + 1 < len(state.segments) and state.segments[removable + 1] <= state.acked_offset:
+                removable += 1
+            if not removable:
+                return 0
+            doomed = state.segments[:removable]
+            self._write_meta(queue, state, dropped=doomed)  # meta first: a crash leaves orphans, never holes
+            for base in doomed:
+                for p in (self._segment(queue, base), self._index(queue, base)):
+                    if os.path.exists(p):
+                        os.remove(p)
+            return removable
+
+    def iter_messages(
+        self, queue: str, start_offset: Optional[int] = None, limit: Optional[int] = None
+    ) -> Iterator[Tuple[int, str, dict]]:
+        """Yield ``(offset, idempotency_key, message)`` from ``start_offset`` (default: the
+        acknowledged watermark) using the offset index to seek straight to the first record.
+        """
+        with self._locked(queue):
+            state = self._state(queue)
+            segments = list(state.segments)
+            stop = state.next_offset
+            offset = state.acked_offset if start_offset is None else int(start_offset)
+        offset = max(offset, segments[0])
+        if limit is not None:
+            stop = min(stop, offset + int(limit))
+        while offset < stop:
+            i = bisect.bisect_right(segments, offset) - 1
+            base = segments[i]
+            seg_stop = min(stop, segments[i + 1] if i + 1 < len(segments) else stop)
+            pos = 0
+            if offset > base:
+                with open(self._index(queue, base), "rb") as fh:
+                    fh.seek((offset - base - 1) * _INDEX_ENTRY.size)
+                    (pos,) = _INDEX_ENTRY.unpack(fh.read(_INDEX_ENTRY.size))
+            with open(self._segment(queue, base), "rb") as fh:
+                fh.seek(pos)
+                while offset < seg_stop:
+                    rec = json.loads(fh.readline())
+                    yield offset, rec["idempotency_key"], rec["message"]
+                    offset += 1
@@ -0,0 +1,76 @@
+"""FND-002 DedupeIndex tests: generations, bloom front, retention by score run, recovery."""
+from __future__ import annotations
+
+import os
+
+from src.common.queue.dedupe_index import DedupeIndex, score_run_id
+
+
+def _index(tmp_path, **kw):
+    kw.setdefault("generation_max_keys", 10)
+    kw.setdefault("retain_runs", 2)
+    kw.setdefault("retain_seconds", 0)
+    return DedupeIndex(str(tmp_path / "dedupe"), **kw)
+
+
+def _run_keys(run, n=10):
+    return [f"sig-{i}:{run}" for i in range(n)]
+
+
+def test_score_run_id_parsing():
+    assert score_run_id("sig-1:run-7") == "run-7"
+    assert score_run_id("sig-1:run-7:QUEUE_FULL:2026-06-23T00:00:00Z") is None
+    assert score_run_id("plain") is None
+
+
+def test_membership_across_seal_and_reopen(tmp_path):
+    idx = _index(tmp_path, retain_runs=10)
+    idx.add_many(_run_keys("r1"))  # exactly fills → sealed
+    idx.add_many(_run_keys("r2", 3))  # stays active
+    assert idx.stats()["generations"] == 2 and idx.stats()["active_keys"] == 3
+    for k in _run_keys("r1") + _run_keys("r2", 3):
+        assert k in idx
+    assert "sig-99:r1" not in idx and "sig-0:r3" not in idx
+    idx.close()
+    again = _index(tmp_path, retain_runs=10)
+    assert "sig-5:r1" in again and "sig-2:r2" in again and "sig-3:r2" not in again
+    assert again.stats()["keys"] == 13
+
+
+def test_retention_drops_generations_of_old_score_runs(tmp_path):
+    idx = _index(tmp_path)
+    for run in ("r1", "r2", "r3", "r4"):
+        idx.add_many(_run_keys(run))
+    assert idx.recent_runs() == ["r3", "r4"]
+    assert "sig-0:r1" not in idx and "sig-0:r2" not in idx
+    assert "sig-0:r3" in idx and "sig-9:r4" in idx
+    assert len([f for f in os.listdir(tmp_path / "dedupe") if f.endswith(".idx")]) == 2
+
+
+def test_time_window_keeps_generations_regardless_of_runs(tmp_path):
+    idx = _index(tmp_path, retain_seconds=3600)
+    for run in ("r1", "r2", "r3", "r4"):
+        idx.add_many(_run_keys(run))
+    assert "sig-0:r1" in idx
+
+
+def test_startup_and_memory_bounded_by_retention(tmp_path):
+    idx = _index(tmp_path)
+    for run in range(50):  # 50 weekly runs of history
+        idx.add_many(_run_keys(f"run-{run:03d}"))
+    idx.close()
+    reopened = _index(tmp_path)
+    s = reopened.stats()
+    assert s["generations"] <= 3 and s["keys"] <= 20
+
+
+def test_torn_active_line_is_truncated(tmp_path):
+    idx = _index(tmp_path)
+    idx.add_many(["a:r1", "b:r1"])
+    idx.close()
+    with open(idx._path(0, "keys"), "a", encoding="utf-8") as fh:
+        fh.write("c:r")  # crash mid-append, never fsync-confirmed
+    again = _index(tmp_path)
+    assert "a:r1" in again and "c:r" not in again
+    again.add_many(["d:r1"])
+    assert "d:r1" in _index(tmp_path)
@@ -0,0 +1,100 @@
+"""FND-004 copy_upsert tests: CSV staging encoding, chunked COPY and the merge statement (no DB)."""
+from __future__ import annotations
+
+import csv
+import io
+from datetime import datetime, timezone
+
+from src.common import db
+
+
+class _Cursor:
+    def __init__(self, log, counts):
+        self.log, self.counts = log, counts
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql):
+        self.log.append(("execute", " ".join(sql.split())))
+
+    def copy_expert(self, sql, buf):
+        self.log.append(("copy", sql, buf.read()))
+
+    def fetchone(self):
+        return self.counts
+
+
+class _Conn:
+    def __init__(self, counts=(0, 0)):
+        self.log, self.counts, self.commits = [], counts, 0
+
+    def cursor(self):
+        return _Cursor(self.log, self.counts)
+
+    def commit(self):
+        self.commits += 1
+
+
+def test_copy_fields_round_trip_through_csv():
+    ts = datetime(2024, 1, 2, 3, tzinfo=timezone.utc)
+    row = (1, ts, 1.1234567890123, None, "", 'say "hi", ok', {"EMA": 1.5}, True)
+    line = ",".join(db._copy_field(v) for v in row)
+    assert line.split(",")[3] == ""  # unquoted empty field: COPY csv reads it as NULL
+    assert line.split(",")[4] == '""'  # quoted empty field: an empty string, not NULL
+    parsed = next(csv.reader(io.StringIO(line)))
+    assert parsed == ["1", str(ts), "1.1234567890123", "", "", 'say "hi", ok', '{"EMA": 1.5}', "True"]
+
+
+def test_copy_upsert_stages_in_chunks_and_merges_once():
+    conn = _Conn(counts=(3, 2))
+    rows = [(i, f"2024-01-0{i + 1}", "H1", float(i)) for i in range(5)]
+    inserted, updated = db.copy_upsert(
+        "fact_market_prices",
+        iter(rows),
+        columns=["asset_id", "timestamp", "granularity", "Close"],
+        conflict_columns=["timestamp", "asset_id", "granularity"],
+        computed_columns={"ingested_at_utc": "now()"},
+        conn=conn,
+        chunk_rows=2,
+    )
+    assert (inserted, updated) == (3, 2)
+    assert conn.commits == 0  # caller-owned transaction
+
+    copies = [entry for entry in conn.log if entry[0] == "copy"]
+    assert [len(c[2].splitlines()) for c in copies] == [2, 2, 1]
+    staged = [tuple(r) for c in copies for r in csv.reader(io.StringIO(c[2]))]
+    assert staged == [tuple(str(v) for v in r) for r in rows]
+
+    statements = [entry[1] for entry in conn.log if entry[0] == "execute"]
+    assert statements[0].startswith('CREATE TEMP TABLE "_stage_fact_market_prices" ON COMMIT DROP AS')
+    merges = [s for s in statements if "ON CONFLICT" in s]
+    assert len(merges) == 1
+    merge = merges[0]
+    assert 'DISTINCT ON ("timestamp", "asset_id", "granularity")' in merge
+    assert '"Close" = EXCLUDED."Close"' in merge and '"ingested_at_utc" = now()' in merge
+    assert '"asset_id" = EXCLUDED' not in merge
+    assert "count(*) FILTER (WHERE inserted)" in merge
+    assert statements[-1] == 'DROP TABLE pg_temp."_stage_fact_market_prices"'
+
+
+def test_copy_upsert_do_nothing_and_empty_input():
+    conn = _Conn(counts=(1, 0))
+    db.copy_upsert("t", [(1, "a")], ["id", "v"], ["id"], do_nothing=True, conn=conn)
+    assert any("ON CONFLICT (\"id\") DO NOTHING" in e[1] for e in conn.log if e[0] == "execute")
+
+    empty = _Conn(counts=(9, 9))
+    assert db.copy_upsert("t", [], ["id", "v"], ["id"], conn=empty) == (0, 0)
+    assert not any(e[0] == "copy" or "ON CONFLICT" in e[1] for e in empty.log)
+
+
+def test_bulk_upsert_routes_dict_rows_through_copy():
+    conn = _Conn(counts=(2, 0))
+    rows = [{"id": 1, "v": "x"}, {"id": 2, "v": None}]
+    assert db.bulk_upsert("t", rows, ["id"], conn=conn) == 2
+    (copy,) = [e for e in conn.log if e[0] == "copy"]
+    assert copy[1] == 'COPY "_stage_t" ("id", "v") FROM STDIN WITH (FORMAT csv)'
+    assert copy[2] == '"1","x"\n"2",\n'
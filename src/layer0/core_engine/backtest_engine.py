@@ -12,16 +12,17 @@ Features:
 - Position tracking and trade history
 """
 
+import contextlib
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 import warnings
 
 from .strategy_base import StrategyBase, Trade, SignalType, StrategyConfig
-from ..data_access.indicators import calculate_pips, get_pip_value
+from ..data_access.indicators import calculate_pips, get_pip_value, indicator_history
 
 
 class ExitReason(Enum):
@@ -44,6 +45,7 @@ class BacktestConfig:
     allow_pyramiding: bool = False
     max_positions: int = 1
     use_fractional_positions: bool = True
+    vectorized: bool = True  # NumPy trade kernel; False forces the per-bar reference loop
 
 
 @dataclass
@@ -94,6 +96,125 @@ class BacktestResult:
         }
 
 
+# Exit codes returned by simulate_trade_kernel (index into _EXIT_REASONS).
+_EXIT_REASONS = (
+    ExitReason.STOP_LOSS.value,
+    ExitReason.TAKE_PROFIT.value,
+    ExitReason.TIME_STOP.value,
+    ExitReason.SIGNAL_REVERSE.value,
+    ExitReason.END_OF_DATA.value,
+)
+_EXIT_END_OF_DATA = 4
+
+
+def simulate_trade_kernel(high: np.ndarray,
+                          low: np.ndarray,
+                          close: np.ndarray,
+                          signals: np.ndarray,
+                          atr_values: np.ndarray,
+                          entry_ok: np.ndarray,
+                          stop_loss_atr: float,
+                          take_profit_atr: float,
+                          max_bars_hold: int,
+                          slippage: float) -> Dict[str, np.ndarray]:
+    """
+    Array-only single-position trade simulation.
+
+    Reproduces the per-bar reference loop (``BacktestEngine._simulate_trades_loop``)
+    with the base-class ATR stop/target: the loop runs once per *trade*, and each
+    trade's exit is found with one masked search over at most ``max_bars_hold`` bars.
+    Same-bar priority is stop loss > take profit > time stop > signal reverse, and a
+    new position may open on the bar the previous one exited.
+
+    Args:
+        high, low, close: Price arrays
+        signals: Signal array (1=buy, -1/other non-zero=sell, 0=hold)
+        atr_values: ATR array used for stop/target distances
+        entry_ok: Bars where an entry is allowed (signal != 0 and volatility filter passed)
+        stop_loss_atr: Stop distance as ATR multiple
+        take_profit_atr: Target distance as ATR multiple
+        max_bars_hold: Time-stop horizon in bars
+        slippage: Slippage in price units (applied on entry and on non-EOD exits)
+
+    Returns:
+        Dict of per-trade arrays: entry_idx, exit_idx, exit_code, entry_price,
+        stop_loss, take_profit, exit_price
+    """
+    n = len(close)
+    candidates = np.flatnonzero(entry_ok)
+    horizon = max(int(max_bars_hold), 1)
+    out: Dict[str, list] = {k: [] for k in (
+        'entry_idx', 'exit_idx', 'exit_code', 'entry_price', 'stop_loss', 'take_profit', 'exit_price'
+    )}
+
+    start = 0
+    while True:
+        k = np.searchsorted(candidates, start)
+        if k >= len(candidates):
+            break
+        e = int(candidates[k])
+        direction = signals[e]
+        is_long = direction == 1
+
+        entry_price = close[e] + slippage if is_long else close[e] - slippage
+        stop_distance = atr_values[e] * stop_loss_atr
+        profit_distance = atr_values[e] * take_profit_atr
+        if is_long:
+            stop_loss, take_profit = entry_price - stop_distance, entry_price + profit_distance
+        else:
+            stop_loss, take_profit = entry_price + stop_distance, entry_price - profit_distance
+
+        time_idx = e + horizon
+        seg = slice(e + 1, min(n, time_idx + 1))
+        if is_long:
+            sl_hit = low[seg] <= stop_loss
+            tp_hit = high[seg] >= take_profit
+        else:
+            sl_hit = high[seg] >= stop_loss
+            tp_hit = low[seg] <= take_profit
+        seg_signals = signals[seg]
+        reverse = (seg_signals != 0) & (seg_signals != direction)
+        events = np.flatnonzero(sl_hit | tp_hit | reverse)
+
+        if events.size:
+            off = int(events[0])
+            j = e + 1 + off
+            if sl_hit[off]:
+                code, exit_price = 0, stop_loss
+            elif tp_hit[off]:
+                code, exit_price = 1, take_profit
+            elif j == time_idx:
+                code, exit_price = 2, close[j]
+            else:
+                code, exit_price = 3, close[j]
+        elif time_idx <= n - 1:
+            j, code, exit_price = time_idx, 2, close[time_idx]
+        else:
+            j, code, exit_price = n - 1, _EXIT_END_OF_DATA, close[n - 1]
+
+        if code != _EXIT_END_OF_DATA:
+            exit_price = exit_price - slippage if is_long else exit_price + slippage
+
+        for key, val in (('entry_idx', e), ('exit_idx', j), ('exit_code', code),
+                         ('entry_price', entry_price), ('stop_loss', stop_loss),
+                         ('take_profit', take_profit), ('exit_price', exit_price)):
+            out[key].append(val)
+
+        if code == _EXIT_END_OF_DATA:
+            break
+        start = j  # re-entry is allowed on the exit bar
+
+    return {
+        'entry_idx': np.asarray(out['entry_idx'], dtype=np.int64),
+        'exit_idx': np.asarray(out['exit_idx'], dtype=np.int64),
+        'exit_code': np.asarray(out['exit_code'], dtype=np.int64),
+        'entry_price': np.asarray(out['entry_price'], dtype=np.float64),
+        'stop_loss': np.asarray(out['stop_loss'], dtype=np.float64),
+        'take_profit': np.asarray(out['take_profit'], dtype=np.float64),
+        'exit_price': np.asarray(out['exit_price'], dtype=np.float64),
+    }
+
+
 class BacktestEngine:
     """
     Vectorized backtesting engine for trading strategies.
@@ -185,6 +306,116 @@ class BacktestEngine:
                         granularity: str) -> List[Trade]:
         """
         Simulate trades based on signals.
+
+        Uses the NumPy kernel whenever it is provably equivalent to the reference
+        loop, i.e. the strategy keeps the base-class stop/target/volatility hooks and
+        the frame carries an ``ATR`` column; otherwise falls back to the loop.
+
+        Args:
+            strategy: Strategy instance
+            df: DataFrame with indicators
+            signals: Signal series
+            asset: Asset symbol
+            granularity: Timeframe
+
+        Returns:
+            List of trades
+        """
+        if self.config.vectorized and self._kernel_supported(strategy, df, signals):
+            return self._simulate_trades_vectorized(strategy, df, signals, asset, granularity)
+        return self._simulate_trades_loop(strategy, df, signals, asset, granularity)
+
+    @staticmethod
+    def _kernel_supported(strategy: StrategyBase, df: pd.DataFrame, signals: pd.Series) -> bool:
+        """True when ``simulate_trade_kernel`` reproduces the reference loop exactly."""
+        cls = type(strategy)
+        return (
+            cls.calculate_stop_loss is StrategyBase.calculate_stop_loss
+            and cls.calculate_take_profit is StrategyBase.calculate_take_profit
+            and cls.check_volatility_filter is StrategyBase.check_volatility_filter
+            and 'ATR' in df.columns
+            and df.index.is_unique
+            and len(signals) == len(df)
+            and not signals.isna().any()
+        )
+
+    def _volatility_entry_mask(self, strategy: StrategyBase, df: pd.DataFrame) -> np.ndarray:
+        """
+        Per-bar result of ``check_volatility_filter`` on the trailing 101-bar window.
+
+        The base filter ranks the current ATR within its last 100 values, so the full
+        series rolling rank gives the same answer for every bar at once.
+        """
+        n = len(df)
+        if not strategy.config.volatility_filter:
+            return np.ones(n, dtype=bool)
+        pct = df['ATR'].rolling(window=100).rank(pct=True).to_numpy()
+        with np.errstate(invalid='ignore'):
+            ok = pct <= (strategy.config.max_atr_percentile / 100)
+        ok[:min(n, 99)] = True  # window shorter than 100 bars → filter passes
+        return ok
+
+    def _simulate_trades_vectorized(self,
+                                    strategy: StrategyBase,
+                                    df: pd.DataFrame,
+                                    signals: pd.Series,
+                                    asset: str,
+                                    granularity: str) -> List[Trade]:
+        """Kernel-backed equivalent of ``_simulate_trades_loop``."""
+        sig = signals.to_numpy()
+        res = simulate_trade_kernel(
+            high=df['High'].to_numpy(dtype=np.float64),
+            low=df['Low'].to_numpy(dtype=np.float64),
+            close=df['Close'].to_numpy(dtype=np.float64),
+            signals=sig,
+            atr_values=df['ATR'].to_numpy(dtype=np.float64),
+            entry_ok=(sig != 0) & self._volatility_entry_mask(strategy, df),
+            stop_loss_atr=strategy.config.stop_loss_atr,
+            take_profit_atr=strategy.config.take_profit_atr,
+            max_bars_hold=strategy.config.max_bars_hold if hasattr(strategy, 'config') else 50,
+            slippage=self.config.slippage_pips * get_pip_value(asset),
+        )
+
+        index = df.index
+        trades: List[Trade] = []
+        for t in range(len(res['entry_idx'])):
+            e, j, code = int(res['entry_idx'][t]), int(res['exit_idx'][t]), int(res['exit_code'][t])
+            trade = Trade(
+                entry_time=index[e],
+                entry_price=res['entry_price'][t],
+                direction=signals.iloc[e],
+                stop_loss=res['stop_loss'][t],
+                take_profit=res['take_profit'][t],
+                asset=asset,
+                strategy=strategy.config.name,
+                granularity=granularity,
+                size=1.0
+            )
+            trade.exit_time = index[j]
+            trade.exit_price = res['exit_price'][t]
+            trade.exit_reason = _EXIT_REASONS[code]
+            if code != _EXIT_END_OF_DATA:
+                trade.bars_held = j - e
+
+            price_diff = trade.exit_price - trade.entry_price
+            if trade.direction == -1:
+                price_diff = -price_diff
+            trade.pnl = self._apply_friction(self._pnl_to_dollars(price_diff, asset))
+            trade.pnl_pips = calculate_pips(price_diff, asset)
+            risk = abs(trade.entry_price - trade.stop_loss)
+            if risk > 0:
+                trade.r_multiple = price_diff / risk
+            trades.append(trade)
+        return trades
+
+    def _simulate_trades_loop(self,
+                              strategy: StrategyBase,
+                              df: pd.DataFrame,
+                              signals: pd.Series,
+                              asset: str,
+                              granularity: str) -> List[Trade]:
+        """
+        Reference per-bar trade simulation (any strategy hooks).
         
         Args:
             strategy: Strategy instance
@@ -386,6 +617,61 @@ class BacktestEngine:
     def _build_equity_curve(self, trades: List[Trade], df: pd.DataFrame) -> pd.Series:
         """
         Build equity curve from trades.
+
+        Replays the one-open-trade state machine of ``_build_equity_curve_loop`` per
+        trade instead of per bar: each trade's open and realization bars come from
+        ``searchsorted`` on the index, realized P&L is a cumulative sum of deltas
+        placed at the realization bars, and a still-open trade is marked to market
+        with a masked array over the bars it is open. Falls back to the loop when
+        the index is not sorted.
+
+        Args:
+            trades: List of trades
+            df: DataFrame for timestamps
+
+        Returns:
+            Equity curve series
+        """
+        timestamps = df.index
+        n = len(df)
+        if n == 0 or not timestamps.is_monotonic_increasing:
+            return self._build_equity_curve_loop(trades, df)
+
+        # Bar i opens a trade once entry_time <= timestamps[i]; realizes once exit_time <= timestamps[i].
+        entry_pos = timestamps.searchsorted([t.entry_time for t in trades], side='left')
+        realized_delta = np.zeros(n, dtype=np.float64)
+        realized_delta[0] = self.config.initial_capital
+        unrealized = np.zeros(n, dtype=np.float64)
+        marked = np.zeros(n, dtype=bool)
+
+        free_from = 1  # first bar at which the next trade may open
+        for trade, entry in zip(trades, entry_pos):
+            opened = max(free_from, int(entry))
+            if opened >= n:
+                break
+            if trade.exit_time is None:
+                # Never realized: marked to market until the end and blocks every later trade.
+                price_diff = df['Close'].to_numpy(dtype=np.float64)[opened:] - trade.entry_price
+                if trade.direction == -1:
+                    price_diff = -price_diff
+                unrealized[opened:] = self._apply_friction(self._pnl_to_dollars(price_diff, trade.asset))
+                marked[opened:] = True
+                break
+            # The exit check runs before the open check, so a trade realizes on a later bar.
+            realized = max(opened + 1, int(timestamps.searchsorted(trade.exit_time, side='left')))
+            if realized >= n:
+                break
+            realized_delta[realized] = trade.pnl if trade.pnl is not None else 0.0
+            free_from = realized
+
+        # cumsum adds sequentially, so zeros between realizations keep the loop's rounding.
+        realized_equity = np.cumsum(realized_delta)
+        equity = np.where(marked, realized_equity + unrealized, realized_equity)
+        return pd.Series(equity, index=timestamps)
+
+    def _build_equity_curve_loop(self, trades: List[Trade], df: pd.DataFrame) -> pd.Series:
+        """
+        Reference per-bar equity curve (any index order).
         
         Args:
             trades: List of trades
@@ -467,7 +753,9 @@ class BacktestEngine:
                                   granularity: str,
                                   train_size: int = 500,
                                   test_size: int = 100,
-                                  n_windows: int = 5) -> List[BacktestResult]:
+                                  n_windows: int = 5,
+                                  window_indices: Optional[Iterable[int]] = None,
+                                  full_history_indicators: bool = True) -> List[BacktestResult]:
         """
         Run walk-forward analysis.
         
@@ -479,27 +767,36 @@ class BacktestEngine:
             train_size: Training window size
             test_size: Testing window size
             n_windows: Number of windows
+            window_indices: Optional subset of window numbers (< n_windows) to run;
+                windows are independent, so results equal the matching entries of
+                a full run
+            full_history_indicators: Serve cached indicators for each test window
+                as slices of one causal computation on ``df`` (warm, and shared
+                across windows and candidates) instead of cold-starting them on
+                the window; see ``indicators.indicator_history``
             
         Returns:
             List of BacktestResults for each test window
         """
         results = []
         total_bars = len(df)
+        history = indicator_history(df) if full_history_indicators else contextlib.nullcontext()
         
-        for i in range(n_windows):
-            start_idx = i * test_size
-            train_end = start_idx + train_size
-            test_end = min(train_end + test_size, total_bars)
-            
-            if test_end > total_bars:
-                break
-            
-            # Test on out-of-sample data
-            test_df = df.iloc[train_end:test_end].copy()
-            
-            result = self.run_backtest(
-                strategy, test_df, asset, granularity, warmup_bars=0
-            )
-            results.append(result)
+        with history:
+            for i in (range(n_windows) if window_indices is None else window_indices):
+                start_idx = i * test_size
+                train_end = start_idx + train_size
+                test_end = min(train_end + test_size, total_bars)
+                
+                if test_end > total_bars:
+                    break
+                
+                # Test on out-of-sample data
+                test_df = df.iloc[train_end:test_end].copy()
+                
+                result = self.run_backtest(
+                    strategy, test_df, asset, granularity, warmup_bars=0
+                )
+                results.append(result)
         
         return results
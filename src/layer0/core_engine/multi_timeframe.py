@@ -11,6 +11,9 @@ Features:
 - Look-ahead bias prevention
 """
 
+import hashlib
+from collections import OrderedDict
+
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Any
@@ -31,6 +34,60 @@ class MTFSignal:
     rejection_reason: str = ""
 
 
+_PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Higher-timeframe bars become visible this long after their index timestamp.
+_CLOSE_LAG = {"D1": pd.Timedelta(days=1), "H4": pd.Timedelta(0)}
+
+_CLOSED_BAR_CACHE_SIZE = 64
+_closed_bar_cache: "OrderedDict[Tuple[str, str, str], np.ndarray]" = OrderedDict()
+
+
+def _index_fingerprint(index: pd.Index) -> str:
+    hashed = pd.util.hash_pandas_object(index, index=False).to_numpy()
+    return f"{index.dtype}:{len(index)}:" + hashlib.blake2b(hashed.tobytes(), digest_size=16).hexdigest()
+
+
+def closed_bar_positions(primary_index: pd.Index,
+                         higher_index: pd.Index,
+                         higher_granularity: str) -> np.ndarray:
+    """
+    As-of join index from primary bars to the last *closed* higher-timeframe bar.
+
+    ``positions[i]`` is the position in ``higher_index`` of the row a primary bar
+    at ``primary_index[i]`` may see, or -1 when none has closed yet. A higher bar
+    is visible once ``higher_ts + _CLOSE_LAG[granularity] <= primary_ts``; among
+    visible rows the one latest in frame order wins, which is the last closed bar
+    for a sorted frame. One sort plus a ``searchsorted`` replaces the per-bar
+    ``higher_df.index <= timestamp`` scan.
+
+    Results are cached by (granularity, primary index, higher index) content, so
+    every column and every strategy aligning the same (asset, primary, higher)
+    frames shares one lookup.
+    """
+    key = (higher_granularity, _index_fingerprint(primary_index), _index_fingerprint(higher_index))
+    cached = _closed_bar_cache.get(key)
+    if cached is not None:
+        _closed_bar_cache.move_to_end(key)
+        return cached
+
+    lag = _CLOSE_LAG[higher_granularity]
+    visible_at = higher_index + lag if lag != pd.Timedelta(0) else higher_index
+    order = np.argsort(visible_at, kind='stable')
+    # Latest frame position among all rows visible by each sorted cut-off.
+    latest_position = np.maximum.accumulate(order) if len(order) else order
+    n_visible = visible_at[order].searchsorted(primary_index, side='right')
+    positions = np.full(len(primary_index), -1, dtype=np.intp)
+    seen = n_visible > 0
+    positions[seen] = latest_position[n_visible[seen] - 1]
+    positions.setflags(write=False)
+
+    _closed_bar_cache[key] = positions
+    if len(_closed_bar_cache) > _CLOSED_BAR_CACHE_SIZE:
+        _closed_bar_cache.popitem(last=False)
+    return positions
+
+
 class MultiTimeframeEngine:
     """
     Engine for multi-timeframe signal validation.
@@ -230,46 +287,25 @@ class MultiTimeframeEngine:
         """
         result = primary_df.copy()
         
-        # Create a column to merge on (date only for daily, etc.)
-        if higher_granularity == "D1":
-            # For daily alignment, use date
-            primary_dates = primary_df.index.date
-            higher_dates = higher_df.index.date
-            
-            # Shift higher data by one day to prevent look-ahead
-            higher_df_shifted = higher_df.copy()
-            higher_df_shifted.index = higher_df_shifted.index + pd.Timedelta(days=1)
-            
-            # Forward fill higher data to primary frequency
-            for col in higher_df.columns:
-                if col not in ['Open', 'High', 'Low', 'Close', 'Volume']:
-                    result[f'{higher_granularity}_{col}'] = np.nan
-                    
-                    for i, timestamp in enumerate(result.index):
-                        # Find last higher timeframe value before this timestamp
-                        valid_higher = higher_df_shifted[higher_df_shifted.index <= timestamp]
-                        if len(valid_higher) > 0:
-                            result.loc[timestamp, f'{higher_granularity}_{col}'] = valid_higher[col].iloc[-1]
-            
-            # Forward fill any gaps
-            higher_cols = [c for c in result.columns if c.startswith(f'{higher_granularity}_')]
-            result[higher_cols] = result[higher_cols].ffill()
-        
-        elif higher_granularity == "H4":
-            # For H4 alignment from H1
-            for col in higher_df.columns:
-                if col not in ['Open', 'High', 'Low', 'Close', 'Volume']:
-                    result[f'{higher_granularity}_{col}'] = np.nan
-                    
-                    for i, timestamp in enumerate(result.index):
-                        # Find last H4 value before this timestamp
-                        valid_higher = higher_df[higher_df.index <= timestamp]
-                        if len(valid_higher) > 0:
-                            result.loc[timestamp, f'{higher_granularity}_{col}'] = valid_higher[col].iloc[-1]
-            
-            # Forward fill
-            higher_cols = [c for c in result.columns if c.startswith(f'{higher_granularity}_')]
-            result[higher_cols] = result[higher_cols].ffill()
+        if higher_granularity not in _CLOSE_LAG:
+            return result
+        
+        # D1 bars are shifted by one day (a daily bar is only closed the next day);
+        # H4 bars are visible from their own timestamp.
+        positions = closed_bar_positions(primary_df.index, higher_df.index, higher_granularity)
+        closed = positions >= 0
+        
+        for col in higher_df.columns:
+            if col not in _PRICE_COLUMNS:
+                values = higher_df[col].to_numpy()
+                values = values.astype(np.float64 if values.dtype.kind in 'biuf' else object)
+                aligned = np.full(len(positions), np.nan, dtype=values.dtype)
+                aligned[closed] = values[positions[closed]]
+                result[f'{higher_granularity}_{col}'] = aligned
+        
+        # Forward fill gaps (higher bars whose value is NaN)
+        higher_cols = [c for c in result.columns if c.startswith(f'{higher_granularity}_')]
+        result[higher_cols] = result[higher_cols].ffill()
         
         return result
     
@@ -124,6 +124,35 @@ class StrategyMetrics:
         }
 
 
+@dataclass
+class EquityCurveArrays:
+    """
+    Equity-curve derivatives shared by every curve-based metric.
+
+    Built once per ``analyze`` call so drawdown, annualized, Sharpe and Sortino
+    metrics do not each recompute ``pct_change``, the running peak and the bar
+    frequency from the ``pd.Series``.
+    """
+    values: np.ndarray
+    returns: pd.Series  # bar-to-bar pct change, first bar dropped
+    bars_per_year: float
+    drawdown: np.ndarray
+    drawdown_pct: np.ndarray
+
+    @classmethod
+    def from_series(cls, equity_curve: pd.Series) -> 'EquityCurveArrays':
+        values = equity_curve.to_numpy(dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = values[1:] / values[:-1] - 1
+            running_peak = np.maximum.accumulate(values)
+            drawdown = values - running_peak
+            drawdown_pct = drawdown / running_peak
+        returns = pd.Series(returns, index=equity_curve.index[1:]).dropna()
+        avg_bar_duration = (equity_curve.index[-1] - equity_curve.index[0]) / len(equity_curve)
+        bars_per_year = pd.Timedelta(days=365) / avg_bar_duration
+        return cls(values, returns, bars_per_year, drawdown, drawdown_pct)
+
+
 class StrategyAnalyzer:
     """
     Analyzer for calculating strategy performance metrics.
@@ -210,30 +239,30 @@ class StrategyAnalyzer:
         if r_multiples:
             metrics.expectancy_r = np.mean(r_multiples)
         
+        curve = EquityCurveArrays.from_series(result.equity_curve) if not result.equity_curve.empty else None
+
         # Drawdown analysis
-        if not result.equity_curve.empty:
-            metrics.max_drawdown, metrics.max_drawdown_pct = self._calculate_max_drawdown(
-                result.equity_curve
-            )
+        if curve is not None:
+            metrics.max_drawdown, metrics.max_drawdown_pct = self._calculate_max_drawdown(curve)
         
         # Consecutive losses/wins
         metrics.max_consecutive_losses, metrics.max_consecutive_wins = \
             self._calculate_consecutive_trades(trades)
         
         # Return metrics
-        if not result.equity_curve.empty:
-            metrics.total_return = result.equity_curve.iloc[-1] - initial_capital
+        if curve is not None:
+            metrics.total_return = curve.values[-1] - initial_capital
             metrics.total_return_pct = metrics.total_return / initial_capital
             
             # Annualized metrics
             metrics.annualized_return, metrics.annualized_volatility = \
-                self._calculate_annualized_metrics(result.equity_curve)
+                self._calculate_annualized_metrics(curve)
             
             # Risk-adjusted metrics
             metrics.sharpe_ratio = self._calculate_sharpe_ratio(
-                result.equity_curve, metrics.annualized_volatility
+                curve, metrics.annualized_volatility
             )
-            metrics.sortino_ratio = self._calculate_sortino_ratio(result.equity_curve)
+            metrics.sortino_ratio = self._calculate_sortino_ratio(curve)
             
             if metrics.max_drawdown_pct > 0:
                 metrics.calmar_ratio = metrics.annualized_return / metrics.max_drawdown_pct
@@ -252,23 +281,19 @@ class StrategyAnalyzer:
         
         return metrics
     
-    def _calculate_max_drawdown(self, equity_curve: pd.Series) -> Tuple[float, float]:
+    def _calculate_max_drawdown(self, curve: EquityCurveArrays) -> Tuple[float, float]:
         """
         Calculate maximum drawdown.
         
         Args:
-            equity_curve: Equity curve series
+            curve: Precomputed equity curve arrays
             
         Returns:
             Tuple of (max_drawdown_value, max_drawdown_percentage)
         """
-        rolling_max = equity_curve.expanding().max()
-        drawdown = equity_curve - rolling_max
-        drawdown_pct = drawdown / rolling_max
-        
-        max_dd_idx = drawdown.idxmin()
-        max_drawdown = drawdown.loc[max_dd_idx]
-        max_drawdown_pct = drawdown_pct.loc[max_dd_idx]
+        max_dd_idx = np.nanargmin(curve.drawdown)
+        max_drawdown = curve.drawdown[max_dd_idx]
+        max_drawdown_pct = curve.drawdown_pct[max_dd_idx]
         
         return max_drawdown, abs(max_drawdown_pct)
     
@@ -302,29 +327,26 @@ class StrategyAnalyzer:
         
         return max_losses, max_wins
     
-    def _calculate_annualized_metrics(self, equity_curve: pd.Series) -> Tuple[float, float]:
+    def _calculate_annualized_metrics(self, curve: EquityCurveArrays) -> Tuple[float, float]:
         """
         Calculate annualized return and volatility.
         
         Args:
-            equity_curve: Equity curve series
+            curve: Precomputed equity curve arrays
             
         Returns:
             Tuple of (annualized_return, annualized_volatility)
         """
-        # Calculate returns
-        returns = equity_curve.pct_change().dropna()
+        returns = curve.returns
         
         if len(returns) == 0:
             return 0.0, 0.0
         
-        # Determine bars per year based on data frequency
-        avg_bar_duration = (equity_curve.index[-1] - equity_curve.index[0]) / len(equity_curve)
-        bars_per_year = pd.Timedelta(days=365) / avg_bar_duration
+        bars_per_year = curve.bars_per_year
         
         # Annualized return
-        total_return = (equity_curve.iloc[-1] / equity_curve.iloc[0]) - 1
-        years = len(equity_curve) / bars_per_year
+        total_return = (curve.values[-1] / curve.values[0]) - 1
+        years = len(curve.values) / bars_per_year
         annualized_return = (1 + total_return) ** (1 / years) - 1 if years > 0 else 0
         
         # Annualized volatility
@@ -332,13 +354,13 @@ class StrategyAnalyzer:
         
         return annualized_return, annualized_volatility
     
-    def _calculate_sharpe_ratio(self, equity_curve: pd.Series, 
+    def _calculate_sharpe_ratio(self, curve: EquityCurveArrays, 
                                 annualized_volatility: float) -> float:
         """
         Calculate Sharpe ratio.
         
         Args:
-            equity_curve: Equity curve series
+            curve: Precomputed equity curve arrays
             annualized_volatility: Annualized volatility
             
         Returns:
@@ -347,33 +369,25 @@ class StrategyAnalyzer:
         if annualized_volatility == 0:
             return 0.0
         
-        returns = equity_curve.pct_change().dropna()
-        avg_return = returns.mean()
-        
-        # Determine bars per year
-        avg_bar_duration = (equity_curve.index[-1] - equity_curve.index[0]) / len(equity_curve)
-        bars_per_year = pd.Timedelta(days=365) / avg_bar_duration
+        avg_return = curve.returns.mean()
         
-        annualized_return = avg_return * bars_per_year
+        annualized_return = avg_return * curve.bars_per_year
         excess_return = annualized_return - self.risk_free_rate
         
         return excess_return / annualized_volatility
     
-    def _calculate_sortino_ratio(self, equity_curve: pd.Series) -> float:
+    def _calculate_sortino_ratio(self, curve: EquityCurveArrays) -> float:
         """
         Calculate Sortino ratio (downside deviation only).
         
         Args:
-            equity_curve: Equity curve series
+            curve: Precomputed equity curve arrays
             
         Returns:
             Sortino ratio
         """
-        returns = equity_curve.pct_change().dropna()
-        
-        # Determine bars per year
-        avg_bar_duration = (equity_curve.index[-1] - equity_curve.index[0]) / len(equity_curve)
-        bars_per_year = pd.Timedelta(days=365) / avg_bar_duration
+        returns = curve.returns
+        bars_per_year = curve.bars_per_year
         
         avg_return = returns.mean() * bars_per_year
         downside_returns = returns[returns < 0]
@@ -0,0 +1,112 @@
+"""Parity tests: NumPy trade kernel vs the per-bar reference loop in BacktestEngine."""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.layer0.core_engine.backtest_engine import BacktestConfig, BacktestEngine
+from src.layer0.core_engine.strategy_base import StrategyBase, StrategyConfig
+from src.layer0.data_access.indicators import atr
+
+
+def make_ohlc(n=3000, seed=0, base=1.10, freq="h"):
+    rng = np.random.RandomState(seed)
+    close = base + np.cumsum(rng.normal(0, base * 0.0015, n))
+    open_ = np.r_[close[0], close[:-1]]
+    spread = np.abs(rng.normal(0, base * 0.001, n))
+    idx = pd.date_range("2020-01-01", periods=n, freq=freq, tz="UTC")
+    return pd.DataFrame({
+        "Open": open_,
+        "High": np.maximum(open_, close) + spread,
+        "Low": np.minimum(open_, close) - spread,
+        "Close": close,
+        "Volume": rng.randint(100, 1000, n).astype(float),
+    }, index=idx)
+
+
+class RandomSignalStrategy(StrategyBase):
+    """Sparse random signals so every exit path (SL/TP/time/reverse/EOD) is exercised."""
+
+    def __init__(self, seed=0, density=0.05, signal_on_last_bar=False, **cfg):
+        super().__init__(StrategyConfig(name="Parity_Test", **cfg))
+        self.seed, self.density, self.signal_on_last_bar = seed, density, signal_on_last_bar
+
+    def calculate_indicators(self, df, asset, granularity):
+        df["ATR"] = atr(df["High"], df["Low"], df["Close"], self.config.atr_period)
+        return df
+
+    def generate_signals(self, df, asset, granularity):
+        rng = np.random.RandomState(self.seed)
+        draw = rng.uniform(size=len(df))
+        sig = np.where(draw < self.density / 2, 1, np.where(draw < self.density, -1, 0))
+        if self.signal_on_last_bar:
+            sig[-3:] = [0, 0, -1]
+        return pd.Series(sig, index=df.index)
+
+    def get_entry_conditions(self):
+        return {}
+
+    def get_exit_conditions(self):
+        return {}
+
+
+class CustomStopStrategy(RandomSignalStrategy):
+    def calculate_stop_loss(self, df, direction, entry_price, asset):
+        return entry_price - direction * 0.002
+
+
+def _run(strategy, df, asset, vectorized, **cfg):
+    engine = BacktestEngine(BacktestConfig(vectorized=vectorized, **cfg))
+    return engine.run_backtest(strategy, df, asset, "H1")
+
+
+def _assert_parity(strategy, df, asset="EUR_USD", **cfg):
+    fast = _run(strategy, df, asset, True, **cfg)
+    ref = _run(strategy, df, asset, False, **cfg)
+    assert len(ref.trades) > 0
+    assert fast.trades == ref.trades
+    pd.testing.assert_series_equal(fast.equity_curve, ref.equity_curve, check_exact=True)
+    return ref
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("max_bars", [1, 5, 50])
+def test_kernel_matches_loop(seed, max_bars):
+    _assert_parity(RandomSignalStrategy(seed=seed, max_bars_hold=max_bars), make_ohlc(seed=seed))
+
+
+def test_all_exit_reasons_covered():
+    reasons = set()
+    for seed, sl_tp, max_bars in ((0, 1.0, 50), (1, 8.0, 10), (2, 3.0, 20)):
+        strat = RandomSignalStrategy(seed=seed, density=0.1, signal_on_last_bar=True,
+                                     stop_loss_atr=sl_tp, take_profit_atr=sl_tp, max_bars_hold=max_bars)
+        reasons |= {t.exit_reason for t in _assert_parity(strat, make_ohlc(seed=seed)).trades}
+    assert {"stop_loss", "take_profit", "time_stop", "signal_reverse", "end_of_data"} <= reasons
+
+
+def test_kernel_matches_loop_without_volatility_filter_and_jpy():
+    strat = RandomSignalStrategy(seed=5, volatility_filter=False)
+    _assert_parity(strat, make_ohlc(seed=5, base=150.0), asset="USD_JPY", slippage_pips=1.5)
+
+
+def test_custom_hooks_fall_back_to_loop():
+    strat = CustomStopStrategy(seed=3)
+    df = make_ohlc(seed=3)
+    engine = BacktestEngine()
+    assert not engine._kernel_supported(strat, strat.calculate_indicators(df.copy(), "EUR_USD", "H1"),
+                                        pd.Series(np.zeros(len(df)), index=df.index))
+    _assert_parity(strat, df)
+
+
+def test_walk_forward_window_subset_matches_full_run():
+    df = make_ohlc(4000, seed=7)
+    strat = RandomSignalStrategy(seed=7, density=0.08)
+    engine = BacktestEngine()
+    kwargs = dict(asset="EUR_USD", granularity="H1", train_size=1000, test_size=500, n_windows=5)
+    full = engine.run_walk_forward_analysis(strat, df, **kwargs)
+    subset = engine.run_walk_forward_analysis(strat, df, window_indices=[1, 3], **kwargs)
+    assert len(subset) == 2
+    for got, want in zip(subset, (full[1], full[3])):
+        assert [(t.entry_time, t.exit_reason, t.pnl) for t in got.trades] == \
+            [(t.entry_time, t.exit_reason, t.pnl) for t in want.trades]
@@ -0,0 +1,95 @@
+"""Parity tests: vectorized equity curve and shared analyzer arrays vs the per-bar references."""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.layer0.core_engine.backtest_engine import BacktestConfig, BacktestEngine
+from src.layer0.core_engine.strategy_analyzer import StrategyAnalyzer
+from src.layer0.core_engine.strategy_base import Trade
+
+from .test_backtest_kernel import RandomSignalStrategy, make_ohlc
+
+
+def _trade(df, entry, exit_=None, direction=1, pnl=None, asset="EUR_USD"):
+    t = Trade(entry_time=df.index[entry] if isinstance(entry, int) else entry,
+              entry_price=float(df["Close"].iloc[entry if isinstance(entry, int) else 0]),
+              direction=direction, stop_loss=0.0, take_profit=0.0, asset=asset,
+              strategy="Parity_Test", granularity="H1")
+    if exit_ is not None:
+        t.exit_time = df.index[exit_] if isinstance(exit_, int) else exit_
+        t.pnl = pnl
+    return t
+
+
+def _assert_curve_parity(engine, trades, df):
+    pd.testing.assert_series_equal(engine._build_equity_curve(trades, df),
+                                   engine._build_equity_curve_loop(trades, df), check_exact=True)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_curve_matches_loop_on_simulated_trades(seed):
+    engine = BacktestEngine(BacktestConfig())
+    strat = RandomSignalStrategy(seed=seed, density=0.1, signal_on_last_bar=True, max_bars_hold=7)
+    df = make_ohlc(seed=seed)
+    result = engine.run_backtest(strat, df, "EUR_USD", "H1")
+    assert len(result.trades) > 50
+    _assert_curve_parity(engine, result.trades, df.iloc[200:])
+
+
+def test_curve_matches_loop_on_edge_case_trades():
+    engine = BacktestEngine(BacktestConfig(commission_per_trade=2.5))
+    df = make_ohlc(n=60)
+    before_start = df.index[0] - pd.Timedelta(hours=3)
+    trades = [
+        _trade(df, before_start, 0, pnl=12.5),  # entered before the frame, exits on bar 0
+        _trade(df, 2, 2, pnl=-3.0),  # exit bar == entry bar → realized one bar later
+        _trade(df, 3, 10, pnl=7.0),  # overlaps the next entry …
+        _trade(df, 5, 12, pnl=None),  # … which therefore opens late; pnl None adds nothing
+        _trade(df, 20, 25, direction=-1, pnl=4.25),
+        _trade(df, 40, direction=-1),  # still open: marked to market to the end
+        _trade(df, 45, 50, pnl=100.0),  # blocked by the open trade, never enters the curve
+    ]
+    _assert_curve_parity(engine, trades, df)
+    _assert_curve_parity(engine, trades[:5] + [_trade(df, 59, 59, pnl=1.0)], df)
+    _assert_curve_parity(engine, [_trade(df, 30, asset="USD_JPY")], df)
+    _assert_curve_parity(engine, [], df)
+
+
+def test_unsorted_index_falls_back_to_loop():
+    engine = BacktestEngine(BacktestConfig())
+    df = make_ohlc(n=40).iloc[::-1]
+    trades = [_trade(df, 30, 35, pnl=5.0), _trade(df, 36, 38, pnl=-2.0)]
+    _assert_curve_parity(engine, trades, df)
+
+
+def _reference_curve_metrics(analyzer, equity_curve):
+    """The per-metric pandas derivations the analyzer used before sharing arrays."""
+    rolling_max = equity_curve.expanding().max()
+    drawdown = equity_curve - rolling_max
+    i = drawdown.idxmin()
+    returns = equity_curve.pct_change().dropna()
+    bars_per_year = pd.Timedelta(days=365) / ((equity_curve.index[-1] - equity_curve.index[0]) / len(equity_curve))
+    total = equity_curve.iloc[-1] / equity_curve.iloc[0] - 1
+    vol = returns.std() * np.sqrt(bars_per_year)
+    downside = returns[returns < 0]
+    return {
+        "max_drawdown": drawdown.loc[i],
+        "max_drawdown_pct": abs((drawdown / rolling_max).loc[i]),
+        "annualized_return": (1 + total) ** (1 / (len(equity_curve) / bars_per_year)) - 1,
+        "annualized_volatility": vol,
+        "sharpe_ratio": (returns.mean() * bars_per_year - analyzer.risk_free_rate) / vol,
+        "sortino_ratio": (returns.mean() * bars_per_year - analyzer.risk_free_rate)
+        / (downside.std() * np.sqrt(bars_per_year)),
+    }
+
+
+@pytest.mark.parametrize("seed", [0, 3])
+def test_analyzer_metrics_match_pandas_reference(seed):
+    engine = BacktestEngine(BacktestConfig())
+    result = engine.run_backtest(RandomSignalStrategy(seed=seed), make_ohlc(seed=seed), "EUR_USD", "H1")
+    analyzer = StrategyAnalyzer()
+    metrics = analyzer.analyze(result).to_dict()
+    for name, expected in _reference_curve_metrics(analyzer, result.equity_curve).items():
+        assert metrics[name] == expected, name
@@ -0,0 +1,83 @@
+"""Equivalence tests: as-of closed-bar alignment vs the per-bar scan in align_timeframes."""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.layer0.core_engine.multi_timeframe import MultiTimeframeEngine, closed_bar_positions
+
+from .test_backtest_kernel import make_ohlc
+
+
+def _reference_align(primary_df, higher_df, higher_granularity):
+    """The original O(rows x higher_rows x columns) implementation."""
+    result = primary_df.copy()
+    shifted = higher_df
+    if higher_granularity == "D1":
+        shifted = higher_df.copy()
+        shifted.index = shifted.index + pd.Timedelta(days=1)
+    elif higher_granularity != "H4":
+        return result
+    for col in higher_df.columns:
+        if col not in ['Open', 'High', 'Low', 'Close', 'Volume']:
+            result[f'{higher_granularity}_{col}'] = np.nan
+            for timestamp in result.index:
+                valid_higher = shifted[shifted.index <= timestamp]
+                if len(valid_higher) > 0:
+                    result.loc[timestamp, f'{higher_granularity}_{col}'] = valid_higher[col].iloc[-1]
+    higher_cols = [c for c in result.columns if c.startswith(f'{higher_granularity}_')]
+    result[higher_cols] = result[higher_cols].ffill()
+    return result
+
+
+def _higher(freq, n, seed, start="2019-12-30"):
+    df = make_ohlc(n=n, seed=seed, freq=freq)
+    df.index = pd.date_range(start, periods=n, freq=freq, tz="UTC")
+    rng = np.random.RandomState(seed)
+    df["EMA_50"] = df["Close"].ewm(span=50).mean()
+    df["ADX"] = rng.uniform(10, 40, n)
+    df.loc[df.index[rng.choice(n, n // 10, replace=False)], "ADX"] = np.nan  # gaps → ffill path
+    df["EMA_Alignment"] = rng.choice([-1, 0, 1], n)
+    return df
+
+
+@pytest.mark.parametrize("gran,freq,n", [("D1", "D", 60), ("H4", "4h", 300)])
+def test_alignment_matches_reference(gran, freq, n):
+    primary = make_ohlc(n=1200, seed=1)
+    higher = _higher(freq, n, seed=2)
+    got = MultiTimeframeEngine().align_timeframes(primary, higher, gran)
+    pd.testing.assert_frame_equal(got, _reference_align(primary, higher, gran))
+    # look-ahead safety: no primary bar sees a higher bar that had not closed
+    lag = pd.Timedelta(days=1) if gran == "D1" else pd.Timedelta(0)
+    pos = closed_bar_positions(primary.index, higher.index, gran)
+    assert (higher.index[pos[pos >= 0]] + lag <= primary.index[pos >= 0]).all()
+
+
+def test_unsorted_and_duplicate_higher_rows_and_prefixed_primary_column():
+    primary = make_ohlc(n=400, seed=3)
+    primary["H4_existing"] = np.where(np.arange(400) % 7 == 0, 1.0, np.nan)
+    higher = _higher("4h", 120, seed=4)
+    higher = pd.concat([higher.iloc[50:], higher.iloc[:50], higher.iloc[10:12]])  # shuffled + duplicated stamps
+    got = MultiTimeframeEngine().align_timeframes(primary, higher, "H4")
+    pd.testing.assert_frame_equal(got, _reference_align(primary, higher, "H4"))
+
+
+def test_higher_starting_after_primary_and_unknown_granularity():
+    primary = make_ohlc(n=300, seed=5)
+    higher = _higher("D", 20, seed=6, start="2020-01-05")
+    engine = MultiTimeframeEngine()
+    pd.testing.assert_frame_equal(engine.align_timeframes(primary, higher, "D1"),
+                                  _reference_align(primary, higher, "D1"))
+    pd.testing.assert_frame_equal(engine.align_timeframes(primary, higher.iloc[:0], "D1"),
+                                  _reference_align(primary, higher.iloc[:0], "D1"))
+    pd.testing.assert_frame_equal(engine.align_timeframes(primary, higher, "W1"), primary)
+
+
+def test_closed_bar_index_is_shared_across_calls():
+    primary = make_ohlc(n=200, seed=7)
+    higher = _higher("4h", 60, seed=8)
+    first = closed_bar_positions(primary.index, higher.index, "H4")
+    assert closed_bar_positions(primary.index.copy(), higher.index.copy(), "H4") is first
+    assert closed_bar_positions(primary.index, higher.index, "D1") is not first
+    assert closed_bar_positions(primary.index[1:], higher.index, "H4") is not first
@@ -4,13 +4,258 @@ Technical Indicators Module
 
 Vectorized technical indicators for strategy development.
 All functions accept pandas Series/DataFrame and return Series.
+
+Causal indicators are memoised in ``INDICATOR_CACHE``, an LRU keyed by
+(input series fingerprint, indicator, params) with a memory cap
+(``LAYER0_INDICATOR_CACHE_MB``, default 256; 0 disables caching). Inside
+``with indicator_history(df):`` a call on a contiguous slice of ``df``'s columns
+(e.g. a walk-forward test window) is served from the indicator computed once on
+the full history and sliced. This stays causal: each value still depends only on
+bars at or before it, so nothing after the window end leaks in. Non-causal or
+start-anchored indicators (``detect_swing_points``, ``vwap``,
+``volume_profile_levels``) are never cached or sliced.
 """
 
+import contextlib
+import contextvars
+import functools
+import hashlib
+import inspect
+import os
+import threading
+from collections import OrderedDict
 import numpy as np
 import pandas as pd
-from typing import Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
 
+# =============================================================================
+# INDICATOR CACHE
+# =============================================================================
 
+def series_fingerprint(series: pd.Series) -> str:
+    """Content hash of a series: values, index and name."""
+    h = hashlib.blake2b(digest_size=16)
+    values = series.to_numpy()
+    if values.dtype == object:
+        h.update(pd.util.hash_pandas_object(series, index=False).to_numpy().tobytes())
+    else:
+        h.update(str(values.dtype).encode())
+        h.update(np.ascontiguousarray(values).tobytes())
+    index = series.index
+    if isinstance(index, pd.DatetimeIndex):
+        h.update(str(index.tz).encode())
+        h.update(np.ascontiguousarray(index.asi8).tobytes())
+    else:
+        h.update(pd.util.hash_pandas_object(index).to_numpy().tobytes())
+    h.update(repr(series.name).encode())
+    return h.hexdigest()
+
+
+def _result_nbytes(result: Any) -> int:
+    if isinstance(result, tuple):
+        return sum(_result_nbytes(r) for r in result)
+    if isinstance(result, pd.Series):
+        return int(result.to_numpy().nbytes)  # index is shared with the input series
+    return 0
+
+
+def _copy_result(result: Any, rows: Optional[slice] = None, index: Optional[pd.Index] = None) -> Any:
+    if isinstance(result, tuple):
+        return tuple(_copy_result(r, rows, index) for r in result)
+    if rows is not None:
+        result = result.iloc[rows]
+    result = result.copy()
+    if index is not None:
+        result.index = index
+    return result
+
+
+class IndicatorCache:
+    """
+    Thread-safe LRU of indicator results capped by total value bytes.
+
+    Example:
+        cache = IndicatorCache(max_bytes=64 * 2**20)
+        cache.get_or_compute(key, lambda: ema.__wrapped__(close, 20))
+        print(cache.stats())   # hits, misses, hit_rate, evictions, bytes, ...
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.history_slices = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_or_compute(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """Cached result for ``key`` (not copied), computing and storing it on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        result = compute()
+        size = _result_nbytes(result)
+        with self._lock:
+            if size <= self.max_bytes and key not in self._entries:
+                self._entries[key] = (result, size)
+                self.bytes += size
+                while self.bytes > self.max_bytes:
+                    _, (_, evicted) = self._entries.popitem(last=False)
+                    self.bytes -= evicted
+                    self.evictions += 1
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.evictions = self.history_slices = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hit_rate, 4),
+                'evictions': self.evictions,
+                'history_slices': self.history_slices,
+            }
+
+
+INDICATOR_CACHE = IndicatorCache(
+    max_bytes=int(float(os.environ.get("LAYER0_INDICATOR_CACHE_MB", 256)) * 2**20)
+)
+
+
+class _History:
+    """Full price history registered by ``indicator_history``."""
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        self.usable = frame.index.is_unique
+        self._fingerprints: Dict[Any, str] = {}
+
+    def fingerprint(self, column: Any) -> str:
+        fp = self._fingerprints.get(column)
+        if fp is None:
+            fp = self._fingerprints[column] = series_fingerprint(self.frame[column])
+        return fp
+
+    def locate(self, series: pd.Series) -> Optional[Tuple[int, int]]:
+        """Row range of ``series`` in the history, if it is an unmodified slice of a column."""
+        name = series.name
+        if len(series) == 0 or name is None or name not in self.frame.columns:
+            return None
+        start, last = self.frame.index.get_indexer([series.index[0], series.index[-1]])
+        if start < 0 or last - start + 1 != len(series):
+            return None
+        column = self.frame[name].to_numpy()[start:last + 1]
+        values = series.to_numpy()
+        if column.dtype != values.dtype or not np.array_equal(column, values, equal_nan=column.dtype.kind == 'f'):
+            return None
+        return start, last + 1
+
+
+_history: contextvars.ContextVar = contextvars.ContextVar("layer0_indicator_history", default=None)
+_in_indicator: contextvars.ContextVar = contextvars.ContextVar("layer0_in_indicator", default=False)
+
+
+@contextlib.contextmanager
+def indicator_history(frame: pd.DataFrame) -> Iterator[None]:
+    """
+    Serve cached indicators on slices of ``frame`` from full-history results.
+
+    Used around walk-forward windows: each window's indicators become slices of
+    one full-history computation per (column, indicator, params).
+    """
+    token = _history.set(_History(frame))
+    try:
+        yield
+    finally:
+        _history.reset(token)
+
+
+def cached_indicator(func: Callable) -> Callable:
+    """
+    Memoise a causal indicator in ``INDICATOR_CACHE``.
+
+    Series arguments are keyed by content fingerprint, the rest by value (after
+    applying defaults). Calls made while computing another cached indicator go
+    straight through, so intermediates do not fill the cache. The uncached
+    function stays available as ``__wrapped__``.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = INDICATOR_CACHE
+        if not cache.enabled or _in_indicator.get():
+            return func(*args, **kwargs)
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        series_args = {k: v for k, v in bound.arguments.items() if isinstance(v, pd.Series)}
+        params = tuple((k, v) for k, v in bound.arguments.items() if k not in series_args)
+        try:
+            hash(params)
+        except TypeError:
+            series_args = {}
+        if not series_args:
+            return func(*args, **kwargs)
+
+        def compute(arguments: Dict[str, Any]) -> Callable[[], Any]:
+            def run() -> Any:
+                token = _in_indicator.set(True)
+                try:
+                    return func(**arguments)
+                finally:
+                    _in_indicator.reset(token)
+            return run
+
+        history = _history.get()
+        if history is not None and history.usable:
+            spans = {k: history.locate(v) for k, v in series_args.items()}
+            first = next(iter(spans.values()))
+            if first is not None and all(span == first for span in spans.values()):
+                key = (func.__name__, params) + tuple(
+                    (k, history.fingerprint(v.name)) for k, v in series_args.items()
+                )
+                full_args = dict(bound.arguments)
+                full_args.update({k: history.frame[v.name] for k, v in series_args.items()})
+                result = cache.get_or_compute(key, compute(full_args))
+                with cache._lock:
+                    cache.history_slices += 1
+                index = next(iter(series_args.values())).index
+                return _copy_result(result, slice(*first), index)
+
+        key = (func.__name__, params) + tuple((k, series_fingerprint(v)) for k, v in series_args.items())
+        return _copy_result(cache.get_or_compute(key, compute(dict(bound.arguments))))
+
+    return wrapper
+
+
+@cached_indicator
 def ema(series: pd.Series, period: int) -> pd.Series:
     """
     Calculate Exponential Moving Average.
@@ -25,6 +270,7 @@ def ema(series: pd.Series, period: int) -> pd.Series:
     return series.ewm(span=period, adjust=False).mean()
 
 
+@cached_indicator
 def sma(series: pd.Series, period: int) -> pd.Series:
     """
     Calculate Simple Moving Average.
@@ -39,6 +285,7 @@ def sma(series: pd.Series, period: int) -> pd.Series:
     return series.rolling(window=period).mean()
 
 
+@cached_indicator
 def atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
     """
     Calculate Average True Range.
@@ -63,6 +310,7 @@ def atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) ->
     return true_range.ewm(span=period, adjust=False).mean()
 
 
+@cached_indicator
 def adx(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
     """
     Calculate Average Directional Index (ADX).
@@ -105,6 +353,7 @@ def adx(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) ->
     return adx_val
 
 
+@cached_indicator
 def bollinger_bands(close: pd.Series, period: int = 20, std_dev: float = 2.0) -> Tuple[pd.Series, pd.Series, pd.Series]:
     """
     Calculate Bollinger Bands.
@@ -126,6 +375,7 @@ def bollinger_bands(close: pd.Series, period: int = 20, std_dev: float = 2.0) ->
     return upper, middle, lower
 
 
+@cached_indicator
 def rsi(close: pd.Series, period: int = 14) -> pd.Series:
     """
     Calculate Relative Strength Index.
@@ -151,6 +401,7 @@ def rsi(close: pd.Series, period: int = 14) -> pd.Series:
     return rsi_val
 
 
+@cached_indicator
 def stochastic(high: pd.Series, low: pd.Series, close: pd.Series, 
                k_period: int = 14, d_period: int = 3) -> Tuple[pd.Series, pd.Series]:
     """
@@ -175,6 +426,7 @@ def stochastic(high: pd.Series, low: pd.Series, close: pd.Series,
     return k, d
 
 
+@cached_indicator
 def donchian_channel(high: pd.Series, low: pd.Series, period: int = 20) -> Tuple[pd.Series, pd.Series, pd.Series]:
     """
     Calculate Donchian Channel.
@@ -194,6 +446,7 @@ def donchian_channel(high: pd.Series, low: pd.Series, period: int = 20) -> Tuple
     return upper, middle, lower
 
 
+@cached_indicator
 def macd(close: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[pd.Series, pd.Series, pd.Series]:
     """
     Calculate MACD.
@@ -217,6 +470,7 @@ def macd(close: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> T
     return macd_line, signal_line, histogram
 
 
+@cached_indicator
 def zscore(series: pd.Series, period: int = 20) -> pd.Series:
     """
     Calculate Z-Score (standardized deviation from mean).
@@ -254,6 +508,7 @@ def vwap(high: pd.Series, low: pd.Series, close: pd.Series, volume: pd.Series) -
     return cum_typical_vol / cum_volume
 
 
+@cached_indicator
 def williams_r(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
     """
     Calculate Williams %R.
@@ -275,6 +530,7 @@ def williams_r(high: pd.Series, low: pd.Series, close: pd.Series, period: int =
     return williams
 
 
+@cached_indicator
 def cci(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 20) -> pd.Series:
     """
     Calculate Commodity Channel Index.
@@ -297,6 +553,7 @@ def cci(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 20) ->
     return cci_val
 
 
+@cached_indicator
 def keltner_channel(high: pd.Series, low: pd.Series, close: pd.Series, 
                     ema_period: int = 20, atr_period: int = 10, atr_multiplier: float = 2.0) -> Tuple[pd.Series, pd.Series, pd.Series]:
     """
@@ -322,6 +579,7 @@ def keltner_channel(high: pd.Series, low: pd.Series, close: pd.Series,
     return upper, middle, lower
 
 
+@cached_indicator
 def chandelier_exit(high: pd.Series, low: pd.Series, close: pd.Series, 
                     period: int = 22, atr_multiplier: float = 3.0) -> Tuple[pd.Series, pd.Series]:
     """
@@ -347,6 +605,7 @@ def chandelier_exit(high: pd.Series, low: pd.Series, close: pd.Series,
     return long_stop, short_stop
 
 
+@cached_indicator
 def supertrend(high: pd.Series, low: pd.Series, close: pd.Series, 
                period: int = 10, atr_multiplier: float = 3.0) -> Tuple[pd.Series, pd.Series]:
     """
@@ -389,6 +648,7 @@ def supertrend(high: pd.Series, low: pd.Series, close: pd.Series,
     return supertrend, trend
 
 
+@cached_indicator
 def volatility_contraction_index(high: pd.Series, low: pd.Series, close: pd.Series, 
                                   lookback: int = 20) -> pd.Series:
     """
@@ -0,0 +1,160 @@
+"""Tests for the keyed indicator cache and full-history slicing of walk-forward windows."""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.layer0.data_access import indicators as ind
+
+
+def make_ohlc(n=2000, seed=0):
+    rng = np.random.RandomState(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.002, n))
+    open_ = np.r_[close[0], close[:-1]]
+    spread = np.abs(rng.normal(0, 0.001, n))
+    return pd.DataFrame({
+        "Open": open_,
+        "High": np.maximum(open_, close) + spread,
+        "Low": np.minimum(open_, close) - spread,
+        "Close": close,
+        "Volume": rng.randint(100, 1000, n).astype(float),
+    }, index=pd.date_range("2021-01-01", periods=n, freq="h", tz="UTC"))
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    cache = ind.IndicatorCache(max_bytes=64 * 2**20)
+    monkeypatch.setattr(ind, "INDICATOR_CACHE", cache)
+    return cache
+
+
+CALLS = [
+    ("ema", lambda d, f: f(d["Close"], 20)),
+    ("sma", lambda d, f: f(d["Close"], period=10)),
+    ("atr", lambda d, f: f(d["High"], d["Low"], d["Close"])),
+    ("adx", lambda d, f: f(d["High"], d["Low"], d["Close"], 14)),
+    ("bollinger_bands", lambda d, f: f(d["Close"], 20, 2.0)),
+    ("rsi", lambda d, f: f(d["Close"], 14)),
+    ("stochastic", lambda d, f: f(d["High"], d["Low"], d["Close"], 14, 3)),
+    ("donchian_channel", lambda d, f: f(d["High"], d["Low"], 20)),
+    ("macd", lambda d, f: f(d["Close"])),
+    ("zscore", lambda d, f: f(d["Close"], 20)),
+    ("williams_r", lambda d, f: f(d["High"], d["Low"], d["Close"])),
+    ("cci", lambda d, f: f(d["High"], d["Low"], d["Close"])),
+    ("keltner_channel", lambda d, f: f(d["High"], d["Low"], d["Close"])),
+    ("chandelier_exit", lambda d, f: f(d["High"], d["Low"], d["Close"])),
+    ("supertrend", lambda d, f: f(d["High"], d["Low"], d["Close"])),
+    ("volatility_contraction_index", lambda d, f: f(d["High"], d["Low"], d["Close"])),
+]
+
+
+def assert_same(got, want):
+    if isinstance(want, tuple):
+        assert isinstance(got, tuple) and len(got) == len(want)
+        for g, w in zip(got, want):
+            pd.testing.assert_series_equal(g, w)
+    else:
+        pd.testing.assert_series_equal(got, want)
+
+
+@pytest.mark.parametrize("name, call", CALLS, ids=[c[0] for c in CALLS])
+def test_cached_indicator_matches_uncached(name, call, fresh_cache):
+    df = make_ohlc(600)
+    func = getattr(ind, name)
+    want = call(df, func.__wrapped__)
+    fresh_cache.clear()  # nested indicators inside the reference call go through the cache
+    fresh_cache.reset_stats()
+    assert_same(call(df, func), want)
+    assert_same(call(df, func), want)
+    assert fresh_cache.hits == 1 and fresh_cache.misses == 1
+
+
+@pytest.mark.parametrize("name, call", CALLS, ids=[c[0] for c in CALLS])
+def test_history_slices_equal_full_history_and_are_causal(name, call, fresh_cache):
+    df = make_ohlc(1500)
+    func = getattr(ind, name)
+    start, stop = 900, 1200
+    full = call(df, func.__wrapped__)
+    # Causal: recomputing on history that ends at the window end gives the same values.
+    truncated = call(df.iloc[:stop], func.__wrapped__)
+    fresh_cache.clear()
+    fresh_cache.reset_stats()
+    with ind.indicator_history(df):
+        window = call(df.iloc[start:stop].copy(), func)
+        again = call(df.iloc[start:stop].copy(), func)
+    sliced = tuple(s.iloc[start:stop] for s in full) if isinstance(full, tuple) else full.iloc[start:stop]
+    assert_same(window, sliced)
+    assert_same(again, sliced)
+    causal = tuple(s.iloc[start:] for s in truncated) if isinstance(truncated, tuple) else truncated.iloc[start:]
+    assert_same(window, causal)
+    assert fresh_cache.history_slices == 2 and fresh_cache.misses == 1
+
+
+def test_history_slices_share_one_computation_across_windows(fresh_cache):
+    df = make_ohlc(3000)
+    with ind.indicator_history(df):
+        for start in range(1000, 3000, 250):
+            ind.atr(df["High"].iloc[start:start + 250], df["Low"].iloc[start:start + 250],
+                    df["Close"].iloc[start:start + 250], 14)
+    assert fresh_cache.misses == 1
+    assert fresh_cache.hits == 7
+    assert fresh_cache.stats()["hit_rate"] == pytest.approx(7 / 8)
+
+
+def test_modified_or_derived_series_are_not_served_from_history(fresh_cache):
+    df = make_ohlc(1000)
+    window = df.iloc[500:700].copy()
+    window.iloc[10, window.columns.get_loc("Close")] += 0.01
+    with ind.indicator_history(df):
+        got = ind.ema(window["Close"], 20)
+        derived = ind.ema((window["High"] + window["Low"]) / 2, 20)
+    pd.testing.assert_series_equal(got, ind.ema.__wrapped__(window["Close"], 20))
+    pd.testing.assert_series_equal(derived, ind.ema.__wrapped__((window["High"] + window["Low"]) / 2, 20))
+    assert fresh_cache.history_slices == 0
+
+
+def test_mutating_a_result_does_not_corrupt_the_cache():
+    df = make_ohlc(500)
+    first = ind.ema(df["Close"], 10)
+    first.iloc[:] = 0.0
+    pd.testing.assert_series_equal(ind.ema(df["Close"], 10), ind.ema.__wrapped__(df["Close"], 10))
+    with ind.indicator_history(df):
+        window = ind.ema(df["Close"].iloc[100:200], 10)
+        window.iloc[:] = 0.0
+        pd.testing.assert_series_equal(
+            ind.ema(df["Close"].iloc[100:200], 10), ind.ema.__wrapped__(df["Close"], 10).iloc[100:200]
+        )
+
+
+def test_lru_evicts_least_recently_used_under_memory_cap(monkeypatch):
+    df = make_ohlc(1000)  # one float64 result = 8000 bytes
+    cache = ind.IndicatorCache(max_bytes=8000 * 2)
+    monkeypatch.setattr(ind, "INDICATOR_CACHE", cache)
+    ind.ema(df["Close"], 10)
+    ind.ema(df["Close"], 20)
+    ind.ema(df["Close"], 10)  # refresh 10
+    ind.ema(df["Close"], 30)  # evicts 20
+    assert cache.evictions == 1 and cache.bytes == 16000
+    ind.ema(df["Close"], 10)
+    ind.ema(df["Close"], 20)
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 4
+
+
+def test_disabled_cache_passes_through(monkeypatch):
+    cache = ind.IndicatorCache(max_bytes=0)
+    monkeypatch.setattr(ind, "INDICATOR_CACHE", cache)
+    df = make_ohlc(300)
+    with ind.indicator_history(df):
+        got = ind.ema(df["Close"].iloc[100:200], 10)
+    pd.testing.assert_series_equal(got, ind.ema.__wrapped__(df["Close"].iloc[100:200], 10))
+    assert cache.stats()["misses"] == 0 and cache.history_slices == 0
+
+
+def test_non_causal_indicators_are_not_cached(fresh_cache):
+    df = make_ohlc(300)
+    ind.detect_swing_points(df["High"], df["Low"], 5)
+    ind.vwap(df["High"], df["Low"], df["Close"], df["Volume"])
+    assert fresh_cache.misses == 0
+    assert not hasattr(ind.detect_swing_points, "__wrapped__")
@@ -0,0 +1 @@
+"""OANDA price ingestion (single-series ETL and the concurrent ingest scheduler)."""
@@ -16,7 +16,7 @@ TECHNICAL REQUIREMENTS:
 - Python 3 with oandapyV20 and psycopg2 (PostgreSQL)
 - Window-based pagination (not huge count calls)
 - Mid candles only (price=M), complete candles only (complete=true)
-- INSERT ... ON CONFLICT upsert for duplicate prevention
+- COPY-staged INSERT ... ON CONFLICT upsert for duplicate prevention
 - Rate limiting with exponential backoff and jitter
 - Gap detection and logging for missing timestamps
 - Bulk loading via PostgreSQL COPY for ingestion velocity
@@ -70,14 +70,20 @@ import re
 from pathlib import Path
 
 import psycopg2
-from psycopg2.extras import execute_values
 from oandapyV20 import API
 from oandapyV20.endpoints.instruments import InstrumentsCandles
 from oandapyV20.exceptions import V20Error
 
 # Ensure the repo root is importable so ``src.common`` resolves.
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-from src.common.db import get_psycopg2_connection  # noqa: E402
+from src.common.db import copy_upsert, get_psycopg2_connection  # noqa: E402
+from src.layer0.ingest_data.ingest_scheduler import (  # noqa: E402
+    HttpCandleFetcher,
+    IngestScheduler,
+    SeriesProgress,
+    SeriesSpec,
+    TokenBucket,
+)
 
 # ==============================================================================
 # CONFIGURATION - TUNABLE VALUES
@@ -104,11 +110,16 @@ class IngestConfig:
         "D1", "H4", "H1", "M30", "M15"
     ])
 
-    # Sleep between API requests (seconds) - be nice to OANDA
+    # Sleep between API requests (seconds) - be nice to OANDA (single-series path)
     REQUEST_SLEEP_SECONDS: float = 0.5
 
-    # Batch size for SQL upsert (INSERT ... ON CONFLICT) operations
-    SQL_BATCH_SIZE: int = 1000
+    # Concurrent scheduler: global request budget (OANDA allows 120/s per token)
+    # shared by all workers, and the number of series fetched concurrently
+    MAX_REQUESTS_PER_SECOND: float = 20.0
+    INGEST_WORKERS: int = 4
+
+    # Rows buffered per COPY-staged upsert (one staging table + merge per flush)
+    SQL_BATCH_SIZE: int = 10000
 
     # Retry configuration
     MAX_RETRIES: int = 5
@@ -860,15 +871,23 @@ def detect_gaps(
 # ==============================================================================
 
 
+# fact_market_prices columns staged by upsert_batch, and the positions of each in a
+# transform_candles row tuple (the bid/ask components are not persisted).
+PRICE_COLUMNS = ("asset_id", "timestamp", "Open", "high", "low", "Close", "volume", "granularity")
+_PRICE_ROW_POSITIONS = (0, 1, 2, 3, 4, 5, 14, 15)
+PRICE_KEY_COLUMNS = ("timestamp", "asset_id", "granularity")
+
+
 def upsert_batch(conn, rows: List[Tuple]) -> Tuple[int, int]:
     """
-    Upsert a batch of rows using ``INSERT ... ON CONFLICT`` (PostgreSQL).
+    Upsert a batch of rows via ``COPY`` + one ``INSERT ... ON CONFLICT`` merge.
 
-    Uses the PostgreSQL ``INSERT ... ON CONFLICT DO UPDATE`` upsert pattern. The conflict
+    Rows are streamed into a temporary staging table and merged in a single
+    set-based statement (:func:`src.common.db.copy_upsert`). The conflict
     target is the ``fact_market_prices`` primary key ``(timestamp, asset_id,
-    granularity)``; re-running is idempotent. The ``RETURNING (xmax = 0)`` flag
-    distinguishes freshly inserted rows (xmax = 0) from updated rows, giving an
-    exact insert/update split.
+    granularity)``; re-running is idempotent. The insert/update split is
+    computed in SQL from ``xmax = 0`` (freshly inserted rows), so it is exact
+    without fetching a row back per input row.
 
     Args:
         conn: Database connection
@@ -885,30 +904,16 @@ def upsert_batch(conn, rows: List[Tuple]) -> Tuple[int, int]:
     if not rows:
         return 0, 0
 
-    cursor = conn.cursor()
-
-    upsert_sql = """
-        INSERT INTO fact_market_prices
-            (asset_id, "timestamp", "Open", high, low, "Close", volume, granularity)
-        VALUES %s
-        ON CONFLICT ("timestamp", asset_id, granularity) DO UPDATE SET
-            "Open" = EXCLUDED."Open",
-            high = EXCLUDED.high,
-            low = EXCLUDED.low,
-            "Close" = EXCLUDED."Close",
-            volume = EXCLUDED.volume
-        RETURNING (xmax = 0) AS inserted
-    """
-
-    # Row tuples are already in (asset_id, timestamp, open, high, low, close,
-    # volume, granularity) order — matching the INSERT column list above.
-    returned = execute_values(cursor, upsert_sql, rows, page_size=1000, fetch=True)
+    inserted, updated = copy_upsert(
+        "fact_market_prices",
+        (tuple(row[i] for i in _PRICE_ROW_POSITIONS) for row in rows),
+        columns=PRICE_COLUMNS,
+        conflict_columns=PRICE_KEY_COLUMNS,
+        conn=conn,
+    )
 
     conn.commit()
 
-    inserted = sum(1 for r in returned if r[0])
-    updated = len(returned) - inserted
-
     return inserted, updated
 
 
@@ -1085,6 +1090,149 @@ def process_asset_granularity(
     return result
 
 
+def build_series_spec(
+    db_conn, asset: Dict[str, Any], granularity: str, now: datetime
+) -> Optional[SeriesSpec]:
+    """
+    Resume cursor for one asset+granularity as a scheduler series.
+
+    Returns None when the series is already up to date (within one interval).
+    Cursors are naive UTC, like the rows ``transform_candles`` produces.
+    """
+    from_ts = get_resume_timestamp(db_conn, asset["Asset_ID"], granularity)
+    if from_ts.tzinfo is not None:
+        from_ts = from_ts.astimezone(timezone.utc).replace(tzinfo=None)
+    now = now.astimezone(timezone.utc).replace(tzinfo=None) if now.tzinfo else now
+    interval = get_interval_delta(granularity)
+
+    if from_ts >= now - interval:
+        logger.info(f"{asset['Symbol']} {granularity} already up to date (last: {from_ts})")
+        return None
+
+    return SeriesSpec(
+        asset_id=asset["Asset_ID"],
+        symbol=asset["Symbol"],
+        granularity=granularity,
+        oanda_granularity=to_oanda_granularity(granularity),
+        start=from_ts,
+        end=now,
+        chunk=timedelta(days=CONFIG.CHUNK_DAYS.get(granularity, 7)),
+        interval=interval,
+    )
+
+
+def process_concurrently(
+    db_conn,
+    env: Dict[str, str],
+    assets: List[Dict[str, Any]],
+    granularities: List[str],
+    workers: Optional[int] = None,
+    fetcher=None,
+    limiter: Optional[TokenBucket] = None,
+) -> List[ProcessingResult]:
+    """
+    Ingest every asset x granularity through the concurrent scheduler.
+
+    Series are fetched concurrently under one global token bucket
+    (``CONFIG.MAX_REQUESTS_PER_SECOND``); rows are buffered per series and
+    upserted on this thread via ``upsert_batch`` while the next windows
+    download. As in ``process_asset_granularity``, a series stops at its first
+    failed window after flushing what it already fetched, so resume from
+    MAX(Timestamp) stays contiguous.
+
+    Args:
+        db_conn: Database connection (used only from the calling thread)
+        env: Environment from ``read_env``
+        assets: Asset dicts with Asset_ID and Symbol
+        granularities: Granularities to process
+        workers: Concurrent series (default ``CONFIG.INGEST_WORKERS``)
+        fetcher: Optional candles fetcher (default ``HttpCandleFetcher`` on OANDA_URL)
+        limiter: Optional shared token bucket (default ``CONFIG.MAX_REQUESTS_PER_SECOND``)
+
+    Returns:
+        ProcessingResult per series, in assets x granularities order
+    """
+    now = datetime.now(timezone.utc)
+    results: Dict[Tuple[str, str], ProcessingResult] = {}
+    buffers: Dict[Tuple[str, str], List[Tuple]] = {}
+    specs: List[SeriesSpec] = []
+
+    for asset in assets:
+        for granularity in granularities:
+            key = (asset["Symbol"], granularity)
+            results[key] = ProcessingResult(
+                asset_id=asset["Asset_ID"], symbol=asset["Symbol"], granularity=granularity, success=False
+            )
+            spec = build_series_spec(db_conn, asset, granularity, now)
+            if spec is None:
+                results[key].success = True
+                results[key].end_time = datetime.now(timezone.utc)
+            else:
+                specs.append(spec)
+                buffers[key] = []
+
+    def prepare(spec: SeriesSpec, candles: List[Dict]):
+        rows, _, skipped = transform_candles(candles, spec.asset_id, spec.granularity)
+        return (rows, skipped), (rows[-1][1] if rows else None)
+
+    def flush(key: Tuple[str, str]) -> None:
+        if buffers[key]:
+            inserted, updated = upsert_batch(db_conn, buffers[key])
+            results[key].rows_inserted += inserted
+            results[key].rows_updated += updated
+            buffers[key] = []
+
+    def write(spec: SeriesSpec, payload, from_ts: datetime, to_ts: datetime) -> None:
+        rows, skipped = payload
+        result = results[spec.key]
+        result.rows_skipped += skipped
+        if rows and from_ts > CONFIG.DEFAULT_START_DATE.replace(tzinfo=None):
+            detect_gaps(from_ts, to_ts, spec.granularity, rows, spec.symbol)
+        buffers[spec.key].extend(rows)
+        if len(buffers[spec.key]) >= CONFIG.SQL_BATCH_SIZE:
+            try:
+                flush(spec.key)
+            except Exception:
+                db_conn.rollback()
+                buffers[spec.key] = []
+                raise
+
+    def finish(spec: SeriesSpec, progress: SeriesProgress) -> None:
+        result = results[spec.key]
+        try:
+            if not progress.stopped.is_set():
+                flush(spec.key)  # also flushes a series halted by a failed window
+        except Exception as e:  # noqa: BLE001 - reported per series
+            db_conn.rollback()
+            progress.success = False
+            progress.error = str(e)
+        result.api_requests = progress.api_requests
+        result.candles_fetched = progress.candles_fetched
+        result.failed_windows = progress.failed_windows
+        result.success = progress.success
+        result.error_message = progress.error or (
+            f"Stopped after failed window at {progress.cursor}" if not progress.success else None
+        )
+        result.end_time = datetime.now(timezone.utc)
+        logger.info(
+            f"Completed {spec.symbol} {spec.granularity}: "
+            f"{result.rows_inserted} inserted, {result.rows_updated} updated, "
+            f"{result.api_requests} API requests"
+        )
+
+    scheduler = IngestScheduler(
+        fetcher or HttpCandleFetcher.from_env(env, price=CONFIG.OANDA_PRICE),
+        limiter=limiter or TokenBucket(CONFIG.MAX_REQUESTS_PER_SECOND),
+        workers=workers if workers is not None else CONFIG.INGEST_WORKERS,
+        max_retries=CONFIG.MAX_RETRIES,
+        backoff=exponential_backoff_with_jitter,
+        default_retry_after=CONFIG.RATE_LIMIT_RETRY_AFTER_DEFAULT,
+    )
+    if specs:
+        scheduler.run(specs, prepare=prepare, write=write, finish=finish)
+    return list(results.values())
+
+
 # ==============================================================================
 # VALIDATION QUERIES
 # ==============================================================================
@@ -1200,6 +1348,7 @@ def run(
     symbol_filter: Optional[str] = None,
     granularity_filter: Optional[str] = None,
     dry_run: bool = False,
+    workers: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Main entry point for OANDA price ingestion.
@@ -1208,6 +1357,7 @@ def run(
         symbol_filter: Optional single symbol to process
         granularity_filter: Optional single granularity to process
         dry_run: If True, only validate connections and show what would be processed
+        workers: Concurrent series (default ``CONFIG.INGEST_WORKERS``)
 
     Returns:
         Summary dict with processing statistics
@@ -1217,7 +1367,6 @@ def run(
     logger.info("OANDA Price Ingestion Started")
     logger.info(f"Symbol filter: {symbol_filter or 'None (all assets)'}")
     logger.info(f"Granularity filter: {granularity_filter or 'None (D1, H4, H1, M30, M15)'}")
-    logger.info(f"Granularities filter: {granularities_filter or 'None'}")
     logger.info(f"Dry run: {dry_run}")
     logger.info("=" * 80)
 
@@ -1277,29 +1426,15 @@ def run(
         db_conn.close()
         raise
 
-    # Process all combinations
-    all_results: List[ProcessingResult] = []
+    # Process all combinations (concurrently, under the shared rate limiter)
     total_combinations = len(assets) * len(granularities)
-    processed = 0
-
-    for asset in assets:
-        for granularity in granularities:
-            processed += 1
-            logger.info(
-                f"Processing combination {processed}/{total_combinations}: {asset['Symbol']} {granularity}"
-            )
-
-            result = process_asset_granularity(
-                db_conn, oanda_client, asset, granularity
-            )
-            all_results.append(result)
-
-            # Log progress every 10 combinations
-            if processed % 10 == 0:
-                successful = sum(1 for r in all_results if r.success)
-                logger.info(
-                    f"Progress: {processed}/{total_combinations} combinations, {successful} successful"
-                )
+    logger.info(
+        f"Processing {total_combinations} combinations with "
+        f"{workers or CONFIG.INGEST_WORKERS} concurrent series"
+    )
+    all_results: List[ProcessingResult] = process_concurrently(
+        db_conn, env, assets, granularities, workers=workers
+    )
 
     # Close connections
     db_conn.close()
@@ -1419,6 +1554,13 @@ Examples:
         help="Validate connections without ingesting data",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"Series fetched concurrently (default: {CONFIG.INGEST_WORKERS})",
+    )
+
     parser.add_argument(
         "--log-file",
         type=str,
@@ -1438,6 +1580,7 @@ Examples:
             symbol_filter=args.symbol,
             granularity_filter=args.granularity,
             dry_run=args.dry_run,
+            workers=args.workers,
         )
 
         # Exit with error code if any failures
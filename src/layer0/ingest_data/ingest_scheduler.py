@@ -0,0 +1,437 @@
+"""
+Concurrent OANDA ingest scheduler with a shared token-bucket rate limiter.
+
+The single-series ingest loops (``ingest_oanda_prices.process_asset_granularity``,
+``multi_timeframe_ingest``) were fetch → transform → upsert → sleep, one
+(asset, granularity) at a time. The scheduler instead:
+
+  * fetches several series concurrently (one worker thread per in-flight series),
+    all drawing from one global :class:`TokenBucket` sized to OANDA's REST budget;
+    a 429 pauses the whole bucket for ``Retry-After`` rather than one worker,
+  * pipelines fetch with DB writes: workers hand each window to a bounded queue
+    drained by the calling thread (which owns the DB connection), so the next
+    window downloads while the current one upserts,
+  * keeps a cursor per series. A series' windows are fetched and written strictly
+    in order, so the resume-from-``MAX("timestamp")`` contract is unchanged: after
+    a crash the next run continues from the last window written for that series.
+
+Transport is plain HTTP (``requests``) against ``{OANDA_URL}/v3/instruments/...``,
+so the scheduler runs unchanged against a local fake candles server in tests.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# OANDA allows 120 REST requests/second per token; stay well inside it by default.
+DEFAULT_MAX_REQUESTS_PER_SECOND = 20.0
+DEFAULT_WORKERS = 4
+DEFAULT_RETRY_AFTER_SECONDS = 10.0
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by every fetch worker.
+
+    ``rate`` tokens are added per second up to ``capacity``; each request takes
+    one. :meth:`pause` (used on HTTP 429) empties the bucket and blocks every
+    caller until the pause elapses.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self.acquired = 0
+        self.waited_seconds = 0.0
+
+    def _refill(self, now: float) -> None:
+        # No tokens accrue while paused: the bucket restarts empty after a 429.
+        since = max(self._updated, self._paused_until)
+        if now > since:
+            self._tokens = min(self.capacity, self._tokens + (now - since) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Block until a token is available. Returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    self.acquired += 1
+                    self.waited_seconds += waited
+                    return waited
+                else:
+                    wait = (1.0 - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds`` (global back-off on 429)."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = 0.0
+            self._paused_until = max(self._paused_until, now + seconds)
+
+
+@dataclass
+class FetchResult:
+    """One candles request: payload, HTTP status (0 = transport error), Retry-After."""
+
+    candles: List[Dict[str, Any]]
+    status: int
+    retry_after: Optional[float] = None
+
+
+class HttpCandleFetcher:
+    """
+    Thread-safe OANDA v20 candles client over ``requests`` (one session per thread).
+
+    Mirrors the request ``ingest_oanda_prices.fetch_candles_window`` makes through
+    ``oandapyV20`` (same params, inclusive ``from``).
+    """
+
+    def __init__(self, base_url: str, token: str, price: str = "BA", timeout: float = 30.0):
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.price = price
+        self.timeout = timeout
+        self._local = threading.local()
+
+    @classmethod
+    def from_env(cls, env: Dict[str, str], price: str = "BA") -> "HttpCandleFetcher":
+        """Build from the ``read_env()`` dict (``OANDA_URL`` / ``OANDA_API_KEY``)."""
+        return cls(env["OANDA_URL"], env["OANDA_API_KEY"], price=price)
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(
+                {
+                    "Authorization": f"Bearer {self.token}",
+                    "Accept-Datetime-Format": "RFC3339",
+                }
+            )
+            self._local.session = session
+        return session
+
+    def __call__(
+        self, instrument: str, granularity: str, from_ts: datetime, to_ts: datetime
+    ) -> FetchResult:
+        params = {
+            "price": self.price,
+            "granularity": granularity,
+            "from": from_ts.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "to": to_ts.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "includeFirst": "true",
+        }
+        url = f"{self.base_url}/v3/instruments/{instrument}/candles"
+        try:
+            response = self._session().get(url, params=params, timeout=self.timeout)
+        except requests.RequestException as e:
+            logger.warning(f"Transport error fetching {instrument} {granularity}: {e}")
+            return FetchResult([], 0)
+
+        if response.status_code != 200:
+            retry_after = response.headers.get("Retry-After")
+            try:
+                retry_after = float(retry_after) if retry_after is not None else None
+            except ValueError:
+                retry_after = None
+            return FetchResult([], response.status_code, retry_after)
+        return FetchResult(response.json().get("candles", []), 200)
+
+
+@dataclass
+class SeriesSpec:
+    """
+    One (asset, granularity) series and its resume cursor.
+
+    Attributes:
+        asset_id: Dim asset identifier
+        symbol: OANDA instrument (e.g. "EUR_USD")
+        granularity: Internal granularity code stored in the DB (D1, H4, ...)
+        oanda_granularity: Code sent to OANDA ("D", "H4", ...)
+        start: Resume cursor (first bar time to request)
+        end: Fetch up to this instant (exclusive)
+        chunk: Duration of one request window
+        interval: One bar interval (cursor advance past the last bar)
+    """
+
+    asset_id: int
+    symbol: str
+    granularity: str
+    oanda_granularity: str
+    start: datetime
+    end: datetime
+    chunk: timedelta
+    interval: timedelta
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return (self.symbol, self.granularity)
+
+
+@dataclass
+class SeriesProgress:
+    """Fetch-side outcome of one series (write-side stats belong to the caller)."""
+
+    spec: SeriesSpec
+    cursor: datetime
+    api_requests: int = 0
+    windows_fetched: int = 0
+    windows_written: int = 0
+    candles_fetched: int = 0
+    rate_limited: int = 0
+    failed_windows: int = 0
+    success: bool = True
+    error: Optional[str] = None
+    fetch_seconds: float = 0.0
+    stopped: threading.Event = field(default_factory=threading.Event, repr=False)
+
+
+@dataclass
+class _Window:
+    spec: SeriesSpec
+    from_ts: datetime
+    to_ts: datetime
+    payload: Any
+    next_cursor: datetime
+
+
+@dataclass
+class _SeriesDone:
+    spec: SeriesSpec
+
+
+# prepare(spec, candles) -> (payload, last_bar_time or None); runs on fetch workers
+PrepareFn = Callable[[SeriesSpec, List[Dict[str, Any]]], Tuple[Any, Optional[datetime]]]
+# write(spec, payload, from_ts, to_ts); runs on the calling (DB-owning) thread
+WriteFn = Callable[[SeriesSpec, Any, datetime, datetime], None]
+# finish(spec, progress); runs on the calling thread once a series is drained
+FinishFn = Callable[[SeriesSpec, SeriesProgress], None]
+
+
+def _default_backoff(attempt: int) -> float:
+    delay = min(1.0 * (2.0**attempt), 60.0)
+    return delay + delay * 0.3 * (2 * random.random() - 1)
+
+
+class IngestScheduler:
+    """
+    Concurrent, rate-limited, write-pipelined ingest over many series.
+
+    Example:
+        scheduler = IngestScheduler(HttpCandleFetcher.from_env(env), workers=4)
+        progress = scheduler.run(specs, prepare=..., write=..., finish=...)
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str, str, datetime, datetime], FetchResult],
+        limiter: Optional[TokenBucket] = None,
+        workers: Optional[int] = None,
+        max_retries: int = 5,
+        stop_on_failure: bool = True,
+        backoff: Callable[[int], float] = _default_backoff,
+        default_retry_after: float = DEFAULT_RETRY_AFTER_SECONDS,
+        queue_windows: Optional[int] = None,
+    ):
+        """
+        Args:
+            fetch: Candles fetcher (``HttpCandleFetcher`` or compatible callable)
+            limiter: Shared token bucket (default from ``INGEST_MAX_RPS``)
+            workers: Concurrent series (default from ``INGEST_WORKERS``)
+            max_retries: Attempts per window before it counts as failed
+            stop_on_failure: Stop a series at its first failed window (keeps the
+                written history contiguous for resume); otherwise skip the window
+            backoff: Delay before retrying a 5xx/transport error, by attempt
+            default_retry_after: 429 pause when the response has no Retry-After
+            queue_windows: Fetched-but-unwritten windows held in memory
+                (default ``2 * workers``)
+        """
+        self.fetch = fetch
+        self.limiter = limiter or TokenBucket(
+            float(os.environ.get("INGEST_MAX_RPS", DEFAULT_MAX_REQUESTS_PER_SECOND))
+        )
+        self.workers = max(
+            1, int(workers if workers is not None else os.environ.get("INGEST_WORKERS", DEFAULT_WORKERS))
+        )
+        self.max_retries = max_retries
+        self.stop_on_failure = stop_on_failure
+        self.backoff = backoff
+        self.default_retry_after = default_retry_after
+        self.queue_windows = queue_windows or 2 * self.workers
+
+    def _fetch_window(
+        self, progress: SeriesProgress, from_ts: datetime, to_ts: datetime
+    ) -> Optional[List[Dict[str, Any]]]:
+        spec = progress.spec
+        for attempt in range(self.max_retries):
+            self.limiter.acquire()
+            started = time.perf_counter()
+            result = self.fetch(spec.symbol, spec.oanda_granularity, from_ts, to_ts)
+            progress.fetch_seconds += time.perf_counter() - started
+            progress.api_requests += 1
+
+            if result.status == 200:
+                return result.candles
+            if result.status == 429:
+                progress.rate_limited += 1
+                pause = result.retry_after if result.retry_after is not None else self.default_retry_after
+                logger.warning(f"Rate limited (429) on {spec.symbol} {spec.granularity}; pausing {pause}s")
+                self.limiter.pause(pause)
+                continue
+            if 400 <= result.status < 500:
+                logger.error(f"Client error ({result.status}) for {spec.symbol} {spec.granularity}. Not retrying.")
+                return None
+            delay = self.backoff(attempt)
+            logger.warning(
+                f"Error (status={result.status}) for {spec.symbol} {spec.granularity}. "
+                f"Waiting {delay:.2f}s before retry {attempt + 1}/{self.max_retries}"
+            )
+            time.sleep(delay)
+        return None
+
+    @staticmethod
+    def _put(out: "queue.Queue", item: Any, abort: threading.Event) -> bool:
+        """Blocking put that gives up once the run is aborted (writer gone)."""
+        while not abort.is_set():
+            try:
+                out.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(
+        self, progress: SeriesProgress, prepare: PrepareFn, out: "queue.Queue", abort: threading.Event
+    ) -> None:
+        spec = progress.spec
+        from_ts = spec.start
+        try:
+            while from_ts < spec.end and not progress.stopped.is_set():
+                to_ts = min(from_ts + spec.chunk, spec.end)
+                candles = self._fetch_window(progress, from_ts, to_ts)
+                if candles is None:
+                    progress.failed_windows += 1
+                    logger.error(f"Failed window {spec.symbol} {spec.granularity} {from_ts}→{to_ts}")
+                    if self.stop_on_failure:
+                        progress.success = False
+                        break
+                    from_ts = to_ts
+                    continue
+
+                progress.windows_fetched += 1
+                progress.candles_fetched += len(candles)
+                payload, last_bar = prepare(spec, candles)
+                next_cursor = last_bar + spec.interval if last_bar is not None else to_ts
+                if not self._put(out, _Window(spec, from_ts, to_ts, payload, next_cursor), abort):
+                    return
+                from_ts = next_cursor
+        except Exception as e:  # noqa: BLE001 - reported per series
+            logger.error(f"Fetch worker failed for {spec.symbol} {spec.granularity}: {e}")
+            progress.success = False
+            progress.error = str(e)
+        finally:
+            self._put(out, _SeriesDone(spec), abort)
+
+    def run(
+        self,
+        series: List[SeriesSpec],
+        prepare: PrepareFn,
+        write: WriteFn,
+        finish: Optional[FinishFn] = None,
+    ) -> List[SeriesProgress]:
+        """
+        Ingest every series; returns per-series progress in input order.
+
+        ``write`` and ``finish`` run on the calling thread, in per-series window
+        order. A ``write`` exception fails that series only: its worker stops
+        fetching and its remaining queued windows are dropped.
+        """
+        progress = {s.key: SeriesProgress(spec=s, cursor=s.start) for s in series}
+        out: "queue.Queue" = queue.Queue(maxsize=self.queue_windows)
+        abort = threading.Event()
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ingest") as pool:
+            for spec in series:
+                pool.submit(self._produce, progress[spec.key], prepare, out, abort)
+            try:
+                self._drain(out, progress, len(series), write, finish)
+            except BaseException:
+                abort.set()
+                for p in progress.values():
+                    p.stopped.set()
+                raise
+
+        logger.info(
+            f"Ingest scheduler: {len(series)} series, {self.limiter.acquired} requests, "
+            f"{sum(p.rate_limited for p in progress.values())} rate-limited, "
+            f"{time.perf_counter() - started:.2f}s"
+        )
+        return [progress[s.key] for s in series]
+
+    @staticmethod
+    def _drain(
+        out: "queue.Queue",
+        progress: Dict[Tuple[str, str], SeriesProgress],
+        remaining: int,
+        write: WriteFn,
+        finish: Optional[FinishFn],
+    ) -> None:
+        """Writer loop: apply windows in arrival (= per-series) order until all series finish."""
+        while remaining:
+            item = out.get()
+            p = progress[item.spec.key]
+            if isinstance(item, _SeriesDone):
+                remaining -= 1
+                if finish is not None:
+                    finish(item.spec, p)
+                continue
+            if p.stopped.is_set():
+                continue
+            try:
+                write(item.spec, item.payload, item.from_ts, item.to_ts)
+            except Exception as e:  # noqa: BLE001 - reported per series
+                logger.error(f"Write failed for {item.spec.symbol} {item.spec.granularity}: {e}")
+                p.success = False
+                p.error = str(e)
+                p.stopped.set()
+                continue
+            p.windows_written += 1
+            p.cursor = item.next_cursor
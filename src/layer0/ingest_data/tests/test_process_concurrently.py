@@ -0,0 +1,105 @@
+"""process_concurrently tests with a fake fetcher, limiter and upsert (no DB/network)."""
+from __future__ import annotations
+
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("oandapyV20")
+
+# The module opens oanda_ingest.log in the working directory at import; keep it out of the checkout.
+_cwd = os.getcwd()
+os.chdir(tempfile.mkdtemp(prefix="oanda_ingest_test_"))
+try:
+    from src.layer0.ingest_data import ingest_oanda_prices as iop  # noqa: E402
+finally:
+    os.chdir(_cwd)
+from src.layer0.ingest_data.ingest_scheduler import FetchResult  # noqa: E402
+
+H4 = timedelta(hours=4)
+
+
+class FakeLimiter:
+    def __init__(self):
+        self.acquired = 0
+
+    def acquire(self) -> float:
+        self.acquired += 1
+        return 0.0
+
+    def pause(self, seconds: float) -> None:
+        pass
+
+
+class FakeFetcher:
+    """Complete H4 bid/ask candles for [from, to); windows starting in ``fail_from`` get HTTP 400."""
+
+    def __init__(self, fail_from=()):
+        self.fail_from = set(fail_from)
+        self.calls = []
+
+    def __call__(self, instrument, granularity, from_ts, to_ts):
+        self.calls.append((instrument, from_ts))
+        if (instrument, from_ts) in self.fail_from:
+            return FetchResult([], 400)
+        quote = {"o": "1.0", "h": "1.2", "l": "0.9", "c": "1.1"}
+        candles, t = [], from_ts
+        while t < to_ts:
+            candles.append({
+                "time": t.strftime("%Y-%m-%dT%H:%M:%S.000000000Z"),
+                "complete": True,
+                "volume": 5,
+                "bid": quote,
+                "ask": quote,
+            })
+            t += H4
+        return FetchResult(candles, 200)
+
+
+class FakeConn:
+    def rollback(self):
+        pass
+
+
+ASSETS = [{"Asset_ID": 1, "Symbol": "EUR_USD"}, {"Asset_ID": 2, "Symbol": "GBP_USD"}]
+
+
+@pytest.fixture
+def upserted(monkeypatch):
+    rows = []
+    start = (datetime.utcnow() - timedelta(days=90)).replace(hour=0, minute=0, second=0, microsecond=0)
+    monkeypatch.setitem(iop.CONFIG.CHUNK_DAYS, "H4", 30)
+    monkeypatch.setattr(iop, "get_resume_timestamp", lambda conn, asset_id, g: start)
+    monkeypatch.setattr(iop, "upsert_batch", lambda conn, batch: (rows.extend(batch), (len(batch), 0))[1])
+    return start, rows
+
+
+def test_failed_window_stops_series_after_flushing_earlier_windows(upserted):
+    start, rows = upserted
+    fetcher = FakeFetcher(fail_from={("EUR_USD", start + timedelta(days=30))})
+    limiter = FakeLimiter()
+
+    results = iop.process_concurrently(FakeConn(), {}, ASSETS, ["H4"], workers=2, fetcher=fetcher, limiter=limiter)
+    eur, gbp = results  # assets x granularities order
+
+    assert (eur.symbol, gbp.symbol) == ("EUR_USD", "GBP_USD")
+    assert not eur.success and eur.failed_windows == 1 and "failed window" in eur.error_message
+    assert gbp.success and gbp.failed_windows == 0 and gbp.error_message is None
+    # EUR_USD keeps only its first window, so resume from MAX(Timestamp) stays contiguous.
+    eur_times = [r[1] for r in rows if r[0] == 1]
+    assert eur.rows_inserted == len(eur_times) == 30 * 6
+    assert max(eur_times) < start + timedelta(days=30)
+    assert gbp.rows_inserted == sum(1 for r in rows if r[0] == 2) > eur.rows_inserted
+    assert limiter.acquired == len(fetcher.calls) == eur.api_requests + gbp.api_requests
+
+
+def test_up_to_date_series_is_not_fetched(upserted, monkeypatch):
+    monkeypatch.setattr(iop, "get_resume_timestamp", lambda conn, asset_id, g: datetime.utcnow())
+    fetcher = FakeFetcher()
+
+    results = iop.process_concurrently(FakeConn(), {}, ASSETS, ["H4"], fetcher=fetcher, limiter=FakeLimiter())
+
+    assert all(r.success and r.api_requests == 0 for r in results)
+    assert fetcher.calls == []
@@ -0,0 +1,427 @@
+"""
+Parallel, resumable execution of strategy qualification units.
+
+Qualification used to loop strategies × assets × granularities (× parameter
+candidates) serially on one core and rewrite the whole result list to JSON after
+each strategy. The work is split here into independent *units* — one
+(strategy, asset, granularity) backtest/optimisation each — and:
+
+  * units run on a process pool. Price frames are published once by
+    :class:`FrameStore` as memory-mapped ``.npy`` column files (under ``/dev/shm``
+    when available, i.e. shared memory); workers map them read-only and rebuild
+    zero-copy DataFrames, so frames are never pickled per task,
+  * every finished unit is appended (one JSON line, fsync'd) to a
+    :class:`CheckpointStore`. A killed run resumes by skipping units already in
+    the store; records are only reused when the run settings, the strategy's
+    config and parameters, and the price frame (bar count and first/last bar) are
+    unchanged.
+
+Results are keyed by unit, so the assembled output does not depend on the order
+in which workers finish.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = os.cpu_count() or 1
+SHARED_MEMORY_DIR = "/dev/shm"
+
+Frames = Dict[str, Dict[str, pd.DataFrame]]
+UnitKey = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class QualificationUnit:
+    """One (strategy, asset, granularity) qualification run."""
+
+    strategy_name: str
+    symbol: str
+    granularity: str
+
+    @property
+    def key(self) -> UnitKey:
+        return (self.strategy_name, self.symbol, self.granularity)
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """Cheap identity of a price frame: bar count and first/last bar timestamps."""
+    if len(df) == 0:
+        return "0"
+    return f"{len(df)}:{df.index[0]}:{df.index[-1]}"
+
+
+def settings_key(settings: Dict[str, Any]) -> str:
+    """Stable hash of the run settings a unit result depends on."""
+    blob = json.dumps(settings, sort_keys=True, default=str)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+
+# StrategyBase attributes filled while backtesting; they are not parameters.
+_STRATEGY_RUNTIME_STATE = frozenset({"indicators", "signals", "trades", "data"})
+
+
+def strategy_fingerprint(strategy: Any) -> str:
+    """Stable hash of a strategy's class, config and parameter attributes."""
+    params = {
+        k: v for k, v in vars(strategy).items()
+        if k not in _STRATEGY_RUNTIME_STATE and not k.startswith("_")
+    }
+    blob = json.dumps(
+        {"class": type(strategy).__qualname__, "params": params},
+        sort_keys=True, default=_param_default,
+    )
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def _param_default(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    return _json_default(value)
+
+
+# ---------------------------------------------------------------------------
+# Shared read-only price frames
+# ---------------------------------------------------------------------------
+
+
+class FrameStore:
+    """
+    Price frames published as memory-mapped column files.
+
+    ``FrameStore.publish(frames)`` writes each (symbol, granularity) frame as one
+    ``.npy`` file per column plus the index and a small JSON manifest;
+    ``FrameStore(root)`` (in any process) maps them back read-only. Mapped pages
+    live once in the OS page cache however many workers read them.
+
+    Example:
+        store = FrameStore.publish(preloaded_data)
+        try:
+            df = FrameStore(store.root).frame("EUR_USD", "H1")
+        finally:
+            store.close()
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, root: str, owner: bool = False):
+        self.root = root
+        self._owner = owner
+        with open(Path(root) / self.MANIFEST) as f:
+            self._manifest: Dict[str, Dict[str, Any]] = json.load(f)
+        self._frames: Dict[Tuple[str, str], pd.DataFrame] = {}
+
+    @classmethod
+    def publish(cls, frames: Frames, base_dir: Optional[str] = None) -> "FrameStore":
+        """Write ``frames`` ({symbol: {granularity: df}}) and return the owning store."""
+        if base_dir is None and os.path.isdir(SHARED_MEMORY_DIR):
+            base_dir = SHARED_MEMORY_DIR
+        root = tempfile.mkdtemp(prefix="qualify_frames_", dir=base_dir)
+        manifest: Dict[str, Dict[str, Any]] = {}
+        try:
+            for symbol, by_gran in frames.items():
+                for gran, df in by_gran.items():
+                    name = f"{len(manifest):04d}"
+                    manifest[f"{symbol}|{gran}"] = cls._write_frame(Path(root), name, df)
+            with open(Path(root) / cls.MANIFEST, "w") as f:
+                json.dump(manifest, f)
+        except Exception:
+            shutil.rmtree(root, ignore_errors=True)
+            raise
+        return cls(root, owner=True)
+
+    @staticmethod
+    def _write_frame(root: Path, name: str, df: pd.DataFrame) -> Dict[str, Any]:
+        index = df.index
+        entry: Dict[str, Any] = {
+            "columns": [str(c) for c in df.columns],
+            "index_name": index.name,
+            "index_tz": None,
+            "index_freq": getattr(index, "freqstr", None),
+        }
+        if isinstance(index, pd.DatetimeIndex) and index.tz is not None:
+            # tz-aware indexes are stored as naive UTC plus the zone name
+            entry["index_tz"] = str(index.tz)
+            index_values = index.tz_convert("UTC").tz_localize(None).to_numpy()
+        else:
+            index_values = index.to_numpy()
+        np.save(root / f"{name}.index.npy", index_values, allow_pickle=index_values.dtype == object)
+        for i, column in enumerate(df.columns):
+            values = df[column].to_numpy()
+            np.save(root / f"{name}.{i}.npy", values, allow_pickle=values.dtype == object)
+        entry["name"] = name
+        return entry
+
+    @staticmethod
+    def _load(path: Path) -> np.ndarray:
+        try:
+            # plain ndarray view of the read-only mapping (pandas would keep the memmap subclass)
+            return np.asarray(np.load(path, mmap_mode="r"))
+        except ValueError:  # object dtype cannot be memory-mapped
+            return np.load(path, allow_pickle=True)
+
+    def keys(self) -> List[Tuple[str, str]]:
+        return [tuple(k.split("|", 1)) for k in self._manifest]  # type: ignore[misc]
+
+    def frame(self, symbol: str, granularity: str) -> pd.DataFrame:
+        """Zero-copy, read-only DataFrame for one published frame (cached per process)."""
+        cached = self._frames.get((symbol, granularity))
+        if cached is not None:
+            return cached
+        entry = self._manifest[f"{symbol}|{granularity}"]
+        root = Path(self.root)
+        index_values = self._load(root / f"{entry['name']}.index.npy")
+        if np.issubdtype(index_values.dtype, np.datetime64):
+            index = pd.DatetimeIndex(index_values, name=entry["index_name"])
+            if entry["index_tz"] is not None:
+                index = index.tz_localize("UTC").tz_convert(entry["index_tz"])
+            if entry.get("index_freq"):
+                index.freq = entry["index_freq"]
+        else:
+            index = pd.Index(index_values, name=entry["index_name"])
+        columns = {
+            column: self._load(root / f"{entry['name']}.{i}.npy")
+            for i, column in enumerate(entry["columns"])
+        }
+        df = pd.DataFrame(columns, index=index, copy=False)
+        self._frames[(symbol, granularity)] = df
+        return df
+
+    def close(self) -> None:
+        """Drop cached frames; the publishing store also removes the files."""
+        self._frames.clear()
+        if self._owner:
+            shutil.rmtree(self.root, ignore_errors=True)
+
+
+# ---------------------------------------------------------------------------
+# Append-only unit checkpoint
+# ---------------------------------------------------------------------------
+
+
+class CheckpointStore:
+    """
+    Append-only JSON-lines log of finished qualification units.
+
+    Each completed unit is one line ``{"run", "unit", "frame", "strategy",
+    "completed_at", "result"}`` written and fsync'd as soon as the unit finishes, so a run killed
+    at any point loses at most the units in flight. A torn last line (killed
+    mid-write) is ignored on load.
+    """
+
+    def __init__(self, path: str, run_key: str, resume: bool = True):
+        self.path = Path(path)
+        self.run_key = run_key
+        self._done: Dict[UnitKey, Tuple[str, str, Dict[str, Any]]] = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume:
+            self._load()
+        elif self.path.exists():
+            self.path.unlink()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with open(self.path) as f:
+            for line_no, line in enumerate(f, start=1):
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring unreadable checkpoint line {line_no} in {self.path}")
+                    continue
+                if record.get("run") != self.run_key:
+                    continue
+                self._done[tuple(record["unit"])] = (  # type: ignore[index]
+                    record.get("frame"), record.get("strategy"), record["result"],
+                )
+        if self._done:
+            logger.info(f"Checkpoint {self.path}: {len(self._done)} completed units reusable")
+
+    def get(self, unit: QualificationUnit, frame: str, strategy: str = "") -> Optional[Dict[str, Any]]:
+        """Checkpointed result for ``unit`` if it was computed on the same frame and strategy."""
+        hit = self._done.get(unit.key)
+        if hit is None or hit[0] != frame or hit[1] != strategy:
+            return None
+        return hit[2]
+
+    def append(
+        self, unit: QualificationUnit, frame: str, result: Dict[str, Any], strategy: str = ""
+    ) -> None:
+        record = {
+            "run": self.run_key,
+            "unit": list(unit.key),
+            "frame": frame,
+            "strategy": strategy,
+            "completed_at": datetime.now().isoformat(),
+            "result": result,
+        }
+        line = json.dumps(record, default=_json_default)
+        with open(self.path, "a") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._done[unit.key] = (frame, strategy, json.loads(line)["result"])
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+
+# ---------------------------------------------------------------------------
+# Execution
+# ---------------------------------------------------------------------------
+
+# Per-worker-process frame store, mapped once by the pool initializer.
+_worker_frames: Optional[FrameStore] = None
+
+
+def _init_worker(frames_root: str) -> None:
+    global _worker_frames
+    _worker_frames = FrameStore(frames_root)
+
+
+def _run_unit_in_worker(
+    evaluate: Callable[..., Dict[str, Any]],
+    strategy: Any,
+    symbol: str,
+    granularity: str,
+    settings: Dict[str, Any],
+) -> Dict[str, Any]:
+    assert _worker_frames is not None, "worker not initialised"
+    df = _worker_frames.frame(symbol, granularity)
+    return evaluate(strategy, df, symbol, granularity, **settings)
+
+
+def run_units(
+    strategies: Dict[str, Any],
+    units: Iterable[QualificationUnit],
+    frames: Frames,
+    evaluate: Callable[..., Dict[str, Any]],
+    settings: Dict[str, Any],
+    checkpoint: Optional[CheckpointStore] = None,
+    workers: Optional[int] = None,
+    frames_dir: Optional[str] = None,
+) -> Tuple[Dict[UnitKey, Dict[str, Any]], Dict[UnitKey, Exception]]:
+    """
+    Evaluate qualification units, reusing checkpointed ones.
+
+    ``evaluate(strategy, df, symbol, granularity, **settings)`` must be a
+    module-level (picklable) function returning a JSON-serialisable dict.
+
+    Args:
+        strategies: Strategy instances by name (pickled once per task; they are small)
+        units: Units to evaluate; units whose frame is missing are skipped
+        frames: Preloaded price frames {symbol: {granularity: df}}
+        evaluate: Unit evaluation function
+        settings: Keyword settings passed to ``evaluate``
+        checkpoint: Append-only store; finished units are appended as they complete
+            and reused only while ``strategy_fingerprint`` of their strategy matches
+        workers: Worker processes (default: all cores); ``<= 1`` runs in-process
+        frames_dir: Where to publish shared frames (default ``/dev/shm`` or tmp)
+
+    Returns:
+        ``(results, errors)`` keyed by ``unit.key``. Failed units are not
+        checkpointed, so a resumed run retries them.
+    """
+    workers = int(workers if workers is not None else os.environ.get("QUALIFY_WORKERS", DEFAULT_WORKERS))
+    results: Dict[UnitKey, Dict[str, Any]] = {}
+    errors: Dict[UnitKey, Exception] = {}
+    pending: List[Tuple[QualificationUnit, str]] = []
+    strategy_keys = {name: strategy_fingerprint(s) for name, s in strategies.items()}
+
+    for unit in units:
+        df = frames.get(unit.symbol, {}).get(unit.granularity)
+        if df is None:
+            continue
+        fingerprint = frame_fingerprint(df)
+        cached = (
+            checkpoint.get(unit, fingerprint, strategy_keys[unit.strategy_name])
+            if checkpoint is not None else None
+        )
+        if cached is not None:
+            results[unit.key] = cached
+        else:
+            pending.append((unit, fingerprint))
+
+    total = len(results) + len(pending)
+    logger.info(
+        f"Qualification units: {total} total, {len(results)} from checkpoint, "
+        f"{len(pending)} to run on {max(1, min(workers, len(pending) or 1))} worker(s)"
+    )
+
+    def _record(unit: QualificationUnit, fingerprint: str, result: Dict[str, Any]) -> None:
+        if checkpoint is not None:
+            checkpoint.append(unit, fingerprint, result, strategy_keys[unit.strategy_name])
+        results[unit.key] = result
+        logger.info(f"Unit done ({len(results)}/{total}): {unit.strategy_name} {unit.symbol} {unit.granularity}")
+
+    def _fail(unit: QualificationUnit, exc: Exception) -> None:
+        errors[unit.key] = exc
+        logger.error(f"Unit failed: {unit.strategy_name} {unit.symbol} {unit.granularity}: {exc}")
+
+    if workers <= 1 or len(pending) <= 1:
+        for unit, fingerprint in pending:
+            try:
+                result = evaluate(
+                    strategies[unit.strategy_name], frames[unit.symbol][unit.granularity],
+                    unit.symbol, unit.granularity, **settings,
+                )
+            except Exception as e:
+                _fail(unit, e)
+                continue
+            _record(unit, fingerprint, result)
+        return results, errors
+
+    needed = {u.symbol: {} for u, _ in pending}
+    for unit, _ in pending:
+        needed[unit.symbol][unit.granularity] = frames[unit.symbol][unit.granularity]
+    store = FrameStore.publish(needed, base_dir=frames_dir)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(pending)),
+            initializer=_init_worker,
+            initargs=(store.root,),
+        ) as pool:
+            futures = {
+                pool.submit(
+                    _run_unit_in_worker, evaluate, strategies[unit.strategy_name],
+                    unit.symbol, unit.granularity, settings,
+                ): (unit, fingerprint)
+                for unit, fingerprint in pending
+            }
+            for future in as_completed(futures):
+                unit, fingerprint = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    _fail(unit, e)
+                    continue
+                _record(unit, fingerprint, result)
+    finally:
+        store.close()
+    return results, errors
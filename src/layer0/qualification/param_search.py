@@ -0,0 +1,117 @@
+"""
+Successive-halving parameter search over walk-forward windows.
+
+Exhaustive optimisation scores every grid candidate on every walk-forward window.
+Successive halving treats windows as the budget instead: every candidate is
+scored on the first window(s), the best ``1/eta`` survive to the next rung, which
+adds more windows, and only the final survivors are scored on all of them.
+Windows are independent out-of-sample backtests, so a candidate's window results
+are computed once and reused across rungs.
+
+Budget is counted in window backtests and reported next to the exhaustive cost
+(``candidates × windows``).
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Sequence
+
+DEFAULT_ETA = 3
+
+
+@dataclass
+class SearchResult:
+    """Outcome of a parameter search over ``n_candidates`` grid points."""
+
+    best_index: int
+    best_score: float
+    best_window_metrics: List[Any]
+    window_backtests: int
+    exhaustive_window_backtests: int
+    rungs: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def budget_fraction(self) -> float:
+        if not self.exhaustive_window_backtests:
+            return 0.0
+        return self.window_backtests / self.exhaustive_window_backtests
+
+
+def halving_schedule(n_candidates: int, n_windows: int, eta: int = DEFAULT_ETA) -> List[int]:
+    """
+    Cumulative window counts per rung, ending with ``n_windows``.
+
+    One rung per factor of ``eta`` in the candidate count, with the window budget
+    growing by ``eta`` per rung (rounded up, at least one window; repeated
+    budgets collapse into one rung).
+    """
+    if eta < 2:
+        raise ValueError(f"eta must be >= 2, got {eta}")
+    if n_windows < 1:
+        return []
+    rungs = 0
+    while eta ** (rungs + 1) <= n_candidates:
+        rungs += 1
+    budgets: List[int] = []
+    for k in range(rungs, -1, -1):
+        b = min(n_windows, max(1, math.ceil(n_windows / eta ** k)))
+        if not budgets or b > budgets[-1]:
+            budgets.append(b)
+    if budgets[-1] != n_windows:
+        budgets.append(n_windows)
+    return budgets
+
+
+def successive_halving(
+    n_candidates: int,
+    n_windows: int,
+    evaluate: Callable[[int, Sequence[int]], List[Any]],
+    score: Callable[[List[Any]], float],
+    eta: int = DEFAULT_ETA,
+) -> SearchResult:
+    """
+    Successive halving over walk-forward windows.
+
+    Args:
+        n_candidates: Number of grid candidates (indexed ``0..n-1``)
+        n_windows: Walk-forward windows available per candidate
+        evaluate: ``evaluate(candidate, window_indices)`` -> per-window metrics
+        score: Ranking score of a candidate's window metrics so far (higher is better)
+        eta: Keep the best ``1/eta`` of candidates after each rung
+
+    Returns:
+        SearchResult; ties are broken by grid order, as in exhaustive search
+    """
+    if n_candidates < 1:
+        raise ValueError("successive_halving needs at least one candidate")
+    metrics: Dict[int, List[Any]] = {i: [] for i in range(n_candidates)}
+    survivors = list(range(n_candidates))
+    used = 0
+    done = 0
+    rungs: List[Dict[str, Any]] = []
+    ranked = survivors
+    scores: Dict[int, float] = {}
+
+    for budget in halving_schedule(n_candidates, n_windows, eta):
+        windows = list(range(done, budget))
+        for i in survivors:
+            metrics[i].extend(evaluate(i, windows))
+        used += len(survivors) * len(windows)
+        done = budget
+        scores = {i: score(metrics[i]) for i in survivors}
+        ranked = sorted(survivors, key=lambda i: -scores[i])  # stable: grid order on ties
+        rungs.append({'windows': budget, 'candidates': len(survivors), 'best_score': scores[ranked[0]]})
+        if budget < n_windows:
+            survivors = sorted(ranked[:max(1, math.ceil(len(survivors) / eta))])
+
+    best = ranked[0]
+    return SearchResult(
+        best_index=best,
+        best_score=scores.get(best, score(metrics[best])),
+        best_window_metrics=metrics[best],
+        window_backtests=used,
+        exhaustive_window_backtests=n_candidates * n_windows,
+        rungs=rungs,
+    )
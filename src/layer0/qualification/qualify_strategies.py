@@ -16,7 +16,12 @@ Usage:
     python qualify_strategies.py --granularities H4 H1
     python qualify_strategies.py --output-dir ./results
     python qualify_strategies.py --use-db --env-file /path/to/.env
-    
+    python qualify_strategies.py --no-bypass-qualification --workers 16
+    python qualify_strategies.py --no-bypass-qualification --no-resume
+
+Units (strategy x asset x granularity) run on a process pool and are checkpointed
+to <output-dir>/qualification_units.jsonl; re-running after a crash resumes.
+
 Bypass Mode (map ALL strategies to ALL assets without backtests):
     python qualify_strategies.py --bypass-qualification --no-use-db
     python qualify_strategies.py --bypass-qualification --use-db --env-file /path/to/.env
@@ -48,7 +53,9 @@ from ..core_engine.backtest_engine import BacktestEngine, BacktestConfig, Backte
 from ..core_engine.strategy_analyzer import StrategyAnalyzer, StrategyMetrics
 from ..core_engine.multi_timeframe import MultiTimeframeEngine, create_mtf_config
 from ..data_access import data_loader
+from ..data_access.indicators import INDICATOR_CACHE
 from ..promotion import layer2_config_adapter
+from . import param_search, parallel_runner
 
 # Import strategies
 from ..strategies import (
@@ -208,6 +215,38 @@ def _score_metrics(metrics_list: List[StrategyMetrics]) -> float:
     return score
 
 
+def _walk_forward_sizes(total_bars: int, wf_train_bars: int, wf_test_bars: int) -> Tuple[int, int]:
+    """Train/test window sizes for walk-forward scoring on ``total_bars`` bars."""
+    test_bars = max(150, wf_test_bars)
+    train_bars = max(400, wf_train_bars)
+
+    if total_bars < (train_bars + test_bars):
+        train_bars = max(300, int(total_bars * 0.65))
+        test_bars = max(100, int(total_bars * 0.2))
+    return train_bars, test_bars
+
+
+def _walk_forward_diagnostics(window_metrics: List[StrategyMetrics], score: float) -> Dict[str, Any]:
+    valid_windows = [m for m in window_metrics if m.total_trades > 0]
+    return {
+        'windows_total': len(window_metrics),
+        'windows_with_trades': len(valid_windows),
+        'avg_expectancy_r': float(np.mean([m.expectancy_r for m in valid_windows])) if valid_windows else 0.0,
+        'avg_profit_factor': float(np.mean([m.profit_factor for m in valid_windows])) if valid_windows else 0.0,
+        'avg_drawdown_pct': float(np.mean([m.max_drawdown_pct for m in valid_windows])) if valid_windows else 0.0,
+        'score': score,
+    }
+
+
+def _with_params(strategy: StrategyBase, params: Dict[str, Any]) -> StrategyBase:
+    """Deep copy of ``strategy`` with ``params`` applied to matching attributes."""
+    candidate = copy.deepcopy(strategy)
+    for k, v in params.items():
+        if hasattr(candidate, k):
+            setattr(candidate, k, v)
+    return candidate
+
+
 def _evaluate_candidate_walk_forward(
     strategy_candidate: StrategyBase,
     df: pd.DataFrame,
@@ -218,17 +257,11 @@ def _evaluate_candidate_walk_forward(
     wf_windows: int,
     wf_train_bars: int,
     wf_test_bars: int,
+    window_indices: Optional[List[int]] = None,
 ) -> Tuple[float, Dict[str, Any]]:
     """Run rolling walk-forward for one candidate and return ranking score + diagnostics."""
     engine = BacktestEngine(BacktestConfig(initial_capital=initial_capital))
-
-    total_bars = len(df)
-    test_bars = max(150, wf_test_bars)
-    train_bars = max(400, wf_train_bars)
-
-    if total_bars < (train_bars + test_bars):
-        train_bars = max(300, int(total_bars * 0.65))
-        test_bars = max(100, int(total_bars * 0.2))
+    train_bars, test_bars = _walk_forward_sizes(len(df), wf_train_bars, wf_test_bars)
 
     wf_results = engine.run_walk_forward_analysis(
         strategy=strategy_candidate,
@@ -238,20 +271,13 @@ def _evaluate_candidate_walk_forward(
         train_size=train_bars,
         test_size=test_bars,
         n_windows=wf_windows,
+        window_indices=window_indices,
     )
 
     window_metrics = [analyzer.analyze(r, initial_capital) for r in wf_results]
     score = _score_metrics(window_metrics)
-    valid_windows = [m for m in window_metrics if m.total_trades > 0]
-
-    diagnostics = {
-        'windows_total': len(window_metrics),
-        'windows_with_trades': len(valid_windows),
-        'avg_expectancy_r': float(np.mean([m.expectancy_r for m in valid_windows])) if valid_windows else 0.0,
-        'avg_profit_factor': float(np.mean([m.profit_factor for m in valid_windows])) if valid_windows else 0.0,
-        'avg_drawdown_pct': float(np.mean([m.max_drawdown_pct for m in valid_windows])) if valid_windows else 0.0,
-        'score': score,
-    }
+    diagnostics = _walk_forward_diagnostics(window_metrics, score)
+    diagnostics['window_metrics'] = window_metrics
     return score, diagnostics
 
 
@@ -266,55 +292,101 @@ def _optimize_strategy_parameters(
     wf_train_bars: int,
     wf_test_bars: int,
     max_param_combos: int,
+    search: str = "grid",
+    halving_eta: int = param_search.DEFAULT_ETA,
 ) -> Tuple[StrategyBase, Dict[str, Any]]:
-    """Select best parameter set via walk-forward scoring and return tuned strategy copy."""
+    """
+    Select best parameter set via walk-forward scoring and return tuned strategy copy.
+
+    ``search="grid"`` scores every candidate on every window, stride-subsampling
+    grids larger than ``max_param_combos``. ``search="halving"`` keeps the whole
+    grid and runs successive halving over the walk-forward windows (see
+    ``param_search``); ``max_param_combos`` does not apply.
+    """
     candidates = _param_grid_for_strategy(strategy.config.name, granularity)
     if not candidates:
         return copy.deepcopy(strategy), {'optimized': False, 'reason': 'no_grid'}
+    if search not in ("grid", "halving"):
+        raise ValueError(f"Unknown parameter search '{search}' (expected 'grid' or 'halving')")
 
-    # Keep runtime predictable on large grids.
-    if len(candidates) > max_param_combos:
-        step = max(1, len(candidates) // max_param_combos)
-        candidates = candidates[::step][:max_param_combos]
+    grid_size = len(candidates)
 
-    best_score = -1e18
-    best_params: Dict[str, Any] = {}
-    best_diag: Dict[str, Any] = {}
+    if search == "halving":
+        candidate_strategies: Dict[int, StrategyBase] = {}
 
-    for params in candidates:
-        candidate_strategy = copy.deepcopy(strategy)
-        for k, v in params.items():
-            if hasattr(candidate_strategy, k):
-                setattr(candidate_strategy, k, v)
+        def evaluate(i: int, windows: List[int]) -> List[StrategyMetrics]:
+            if i not in candidate_strategies:
+                candidate_strategies[i] = _with_params(strategy, candidates[i])
+            _, diag = _evaluate_candidate_walk_forward(
+                strategy_candidate=candidate_strategies[i],
+                df=df,
+                asset=asset,
+                granularity=granularity,
+                analyzer=analyzer,
+                initial_capital=initial_capital,
+                wf_windows=wf_windows,
+                wf_train_bars=wf_train_bars,
+                wf_test_bars=wf_test_bars,
+                window_indices=windows,
+            )
+            return diag['window_metrics']
 
-        score, diag = _evaluate_candidate_walk_forward(
-            strategy_candidate=candidate_strategy,
-            df=df,
-            asset=asset,
-            granularity=granularity,
-            analyzer=analyzer,
-            initial_capital=initial_capital,
-            wf_windows=wf_windows,
-            wf_train_bars=wf_train_bars,
-            wf_test_bars=wf_test_bars,
+        result = param_search.successive_halving(
+            len(candidates), wf_windows, evaluate, _score_metrics, eta=halving_eta,
         )
+        best_params = candidates[result.best_index]
+        best_score = result.best_score
+        best_diag = _walk_forward_diagnostics(result.best_window_metrics, best_score)
+        budget = {
+            'window_backtests': result.window_backtests,
+            'exhaustive_window_backtests': result.exhaustive_window_backtests,
+            'budget_fraction': round(result.budget_fraction, 4),
+            'rungs': result.rungs,
+        }
+    else:
+        # Keep runtime predictable on large grids.
+        if len(candidates) > max_param_combos:
+            step = max(1, len(candidates) // max_param_combos)
+            candidates = candidates[::step][:max_param_combos]
+
+        best_score = -1e18
+        best_params = {}
+        best_diag = {}
+
+        for params in candidates:
+            score, diag = _evaluate_candidate_walk_forward(
+                strategy_candidate=_with_params(strategy, params),
+                df=df,
+                asset=asset,
+                granularity=granularity,
+                analyzer=analyzer,
+                initial_capital=initial_capital,
+                wf_windows=wf_windows,
+                wf_train_bars=wf_train_bars,
+                wf_test_bars=wf_test_bars,
+            )
+            diag.pop('window_metrics')
 
-        if score > best_score:
-            best_score = score
-            best_params = params
-            best_diag = diag
+            if score > best_score:
+                best_score = score
+                best_params = params
+                best_diag = diag
 
-    tuned_strategy = copy.deepcopy(strategy)
-    for k, v in best_params.items():
-        if hasattr(tuned_strategy, k):
-            setattr(tuned_strategy, k, v)
+        budget = {
+            'window_backtests': len(candidates) * wf_windows,
+            'exhaustive_window_backtests': grid_size * wf_windows,
+            'budget_fraction': round(len(candidates) / grid_size, 4),
+        }
 
-    return tuned_strategy, {
+    return _with_params(strategy, best_params), {
         'optimized': True,
+        'search': search,
         'best_params': best_params,
         'best_score': best_score,
         'walk_forward': best_diag,
         'candidates_tested': len(candidates),
+        'grid_size': grid_size,
+        'budget': budget,
     }
 
 
@@ -484,6 +556,8 @@ def run_strategy_qualification(
     wf_train_bars: int = 1200,
     wf_test_bars: int = 300,
     max_param_combos: int = 30,
+    param_search_mode: str = "grid",
+    halving_eta: int = param_search.DEFAULT_ETA,
 ) -> Dict[str, Any]:
     """
     Run qualification for a single strategy across assets and timeframes.
@@ -505,16 +579,6 @@ def run_strategy_qualification(
     logger.info(f"Qualifying Strategy: {strategy.config.name}")
     logger.info(f"{'='*60}")
     
-    results = {
-        'strategy_name': strategy.config.name,
-        'description': strategy.config.description,
-        'assets_tested': [],
-        'granularities_tested': [],
-        'asset_results': {},
-        'overall_qualified': False,
-        'qualification_reason': ""
-    }
-    
     if preloaded_data is not None:
         all_data = preloaded_data
     else:
@@ -529,80 +593,164 @@ def run_strategy_qualification(
             lookback_years=lookback_years,
         )
     
+    unit_results: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for symbol in asset_symbols:
+        for gran in granularities:
+            if gran not in all_data.get(symbol, {}):
+                continue
+            unit_results[(symbol, gran)] = qualify_unit(
+                strategy,
+                all_data[symbol][gran],
+                symbol,
+                gran,
+                initial_capital=initial_capital,
+                optimize_params=optimize_params,
+                wf_windows=wf_windows,
+                wf_train_bars=wf_train_bars,
+                wf_test_bars=wf_test_bars,
+                max_param_combos=max_param_combos,
+                param_search_mode=param_search_mode,
+                halving_eta=halving_eta,
+            )
+
+    return assemble_strategy_result(
+        strategy, asset_symbols, granularities, unit_results, list(all_data.keys())
+    )
+
+
+def qualify_unit(
+    strategy: StrategyBase,
+    df: pd.DataFrame,
+    symbol: str,
+    gran: str,
+    initial_capital: float = 100000.0,
+    optimize_params: bool = False,
+    wf_windows: int = 4,
+    wf_train_bars: int = 1200,
+    wf_test_bars: int = 300,
+    max_param_combos: int = 30,
+    param_search_mode: str = "grid",
+    halving_eta: int = param_search.DEFAULT_ETA,
+) -> Dict[str, Any]:
+    """
+    Qualify one strategy on one asset+granularity frame.
+
+    This is the unit of work of the parallel runner, so it only takes picklable
+    arguments and returns a JSON-serialisable dict.
+
+    Returns:
+        ``{'metrics': ..., 'trades': ..., 'optimization': ...}``
+    """
     backtest_engine = BacktestEngine(BacktestConfig(initial_capital=initial_capital))
     analyzer = StrategyAnalyzer()
-    
-    all_metrics = []
+
+    # Create a fresh deep copy for each asset+granularity pair to prevent
+    # any state leakage between runs (e.g., cached indicators, mutable state)
+    strategy_for_run = copy.deepcopy(strategy)
+    optimization_info: Dict[str, Any] = {'optimized': False}
+
+    if optimize_params:
+        strategy_for_run, optimization_info = _optimize_strategy_parameters(
+            strategy=strategy,
+            df=df,
+            asset=symbol,
+            granularity=gran,
+            analyzer=analyzer,
+            initial_capital=initial_capital,
+            wf_windows=wf_windows,
+            wf_train_bars=wf_train_bars,
+            wf_test_bars=wf_test_bars,
+            max_param_combos=max_param_combos,
+            search=param_search_mode,
+            halving_eta=halving_eta,
+        )
+        if optimization_info.get('optimized'):
+            logger.info(
+                f"  Optimized {symbol} {gran}: {optimization_info.get('best_params')} "
+                f"score={optimization_info.get('best_score'):.4f} "
+                f"candidates={optimization_info.get('candidates_tested')}/{optimization_info.get('grid_size')} "
+                f"window_backtests={optimization_info['budget']['window_backtests']}"
+                f"/{optimization_info['budget']['exhaustive_window_backtests']}"
+            )
+
+    backtest_result = backtest_engine.run_backtest(
+        strategy_for_run, df, symbol, gran,
+        warmup_bars=strategy_for_run.get_required_warmup_bars()
+    )
+
+    metrics = analyzer.analyze(backtest_result, initial_capital)
+
+    logger.info(f"\n{strategy.config.name} {symbol} {gran}:")
+    logger.info(f"  Trades: {metrics.total_trades}")
+    logger.info(f"  Win Rate: {metrics.win_rate:.2%}")
+    logger.info(f"  Expectancy: {metrics.expectancy_r:.3f}R")
+    logger.info(f"  Profit Factor: {metrics.profit_factor:.3f}")
+    logger.info(f"  Qualified: {metrics.qualified}")
+    cache_stats = INDICATOR_CACHE.stats()
+    logger.info(
+        f"  Indicator cache: hit_rate={cache_stats['hit_rate']:.2%} "
+        f"({cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+        f"{cache_stats['bytes'] / 2**20:.1f} MB)"
+    )
+
+    return {
+        'metrics': metrics.to_dict(),
+        'trades': len(backtest_result.trades),
+        'optimization': optimization_info,
+    }
+
+
+def assemble_strategy_result(
+    strategy: StrategyBase,
+    asset_symbols: List[str],
+    granularities: List[str],
+    unit_results: Dict[Tuple[str, str], Dict[str, Any]],
+    assets_tested: List[str],
+) -> Dict[str, Any]:
+    """
+    Build a strategy's qualification result from its per-unit results.
+
+    Args:
+        strategy: Strategy instance
+        asset_symbols: Asset symbols in report order
+        granularities: Timeframes in report order
+        unit_results: ``qualify_unit`` results keyed by (symbol, granularity)
+        assets_tested: Symbols that had price data
+
+    Returns:
+        Dictionary with qualification results
+    """
+    results = {
+        'strategy_name': strategy.config.name,
+        'description': strategy.config.description,
+        'assets_tested': assets_tested,
+        'granularities_tested': granularities,
+        'asset_results': {},
+        'overall_qualified': False,
+        'qualification_reason': ""
+    }
+
+    all_metrics: List[Dict[str, Any]] = []
     qualified_assets = []
-    
+
     for symbol in asset_symbols:
-        if symbol not in all_data:
+        if symbol not in assets_tested:
             continue
-        
+
         asset_results = {}
-        
         for gran in granularities:
-            if gran not in all_data.get(symbol, {}):
+            unit = unit_results.get((symbol, gran))
+            if unit is None:
                 continue
-            
-            df = all_data[symbol][gran]
-            # Create a fresh deep copy for each asset+granularity pair to prevent
-            # any state leakage between runs (e.g., cached indicators, mutable state)
-            strategy_for_run = copy.deepcopy(strategy)
-            optimization_info: Dict[str, Any] = {'optimized': False}
-
-            if optimize_params:
-                strategy_for_run, optimization_info = _optimize_strategy_parameters(
-                    strategy=strategy,
-                    df=df,
-                    asset=symbol,
-                    granularity=gran,
-                    analyzer=analyzer,
-                    initial_capital=initial_capital,
-                    wf_windows=wf_windows,
-                    wf_train_bars=wf_train_bars,
-                    wf_test_bars=wf_test_bars,
-                    max_param_combos=max_param_combos,
-                )
-                if optimization_info.get('optimized'):
-                    logger.info(
-                        f"  Optimized {symbol} {gran}: {optimization_info.get('best_params')} "
-                        f"score={optimization_info.get('best_score'):.4f} "
-                        f"candidates={optimization_info.get('candidates_tested')}"
-                    )
-            
-            backtest_result = backtest_engine.run_backtest(
-                strategy_for_run, df, symbol, gran,
-                warmup_bars=strategy_for_run.get_required_warmup_bars()
-            )
-            
-            metrics = analyzer.analyze(backtest_result, initial_capital)
-            
-            asset_results[gran] = {
-                'metrics': metrics.to_dict(),
-                'trades': len(backtest_result.trades),
-                'optimization': optimization_info,
-            }
-            
-            all_metrics.append(metrics)
-            
-            logger.info(f"\n{symbol} {gran}:")
-            logger.info(f"  Trades: {metrics.total_trades}")
-            logger.info(f"  Win Rate: {metrics.win_rate:.2%}")
-            logger.info(f"  Expectancy: {metrics.expectancy_r:.3f}R")
-            logger.info(f"  Profit Factor: {metrics.profit_factor:.3f}")
-            logger.info(f"  Qualified: {metrics.qualified}")
-            
-            if metrics.qualified:
-                if symbol not in qualified_assets:
-                    qualified_assets.append(symbol)
-        
+            asset_results[gran] = unit
+            all_metrics.append(unit['metrics'])
+            if unit['metrics'].get('qualified') and symbol not in qualified_assets:
+                qualified_assets.append(symbol)
+
         results['asset_results'][symbol] = asset_results
-    
-    results['assets_tested'] = list(all_data.keys())
-    results['granularities_tested'] = granularities
+
     results['qualified_assets'] = qualified_assets
-    
+
     # Sandbox mode: promote strategy if it qualifies on any asset+granularity pair
     # Count unique asset+granularity pairs that qualified
     qualified_pairs = []
@@ -612,28 +760,112 @@ def run_strategy_qualification(
                 if gran in results['asset_results'][symbol]:
                     if results['asset_results'][symbol][gran]['metrics'].get('qualified'):
                         qualified_pairs.append(f"{symbol}_{gran}")
-    
+
     if len(qualified_pairs) >= 1:
         results['overall_qualified'] = True
         results['qualification_reason'] = f"Sandbox qualified: {len(qualified_pairs)} asset+granularity pair(s): {', '.join(qualified_pairs)}"
     else:
         results['overall_qualified'] = False
         results['qualification_reason'] = f"No asset+granularity pairs met qualification criteria"
-    
+
     if all_metrics:
-        valid_metrics = [m for m in all_metrics if m.total_trades > 0]
+        valid_metrics = [m for m in all_metrics if m['total_trades'] > 0]
         if valid_metrics:
             results['aggregate'] = {
-                'avg_win_rate': np.mean([m.win_rate for m in valid_metrics]),
-                'avg_expectancy_r': np.mean([m.expectancy_r for m in valid_metrics]),
-                'avg_profit_factor': np.mean([m.profit_factor for m in valid_metrics]),
-                'avg_max_drawdown_pct': np.mean([m.max_drawdown_pct for m in valid_metrics]),
-                'total_trades': sum([m.total_trades for m in valid_metrics]),
+                'avg_win_rate': np.mean([m['win_rate'] for m in valid_metrics]),
+                'avg_expectancy_r': np.mean([m['expectancy_r'] for m in valid_metrics]),
+                'avg_profit_factor': np.mean([m['profit_factor'] for m in valid_metrics]),
+                'avg_max_drawdown_pct': np.mean([m['max_drawdown_pct'] for m in valid_metrics]),
+                'total_trades': sum([m['total_trades'] for m in valid_metrics]),
             }
-    
+
     return results
 
 
+def run_parallel_qualification(
+    strategies: List[StrategyBase],
+    asset_symbols: List[str],
+    granularities: List[str],
+    preloaded_data: Dict[str, Dict[str, pd.DataFrame]],
+    output_dir: str,
+    workers: Optional[int] = None,
+    resume: bool = True,
+    frames_dir: Optional[str] = None,
+    initial_capital: float = 100000.0,
+    optimize_params: bool = False,
+    wf_windows: int = 4,
+    wf_train_bars: int = 1200,
+    wf_test_bars: int = 300,
+    max_param_combos: int = 30,
+    param_search_mode: str = "grid",
+    halving_eta: int = param_search.DEFAULT_ETA,
+) -> List[Dict[str, Any]]:
+    """
+    Qualify every strategy × asset × granularity unit on a process pool.
+
+    Price frames are shared with workers through memory-mapped files and each
+    finished unit is appended to ``<output_dir>/qualification_units.jsonl``; with
+    ``resume`` a restarted run skips units already recorded there for the same
+    settings, strategy parameters and price data. Per-strategy results match ``run_strategy_qualification``.
+
+    Returns:
+        List of strategy qualification results, in ``strategies`` order
+    """
+    settings = {
+        'initial_capital': initial_capital,
+        'optimize_params': optimize_params,
+        'wf_windows': wf_windows,
+        'wf_train_bars': wf_train_bars,
+        'wf_test_bars': wf_test_bars,
+        'max_param_combos': max_param_combos,
+        'param_search_mode': param_search_mode,
+        'halving_eta': halving_eta,
+    }
+    checkpoint = parallel_runner.CheckpointStore(
+        str(Path(output_dir) / "qualification_units.jsonl"),
+        run_key=parallel_runner.settings_key(settings),
+        resume=resume,
+    )
+    by_name = {s.config.name: s for s in strategies}
+    units = [
+        parallel_runner.QualificationUnit(s.config.name, symbol, gran)
+        for s in strategies
+        for symbol in asset_symbols
+        for gran in granularities
+    ]
+    unit_results, errors = parallel_runner.run_units(
+        by_name, units, preloaded_data, qualify_unit, settings,
+        checkpoint=checkpoint, workers=workers, frames_dir=frames_dir,
+    )
+
+    all_results = []
+    for strategy in strategies:
+        name = strategy.config.name
+        failed = [(k, e) for k, e in errors.items() if k[0] == name]
+        if failed:
+            (_, symbol, gran), e = failed[0]
+            logger.error(f"Error qualifying {name} on {symbol} {gran}: {e}")
+            all_results.append({
+                'strategy_name': name,
+                'description': strategy.config.description,
+                'assets_tested': [],
+                'granularities_tested': granularities,
+                'asset_results': {},
+                'overall_qualified': False,
+                'qualification_reason': f'Execution failed: {e}',
+                'status': 'failed',
+            })
+            continue
+        all_results.append(assemble_strategy_result(
+            strategy,
+            asset_symbols,
+            granularities,
+            {(symbol, gran): r for (n, symbol, gran), r in unit_results.items() if n == name},
+            list(preloaded_data.keys()),
+        ))
+    return all_results
+
+
 def preload_historical_data(
     asset_symbols: List[str],
     asset_symbol_map: Dict[str, int],
@@ -672,27 +904,6 @@ def preload_historical_data(
     return all_data
 
 
-def write_progress_checkpoint(
-    all_results: List[Dict[str, Any]],
-    output_dir: str,
-    completed: int,
-    total: int,
-) -> str:
-    """Persist rolling qualification progress so long runs have visible output."""
-    os.makedirs(output_dir, exist_ok=True)
-    checkpoint_path = Path(output_dir) / "qualification_progress.json"
-    payload = {
-        "updated_at": datetime.now().isoformat(),
-        "completed_strategies": completed,
-        "total_strategies": total,
-        "completion_pct": round((completed / total) * 100, 2) if total else 0,
-        "results": all_results,
-    }
-    with open(checkpoint_path, 'w') as f:
-        json.dump(payload, f, indent=2, default=str)
-    return str(checkpoint_path)
-
-
 def generate_qualification_report(all_results: List[Dict], output_dir: str = "./results") -> str:
     """
     Generate comprehensive qualification report.
@@ -1204,6 +1415,43 @@ def main():
         help='Max parameter combinations tested per strategy/asset/granularity (default: 30)'
     )
     
+    parser.add_argument(
+        '--param-search',
+        choices=['grid', 'halving'],
+        default='grid',
+        help='Parameter search: exhaustive/subsampled grid, or successive halving over '
+             'walk-forward windows on the full grid (default: grid)'
+    )
+
+    parser.add_argument(
+        '--halving-eta',
+        type=int,
+        default=param_search.DEFAULT_ETA,
+        help='Successive halving keeps the best 1/eta candidates per rung (default: 3)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for qualification units (default: $QUALIFY_WORKERS or all cores; 1 = in-process)'
+    )
+
+    parser.add_argument(
+        '--no-resume',
+        dest='resume',
+        action='store_false',
+        default=True,
+        help='Ignore <output-dir>/qualification_units.jsonl and re-run every unit'
+    )
+
+    parser.add_argument(
+        '--frames-dir',
+        type=str,
+        default=None,
+        help='Directory for the shared memory-mapped price frames (default: /dev/shm if present)'
+    )
+
     parser.add_argument(
         '--bypass-qualification',
         action='store_true',
@@ -1270,8 +1518,10 @@ def main():
             logger.info(
                 f"Optimization Config: wf_windows={args.wf_windows}, "
                 f"wf_train_bars={args.wf_train_bars}, wf_test_bars={args.wf_test_bars}, "
-                f"max_param_combos={args.max_param_combos}"
+                f"max_param_combos={args.max_param_combos}, "
+                f"param_search={args.param_search}, halving_eta={args.halving_eta}"
             )
+        logger.info(f"Workers: {args.workers or 'auto'}, Resume: {args.resume}")
     logger.info("="*60)
     
     all_strategies = get_all_strategies()
@@ -1346,62 +1596,25 @@ def main():
     )
     logger.info("Completed shared historical data preload for all strategies")
     
-    all_results = []
-    
-    total_strategies = len(strategies)
-    for idx, strategy in enumerate(strategies, start=1):
-        try:
-            result = run_strategy_qualification(
-                strategy,
-                asset_symbols,
-                asset_symbol_map,
-                args.granularities,
-                args.data_dir,
-                use_db,
-                env_path,
-                args.initial_capital,
-                preloaded_data,
-                shared_conn,
-                args.lookback_years,
-                args.optimize_params,
-                args.wf_windows,
-                args.wf_train_bars,
-                args.wf_test_bars,
-                args.max_param_combos,
-            )
-            all_results.append(result)
-            checkpoint_path = write_progress_checkpoint(
-                all_results=all_results,
-                output_dir=args.output_dir,
-                completed=idx,
-                total=total_strategies,
-            )
-            logger.info(
-                f"Progress checkpoint updated ({idx}/{total_strategies}): {checkpoint_path}"
-            )
-        except Exception as e:
-            logger.error(f"Error qualifying {strategy.config.name}: {e}")
-            all_results.append({
-                'strategy_name': strategy.config.name,
-                'description': strategy.config.description,
-                'assets_tested': [],
-                'granularities_tested': args.granularities,
-                'asset_results': {},
-                'overall_qualified': False,
-                'qualification_reason': f'Execution failed: {e}',
-                'status': 'failed',
-            })
-            checkpoint_path = write_progress_checkpoint(
-                all_results=all_results,
-                output_dir=args.output_dir,
-                completed=idx,
-                total=total_strategies,
-            )
-            logger.info(
-                f"Progress checkpoint updated ({idx}/{total_strategies}): {checkpoint_path}"
-            )
-            import traceback
-            traceback.print_exc()
+    # Workers map the frames from shared files; the DB connection stays in this process.
+    all_results = run_parallel_qualification(
+        strategies,
+        asset_symbols,
+        args.granularities,
+        preloaded_data,
+        output_dir=args.output_dir,
+        workers=args.workers,
+        resume=args.resume,
+        frames_dir=args.frames_dir,
+        initial_capital=args.initial_capital,
+        optimize_params=args.optimize_params,
+        wf_windows=args.wf_windows,
+        wf_train_bars=args.wf_train_bars,
+        wf_test_bars=args.wf_test_bars,
+        max_param_combos=args.max_param_combos,
+        param_search_mode=args.param_search,
+        halving_eta=args.halving_eta,
+    )
 
     if shared_conn is not None:
         shared_conn.close()
@@ -0,0 +1,176 @@
+"""Tests for the parallel qualification runner: shared frames, append-only checkpoint, resume."""
+from __future__ import annotations
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.layer0.qualification.parallel_runner import (
+    CheckpointStore,
+    FrameStore,
+    QualificationUnit,
+    frame_fingerprint,
+    run_units,
+    settings_key,
+    strategy_fingerprint,
+)
+
+
+def make_frame(n=500, seed=0, tz="UTC"):
+    rng = np.random.RandomState(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.001, n))
+    return pd.DataFrame({
+        "Open": close,
+        "High": close + 0.001,
+        "Low": close - 0.001,
+        "Close": close,
+        "Volume": rng.randint(100, 1000, n),
+    }, index=pd.date_range("2021-01-01", periods=n, freq="h", tz=tz, name="Timestamp"))
+
+
+class NamedStrategy:
+    def __init__(self, name, fail_on=None, period=14):
+        self.name = name
+        self.fail_on = fail_on
+        self.period = period
+        self.trades = []
+
+
+def summarise(strategy, df, symbol, granularity, scale=1.0):
+    """Module-level (picklable) unit evaluation used by the tests."""
+    if strategy.fail_on == symbol:
+        raise RuntimeError(f"boom {symbol}")
+    return {
+        "pid": os.getpid(),
+        "bars": len(df),
+        "close_sum": float(df["Close"].sum() * scale),
+        "volume_dtype": str(df["Volume"].dtype),
+        "writeable": bool(df["Close"].to_numpy().flags.writeable),
+    }
+
+
+@pytest.fixture
+def frames():
+    return {
+        "EUR_USD": {"H1": make_frame(seed=1), "H4": make_frame(200, seed=2)},
+        "USD_JPY": {"H1": make_frame(300, seed=3, tz=None)},
+    }
+
+
+def test_frame_store_round_trip_is_zero_copy_and_read_only(frames, tmp_path):
+    store = FrameStore.publish(frames, base_dir=str(tmp_path))
+    try:
+        reader = FrameStore(store.root)
+        assert sorted(reader.keys()) == [("EUR_USD", "H1"), ("EUR_USD", "H4"), ("USD_JPY", "H1")]
+        for symbol, by_gran in frames.items():
+            for gran, df in by_gran.items():
+                shared = reader.frame(symbol, gran)
+                pd.testing.assert_frame_equal(shared, df)
+                assert not shared["Close"].to_numpy().flags.owndata
+                with pytest.raises(ValueError):
+                    shared["Close"].to_numpy()[0] = 0.0
+        assert reader.frame("EUR_USD", "H1") is reader.frame("EUR_USD", "H1")
+    finally:
+        store.close()
+    assert not os.path.exists(store.root)
+
+
+def test_checkpoint_store_appends_and_survives_torn_line(tmp_path):
+    path = tmp_path / "units.jsonl"
+    unit = QualificationUnit("S1", "EUR_USD", "H1")
+    store = CheckpointStore(str(path), run_key="k1")
+    store.append(unit, "500:a:b", {"metrics": {"total_trades": np.int64(3), "win_rate": np.float64(0.5)}})
+    with open(path, "a") as f:
+        f.write('{"run": "k1", "unit": ["S1", "EUR_USD", "H4"], "res')  # killed mid-write
+
+    reopened = CheckpointStore(str(path), run_key="k1")
+    assert len(reopened) == 1
+    assert reopened.get(unit, "500:a:b") == {"metrics": {"total_trades": 3, "win_rate": 0.5}}
+    assert reopened.get(unit, "501:a:c") is None  # price data changed
+    assert len(CheckpointStore(str(path), run_key="other")) == 0  # settings changed
+    assert len(CheckpointStore(str(path), run_key="k1", resume=False)) == 0
+    assert not path.exists()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_units_matches_serial_and_resumes(frames, tmp_path, workers):
+    strategies = {"S1": NamedStrategy("S1"), "S2": NamedStrategy("S2")}
+    units = [
+        QualificationUnit(name, symbol, gran)
+        for name in strategies
+        for symbol in ("EUR_USD", "USD_JPY", "GBP_USD")
+        for gran in ("H1", "H4")
+    ]
+    settings = {"scale": 2.0}
+    path = str(tmp_path / "units.jsonl")
+
+    first = CheckpointStore(path, settings_key(settings))
+    results, errors = run_units(
+        strategies, units[:3], frames, summarise, settings,
+        checkpoint=first, workers=workers, frames_dir=str(tmp_path),
+    )
+    assert not errors
+    assert len(results) == 3
+
+    resumed = CheckpointStore(path, settings_key(settings))
+    results, errors = run_units(
+        strategies, units, frames, summarise, settings,
+        checkpoint=resumed, workers=workers, frames_dir=str(tmp_path),
+    )
+    assert not errors
+    assert set(results) == {
+        (name, symbol, gran)
+        for name in strategies
+        for symbol, by_gran in frames.items()
+        for gran in by_gran
+    }
+    for (name, symbol, gran), result in results.items():
+        df = frames[symbol][gran]
+        assert result["bars"] == len(df)
+        assert result["close_sum"] == pytest.approx(float(df["Close"].sum() * 2.0))
+        assert result["volume_dtype"] == str(df["Volume"].dtype)
+        if workers > 1 and (name, symbol, gran) not in {u.key for u in units[:3]}:
+            assert result["pid"] != os.getpid()
+            assert result["writeable"] is False
+
+    with open(path) as f:
+        recorded = [tuple(json.loads(line)["unit"]) for line in f]
+    assert len(recorded) == len(set(recorded)) == len(results)  # nothing re-run
+
+
+def test_run_units_failed_units_are_not_checkpointed(frames, tmp_path):
+    strategies = {"S1": NamedStrategy("S1", fail_on="USD_JPY")}
+    units = [QualificationUnit("S1", s, "H1") for s in ("EUR_USD", "USD_JPY")]
+    store = CheckpointStore(str(tmp_path / "units.jsonl"), "k")
+    results, errors = run_units(strategies, units, frames, summarise, {}, checkpoint=store, workers=2,
+                                frames_dir=str(tmp_path))
+    assert set(results) == {("S1", "EUR_USD", "H1")}
+    assert set(errors) == {("S1", "USD_JPY", "H1")}
+    assert "boom" in str(errors[("S1", "USD_JPY", "H1")])
+    assert len(CheckpointStore(str(tmp_path / "units.jsonl"), "k")) == 1
+
+
+def test_frame_fingerprint_changes_with_new_bars():
+    df = make_frame(100)
+    assert frame_fingerprint(df) != frame_fingerprint(make_frame(101))
+    assert frame_fingerprint(df.iloc[:0]) == "0"
+
+
+def test_changed_strategy_params_invalidate_only_its_checkpointed_units(frames, tmp_path):
+    units = [QualificationUnit(name, "EUR_USD", "H1") for name in ("S1", "S2")]
+    path = str(tmp_path / "units.jsonl")
+    strategies = {"S1": NamedStrategy("S1"), "S2": NamedStrategy("S2")}
+    run_units(strategies, units, frames, summarise, {}, checkpoint=CheckpointStore(path, "k"), workers=1)
+
+    strategies["S1"].trades.append("runtime state is not a parameter")
+    assert strategy_fingerprint(strategies["S1"]) == strategy_fingerprint(NamedStrategy("S1"))
+    strategies["S2"] = NamedStrategy("S2", period=21)
+    assert strategy_fingerprint(strategies["S2"]) != strategy_fingerprint(NamedStrategy("S2"))
+    run_units(strategies, units, frames, summarise, {}, checkpoint=CheckpointStore(path, "k"), workers=1)
+
+    with open(path) as f:
+        recorded = [tuple(json.loads(line)["unit"]) for line in f]
+    assert recorded == [("S1", "EUR_USD", "H1"), ("S2", "EUR_USD", "H1"), ("S2", "EUR_USD", "H1")]
@@ -0,0 +1,78 @@
+"""Tests for successive-halving parameter search over walk-forward windows."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.layer0.qualification.param_search import halving_schedule, successive_halving
+
+
+@pytest.mark.parametrize("n, windows, eta, expected", [
+    (36, 4, 3, [1, 2, 4]),
+    (36, 9, 3, [1, 3, 9]),
+    (100, 4, 2, [1, 2, 4]),
+    (2, 4, 3, [4]),
+    (200, 1, 3, [1]),
+])
+def test_halving_schedule(n, windows, eta, expected):
+    assert halving_schedule(n, windows, eta) == expected
+
+
+def test_halving_schedule_rejects_eta_below_two():
+    with pytest.raises(ValueError):
+        halving_schedule(10, 4, eta=1)
+
+
+def make_problem(n_candidates, n_windows, seed=0):
+    """Per-(candidate, window) scores: a stable candidate quality plus window noise."""
+    rng = np.random.RandomState(seed)
+    quality = rng.normal(0, 1, n_candidates)
+    return quality[:, None] + rng.normal(0, 0.2, (n_candidates, n_windows))
+
+
+def run(values, eta=3):
+    calls = []
+
+    def evaluate(i, windows):
+        calls.extend((i, w) for w in windows)
+        return [values[i, w] for w in windows]
+
+    result = successive_halving(values.shape[0], values.shape[1], evaluate, lambda m: float(np.mean(m)), eta=eta)
+    return result, calls
+
+
+def test_successive_halving_finds_exhaustive_best_with_less_budget():
+    values = make_problem(81, 9)
+    result, calls = run(values)
+
+    exhaustive_best = int(np.argmax(values.mean(axis=1)))
+    assert result.best_index == exhaustive_best
+    assert result.best_score == pytest.approx(values[exhaustive_best].mean())
+    assert result.best_window_metrics == list(values[exhaustive_best])
+
+    assert len(calls) == len(set(calls)) == result.window_backtests  # each window run once
+    assert result.exhaustive_window_backtests == 81 * 9
+    assert result.budget_fraction < 0.4
+    assert [r["candidates"] for r in result.rungs] == [81, 27, 9]
+
+
+def test_successive_halving_rungs_follow_schedule():
+    values = make_problem(36, 9)
+    result, _ = run(values)
+    assert [r["windows"] for r in result.rungs] == halving_schedule(36, 9)
+    assert [r["candidates"] for r in result.rungs] == [36, 12, 4]
+    assert result.window_backtests == 36 * 1 + 12 * 2 + 4 * 6
+
+
+def test_successive_halving_breaks_ties_by_grid_order():
+    values = np.zeros((10, 3))
+    result, _ = run(values)
+    assert result.best_index == 0
+
+
+def test_successive_halving_single_candidate_uses_all_windows():
+    values = make_problem(1, 4)
+    result, calls = run(values)
+    assert result.best_index == 0
+    assert sorted(calls) == [(0, w) for w in range(4)]
+    assert result.budget_fraction == 1.0
@@ -22,6 +22,7 @@ import numpy as np
 from signal_engine.config.settings import Settings
 from signal_engine.config.database import DatabaseConnection
 from signal_engine.indicators.calculator import IndicatorCalculator
+from signal_engine.indicators.shared_plan import SharedIndicatorPlan
 from signal_engine.rules.evaluator import RuleEvaluator
 from signal_engine.persistence.repository import SignalRepository
 from signal_engine.persistence.processing_tracker import ProcessingTracker
@@ -99,6 +100,7 @@ class SignalEngine:
         total_signals = 0
         processed_strategies = 0
         processed_assets = set()
+        indicator_computations_saved = 0
 
         try:
             # Process each granularity
@@ -150,14 +152,6 @@ class SignalEngine:
                     )
 
                     try:
-                        # Fetch price data - use earliest start date across strategies
-                        fetch_start_date = start_date
-                        if incremental and not start_date and strategy_start_dates:
-                            # Use the minimum (earliest) start date across all strategies
-                            valid_starts = [s for s in strategy_start_dates.values() if s is not None]
-                            if valid_starts:
-                                fetch_start_date = min(valid_starts)
-                        
                         df = self._fetch_price_data(
                             asset_id=asset_id,
                             granularity=granularity,
@@ -172,13 +166,34 @@ class SignalEngine:
                         logger.info(f"    Loaded {len(df)} price bars")
                         processed_assets.add(asset_id)
 
+                        # Merge every strategy's indicator graph into one plan so each
+                        # (indicator, params) is computed once for this price frame
+                        plan = SharedIndicatorPlan()
+                        calculators = {}
+                        for strategy_config in asset_strategies:
+                            calculator = IndicatorCalculator(registry=plan.registry)
+                            try:
+                                calculator.add_configs_from_json(strategy_config.indicator_configs)
+                                plan.add_calculator(calculator)
+                                calculators[id(strategy_config)] = calculator
+                            except Exception as e:
+                                # Left out of the plan; _process_strategy re-raises it below
+                                logger.debug(f"Strategy {strategy_config.strategy_id} not planned: {e}")
+                        plan.calculate(df)
+                        indicator_computations_saved += plan.computations_saved
+
                         # Process each strategy for this asset
                         for strategy_config in asset_strategies:
                             try:
+                                calculator = calculators.get(id(strategy_config))
                                 result = self._process_strategy(
                                     df=df,
                                     asset_id=asset_id,
                                     strategy_config=strategy_config,
+                                    calculator=calculator,
+                                    indicator_results=(
+                                        plan.results_for(calculator) if calculator else None
+                                    ),
                                 )
 
                                 if result.rows_generated > 0 and not dry_run:
@@ -223,6 +238,7 @@ class SignalEngine:
         logger.info(f"Strategies processed: {processed_strategies}")
         logger.info(f"Assets processed: {len(processed_assets)}")
         logger.info(f"Total signals: {total_signals}")
+        logger.info(f"Indicator computations saved: {indicator_computations_saved}")
         logger.info(f"Execution time: {execution_time:.2f}ms")
 
         if errors:
@@ -237,6 +253,7 @@ class SignalEngine:
             execution_time_ms=execution_time,
             errors=errors,
             batch_id=batch_id,
+            indicator_computations_saved=indicator_computations_saved,
         )
 
     def _load_strategies(
@@ -435,7 +452,12 @@ class SignalEngine:
         return grouped
 
     def _process_strategy(
-        self, df: pd.DataFrame, asset_id: int, strategy_config: StrategyConfig
+        self,
+        df: pd.DataFrame,
+        asset_id: int,
+        strategy_config: StrategyConfig,
+        calculator: Optional[IndicatorCalculator] = None,
+        indicator_results: Optional[Dict[str, pd.Series]] = None,
     ) -> SignalResult:
         """
         Process a single strategy against price data.
@@ -444,6 +466,9 @@ class SignalEngine:
             df: DataFrame with price data
             asset_id: Asset identifier
             strategy_config: Strategy configuration
+            calculator: Optional calculator already configured for this strategy
+            indicator_results: Optional precomputed indicator view (from a
+                SharedIndicatorPlan); calculated here when omitted
 
         Returns:
             SignalResult with generated signals
@@ -456,11 +481,13 @@ class SignalEngine:
         )
 
         # Step 1: Build indicator calculator with required indicators
-        calculator = IndicatorCalculator()
-        calculator.add_configs_from_json(strategy_config.indicator_configs)
+        if calculator is None:
+            calculator = IndicatorCalculator()
+            calculator.add_configs_from_json(strategy_config.indicator_configs)
 
-        # Step 2: Calculate indicators
-        indicator_results = calculator.calculate(df)
+        # Step 2: Calculate indicators (unless the shared plan already did)
+        if indicator_results is None:
+            indicator_results = calculator.calculate(df)
 
         # Step 3: Build DataFrame with indicators
         df_with_indicators = df.copy()
@@ -493,11 +520,9 @@ class SignalEngine:
         if validation_errors:
             raise ValueError(f"Rule validation failed: {validation_errors}")
 
-        # Get consolidated signals
-        signals = evaluator.evaluate_consolidated(df_with_indicators)
-
-        # Get triggered rules for each row
-        triggered_rules = evaluator.get_triggered_rules(df_with_indicators)
+        # One pass: consolidated signal, per-rule masks and first triggered rule
+        plan = evaluator.evaluate_plan(df_with_indicators)
+        signal_values = plan.consolidated
 
         # Step 5: Build result DataFrame
         result_df = pd.DataFrame(
@@ -506,40 +531,36 @@ class SignalEngine:
                 "Asset_ID": asset_id,
                 "Granularity": strategy_config.granularity,
                 "Strategy_ID": strategy_config.strategy_id,
-                "Signal_Value": signals.values,
+                "Signal_Value": signal_values,
             }
         )
 
-        # Add signal reason and rule ID
-        signal_reasons = []
-        rule_ids = []
-
-        for idx, row in df_with_indicators.iterrows():
-            # Find which rule triggered
-            triggered = triggered_rules.loc[idx]
-            triggered_rule_ids = triggered[triggered].index.tolist()
-
-            if triggered_rule_ids:
-                rule = evaluator.get_rule(triggered_rule_ids[0])
-                signal_reasons.append(rule.description if rule else "")
-                rule_ids.append(triggered_rule_ids[0])
-            else:
-                signal_reasons.append("")
-                rule_ids.append("")
-
-        result_df["Signal_Reason"] = signal_reasons
-        result_df["Rule_ID"] = rule_ids
-
-        # Add indicator snapshot (key indicators only, as JSON)
-        snapshots = []
-        for idx in df_with_indicators.index:
-            snapshot = {}
-            for indicator_name in indicator_results.keys():
-                if indicator_name in df_with_indicators.columns:
-                    val = df_with_indicators.loc[idx, indicator_name]
-                    if pd.notna(val):
-                        snapshot[indicator_name] = round(float(val), 6)
-            snapshots.append(json.dumps(snapshot) if snapshot else None)
+        # Signal reason and rule ID of the first triggered rule ("" where none;
+        # index -1 selects the trailing sentinel)
+        rule_ids = np.array(plan.rule_ids + [""], dtype=object)
+        reasons = np.array(
+            [evaluator.get_rule(rule_id).description for rule_id in plan.rule_ids] + [""],
+            dtype=object,
+        )
+        result_df["Signal_Reason"] = reasons[plan.first_triggered]
+        result_df["Rule_ID"] = rule_ids[plan.first_triggered]
+
+        # Add indicator snapshot (key indicators only, as JSON) for signal rows
+        signal_rows = np.flatnonzero(signal_values != 0)
+        snapshot_columns = []
+        for indicator_name in indicator_results.keys():
+            if indicator_name in df_with_indicators.columns:
+                values = df_with_indicators[indicator_name].to_numpy()[signal_rows]
+                snapshot_columns.append(
+                    (indicator_name, [round(float(v), 6) if pd.notna(v) else None for v in values])
+                )
+
+        snapshots = np.full(len(result_df), None, dtype=object)
+        for pos, row in enumerate(signal_rows):
+            snapshot = {
+                name: column[pos] for name, column in snapshot_columns if column[pos] is not None
+            }
+            snapshots[row] = json.dumps(snapshot) if snapshot else None
 
         result_df["Indicator_Snapshot"] = snapshots
 
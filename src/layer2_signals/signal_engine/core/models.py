@@ -194,6 +194,8 @@ class ProcessingSummary:
         execution_time_ms: Total execution time
         errors: List of errors encountered
         batch_id: Batch identifier
+        indicator_computations_saved: Indicator computations avoided by
+            sharing one indicator plan across strategies of the same asset
     """
     total_strategies: int
     total_assets: int
@@ -201,6 +203,7 @@ class ProcessingSummary:
     execution_time_ms: float
     errors: List[str] = field(default_factory=list)
     batch_id: Optional[str] = None
+    indicator_computations_saved: int = 0
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -210,5 +213,6 @@ class ProcessingSummary:
             'total_signals': self.total_signals,
             'execution_time_ms': self.execution_time_ms,
             'errors': self.errors,
-            'batch_id': self.batch_id
+            'batch_id': self.batch_id,
+            'indicator_computations_saved': self.indicator_computations_saved,
         }
@@ -3,5 +3,6 @@
 from signal_engine.indicators.calculator import IndicatorCalculator
 from signal_engine.indicators.registry import IndicatorRegistry
 from signal_engine.indicators.dependency_graph import DependencyGraph
+from signal_engine.indicators.shared_plan import SharedIndicatorPlan
 
-__all__ = ["IndicatorCalculator", "IndicatorRegistry", "DependencyGraph"]
+__all__ = ["IndicatorCalculator", "IndicatorRegistry", "DependencyGraph", "SharedIndicatorPlan"]
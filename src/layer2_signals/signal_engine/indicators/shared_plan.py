@@ -0,0 +1,190 @@
+"""
+Shared Indicator Plan - One deduplicated indicator DAG per price frame.
+
+Strategies trading the same asset/granularity routinely configure the same
+indicators (EMA_50, ATR_14, ...) under their own instance names. The plan merges
+every strategy calculator's DependencyGraph into a single graph keyed by
+computation signature (indicator key + effective params), computes each
+(signature, output) once per price frame, and hands each strategy a view of the
+shared Series under its own instance names - the same dict, in the same order,
+that ``IndicatorCalculator.calculate`` would have produced.
+"""
+
+import json
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from signal_engine.indicators.calculator import IndicatorCalculator, IndicatorConfig
+from signal_engine.indicators.dependency_graph import DependencyGraph
+from signal_engine.indicators.registry import IndicatorRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class SharedIndicatorPlan:
+    """
+    Deduplicated indicator plan shared by all strategies of one price frame.
+
+    Example:
+        plan = SharedIndicatorPlan()
+        for config in asset_strategies:
+            calculator = IndicatorCalculator()
+            calculator.add_configs_from_json(config.indicator_configs)
+            plan.add_calculator(calculator)
+
+        plan.calculate(df)
+        results = plan.results_for(calculator)  # view keyed by instance name
+        print(plan.computations_saved)
+    """
+
+    def __init__(self, registry: Optional[IndicatorRegistry] = None):
+        """
+        Initialize an empty plan.
+
+        Args:
+            registry: Optional custom indicator registry
+        """
+        self.registry = registry or IndicatorRegistry()
+        self.dependency_graph = DependencyGraph()
+        self._configs: Dict[str, IndicatorConfig] = {}
+        # signature -> output names requested by any strategy (first-seen order)
+        self._outputs: Dict[str, List[str]] = {}
+        # id(calculator) -> [(instance_name, signature, outputs)] in calculator execution order
+        self._views: Dict[int, List[Tuple[str, str, List[str]]]] = {}
+        self._series: Dict[Tuple[str, str], pd.Series] = {}
+        self._failures: Dict[str, Exception] = {}
+        self.computations_requested = 0
+        self.computations_performed = 0
+
+    @property
+    def computations_saved(self) -> int:
+        """Indicator output computations avoided versus per-strategy calculators."""
+        return self.computations_requested - self.computations_performed
+
+    def signature(self, config: IndicatorConfig) -> str:
+        """
+        Computation identity of an indicator config.
+
+        Params are merged with the registry defaults first (as ``registry.create``
+        does), so ``EMA {}`` and ``EMA {"window": 20}`` share one computation.
+        """
+        definition = self.registry.get(config.indicator_key)
+        params = {**definition.default_params, **config.params}
+        return f"{definition.key}{json.dumps(params, sort_keys=True, default=str)}"
+
+    def _requested_outputs(self, config: IndicatorConfig) -> List[str]:
+        """Outputs ``IndicatorCalculator._calculate_single`` would compute for ``config``."""
+        definition = self.registry.get(config.indicator_key)
+        if config.output_columns:
+            outputs = config.output_columns
+        elif config.output_column:
+            outputs = [config.output_column]
+        else:
+            outputs = list(definition.output_methods.keys())
+        return list(outputs)
+
+    def add_calculator(self, calculator: IndicatorCalculator) -> None:
+        """
+        Merge a strategy calculator's indicators into the plan.
+
+        Args:
+            calculator: Calculator configured with one strategy's indicators
+
+        Raises:
+            KeyError: If the calculator references an unknown indicator key
+                (nothing is merged in that case)
+        """
+        view = []
+        for instance_name in calculator.dependency_graph.get_execution_order():
+            config = calculator._configs.get(instance_name)
+            if config is None:
+                continue
+            view.append((instance_name, self.signature(config), self._requested_outputs(config)))
+
+        for instance_name, signature, outputs in view:
+            node = calculator.dependency_graph.get_node(instance_name)
+            if signature not in self.dependency_graph:
+                config = calculator._configs[instance_name]
+                self._configs[signature] = config
+                self.dependency_graph.add_indicator(
+                    instance_name=signature,
+                    indicator_key=config.indicator_key,
+                    params=config.params,
+                    dependencies=[
+                        self.signature(calculator._configs[d])
+                        for d in node.dependencies
+                        if d in calculator._configs
+                    ],
+                )
+            merged = self._outputs.setdefault(signature, [])
+            merged.extend(o for o in outputs if o not in merged)
+            known = self.registry.get(self._configs[signature].indicator_key).output_methods
+            self.computations_requested += sum(1 for o in outputs if o in known)
+
+        self._views[id(calculator)] = view
+
+    def calculate(self, df: pd.DataFrame) -> None:
+        """
+        Compute every (signature, output) of the merged plan once on ``df``.
+
+        A failing indicator is recorded rather than raised, so only the
+        strategies that depend on it fail (in ``results_for``).
+
+        Args:
+            df: DataFrame with price data (Open, High, Low, Close)
+        """
+        self._series.clear()
+        self._failures.clear()
+        self.computations_performed = 0
+
+        for signature in self.dependency_graph.get_execution_order():
+            config = self._configs[signature]
+            definition = self.registry.get(config.indicator_key)
+            try:
+                instance = self.registry.create(config.indicator_key, df, **config.params)
+                for output_name in self._outputs[signature]:
+                    if output_name not in definition.output_methods:
+                        continue  # the per-strategy view logs the warning
+                    method = getattr(instance, definition.output_methods[output_name])
+                    self._series[(signature, output_name)] = method()
+                    self.computations_performed += 1
+            except Exception as e:
+                logger.error(f"Failed to calculate {signature}: {e}")
+                self._failures[signature] = e
+
+        logger.info(
+            f"Shared indicator plan: {self.computations_performed} computations, "
+            f"{self.computations_saved} saved across {len(self._views)} strategies"
+        )
+
+    def results_for(self, calculator: IndicatorCalculator) -> Dict[str, pd.Series]:
+        """
+        A strategy's view of the shared results.
+
+        Args:
+            calculator: A calculator previously passed to ``add_calculator``
+
+        Returns:
+            Dictionary mapping the strategy's result names to shared Series
+
+        Raises:
+            Exception: The original error of any indicator this strategy needs
+                that failed to calculate
+        """
+        results: Dict[str, pd.Series] = {}
+        for instance_name, signature, outputs in self._views[id(calculator)]:
+            if signature in self._failures:
+                raise self._failures[signature]
+            for output_name in outputs:
+                series = self._series.get((signature, output_name))
+                if series is None:
+                    logger.warning(
+                        f"Unknown output '{output_name}' for "
+                        f"{self._configs[signature].indicator_key}"
+                    )
+                    continue
+                key = f"{instance_name}.{output_name}" if len(outputs) > 1 else instance_name
+                results[key] = series
+        return results
@@ -1,9 +1,10 @@
 """
 Signal Repository - Database persistence with bulk upsert operations.
 
-Provides idempotent upsert operations using PostgreSQL
-``INSERT ... ON CONFLICT`` (FND-004 Phase 3 — migrated off the SQL Server
-temp-table + ``MERGE`` pattern) for efficient and safe signal persistence.
+Provides idempotent upsert operations using PostgreSQL ``COPY`` into a staging
+table plus one ``INSERT ... ON CONFLICT`` merge (FND-004 Phase 3 — migrated off
+the SQL Server temp-table + ``MERGE`` pattern) for efficient and safe signal
+persistence.
 """
 
 import logging
@@ -13,10 +14,10 @@ from datetime import datetime
 from dataclasses import dataclass
 
 import pandas as pd
-from psycopg2.extras import execute_values
 
 from signal_engine.config.database import DatabaseConnection
 from signal_engine.config.settings import Settings
+from src.common.db import copy_upsert  # repo root is on sys.path via config.database
 
 logger = logging.getLogger(__name__)
 
@@ -76,9 +77,10 @@ class SignalRepository:
     """
     Repository for signal persistence operations.
 
-    Uses PostgreSQL ``INSERT ... ON CONFLICT`` for idempotent upserts:
-    1. Bulk insert rows with ``execute_values``
-    2. On PK conflict, update the existing record
+    Uses PostgreSQL ``COPY`` + ``INSERT ... ON CONFLICT`` for idempotent upserts:
+    1. Stream rows with ``COPY`` into a temporary staging table
+    2. Merge the staging table in one statement; on PK conflict, update the
+       existing record
 
     This ensures:
     - Idempotency: Running twice produces same result
@@ -191,14 +193,23 @@ class SignalRepository:
 
         return records
 
+    # Staged fact_signals columns, in SignalRecord.to_tuple() order
+    COLUMNS = (
+        "timestamp", "asset_id", "granularity", "strategy_id", "signal_value",
+        "strategy_version", "config_hash", "signal_reason", "rule_id",
+        "indicator_snapshot", "confidence_score", "batch_id",
+    )
+    KEY_COLUMNS = ("timestamp", "asset_id", "granularity", "strategy_id")
+
     def _bulk_merge(self, records: List[SignalRecord]) -> int:
         """
-        Perform a bulk idempotent upsert via ``INSERT ... ON CONFLICT``.
+        Perform a bulk idempotent upsert via ``COPY`` + one set-based merge.
 
-        The conflict target is the ``fact_signals`` primary key
-        ``(timestamp, asset_id, granularity, strategy_id)``; ``created_at`` is
-        set to ``now()`` on both insert and update (matching the former
-        ``GETUTCDATE()`` behaviour). ``indicator_snapshot`` is cast to ``jsonb``.
+        Rows are staged with :func:`src.common.db.copy_upsert` and merged on
+        the ``fact_signals`` primary key ``(timestamp, asset_id, granularity,
+        strategy_id)``; ``created_at`` is set to ``now()`` on both insert and
+        update (matching the former ``GETUTCDATE()`` behaviour).
+        ``indicator_snapshot`` is staged straight into its ``jsonb`` column.
 
         Args:
             records: List of signal records
@@ -206,60 +217,28 @@ class SignalRepository:
         Returns:
             Number of rows affected
         """
-        total_affected = 0
-
-        upsert_sql = f"""
-            INSERT INTO {self.TARGET_TABLE} (
-                "timestamp", asset_id, granularity, strategy_id, signal_value,
-                strategy_version, config_hash, signal_reason, rule_id,
-                indicator_snapshot, confidence_score, batch_id, created_at
-            ) VALUES %s
-            ON CONFLICT ("timestamp", asset_id, granularity, strategy_id)
-            DO UPDATE SET
-                signal_value = EXCLUDED.signal_value,
-                strategy_version = EXCLUDED.strategy_version,
-                config_hash = EXCLUDED.config_hash,
-                signal_reason = EXCLUDED.signal_reason,
-                rule_id = EXCLUDED.rule_id,
-                indicator_snapshot = EXCLUDED.indicator_snapshot,
-                confidence_score = EXCLUDED.confidence_score,
-                batch_id = EXCLUDED.batch_id,
-                created_at = now()
-        """
-        # to_tuple() yields 12 values; created_at is supplied by now() in the
-        # template. indicator_snapshot (position 10) is cast to jsonb.
-        template = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s::jsonb, %s, %s, now())"
-
         with self.db.connection() as conn:
-            cursor = conn.cursor()
-
             try:
-                data_tuples = [r.to_tuple() for r in records]
-
-                for i in range(0, len(data_tuples), self.batch_size):
-                    batch = data_tuples[i : i + self.batch_size]
-                    execute_values(
-                        cursor,
-                        upsert_sql,
-                        batch,
-                        template=template,
-                        page_size=self.batch_size,
-                    )
-                    total_affected += cursor.rowcount
-                    logger.debug(f"Upserted batch of {len(batch)} rows")
-
+                inserted, updated = copy_upsert(
+                    self.TARGET_TABLE,
+                    (r.to_tuple() for r in records),
+                    columns=self.COLUMNS,
+                    conflict_columns=self.KEY_COLUMNS,
+                    computed_columns={"created_at": "now()"},
+                    conn=conn,
+                )
                 conn.commit()
 
-                logger.info(f"Upsert complete: {total_affected} rows inserted/updated")
+                logger.info(
+                    f"Upsert complete: {inserted} rows inserted, {updated} updated"
+                )
 
             except Exception as e:
                 conn.rollback()
                 logger.error(f"Bulk upsert failed: {e}")
                 raise
-            finally:
-                cursor.close()
 
-        return total_affected
+        return inserted + updated
 
     def get_signals(
         self,
@@ -1,5 +1,11 @@
 """Rule evaluation module for signal generation."""
 
-from signal_engine.rules.evaluator import RuleEvaluator, Rule, Condition
+from signal_engine.rules.evaluator import (
+    RuleEvaluator,
+    Rule,
+    Condition,
+    CompiledRulePlan,
+    RulePlanResult,
+)
 
-__all__ = ["RuleEvaluator", "Rule", "Condition"]
+__all__ = ["RuleEvaluator", "Rule", "Condition", "CompiledRulePlan", "RulePlanResult"]
@@ -216,6 +216,108 @@ class Rule:
         }
 
 
+@dataclass
+class RulePlanResult:
+    """
+    Outcome of one pass of a CompiledRulePlan over a DataFrame.
+
+    Attributes:
+        rule_ids: Rule IDs in evaluation order (one per mask row)
+        masks: Boolean array (n_rules, n_rows), True where a rule triggered
+        consolidated: Consolidated signal per row (-1, 0, 1)
+        first_triggered: Index into ``rule_ids`` of the first triggered rule
+            per row, -1 where no rule triggered
+    """
+    rule_ids: List[str]
+    masks: np.ndarray
+    consolidated: np.ndarray
+    first_triggered: np.ndarray
+
+
+class CompiledRulePlan:
+    """
+    Rule set compiled into unique conditions and per-rule condition indices.
+
+    Identical conditions shared by several rules (e.g. the ADX filter that
+    gates both the long and the short rule) are evaluated once per pass, and
+    the consolidated signal, per-rule masks and first-triggered rule all come
+    from the same evaluation.
+
+    Rules sharing a rule_id follow the ``get_triggered_rules`` semantics: the
+    last definition wins, in the position of the first.
+    """
+
+    def __init__(self, rules: List[Rule]):
+        """
+        Compile rules into an evaluation plan.
+
+        Args:
+            rules: Rules in evaluation order
+        """
+        unique: Dict[str, Rule] = {}
+        for rule in rules:
+            unique[rule.rule_id] = rule
+
+        self.rules: List[Rule] = list(unique.values())
+        self.conditions: List[Condition] = []
+        condition_index: Dict[tuple, int] = {}
+        self._rule_conditions: List[List[int]] = []
+
+        for rule in self.rules:
+            indices = []
+            for cond in rule.conditions:
+                key = (cond.left, cond.operator, cond.right)
+                if key not in condition_index:
+                    condition_index[key] = len(self.conditions)
+                    self.conditions.append(cond)
+                indices.append(condition_index[key])
+            self._rule_conditions.append(indices)
+
+        self._signal_values = np.array([r.signal_value for r in self.rules], dtype=np.int64)
+
+    def evaluate(self, df: pd.DataFrame) -> RulePlanResult:
+        """
+        Evaluate every unique condition once and combine them per rule.
+
+        Args:
+            df: DataFrame with indicator columns
+
+        Returns:
+            RulePlanResult with masks, consolidated signal and first-triggered rule
+        """
+        n_rows = len(df)
+        cond_masks = []
+        for cond in self.conditions:
+            result = cond.evaluate(df)
+            if isinstance(result, pd.Series):
+                cond_masks.append(result.to_numpy(dtype=bool))
+            else:  # literal vs literal
+                cond_masks.append(np.full(n_rows, bool(result)))
+
+        masks = np.zeros((len(self.rules), n_rows), dtype=bool)
+        for i, (rule, indices) in enumerate(zip(self.rules, self._rule_conditions)):
+            if not indices:
+                continue
+            combine = np.logical_and if rule.logic == 'AND' else np.logical_or
+            combine.reduce([cond_masks[j] for j in indices], axis=0, out=masks[i])
+
+        consolidated = np.sign(self._signal_values @ masks).astype(np.int64)
+        if len(self.rules):
+            first_triggered = np.where(masks.any(axis=0), masks.argmax(axis=0), -1)
+        else:
+            first_triggered = np.full(n_rows, -1)
+
+        logger.debug(
+            f"Rule plan: {len(self.rules)} rules, {len(self.conditions)} unique conditions"
+        )
+        return RulePlanResult(
+            rule_ids=[r.rule_id for r in self.rules],
+            masks=masks,
+            consolidated=consolidated,
+            first_triggered=first_triggered,
+        )
+
+
 class RuleEvaluator:
     """
     Evaluates signal generation rules from JSON configuration.
@@ -363,21 +465,8 @@ class RuleEvaluator:
         Returns:
             Series with consolidated signal values
         """
-        rule_signals = self.evaluate(df)
-        
-        if rule_signals.empty:
-            return pd.Series(0, index=df.index)
-        
-        # Sum signals across rules
-        consolidated = rule_signals.sum(axis=1)
-        
-        # Normalize: if conflicting signals, result is 0
-        # Otherwise, take the sign
-        result = pd.Series(0, index=df.index)
-        result[consolidated > 0] = 1
-        result[consolidated < 0] = -1
-        
-        return result
+        plan = self.evaluate_plan(df)
+        return pd.Series(plan.consolidated, index=df.index)
     
     def get_triggered_rules(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -389,13 +478,30 @@ class RuleEvaluator:
         Returns:
             DataFrame with rule IDs as columns, boolean values
         """
-        results = {}
+        plan = self.evaluate_plan(df)
+        return pd.DataFrame(plan.masks.T, index=df.index, columns=plan.rule_ids)
+    
+    def compile(self) -> CompiledRulePlan:
+        """
+        Compile the current rules into a single-pass evaluation plan.
         
-        for rule in self.rules:
-            triggered = rule.evaluate(df)
-            results[rule.rule_id] = triggered
+        Returns:
+            CompiledRulePlan over the current rules
+        """
+        return CompiledRulePlan(self.rules)
+    
+    def evaluate_plan(self, df: pd.DataFrame) -> RulePlanResult:
+        """
+        Evaluate all rules in one pass over their unique conditions.
         
-        return pd.DataFrame(results, index=df.index)
+        Args:
+            df: DataFrame with indicator columns
+            
+        Returns:
+            RulePlanResult with per-rule masks, consolidated signal and
+            first-triggered rule index
+        """
+        return self.compile().evaluate(df)
     
     def get_rule(self, rule_id: str) -> Optional[Rule]:
         """
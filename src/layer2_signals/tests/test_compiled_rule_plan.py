@@ -0,0 +1,209 @@
+"""CompiledRulePlan and SignalEngine._process_strategy parity with the per-rule / per-row path they replaced."""
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# signal_engine is imported as a top-level package, as when run from src/layer2_signals.
+_LAYER2_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _LAYER2_DIR not in sys.path:
+    sys.path.insert(0, _LAYER2_DIR)
+
+from signal_engine.core.engine import SignalEngine  # noqa: E402
+from signal_engine.core.models import StrategyConfig  # noqa: E402
+from signal_engine.indicators.calculator import IndicatorCalculator  # noqa: E402
+from signal_engine.rules.evaluator import CompiledRulePlan, RuleEvaluator  # noqa: E402
+
+INDICATORS = [
+    {"instance_name": "EMA_FAST", "indicator_key": "EMA", "params": {"window": 10}},
+    {"instance_name": "EMA_SLOW", "indicator_key": "EMA", "params": {"window": 30}},
+    {"instance_name": "RSI_14", "indicator_key": "RSI", "params": {"window": 14}},
+    {"instance_name": "BB_20", "indicator_key": "BB", "params": {"window": 20},
+     "output_columns": ["hband", "lband"]},
+]
+
+# Shared conditions (the RSI filters), OR logic, .prev and cross operators, a
+# conditionless rule, and a redefined rule_id (last definition wins in place).
+RULES = [
+    {"rule_id": "LONG_CROSS", "description": "EMA fast crosses above slow", "signal_value": 1,
+     "conditions": [{"left": "EMA_FAST", "operator": ">", "right": "EMA_SLOW"},
+                    {"left": "EMA_FAST.prev", "operator": "<=", "right": "EMA_SLOW"},
+                    {"left": "RSI_14", "operator": "<", "right": 70}]},
+    {"rule_id": "SHORT_CROSS", "description": "EMA fast crosses below slow", "signal_value": -1,
+     "conditions": [{"left": "EMA_FAST", "operator": "<", "right": "EMA_SLOW"},
+                    {"left": "EMA_FAST.prev", "operator": ">=", "right": "EMA_SLOW"},
+                    {"left": "RSI_14", "operator": ">", "right": 30}]},
+    {"rule_id": "BAND_BREAK", "description": "Close outside the bands", "signal_value": 1,
+     "logic": "OR",
+     "conditions": [{"left": "Close", "operator": ">", "right": "BB_20.hband"},
+                    {"left": "Close", "operator": "<", "right": "BB_20.lband"}]},
+    {"rule_id": "RSI_FADE", "description": "RSI leaves overbought", "signal_value": -1,
+     "conditions": [{"left": "RSI_14", "operator": "cross_below", "right": 60},
+                    {"left": "RSI_14", "operator": ">", "right": 30}]},
+    {"rule_id": "NEVER", "description": "No conditions", "signal_value": 1, "conditions": []},
+    {"rule_id": "BAND_BREAK", "description": "Close above the upper band", "signal_value": 1,
+     "conditions": [{"left": "Close", "operator": ">", "right": "BB_20.hband"}]},
+]
+
+
+def _prices(n=300, seed=11):
+    rng = np.random.default_rng(seed)
+    close = 1.10 + np.cumsum(rng.normal(0, 0.003, n))
+    spread = np.abs(rng.normal(0, 0.001, n))
+    df = pd.DataFrame({
+        "Timestamp": pd.date_range("2024-01-01", periods=n, freq="h"),
+        "Open": close + rng.normal(0, 0.0005, n),
+        "High": close + spread,
+        "Low": close - spread,
+        "Close": close,
+        "Volume": rng.integers(100, 1000, n),
+    })
+    # A gap in the feed: every rolling indicator is NaN for a window after it.
+    df.loc[150:152, ["Open", "High", "Low", "Close"]] = np.nan
+    return df
+
+
+def _with_indicators(df):
+    calculator = IndicatorCalculator()
+    calculator.add_configs_from_json(INDICATORS)
+    out = df.copy()
+    for name, series in calculator.calculate(df).items():
+        out[name] = series
+    return out
+
+
+def _evaluator(rules):
+    evaluator = RuleEvaluator()
+    evaluator.add_rules_from_json(rules)
+    return evaluator
+
+
+def _legacy_consolidated(evaluator, df):
+    rule_signals = evaluator.evaluate(df)
+    if rule_signals.empty:
+        return pd.Series(0, index=df.index)
+    consolidated = rule_signals.sum(axis=1)
+    result = pd.Series(0, index=df.index)
+    result[consolidated > 0] = 1
+    result[consolidated < 0] = -1
+    return result
+
+
+def _legacy_triggered(evaluator, df):
+    return pd.DataFrame({rule.rule_id: rule.evaluate(df) for rule in evaluator.rules}, index=df.index)
+
+
+def _legacy_process(df, asset_id, config):
+    """_process_strategy's steps 3-5 as they were: per-rule evaluation, iterrows, every-row snapshots."""
+    calculator = IndicatorCalculator()
+    calculator.add_configs_from_json(config.indicator_configs)
+    indicator_results = calculator.calculate(df)
+    frame = df.copy()
+    for name, series in indicator_results.items():
+        frame[name] = series
+    frame = frame.iloc[calculator.get_warmup_period():].copy()
+
+    evaluator = _evaluator(config.signal_rules)
+    signals = _legacy_consolidated(evaluator, frame)
+    triggered_rules = _legacy_triggered(evaluator, frame)
+    result = pd.DataFrame({
+        "Timestamp": frame["Timestamp"],
+        "Asset_ID": asset_id,
+        "Granularity": config.granularity,
+        "Strategy_ID": config.strategy_id,
+        "Signal_Value": signals.values,
+    })
+
+    reasons, rule_ids = [], []
+    for idx, _ in frame.iterrows():
+        triggered = triggered_rules.loc[idx]
+        triggered_ids = triggered[triggered].index.tolist()
+        if triggered_ids:
+            reasons.append(evaluator.get_rule(triggered_ids[0]).description)
+            rule_ids.append(triggered_ids[0])
+        else:
+            reasons.append("")
+            rule_ids.append("")
+    result["Signal_Reason"] = reasons
+    result["Rule_ID"] = rule_ids
+
+    snapshots = []
+    for idx in frame.index:
+        snapshot = {}
+        for name in indicator_results:
+            val = frame.loc[idx, name]
+            if pd.notna(val):
+                snapshot[name] = round(float(val), 6)
+        snapshots.append(json.dumps(snapshot) if snapshot else None)
+    result["Indicator_Snapshot"] = snapshots
+    return result
+
+
+def _config(rules):
+    return StrategyConfig(
+        strategy_id=7, strategy_key="TEST", strategy_name="Test", config_id=3,
+        config_version="1.0.0", config_hash="abc", granularity="H1", asset_id=1,
+        indicator_configs=INDICATORS, signal_rules=rules,
+    )
+
+
+def test_plan_matches_per_rule_evaluation():
+    df = _with_indicators(_prices())
+    evaluator = _evaluator(RULES)
+
+    result = evaluator.evaluate_plan(df)
+    legacy = _legacy_triggered(evaluator, df)
+
+    assert result.rule_ids == list(legacy.columns) == ["LONG_CROSS", "SHORT_CROSS", "BAND_BREAK", "RSI_FADE", "NEVER"]
+    np.testing.assert_array_equal(result.masks, legacy.to_numpy(dtype=bool).T)
+    np.testing.assert_array_equal(result.consolidated, _legacy_consolidated(evaluator, df).to_numpy())
+    for row, first in enumerate(result.first_triggered):
+        hits = list(legacy.columns[legacy.iloc[row].to_numpy(dtype=bool)])
+        assert first == (result.rule_ids.index(hits[0]) if hits else -1)
+
+    # Every case the plan has to get right actually occurs in the frame.
+    assert {-1, 0, 1} <= set(result.consolidated)
+    assert (result.masks.sum(axis=0) > 1).any()
+    assert ((result.masks[0] | result.masks[2]) & (result.masks[1] | result.masks[3])).any()
+    # RSI_14 > 30 is evaluated once, and the replaced BAND_BREAK adds nothing.
+    assert len(CompiledRulePlan(evaluator.rules).conditions) == 8
+
+
+def test_plan_without_rules_never_signals():
+    df = _with_indicators(_prices())
+    result = RuleEvaluator().evaluate_plan(df)
+
+    assert result.rule_ids == [] and result.masks.shape == (0, len(df))
+    assert not result.consolidated.any() and (result.first_triggered == -1).all()
+    assert (RuleEvaluator().evaluate_consolidated(df) == 0).all()
+
+
+@pytest.mark.parametrize("rules", [RULES, []], ids=["rules", "no_rules"])
+def test_process_strategy_matches_row_wise_reasons_and_snapshots(rules):
+    df = _prices()
+    config = _config(rules)
+
+    got = SignalEngine.__new__(SignalEngine)._process_strategy(df, asset_id=1, strategy_config=config).signals_df
+    legacy = _legacy_process(df, 1, config)
+
+    columns = ["Timestamp", "Asset_ID", "Granularity", "Strategy_ID", "Signal_Value", "Signal_Reason", "Rule_ID"]
+    pd.testing.assert_frame_equal(got[columns], legacy[columns])
+
+    # Snapshots are built only for signal rows, the only rows the repository persists.
+    signal = got["Signal_Value"] != 0
+    assert got.loc[signal, "Indicator_Snapshot"].tolist() == legacy.loc[signal, "Indicator_Snapshot"].tolist()
+    assert got.loc[~signal, "Indicator_Snapshot"].isna().all()
+
+    if rules:
+        assert signal.any() and (~signal).any()
+        assert (got.loc[~signal, "Rule_ID"] == "").any() and (got.loc[signal, "Rule_ID"] != "").all()
+        # Some signal rows fall in the NaN gap, so their snapshots omit indicators.
+        widths = got.loc[signal, "Indicator_Snapshot"].map(lambda s: len(json.loads(s)))
+        assert widths.min() < widths.max() == 5
+    else:
+        assert not signal.any() and (got["Rule_ID"] == "").all() and (got["Signal_Reason"] == "").all()
@@ -0,0 +1,115 @@
+"""SharedIndicatorPlan tests: per-strategy views match IndicatorCalculator.calculate, shared work is counted."""
+from __future__ import annotations
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# signal_engine is imported as a top-level package, as when run from src/layer2_signals.
+_LAYER2_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _LAYER2_DIR not in sys.path:
+    sys.path.insert(0, _LAYER2_DIR)
+
+from signal_engine.indicators.calculator import IndicatorCalculator  # noqa: E402
+from signal_engine.indicators.shared_plan import SharedIndicatorPlan  # noqa: E402
+
+# Three strategies on one frame. EMA_50/EMA_FAST, ATR_14/ATR and the BB hband are
+# the same computations under different names and params spellings.
+STRATEGIES = {
+    "trend": [
+        {"instance_name": "EMA_50", "indicator_key": "EMA", "params": {"window": 50}},
+        {"instance_name": "ATR_14", "indicator_key": "ATR", "params": {}, "output_column": "atr"},
+        {"instance_name": "BB_20", "indicator_key": "BB", "params": {"window": 20},
+         "output_columns": ["hband", "lband"]},
+    ],
+    "momentum": [
+        {"instance_name": "EMA_FAST", "indicator_key": "EMA", "params": {"window": 50}},
+        {"instance_name": "ATR", "indicator_key": "ATR", "params": {"window": 14}, "output_column": "atr"},
+        {"instance_name": "RSI_14", "indicator_key": "RSI", "params": {}},
+    ],
+    "breakout": [
+        {"instance_name": "BB", "indicator_key": "BB", "params": {"window": 20, "window_dev": 2},
+         "output_columns": ["hband", "mavg"]},
+        {"instance_name": "EMA_200", "indicator_key": "EMA", "params": {"window": 200}},
+        {"instance_name": "ADX_14", "indicator_key": "ADX", "params": {}},
+        {"instance_name": "ATR_ALL", "indicator_key": "ATR", "params": {}},
+    ],
+}
+
+
+def _prices(n=400, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 1.10 + np.cumsum(rng.normal(0, 0.002, n))
+    spread = np.abs(rng.normal(0, 0.001, n))
+    return pd.DataFrame({
+        "Timestamp": pd.date_range("2024-01-01", periods=n, freq="h"),
+        "Open": close + rng.normal(0, 0.0005, n),
+        "High": close + spread,
+        "Low": close - spread,
+        "Close": close,
+        "Volume": rng.integers(100, 1000, n),
+    })
+
+
+def _calculator(configs):
+    calculator = IndicatorCalculator()
+    calculator.add_configs_from_json(configs)
+    return calculator
+
+
+@pytest.fixture
+def planned():
+    df = _prices()
+    plan = SharedIndicatorPlan()
+    calculators = {name: _calculator(configs) for name, configs in STRATEGIES.items()}
+    for calculator in calculators.values():
+        plan.add_calculator(calculator)
+    plan.calculate(df)
+    return df, plan, calculators
+
+
+def test_results_for_matches_per_strategy_calculate(planned):
+    df, plan, calculators = planned
+
+    for name, calculator in calculators.items():
+        expected = _calculator(STRATEGIES[name]).calculate(df)
+        got = plan.results_for(calculator)
+
+        assert list(got) == list(expected), name
+        for key in expected:
+            pd.testing.assert_series_equal(got[key], expected[key], check_names=False)
+
+
+def test_shared_computations_are_counted_once(planned):
+    _, plan, calculators = planned
+
+    # trend 4 + momentum 3 + breakout 6 (ATR_ALL asks for both ATR aliases)
+    assert plan.computations_requested == 13
+    # EMA(50) and BB(20, 2).hband are requested twice, ATR(14).atr three times.
+    assert plan.computations_performed == 9
+    assert plan.computations_saved == 4
+
+    trend, momentum, breakout = (plan.results_for(c) for c in calculators.values())
+    assert trend["EMA_50"] is momentum["EMA_FAST"]
+    assert trend["ATR_14"] is momentum["ATR"] is breakout["ATR_ALL.atr"]
+    assert trend["BB_20.hband"] is breakout["BB.hband"]
+
+
+def test_failed_indicator_only_fails_the_strategies_that_need_it(planned, monkeypatch):
+    df, plan, calculators = planned
+    create = plan.registry.create
+
+    def failing_rsi(key, *args, **kwargs):
+        if key == "RSI":
+            raise RuntimeError("rsi unavailable")
+        return create(key, *args, **kwargs)
+
+    monkeypatch.setattr(plan.registry, "create", failing_rsi)
+    plan.calculate(df)
+
+    with pytest.raises(RuntimeError, match="rsi unavailable"):
+        plan.results_for(calculators["momentum"])
+    assert set(plan.results_for(calculators["trend"])) == {"EMA_50", "ATR_14", "BB_20.hband", "BB_20.lband"}
@@ -0,0 +1,195 @@
+"""
+Layer 4.5: Batch price-history preload for the correlation gate.
+
+The live pipeline runs once per scheduled invocation. Instead of querying
+``fact_market_prices`` for the new asset and every open position on each
+signal, ``preload`` loads the last ``bars`` closes of every (Asset_ID,
+Granularity) pair the batch will need in one query (a ``LATERAL ... LIMIT``
+per pair).
+
+- ``history`` returns a pair's closes with the same contract as
+  ``fetch_price_history``.
+- ``correlation`` returns the pairwise return correlation, computed exactly as
+  ``evaluate_correlation_gate`` always has, memoised per pair for the run.
+
+A pair loaded more than ``max_age_seconds`` ago (or never loaded) is reported
+as not fresh; the gate then falls back to its direct database query, so the
+cache never changes a decision the uncached gate would have taken.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import sqlalchemy as sa
+
+logger = logging.getLogger("layer4")
+
+Key = Tuple[int, str]
+
+DEFAULT_HISTORY_BARS = 100
+MIN_CORRELATION_BARS = 20
+DEFAULT_MAX_AGE_SECONDS = float(os.getenv("LAYER4_CORRELATION_CACHE_MAX_AGE", "900"))
+
+
+def _key(asset_id: int, granularity: str) -> Key:
+    return int(asset_id), str(granularity)
+
+
+def pairwise_return_correlation(a: np.ndarray, b: np.ndarray) -> Optional[float]:
+    """
+    Pearson correlation of bar-to-bar returns over the common tail of two series.
+
+    Mirrors the gate's original calculation: both series are cut to the shorter
+    length, converted to percentage changes and passed to ``np.corrcoef``.
+
+    Returns:
+        The correlation, or None if fewer than 20 bars overlap or it is undefined
+    """
+    min_len = min(len(a), len(b))
+    if min_len < MIN_CORRELATION_BARS:
+        return None
+    a = a[-min_len:]
+    b = b[-min_len:]
+    correlation = np.corrcoef(a[1:] / a[:-1] - 1, b[1:] / b[:-1] - 1)[0, 1]
+    if np.isnan(correlation):
+        return None
+    return float(correlation)
+
+
+def read_latest_closes(engine: sa.engine.Engine, keys: List[Key], bars: int) -> pd.DataFrame:
+    """
+    Latest ``bars`` closes of each (Asset_ID, Granularity) pair in one query.
+
+    Returns:
+        DataFrame with asset_id, granularity, bar_timestamp, close_price in
+        ascending time order per pair
+    """
+    query = sa.text("""
+    SELECT k.asset_id, k.granularity, p.bar_timestamp, p.close_price
+    FROM unnest(CAST(:asset_ids AS integer[]), CAST(:granularities AS text[]))
+        AS k(asset_id, granularity)
+    CROSS JOIN LATERAL (
+        SELECT "timestamp" AS bar_timestamp, "Close" AS close_price
+        FROM fact_market_prices
+        WHERE Asset_ID = k.asset_id
+          AND Granularity = k.granularity
+        ORDER BY "timestamp" DESC
+        LIMIT :bars
+    ) p
+    ORDER BY k.asset_id, k.granularity, p.bar_timestamp
+    """)
+    return pd.read_sql(query, engine, params={
+        "asset_ids": [a for a, _ in keys],
+        "granularities": [g for _, g in keys],
+        "bars": int(bars),
+    })
+
+
+class CorrelationService:
+    """Price histories preloaded once per batch, with memoised pairwise correlations."""
+
+    def __init__(
+        self,
+        bars: int = DEFAULT_HISTORY_BARS,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+        clock=time.monotonic,
+    ):
+        self.bars = max(1, int(bars))
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._histories: Dict[Key, np.ndarray] = {}
+        self._loaded_at: Dict[Key, float] = {}
+        self._correlations: Dict[Tuple[Key, Key], Optional[float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def preload(self, engine: sa.engine.Engine, keys: Iterable[Tuple[int, str]]) -> None:
+        """
+        Load the latest ``bars`` closes of every pair in ``keys`` that is not fresh.
+
+        Database errors are logged and leave the affected pairs unloaded, so the
+        gate falls back to its direct query.
+        """
+        pending = [k for k in dict.fromkeys(_key(a, g) for a, g in keys) if not self.is_fresh(*k)]
+        if not pending:
+            return
+        try:
+            df = read_latest_closes(engine, pending, self.bars)
+        except Exception as e:
+            logger.warning(f"Correlation service: failed to load {len(pending)} price histories: {e}")
+            return
+
+        closes: Dict[Key, np.ndarray] = {}
+        if not df.empty:
+            values = df["close_price"].to_numpy(dtype=float)
+            for (asset_id, gran), idx in df.groupby(["asset_id", "granularity"], sort=False).indices.items():
+                closes[_key(asset_id, gran)] = values[idx]
+        now = self._clock()
+        with self._lock:
+            for key in pending:
+                history = closes.get(key, np.empty(0))
+                history.flags.writeable = False
+                self._histories[key] = history
+                self._loaded_at[key] = now
+            # Reloaded pairs may have new closes; drop every memoised value that used them.
+            reloaded = set(pending)
+            self._correlations = {
+                pair: value for pair, value in self._correlations.items()
+                if pair[0] not in reloaded and pair[1] not in reloaded
+            }
+
+    def is_fresh(self, asset_id: int, granularity: str) -> bool:
+        """True if the pair was loaded within ``max_age_seconds``."""
+        loaded_at = self._loaded_at.get(_key(asset_id, granularity))
+        if loaded_at is None:
+            return False
+        return self._clock() - loaded_at <= self.max_age_seconds
+
+    def history(self, asset_id: int, granularity: str) -> Optional[np.ndarray]:
+        """
+        Preloaded closes in ascending time order (read-only).
+
+        Same contract as ``fetch_price_history``: None when fewer than 80% of
+        ``bars`` closes exist. Callers should check ``is_fresh`` first.
+        """
+        history = self._histories.get(_key(asset_id, granularity))
+        if history is None or len(history) < self.bars * 0.8:
+            return None
+        return history
+
+    def correlation(self, a: Key, b: Key) -> Optional[float]:
+        """
+        Return correlation between two preloaded pairs, memoised for the run.
+
+        Returns None when either pair lacks history or the overlap is too short,
+        matching the pairs the gate skips.
+        """
+        # Keyed by ordered pair: np.corrcoef is only symmetric up to rounding,
+        # and the gate always asks for (new signal, open position).
+        pair = (_key(*a), _key(*b))
+        with self._lock:
+            if pair in self._correlations:
+                self.hits += 1
+                return self._correlations[pair]
+            self.misses += 1
+            hist_a, hist_b = self.history(*pair[0]), self.history(*pair[1])
+            value = None
+            if hist_a is not None and hist_b is not None:
+                value = pairwise_return_correlation(hist_a, hist_b)
+            self._correlations[pair] = value
+            return value
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "pairs": len(self._histories),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -58,40 +58,26 @@ from dotenv import load_dotenv
 from email.mime.text import MIMEText
 from oandapyV20 import API
 from oandapyV20.endpoints.instruments import InstrumentsCandles
+from oandapyV20.endpoints.pricing import PricingInfo
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 from src.layer7.oanda_executor import execute_trade
+from src.layer4_executor.correlation_service import (
+    CorrelationService,
+    pairwise_return_correlation,
+)
 from src.common.db import get_engine
 
-# Import feature engineering from Layer 3 training
+# Import inference-side feature alignment from Layer 3
 # Add 'src' directory to path for proper module imports
 sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
-try:
-    # Try new import structure (preferred)
-    from layer3_ml import (
-        align_features_for_inference,
-        safe_comprehensive_feature_engineering,
-        prepare_inference_dataframe,
-        validate_inference_data,
-        SUPPORTED_GATEKEEPER_GRANULARITIES,
-    )
-except ImportError as e:
-    logging.getLogger("layer4").warning(
-        f"Layer 3 import failed: {e}, trying fallback..."
-    )
-    # Fallback: add layer3_ml directly and import from there
-    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src" / "layer3_ml"))
-    from train_ml_gatekeeper import (
-        comprehensive_feature_engineering,
-        SUPPORTED_GATEKEEPER_GRANULARITIES,
-    )
-    from feature_alignment import (
-        align_features_for_inference,
-        safe_comprehensive_feature_engineering,
-        prepare_inference_dataframe,
-        validate_inference_data,
-    )
+from layer3_ml import (
+    align_features_for_inference,
+    safe_comprehensive_feature_engineering,
+    prepare_inference_dataframe,
+    validate_inference_data,
+)
 
 
 # =============================================================================
@@ -118,7 +104,10 @@ LAYER3_LEGACY_PREPROCESSOR_PATH = (
     LAYER3_MODELS_DIR / "best_ml_gatekeeper_preprocessor.pkl"
 )
 
-# Supported granularities (must match Layer 3 training contract)
+# Supported granularities (must match Layer 3 training contract,
+# src/layer3_ml/training/train_ml_gatekeeper.py; FIX-S1-009 retired the root
+# trainer this used to be imported from)
+SUPPORTED_GATEKEEPER_GRANULARITIES = ["H1", "H4"]
 DEFAULT_GRANULARITY = "H1"
 
 # Risk Parameters
@@ -270,6 +259,14 @@ class ExecutionResult:
     execution_metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class BatchPrefetch:
+    """Model scores and market data gathered once per signal batch."""
+
+    scores: Dict[Any, Tuple[TradeDecision, float]] = field(default_factory=dict)
+    live_prices: Dict[str, Optional[pd.DataFrame]] = field(default_factory=dict)
+
+
 # =============================================================================
 # LOGGING SETUP
 # =============================================================================
@@ -983,6 +980,70 @@ def fetch_live_price(
         return None
 
 
+def fetch_live_prices(
+    symbols: List[str], granularity: str = "H1", count: int = 50
+) -> Dict[str, Optional[pd.DataFrame]]:
+    """
+    Fetch current prices for several instruments in one OANDA pricing request.
+
+    Each instrument maps to a one-row frame with the bid/ask mid as ``Close``
+    (the same field ``compute_atr_risk_parameters`` reads from candles). If the
+    pricing request is unavailable or fails, each distinct instrument falls back
+    to ``fetch_live_price`` once.
+
+    Args:
+        symbols: Instruments to price (duplicates are ignored)
+        granularity: Candle granularity for the per-instrument fallback
+        count: Candle count for the per-instrument fallback
+
+    Returns:
+        Mapping of symbol to price frame (None when no price is available)
+    """
+    unique_symbols = list(dict.fromkeys(symbols))
+    if not unique_symbols:
+        return {}
+
+    api_key = os.getenv("OANDA_API_KEY")
+    env = os.getenv("OANDA_ENV", "practice")
+    account_id = os.getenv("OANDA_ACCOUNT_ID_DEMO") or os.getenv("OANDA_ACCOUNT_ID")
+
+    prices: Dict[str, Optional[pd.DataFrame]] = {}
+    if api_key and account_id:
+        try:
+            api = API(access_token=api_key, environment=env)
+            r = PricingInfo(
+                accountID=account_id,
+                params={"instruments": ",".join(unique_symbols)},
+            )
+            response = api.request(r)
+            for p in response.get("prices", []):
+                try:
+                    bid = float((p.get("bids") or [{}])[0].get("price", p.get("closeoutBid")))
+                    ask = float((p.get("asks") or [{}])[0].get("price", p.get("closeoutAsk")))
+                except (TypeError, ValueError):
+                    continue  # priced individually below
+                prices[p["instrument"]] = pd.DataFrame(
+                    [
+                        {
+                            "Timestamp": pd.to_datetime(p.get("time")),
+                            "Bid": bid,
+                            "Ask": ask,
+                            "Close": (bid + ask) / 2,
+                        }
+                    ]
+                )
+        except Exception as e:
+            logger.warning(
+                f"Batch pricing request failed for {len(unique_symbols)} instruments: {e}"
+            )
+
+    for symbol in unique_symbols:
+        if symbol not in prices:
+            prices[symbol] = fetch_live_price(symbol, granularity, count)
+
+    return prices
+
+
 def compute_atr_risk_parameters(
     signal: SignalContext,
     regime: RegimeContext,
@@ -1091,6 +1152,7 @@ def evaluate_correlation_gate(
     signal: SignalContext,
     open_positions: List[Dict[str, Any]],
     correlation_threshold: float = CORRELATION_THRESHOLD,
+    correlation_service: Optional[CorrelationService] = None,
 ) -> CorrelationResult:
     """
     Evaluate portfolio exposure and correlation constraints.
@@ -1100,10 +1162,16 @@ def evaluate_correlation_gate(
         signal: New signal being evaluated
         open_positions: List of currently open positions
         correlation_threshold: Maximum allowed correlation
+        correlation_service: Optional in-process price history cache; pairs it
+            does not hold fresh data for are queried from the database
 
     Returns:
         CorrelationResult with pass/fail and details
     """
+
+    def cached(key: Tuple[int, str]) -> bool:
+        return correlation_service is not None and correlation_service.is_fresh(*key)
+
     # Check exposure limit
     total_exposure = len(open_positions)
     if total_exposure >= MAX_TOTAL_EXPOSURE_PCT * 10:
@@ -1126,7 +1194,11 @@ def evaluate_correlation_gate(
     correlated_assets = []
     max_correlation = 0.0
 
-    new_asset_prices = fetch_price_history(engine, signal.asset_id, signal.granularity)
+    new_key = (signal.asset_id, signal.granularity)
+    if cached(new_key):
+        new_asset_prices = correlation_service.history(*new_key)
+    else:
+        new_asset_prices = fetch_price_history(engine, *new_key)
     if new_asset_prices is None:
         logger.warning(
             f"Cannot calculate correlation: no price history for Asset_ID={signal.asset_id}"
@@ -1138,24 +1210,25 @@ def evaluate_correlation_gate(
         )
 
     for position in open_positions:
-        existing_prices = fetch_price_history(
-            engine,
+        position_key = (
             position["asset_id"],
             position.get("granularity", signal.granularity),
         )
-        if existing_prices is None:
-            continue
-
-        min_len = min(len(new_asset_prices), len(existing_prices))
-        if min_len < 20:
-            continue
-
-        correlation = np.corrcoef(
-            new_asset_prices.iloc[-min_len:].pct_change().dropna(),
-            existing_prices.iloc[-min_len:].pct_change().dropna(),
-        )[0, 1]
+        if cached(new_key) and cached(position_key):
+            correlation = correlation_service.correlation(new_key, position_key)
+        else:
+            if cached(position_key):
+                existing_prices = correlation_service.history(*position_key)
+            else:
+                existing_prices = fetch_price_history(engine, *position_key)
+            if existing_prices is None:
+                continue
+            correlation = pairwise_return_correlation(
+                np.asarray(new_asset_prices, dtype=float),
+                np.asarray(existing_prices, dtype=float),
+            )
 
-        if not np.isnan(correlation):
+        if correlation is not None:
             max_correlation = max(max_correlation, abs(correlation))
             if abs(correlation) > correlation_threshold:
                 correlated_assets.append(position["symbol"])
@@ -1306,6 +1379,73 @@ def run_ml_gatekeeper(
         return TradeDecision.ERROR, 0.0
 
 
+def run_ml_gatekeeper_batch(
+    artifact: ModelArtifact, signals_df: pd.DataFrame
+) -> Dict[Any, Tuple[TradeDecision, float]]:
+    """
+    Score a batch of signals with one transform and one predict call.
+
+    Feature engineering stays per signal: the derived columns (regime/session
+    dummies, EMA spreads) depend on which values are present in the frame, so
+    engineering the whole batch at once would change the model inputs. The
+    aligned rows are then stacked and scored together, which gives the same
+    decision per signal as ``run_ml_gatekeeper``.
+
+    Args:
+        artifact: Loaded model artifact
+        signals_df: Signal rows with all available features
+
+    Returns:
+        Mapping of signal row label to (decision, confidence_score)
+    """
+    results: Dict[Any, Tuple[TradeDecision, float]] = {}
+    labels: List[Any] = []
+    frames: List[pd.DataFrame] = []
+
+    for label, signal_row in signals_df.iterrows():
+        granularity = signal_row.get("Granularity", "H1")
+        if (
+            artifact.supported_granularities
+            and granularity not in artifact.supported_granularities
+        ):
+            logger.warning(
+                f"Granularity {granularity} not supported by model. "
+                f"Supported: {artifact.supported_granularities}"
+            )
+            results[label] = (TradeDecision.ERROR, 0.0)
+            continue
+        try:
+            frames.append(prepare_features_for_inference(signal_row, artifact))
+            labels.append(label)
+        except Exception as e:
+            logger.error(f"Feature preparation failed for signal {label}: {e}")
+            results[label] = (TradeDecision.ERROR, 0.0)
+
+    if not frames:
+        return results
+
+    try:
+        features_df = pd.concat(frames, ignore_index=True)
+        features = artifact.preprocessor.transform(features_df)
+
+        if hasattr(artifact.model, "predict_proba"):
+            probs = np.asarray(artifact.model.predict_proba(features))[:, 1]
+        else:
+            probs = np.asarray(artifact.model.predict(features), dtype=float).reshape(-1)
+
+        for label, prob in zip(labels, probs):
+            if prob >= artifact.threshold:
+                results[label] = (TradeDecision.APPROVED, prob)
+            else:
+                results[label] = (TradeDecision.VETOED_MODEL, prob)
+    except Exception as e:
+        logger.warning(f"Batch scoring failed ({e}); scoring signals individually")
+        for label in labels:
+            results[label] = run_ml_gatekeeper(artifact, signals_df.loc[label])
+
+    return results
+
+
 # =============================================================================
 # STAGE 7: BROKER EXECUTION
 # =============================================================================
@@ -1519,11 +1659,14 @@ class ExecutionPipeline:
         model_artifact: ModelArtifact,
         dry_run: bool = False,
         skip_correlation: bool = False,
+        batch_scoring: bool = True,
     ):
         self.engine = engine
         self.model_artifact = model_artifact
         self.dry_run = dry_run
         self.skip_correlation = skip_correlation
+        self.batch_scoring = batch_scoring
+        self.correlation_service = CorrelationService(bars=CORRELATION_LOOKBACK_BARS)
         self.open_positions: List[Dict[str, Any]] = []
         self.symbol_map: Dict[int, str] = {}
 
@@ -1546,9 +1689,70 @@ class ExecutionPipeline:
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
         return f"T{signal_row['Asset_ID']}_{signal_row['Strategy_ID']}_{timestamp}"
 
-    def process_signal(self, signal_row: pd.Series) -> ExecutionResult:
+    def prefetch_batch(self, signals_df: pd.DataFrame) -> BatchPrefetch:
+        """
+        Score all signals and fetch their market data up front.
+
+        Decisions are still taken signal by signal in ``process_signal`` (the
+        correlation gate depends on positions opened earlier in the batch);
+        this only replaces the per-signal model calls, price requests and
+        history queries with one of each.
+        """
+        started = datetime.now()
+        prefetch = BatchPrefetch()
+
+        regimes = signals_df.get("Regime_Label", pd.Series("UNKNOWN", index=signals_df.index))
+        has_regime = regimes.notna() & (regimes != "UNKNOWN")
+        scoreable = signals_df[has_regime]
+        if scoreable.empty:
+            return prefetch
+
+        prefetch.scores = run_ml_gatekeeper_batch(self.model_artifact, scoreable)
+        approved_labels = [
+            label
+            for label, (decision, _) in prefetch.scores.items()
+            if decision == TradeDecision.APPROVED
+        ]
+        approved = scoreable.loc[approved_labels]
+
+        if not approved.empty:
+            # Live prices are only needed for the signals that reach risk sizing.
+            for gran, group in approved.groupby("Granularity"):
+                prefetch.live_prices.update(
+                    fetch_live_prices(group["Symbol"].tolist(), gran)
+                )
+
+            if not self.skip_correlation:
+                # Positions opened during the batch are approved signals, so
+                # their histories are already covered by the approved keys.
+                keys = list(zip(approved["Asset_ID"], approved["Granularity"]))
+                for position in self.open_positions:
+                    grans = (
+                        [position["granularity"]]
+                        if "granularity" in position
+                        else approved["Granularity"].unique()
+                    )
+                    keys += [(position["asset_id"], gran) for gran in grans]
+                self.correlation_service.preload(self.engine, keys)
+
+        elapsed = (datetime.now() - started).total_seconds()
+        logger.info(
+            f"Batch prefetch: scored {len(prefetch.scores)} signals, "
+            f"{len(approved)} approved, {len(prefetch.live_prices)} live prices, "
+            f"{self.correlation_service.stats()['pairs']} cached price histories in {elapsed:.2f}s"
+        )
+        return prefetch
+
+    def process_signal(
+        self, signal_row: pd.Series, prefetch: Optional[BatchPrefetch] = None
+    ) -> ExecutionResult:
         """
         Process a single signal through the full execution pipeline.
+
+        Args:
+            signal_row: Signal data row with all available features
+            prefetch: Optional batch scores and market data from
+                ``prefetch_batch``; anything missing is computed for this signal
         """
         trade_id = self.generate_trade_id(signal_row)
 
@@ -1589,7 +1793,10 @@ class ExecutionPipeline:
 
         # Stage 2: ML Gatekeeper with full features
         logger.info("Stage 2: Running ML gatekeeper with full features...")
-        model_decision, confidence = run_ml_gatekeeper(self.model_artifact, signal_row)
+        if prefetch is not None and signal_row.name in prefetch.scores:
+            model_decision, confidence = prefetch.scores[signal_row.name]
+        else:
+            model_decision, confidence = run_ml_gatekeeper(self.model_artifact, signal_row)
 
         logger.info(
             f"  Decision: {model_decision.value} | Confidence: {confidence:.3f} | Threshold: {self.model_artifact.threshold:.3f}"
@@ -1640,7 +1847,10 @@ class ExecutionPipeline:
             adx_value=signal_row.get("ADX_Value", 0),
         )
 
-        live_price = fetch_live_price(signal.symbol, signal.granularity)
+        if prefetch is not None and signal.symbol in prefetch.live_prices:
+            live_price = prefetch.live_prices[signal.symbol]
+        else:
+            live_price = fetch_live_price(signal.symbol, signal.granularity)
         risk = compute_atr_risk_parameters(signal, regime, live_price)
 
         if risk is None:
@@ -1673,7 +1883,10 @@ class ExecutionPipeline:
         if not self.skip_correlation:
             logger.info("Stage 4: Evaluating correlation gate...")
             correlation_result = evaluate_correlation_gate(
-                self.engine, signal, self.open_positions
+                self.engine,
+                signal,
+                self.open_positions,
+                correlation_service=self.correlation_service,
             )
             logger.info(
                 f"  Passed: {correlation_result.passed} | Score: {correlation_result.correlation_score}"
@@ -1841,11 +2054,20 @@ class ExecutionPipeline:
             logger.info("Veto/Skip by asset: none (no signals loaded in current window)")
             return []
 
+        # Score the batch and fetch its market data once; decisions stay sequential
+        signals_df = signals_df.reset_index(drop=True)
+        prefetch = None
+        if self.batch_scoring:
+            try:
+                prefetch = self.prefetch_batch(signals_df)
+            except Exception as e:
+                logger.warning(f"Batch prefetch failed ({e}); processing signals individually")
+
         # Process each signal
         results = []
         for _, signal_row in signals_df.iterrows():
             try:
-                result = self.process_signal(signal_row)
+                result = self.process_signal(signal_row, prefetch)
                 results.append(result)
             except Exception as e:
                 logger.exception(f"Failed to process signal: {e}")
@@ -1854,14 +2076,26 @@ class ExecutionPipeline:
         # Summary
         approved = sum(1 for r in results if r.model_decision == TradeDecision.APPROVED)
         executed = sum(1 for r in results if r.broker_order_id is not None)
+        veto_by_asset = Counter(r.symbol for r in results if r.broker_order_id is None)
 
         logger.info(f"\n{'='*80}")
         logger.info(f"Pipeline Complete")
         logger.info(f"Total signals: {len(results)}")
         logger.info(f"ML approved: {approved}")
         logger.info(f"Executed: {executed}")
+        if not self.skip_correlation:
+            cache_stats = self.correlation_service.stats()
+            logger.info(
+                f"Correlation cache: {cache_stats['pairs']} pairs, "
+                f"hit rate {cache_stats['hit_rate']:.0%}"
+            )
         if not veto_by_asset:
             logger.info("Veto/Skip by asset: none")
+        else:
+            logger.info(
+                "Veto/Skip by asset: "
+                + ", ".join(f"{sym}={n}" for sym, n in veto_by_asset.most_common())
+            )
         logger.info(f"{'='*80}\n")
 
         return results
@@ -1883,6 +2117,7 @@ Examples:
   %(prog)s --dry-run                          # Simulate without executing
   %(prog)s --granularity H4                   # Process H4 signals only
   %(prog)s --skip-correlation-check           # Skip correlation gate
+  %(prog)s --no-batch-scoring                 # Score/price signals one at a time
   %(prog)s --model-manifest models/custom_manifest.json
     %(prog)s --enable-threshold-override --threshold-override 0.20
   %(prog)s --all-signals                      # Process all signals in database
@@ -1911,6 +2146,12 @@ Examples:
         help="Skip correlation/exposure gate",
     )
 
+    parser.add_argument(
+        "--no-batch-scoring",
+        action="store_true",
+        help="Score and price each signal individually instead of once per batch",
+    )
+
     parser.add_argument(
         "--model-manifest",
         type=str,
@@ -1989,6 +2230,7 @@ def main() -> int:
             model_artifact=model_artifact,
             dry_run=args.dry_run,
             skip_correlation=args.skip_correlation_check,
+            batch_scoring=not args.no_batch_scoring,
         )
 
         results = pipeline.run(
@@ -0,0 +1,180 @@
+"""Unit tests for the Layer 4.5 correlation preload (fake price reader and clock, no DB)."""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.layer4_executor import correlation_service as cs
+
+BARS = 50
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakePrices:
+    """Stands in for ``read_latest_closes``: serves closes per pair and records each query."""
+
+    def __init__(self, closes):
+        self.closes = closes
+        self.queries = []
+        self.fail = False
+
+    def __call__(self, engine, keys, bars):
+        self.queries.append(list(keys))
+        if self.fail:
+            raise RuntimeError("connection refused")
+        rows = [
+            (a, g, pd.Timestamp("2024-01-01") + pd.Timedelta(hours=i), c)
+            for a, g in keys
+            for i, c in enumerate(self.closes.get((a, g), [])[-bars:])
+        ]
+        return pd.DataFrame(rows, columns=["asset_id", "granularity", "bar_timestamp", "close_price"])
+
+
+def _walk(seed, n=80):
+    rng = np.random.default_rng(seed)
+    return list(1.1 * np.exp(np.cumsum(rng.normal(0, 1e-3, n))))
+
+
+@pytest.fixture
+def prices(monkeypatch):
+    fake = FakePrices({
+        (1, "H1"): _walk(1),
+        (2, "H1"): _walk(2),
+        (3, "H1"): _walk(3, n=30),  # below the 80% coverage rule
+        (1, "H4"): _walk(4),
+    })
+    monkeypatch.setattr(cs, "read_latest_closes", fake)
+    return fake
+
+
+def test_preload_queries_only_pairs_that_are_not_fresh(prices):
+    clock = FakeClock()
+    service = cs.CorrelationService(bars=BARS, max_age_seconds=60, clock=clock)
+
+    service.preload(None, [(1, "H1"), (2, "H1"), (1, "H1"), (np.int64(2), "H1")])
+    service.preload(None, [(1, "H1"), (2, "H1"), (1, "H4")])
+    clock.now += 61
+    service.preload(None, [(1, "H4")])
+
+    assert prices.queries == [[(1, "H1"), (2, "H1")], [(1, "H4")], [(1, "H4")]]
+    assert np.array_equal(service.history(1, "H1"), prices.closes[(1, "H1")][-BARS:])
+    assert service.stats()["pairs"] == 3
+
+
+def test_history_contract_matches_fetch_price_history(prices):
+    service = cs.CorrelationService(bars=BARS)
+    service.preload(None, [(1, "H1"), (3, "H1"), (7, "H1")])
+
+    history = service.history(1, "H1")
+    assert len(history) == BARS and not history.flags.writeable
+    assert service.history(3, "H1") is None  # 30 of 50 bars < 80%
+    # A pair with no rows is loaded (fresh) but has no history, like an empty query.
+    assert service.is_fresh(7, "H1") and service.history(7, "H1") is None
+    assert not service.is_fresh(8, "H1") and service.history(8, "H1") is None
+
+
+def test_is_fresh_expires_after_max_age(prices):
+    clock = FakeClock()
+    service = cs.CorrelationService(bars=BARS, max_age_seconds=900, clock=clock)
+    assert not service.is_fresh(1, "H1")
+
+    service.preload(None, [(1, "H1")])
+    assert service.is_fresh(1, "H1")
+    clock.now += 900
+    assert service.is_fresh(1, "H1")
+    clock.now += 1
+    assert not service.is_fresh(1, "H1")
+
+
+def test_failed_load_leaves_pairs_unloaded(prices):
+    prices.fail = True
+    service = cs.CorrelationService(bars=BARS)
+    service.preload(None, [(1, "H1"), (2, "H1")])
+
+    assert not service.is_fresh(1, "H1") and service.history(1, "H1") is None
+    assert service.stats()["pairs"] == 0
+
+
+def test_correlation_matches_pairwise_return_correlation(prices):
+    clock = FakeClock()
+    service = cs.CorrelationService(bars=BARS, max_age_seconds=60, clock=clock)
+    service.preload(None, [(1, "H1"), (2, "H1"), (3, "H1"), (1, "H4")])
+
+    for a, b in [((1, "H1"), (2, "H1")), ((2, "H1"), (1, "H1")), ((1, "H1"), (1, "H4"))]:
+        expected = cs.pairwise_return_correlation(
+            np.asarray(prices.closes[a][-BARS:]), np.asarray(prices.closes[b][-BARS:])
+        )
+        assert service.correlation(a, b) == expected  # bit for bit, ordered pair
+    assert service.correlation((1, "H1"), (3, "H1")) is None  # insufficient history
+    assert service.correlation((1, "H1"), (9, "H1")) is None  # never loaded
+
+    assert service.correlation((1, "H1"), (2, "H1")) is not None
+    assert service.stats()["hits"] == 1
+
+    # Reloading a stale pair drops the memoised values that used it.
+    prices.closes[(2, "H1")] = _walk(5)
+    clock.now += 61
+    service.preload(None, [(2, "H1")])
+    assert service.correlation((1, "H1"), (2, "H1")) == cs.pairwise_return_correlation(
+        np.asarray(prices.closes[(1, "H1")][-BARS:]), np.asarray(prices.closes[(2, "H1")][-BARS:])
+    )
+
+
+def test_pairwise_return_correlation_needs_overlap():
+    a = np.asarray(_walk(1))
+    assert cs.pairwise_return_correlation(a[:19], a[:19]) is None
+    assert cs.pairwise_return_correlation(a, a) == pytest.approx(1.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        assert cs.pairwise_return_correlation(np.ones(30), a) is None  # flat series: undefined
+
+
+def test_read_latest_closes_sends_one_lateral_query_per_batch(monkeypatch):
+    calls = []
+    monkeypatch.setattr(cs.pd, "read_sql", lambda query, engine, params: calls.append((str(query), params)))
+
+    cs.read_latest_closes("engine", [(1, "H1"), (2, "H4")], BARS)
+
+    (sql, params), = calls
+    assert "CROSS JOIN LATERAL" in sql and "LIMIT :bars" in sql and "ROW_NUMBER" not in sql
+    # Keys are zipped into parallel arrays, so only the requested pairs are read.
+    assert params == {"asset_ids": [1, 2], "granularities": ["H1", "H4"], "bars": BARS}
+
+
+def test_stale_cache_falls_back_to_the_uncached_gate(prices, monkeypatch):
+    pytest.importorskip("oandapyV20")
+    from src.layer4_executor import live_pipeline as lp
+
+    queried = []
+
+    def fetch_price_history(engine, asset_id, granularity, bars=lp.CORRELATION_LOOKBACK_BARS):
+        queried.append((asset_id, granularity))
+        return None  # e.g. the table has no history yet
+
+    monkeypatch.setattr(lp, "fetch_price_history", fetch_price_history)
+    clock = FakeClock()
+    service = cs.CorrelationService(bars=BARS, max_age_seconds=60, clock=clock)
+    service.preload(None, [(1, "H1"), (2, "H1")])
+    signal = lp.SignalContext(
+        timestamp=pd.Timestamp("2024-01-03"), asset_id=1, strategy_id=7,
+        granularity="H1", signal_value=1, symbol="EUR_USD",
+    )
+    positions = [{"asset_id": 2, "symbol": "GBP_USD", "granularity": "H1"}]
+
+    fresh = lp.evaluate_correlation_gate(None, signal, positions, correlation_service=service)
+    assert queried == [] and fresh.correlation_score is not None
+
+    clock.now += 61
+    stale = lp.evaluate_correlation_gate(None, signal, positions, correlation_service=service)
+    uncached = lp.evaluate_correlation_gate(None, signal, positions)
+    assert queried == [(1, "H1"), (1, "H1")]
+    # Stale closes are never used: the gate takes the default-safe pass of the uncached path.
+    assert stale == uncached
+    assert stale.passed and stale.correlation_score is None
@@ -0,0 +1,210 @@
+"""Unit tests for Layer 4 batch scoring and prefetch (stub model / fake OANDA, no DB / no network)."""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+
+pytest.importorskip("oandapyV20")
+
+from src.layer4_executor import live_pipeline as lp  # noqa: E402
+
+FEATURES = ["Signal_Confidence", "ATR_Value", "ADX_Value"]
+WEIGHTS = np.array([4.0, 200.0, -0.05])
+
+
+class StubPreprocessor:
+    """Selects the aligned feature columns as floats; counts transform calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def transform(self, df):
+        self.calls += 1
+        return df[FEATURES].astype(float).fillna(0.0).to_numpy()
+
+
+def _score(X):
+    return 1.0 / (1.0 + np.exp(-(np.asarray(X) @ WEIGHTS)))
+
+
+class StubModel:
+    """Logistic score of a fixed linear combination; counts predict calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def predict_proba(self, X):
+        self.calls += 1
+        p = _score(X)
+        return np.column_stack([1.0 - p, p])
+
+
+class StubRegressor:
+    """Model without predict_proba: ``predict`` returns the positive-class score."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def predict(self, X):
+        self.calls += 1
+        return _score(X)
+
+
+def _artifact(model=None):
+    return lp.ModelArtifact(
+        model=model or StubModel(),
+        preprocessor=StubPreprocessor(),
+        threshold=0.5,
+        model_type="stub",
+        feature_columns=FEATURES,
+        run_id="test",
+        training_timestamp="2024-01-01T00:00:00",
+        supported_granularities=["H1", "H4"],
+        artifact_hash="0" * 64,
+    )
+
+
+def _signals(n=12, seed=0):
+    rng = np.random.default_rng(seed)
+    symbols = ["EUR_USD", "USD_JPY", "GBP_USD", "AUD_USD"]
+    return pd.DataFrame({
+        "Timestamp": pd.date_range("2024-03-04", periods=n, freq="h"),
+        "Asset_ID": [1 + i % 4 for i in range(n)],
+        "Symbol": [symbols[i % 4] for i in range(n)],
+        "Strategy_ID": 7,
+        "Granularity": ["D1" if i == 3 else "H1" for i in range(n)],
+        "Signal_Value": [1 if i % 2 else -1 for i in range(n)],
+        "Regime_Label": "Ranging",
+        "Confidence_Score": rng.uniform(0.2, 0.9, n),
+        "ATR_Value": rng.uniform(0.0005, 0.004, n),
+        "ADX_Value": rng.uniform(10, 40, n),
+    }, index=pd.RangeIndex(100, 100 + n))
+
+
+@pytest.mark.parametrize("model_cls", [StubModel, StubRegressor])
+def test_batch_scoring_matches_per_row_gatekeeper(model_cls):
+    signals = _signals()
+    batch_artifact = _artifact(model_cls())
+    batch = lp.run_ml_gatekeeper_batch(batch_artifact, signals)
+
+    row_artifact = _artifact(model_cls())
+    per_row = {label: lp.run_ml_gatekeeper(row_artifact, row) for label, row in signals.iterrows()}
+
+    assert set(batch) == set(per_row) == set(signals.index)
+    for label, (decision, prob) in per_row.items():
+        assert batch[label][0] == decision
+        assert batch[label][1] == pytest.approx(prob, rel=1e-12, abs=1e-15)
+    assert batch[103] == (lp.TradeDecision.ERROR, 0.0)  # D1 is not a gatekeeper granularity
+    decisions = {d for d, _ in batch.values()}
+    assert {lp.TradeDecision.APPROVED, lp.TradeDecision.VETOED_MODEL} <= decisions
+    # One transform and one predict for the whole batch, against one per row.
+    assert batch_artifact.preprocessor.calls == batch_artifact.model.calls == 1
+    assert row_artifact.preprocessor.calls == len(signals) - 1
+
+
+class FakeAPI:
+    requests = []
+
+    def __init__(self, access_token, environment):
+        self.environment = environment
+
+    def request(self, endpoint):
+        FakeAPI.requests.append(endpoint)
+        return {"prices": [
+            {"instrument": "EUR_USD", "time": "2024-03-04T10:00:00Z",
+             "bids": [{"price": "1.0850"}], "asks": [{"price": "1.0852"}]},
+            {"instrument": "USD_JPY", "time": "2024-03-04T10:00:01Z",
+             "closeoutBid": "150.10", "closeoutAsk": "150.14"},
+            {"instrument": "GBP_USD", "time": "2024-03-04T10:00:02Z", "bids": [], "asks": []},
+        ]}
+
+
+class FakePricingInfo:
+    def __init__(self, accountID, params):
+        self.accountID = accountID
+        self.params = params
+
+
+def test_fetch_live_prices_makes_one_pricing_request(monkeypatch):
+    FakeAPI.requests = []
+    fallback = []
+    monkeypatch.setenv("OANDA_API_KEY", "token")
+    monkeypatch.setenv("OANDA_ACCOUNT_ID_DEMO", "101-001")
+    monkeypatch.setattr(lp, "API", FakeAPI)
+    monkeypatch.setattr(lp, "PricingInfo", FakePricingInfo)
+    monkeypatch.setattr(
+        lp, "fetch_live_price",
+        lambda symbol, granularity="H1", count=50: fallback.append(symbol) or pd.DataFrame({"Close": [1.27]}),
+    )
+
+    prices = lp.fetch_live_prices(["EUR_USD", "USD_JPY", "EUR_USD", "GBP_USD"], "H1")
+
+    assert len(FakeAPI.requests) == 1
+    request = FakeAPI.requests[0]
+    assert request.accountID == "101-001"
+    assert request.params == {"instruments": "EUR_USD,USD_JPY,GBP_USD"}
+    assert list(prices) == ["EUR_USD", "USD_JPY", "GBP_USD"]
+    assert prices["EUR_USD"]["Close"].iloc[-1] == pytest.approx(1.0851)
+    assert prices["USD_JPY"][["Bid", "Ask"]].iloc[0].tolist() == [150.10, 150.14]
+    assert prices["USD_JPY"]["Close"].iloc[-1] == pytest.approx(150.12)
+    # An instrument the pricing response cannot price is fetched on its own.
+    assert fallback == ["GBP_USD"]
+    assert prices["GBP_USD"]["Close"].iloc[-1] == 1.27
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    for name in ("write_pre_execution_log", "update_post_execution_log", "log_skipped_trade", "send_email"):
+        monkeypatch.setattr(lp, name, lambda *a, **k: None)
+    monkeypatch.setattr(lp, "MAX_TOTAL_EXPOSURE_PCT", 1.0)  # room for every test signal
+    # The cache's PostgreSQL queries fail on SQLite, so it holds no history.
+    pipe = lp.ExecutionPipeline(sa.create_engine("sqlite://"), _artifact(), dry_run=True)
+    pipe.open_positions = [{"trade_id": "T0", "asset_id": 9, "symbol": "NZD_USD", "granularity": "H1"}]
+    return pipe
+
+
+def test_process_signal_falls_back_per_signal_for_missing_prefetch(pipeline, monkeypatch):
+    signals = _signals(4)
+    signals["Confidence_Score"] = 0.9  # every H1 signal is approved
+    signals.loc[103, "Granularity"] = "H1"
+    batch_prices, single_prices, histories = [], [], []
+    monkeypatch.setattr(
+        lp, "fetch_live_prices",
+        lambda symbols, gran: batch_prices.append(list(symbols)) or {
+            s: pd.DataFrame({"Close": [1.1]}) for s in symbols if s != "USD_JPY"
+        },
+    )
+    monkeypatch.setattr(
+        lp, "fetch_live_price",
+        lambda symbol, granularity="H1", count=50: single_prices.append(symbol) or pd.DataFrame({"Close": [150.0]}),
+    )
+    monkeypatch.setattr(
+        lp, "fetch_price_history",
+        lambda engine, asset_id, granularity, bars=lp.CORRELATION_LOOKBACK_BARS:
+            histories.append((asset_id, granularity)) or None,
+    )
+    run_ml_gatekeeper = lp.run_ml_gatekeeper
+    per_signal_scores = []
+    monkeypatch.setattr(
+        lp, "run_ml_gatekeeper",
+        lambda artifact, row: per_signal_scores.append(row.name) or run_ml_gatekeeper(artifact, row),
+    )
+
+    prefetch = pipeline.prefetch_batch(signals.iloc[:3])
+    assert batch_prices == [["EUR_USD", "USD_JPY", "GBP_USD"]]
+    assert set(prefetch.scores) == {100, 101, 102}
+    assert "USD_JPY" not in prefetch.live_prices
+    assert not any(pipeline.correlation_service.is_fresh(a, "H1") for a in (1, 2, 3, 9))
+
+    results = [pipeline.process_signal(row, prefetch) for _, row in signals.iterrows()]
+
+    assert all(r.model_decision == lp.TradeDecision.APPROVED for r in results)
+    # Only the signal without a prefetched score is scored again ...
+    assert per_signal_scores == [103]
+    # ... only instruments the batch did not price are fetched on their own ...
+    assert single_prices == ["USD_JPY", "AUD_USD"]
+    assert results[1].entry_price == 150.0
+    # ... and histories the cache does not hold are queried per signal.
+    assert histories == [(1, "H1"), (2, "H1"), (3, "H1"), (4, "H1")]
@@ -437,6 +437,7 @@ def calculate_indicators_batch(
     
     results = []
     timestamps = [c["timestamp"] for c in ohlc_data]
+    candles = indicators_library.OHLCArrays.from_candles(ohlc_data)
     
     for ind_config in indicators:
         indicator_name = ind_config.indicator
@@ -452,7 +453,7 @@ def calculate_indicators_batch(
         
         # Calculate indicator
         calc_result = indicators_library.calculate_indicator(
-            ohlc_data, indicator_name, params
+            candles, indicator_name, params
         )
         
         if calc_result.get("error"):
@@ -8,38 +8,95 @@ Provides a complete suite of technical indicators for chart analysis organized b
 - Trend Strength (3): QStick, VHF, Mass Index
 
 All calculations are performed on OHLC data and return values aligned with input length.
+
+Candles are unpacked once into float64 arrays and every indicator is built from
+the NumPy kernels below (strided window views, cumulative sums for running
+totals and seeded recursive filters). Outputs keep the list contract of the original
+pure-Python implementations: leading ``None`` padding and values rounded per
+indicator (5 dp for prices).
 """
 
 from typing import List, Dict, Any, Optional, Callable, Union
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
-def _validate_ohlc_data(ohlc_data: List[Dict[str, Any]]) -> tuple:
+class OHLCArrays:
+    """Candles unpacked once into float64 columns.
+
+    Every indicator accepts this in place of the candle list, so callers that
+    compute several indicators over the same candles (batch endpoints, dashboard
+    refreshes) pay for the dict-to-array conversion only once.
+
+    Example:
+        >>> candles = OHLCArrays.from_candles(ohlc_data)
+        >>> rsi = calculate_indicator(candles, "rsi", {"period": 14})
+        >>> macd = calculate_indicator(candles, "macd")
+    """
+
+    __slots__ = ("opens", "highs", "lows", "closes", "volumes")
+
+    def __init__(
+        self,
+        opens: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        volumes: np.ndarray
+    ):
+        self.opens = opens
+        self.highs = highs
+        self.lows = lows
+        self.closes = closes
+        self.volumes = volumes
+
+    @classmethod
+    def from_candles(cls, ohlc_data: List[Dict[str, Any]]) -> "OHLCArrays":
+        """Unpack a list of OHLC candle dictionaries (missing fields read as 0)."""
+        n = len(ohlc_data)
+        return cls(
+            np.fromiter((c.get("open", 0.0) for c in ohlc_data), dtype=float, count=n),
+            np.fromiter((c.get("high", 0.0) for c in ohlc_data), dtype=float, count=n),
+            np.fromiter((c.get("low", 0.0) for c in ohlc_data), dtype=float, count=n),
+            np.fromiter((c.get("close", 0.0) for c in ohlc_data), dtype=float, count=n),
+            np.fromiter((c.get("volume", 0) for c in ohlc_data), dtype=float, count=n),
+        )
+
+    def __len__(self) -> int:
+        return len(self.closes)
+
+
+def _validate_ohlc_data(ohlc_data: Union[List[Dict[str, Any]], OHLCArrays]) -> tuple:
     """Extract and validate OHLC data from input list.
     
     Args:
-        ohlc_data: List of OHLC candle dictionaries
+        ohlc_data: List of OHLC candle dictionaries, or candles already
+            unpacked with ``OHLCArrays.from_candles``
         
     Returns:
-        Tuple of (opens, highs, lows, closes, volumes) as lists
+        Tuple of (opens, highs, lows, closes, volumes) as float64 arrays
         
     Raises:
         ValueError: If data is empty or missing required fields
     """
-    if not ohlc_data:
+    if not isinstance(ohlc_data, OHLCArrays):
+        if not ohlc_data:
+            raise ValueError("OHLC data is empty")
+        ohlc_data = OHLCArrays.from_candles(ohlc_data)
+    elif not len(ohlc_data):
         raise ValueError("OHLC data is empty")
     
-    opens = [c.get("open", 0.0) for c in ohlc_data]
-    highs = [c.get("high", 0.0) for c in ohlc_data]
-    lows = [c.get("low", 0.0) for c in ohlc_data]
-    closes = [c.get("close", 0.0) for c in ohlc_data]
-    volumes = [c.get("volume", 0) for c in ohlc_data]
-    
-    return opens, highs, lows, closes, volumes
+    return (
+        ohlc_data.opens,
+        ohlc_data.highs,
+        ohlc_data.lows,
+        ohlc_data.closes,
+        ohlc_data.volumes,
+    )
 
 
 def _pad_leading_nones(values: List[Any], target_length: int) -> List[Optional[float]]:
@@ -58,11 +115,176 @@ def _pad_leading_nones(values: List[Any], target_length: int) -> List[Optional[f
     return values
 
 
+def _round(values: Union[np.ndarray, float], decimals: int = 5) -> np.ndarray:
+    """Vectorised builtin ``round``: nearest ``decimals``-place value of the exact input.
+
+    ``np.round`` scales by ``10**decimals`` in floating point, which can move a
+    value sitting just off a half-way point across it (means of 5-dp quotes land
+    there often). The scaled value is carried exactly as a hi/lo pair (Dekker's
+    two-product) so the half-way test sees the true remainder, matching the
+    per-element ``round`` of the pure-Python implementation.
+
+    Args:
+        values: Values to round
+        decimals: Number of decimal places (>= 0)
+
+    Returns:
+        Float64 array of rounded values
+    """
+    x = np.asarray(values, dtype=float)
+    scale = 10.0 ** decimals
+    hi = x * scale
+    # Exact rounding error of the product via Veltkamp splitting
+    x_split = 134217729.0 * x
+    x_hi = x_split - (x_split - x)
+    x_lo = x - x_hi
+    s_split = 134217729.0 * scale
+    s_hi = s_split - (s_split - scale)
+    s_lo = scale - s_hi
+    lo = ((x_hi * s_hi - hi) + x_hi * s_lo + x_lo * s_hi) + x_lo * s_lo
+
+    nearest = np.rint(hi)
+    remainder = hi - nearest
+    # Only an exact half in ``hi`` is ambiguous; the sign of ``lo`` settles it
+    # (a true tie, lo == 0, keeps rint's round-half-even like the builtin).
+    up = (remainder == 0.5) & (lo > 0)
+    down = (remainder == -0.5) & (lo < 0)
+    nearest = nearest + up - down
+    return nearest / scale
+
+
+def _padded(values: np.ndarray, target_length: int, decimals: int = 5) -> List[Optional[float]]:
+    """Round an array of calculated values and pad it with leading None values.
+    
+    Args:
+        values: Calculated values (the valid tail of the output)
+        target_length: Desired output length
+        decimals: Decimal places to round to
+        
+    Returns:
+        List of rounded floats padded with None values at the beginning
+    """
+    return _pad_leading_nones(_round(values, decimals).tolist(), target_length)
+
+
+def _masked(values: np.ndarray, valid: np.ndarray, decimals: int) -> List[Optional[float]]:
+    """Round values and replace entries where ``valid`` is False with None."""
+    rounded = _round(values, decimals).tolist()
+    return [v if ok else None for v, ok in zip(rounded, valid.tolist())]
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray, fill: float = 0.0) -> np.ndarray:
+    """Element-wise division returning ``fill`` where the denominator is zero."""
+    out = np.full(np.broadcast(numerator, denominator).shape, fill, dtype=float)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
+
+
+# =============================================================================
+# ROLLING-WINDOW KERNELS
+# =============================================================================
+
+def _column_sum(windows: np.ndarray) -> np.ndarray:
+    """Row sums of a 2-D window matrix, added column by column from the left.
+
+    Same addition order as the builtin ``sum`` over each window, so values that
+    land exactly on a rounding tie (common for means of 5-dp quotes) round the
+    same way as the pure-Python implementation did.
+    """
+    total = windows[:, 0].copy()
+    for k in range(1, windows.shape[1]):
+        total += windows[:, k]
+    return total
+
+
+def _rolling_sum(x: np.ndarray, period: int) -> np.ndarray:
+    """Sums of every full window of ``period`` values over a strided view.
+
+    Returns ``len(x) - period + 1`` sums; the sum at position ``j`` covers
+    ``x[j:j + period]``. Windows of zeros give an exact ``0.0``.
+    """
+    if period <= 0:
+        return np.zeros(len(x) + 1)
+    return _column_sum(sliding_window_view(x, period))
+
+
+def _rolling_max(x: np.ndarray, period: int) -> np.ndarray:
+    """Maximum of every full window of ``period`` values (strided view, no copies)."""
+    return sliding_window_view(x, period).max(axis=1)
+
+
+def _rolling_min(x: np.ndarray, period: int) -> np.ndarray:
+    """Minimum of every full window of ``period`` values (strided view, no copies)."""
+    return sliding_window_view(x, period).min(axis=1)
+
+
+def _rolling_std(x: np.ndarray, period: int) -> np.ndarray:
+    """Population standard deviation (``np.std``) of every full window."""
+    return sliding_window_view(x, period).std(axis=1)
+
+
+def _ema_filter(x: np.ndarray, period: int) -> np.ndarray:
+    """Exponential moving average seeded with the SMA of the first ``period`` values.
+    
+    The recursion has a loop-carried dependency, so it runs as a tight scalar
+    loop over native floats; callers round the result once, at the end.
+    
+    Returns:
+        ``len(x) - period + 1`` unrounded EMA values, starting at the seed
+    """
+    multiplier = 2 / (period + 1)
+    ema = float(np.sum(x[:period])) / period
+    out = [ema]
+    append = out.append
+    for price in x[period:].tolist():
+        ema = (price - ema) * multiplier + ema
+        append(ema)
+    return np.array(out)
+
+
+def _wilder_filter(x: np.ndarray, period: int, seed: float) -> np.ndarray:
+    """Wilder's smoothing ``avg = (avg * (period - 1) + value) / period``.
+    
+    Returns:
+        One smoothed value per element of ``x`` (the seed itself is not included)
+    """
+    avg = seed
+    out = []
+    append = out.append
+    for value in x.tolist():
+        avg = (avg * (period - 1) + value) / period
+        append(avg)
+    return np.array(out)
+
+
+def _wilder_sum_filter(x: np.ndarray, period: int, seed: float) -> np.ndarray:
+    """Wilder's running-sum smoothing ``total = total - total / period + value``."""
+    total = seed
+    out = []
+    append = out.append
+    for value in x.tolist():
+        total = total - total / period + value
+        append(total)
+    return np.array(out)
+
+
 # =============================================================================
 # MOVING AVERAGE HELPERS
 # =============================================================================
 
-def _calculate_sma(data: List[float], period: int) -> List[Optional[float]]:
+def _sma_values(data: Union[List[float], np.ndarray], period: int) -> np.ndarray:
+    """Rounded SMA over the valid tail (``len(data) - period + 1`` values)."""
+    x = np.asarray(data, dtype=float)
+    return _round(_rolling_sum(x, period) / period, 5)
+
+
+def _ema_values(data: Union[List[float], np.ndarray], period: int) -> np.ndarray:
+    """Rounded EMA over the valid tail (``len(data) - period + 1`` values)."""
+    x = np.asarray(data, dtype=float)
+    return _round(_ema_filter(x, period), 5)
+
+
+def _calculate_sma(data: Union[List[float], np.ndarray], period: int) -> List[Optional[float]]:
     """Calculate Simple Moving Average.
     
     Args:
@@ -74,15 +296,11 @@ def _calculate_sma(data: List[float], period: int) -> List[Optional[float]]:
     """
     if len(data) < period:
         return [None] * len(data)
-    
-    result = [None] * (period - 1)
-    for i in range(period - 1, len(data)):
-        sma = sum(data[i - period + 1:i + 1]) / period
-        result.append(round(sma, 5))
-    return result
+        
+    return _pad_leading_nones(_sma_values(data, period).tolist(), len(data))
 
 
-def _calculate_ema(data: List[float], period: int) -> List[Optional[float]]:
+def _calculate_ema(data: Union[List[float], np.ndarray], period: int) -> List[Optional[float]]:
     """Calculate Exponential Moving Average.
     
     Args:
@@ -94,20 +312,11 @@ def _calculate_ema(data: List[float], period: int) -> List[Optional[float]]:
     """
     if len(data) < period:
         return [None] * len(data)
-    
-    multiplier = 2 / (period + 1)
-    ema = sum(data[:period]) / period
-    result = [None] * (period - 1)
-    result.append(round(ema, 5))
-    
-    for price in data[period:]:
-        ema = (price - ema) * multiplier + ema
-        result.append(round(ema, 5))
-    
-    return result
+        
+    return _pad_leading_nones(_ema_values(data, period).tolist(), len(data))
 
 
-def _calculate_wma(data: List[float], period: int) -> List[Optional[float]]:
+def _calculate_wma(data: Union[List[float], np.ndarray], period: int) -> List[Optional[float]]:
     """Calculate Weighted Moving Average.
     
     Args:
@@ -119,18 +328,14 @@ def _calculate_wma(data: List[float], period: int) -> List[Optional[float]]:
     """
     if len(data) < period:
         return [None] * len(data)
-    
-    weights = list(range(1, period + 1))
-    weight_sum = sum(weights)
-    
-    result = [None] * (period - 1)
-    for i in range(period - 1, len(data)):
-        weighted_sum = sum(w * p for w, p in zip(weights, data[i - period + 1:i + 1]))
-        result.append(round(weighted_sum / weight_sum, 5))
-    return result
+        
+    x = np.asarray(data, dtype=float)
+    weights = np.arange(1, period + 1, dtype=float)
+    wma = _column_sum(sliding_window_view(x, period) * weights) / weights.sum()
+    return _padded(wma, len(x))
 
 
-def _calculate_tema(data: List[float], period: int) -> List[Optional[float]]:
+def _calculate_tema(data: Union[List[float], np.ndarray], period: int) -> List[Optional[float]]:
     """Calculate Triple Exponential Moving Average.
     
     TEMA = 3*EMA - 3*EMA(EMA) + EMA(EMA(EMA))
@@ -144,26 +349,18 @@ def _calculate_tema(data: List[float], period: int) -> List[Optional[float]]:
     """
     if len(data) < 3 * period:
         return [None] * len(data)
-    
-    ema1 = _calculate_ema(data, period)
-    ema1_valid = [v for v in ema1 if v is not None]
-    ema2 = _calculate_ema(ema1_valid, period)
-    ema2_valid = [v for v in ema2 if v is not None]
-    ema3 = _calculate_ema(ema2_valid, period)
-    ema3_valid = [v for v in ema3 if v is not None]
+        
+    ema1 = _ema_values(data, period)
+    ema2 = _ema_values(ema1, period)
+    ema3 = _ema_values(ema2, period)
     
     # All three EMAs need valid values at the same index
-    min_len = min(len(ema1_valid), len(ema2_valid), len(ema3_valid))
-    
-    result = [None] * (len(data) - min_len)
-    for i in range(min_len):
-        tema = 3 * ema1_valid[i] - 3 * ema2_valid[i] + ema3_valid[i]
-        result.append(round(tema, 5))
-    
-    return result
+    min_len = len(ema3)
+    tema = 3 * ema1[:min_len] - 3 * ema2[:min_len] + ema3
+    return _padded(tema, len(data))
 
 
-def _calculate_dema(data: List[float], period: int) -> List[Optional[float]]:
+def _calculate_dema(data: Union[List[float], np.ndarray], period: int) -> List[Optional[float]]:
     """Calculate Double Exponential Moving Average.
     
     DEMA = 2*EMA - EMA(EMA)
@@ -177,21 +374,14 @@ def _calculate_dema(data: List[float], period: int) -> List[Optional[float]]:
     """
     if len(data) < 2 * period:
         return [None] * len(data)
-    
-    ema1 = _calculate_ema(data, period)
-    ema1_valid = [v for v in ema1 if v is not None]
-    ema2 = _calculate_ema(ema1_valid, period)
-    ema2_valid = [v for v in ema2 if v is not None]
+        
+    ema1 = _ema_values(data, period)
+    ema2 = _ema_values(ema1, period)
     
     # Both EMAs need valid values at the same index
-    min_len = min(len(ema1_valid), len(ema2_valid))
-    
-    result = [None] * (len(data) - min_len)
-    for i in range(min_len):
-        dema = 2 * ema1_valid[i] - ema2_valid[i]
-        result.append(round(dema, 5))
-    
-    return result
+    min_len = len(ema2)
+    dema = 2 * ema1[:min_len] - ema2
+    return _padded(dema, len(data))
 
 
 # =============================================================================
@@ -218,28 +408,18 @@ def calculate_rsi(ohlc_data: List[Dict[str, Any]], period: int = 14) -> List[Opt
     
     if len(closes) < period + 1:
         return [None] * len(closes)
+        
+    deltas = np.diff(closes)
+    gains = np.maximum(deltas, 0.0)
+    losses = np.maximum(-deltas, 0.0)
     
-    deltas = [closes[i] - closes[i - 1] for i in range(1, len(closes))]
-    gains = [max(d, 0) for d in deltas]
-    losses = [abs(min(d, 0)) for d in deltas]
-    
-    result = [None] * period
-    
-    avg_gain = sum(gains[:period]) / period
-    avg_loss = sum(losses[:period]) / period
+    avg_gain = _wilder_filter(gains[period:], period, float(np.sum(gains[:period])) / period)
+    avg_loss = _wilder_filter(losses[period:], period, float(np.sum(losses[:period])) / period)
     
-    for i in range(period, len(deltas)):
-        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-        
-        if avg_loss == 0:
-            result.append(100.0)
-        else:
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
-            result.append(round(rsi, 2))
+    rs = _safe_divide(avg_gain, avg_loss)
+    rsi = np.where(avg_loss == 0, 100.0, _round(100 - (100 / (1 + rs)), 2))
     
-    return result
+    return [None] * period + rsi.tolist()
 
 
 def calculate_macd(
@@ -263,28 +443,26 @@ def calculate_macd(
         Dictionary with 'macd', 'signal', and 'histogram' lists
     """
     _, _, _, closes, _ = _validate_ohlc_data(ohlc_data)
+    n = len(closes)
     
-    ema_fast = _calculate_ema(closes, fast)
-    ema_slow = _calculate_ema(closes, slow)
-    
-    macd_line = []
-    for f, s in zip(ema_fast, ema_slow):
-        if f is None or s is None:
-            macd_line.append(None)
-        else:
-            macd_line.append(round(f - s, 5))
+    if n < max(fast, slow):
+        empty = [None] * n
+        return {"macd": empty, "signal": list(empty), "histogram": list(empty)}
+        
+    # Align both EMAs on the bars where each is valid
+    valid_len = n - max(fast, slow) + 1
+    ema_fast = _ema_values(closes, fast)[-valid_len:]
+    ema_slow = _ema_values(closes, slow)[-valid_len:]
+    valid_macd = _round(ema_fast - ema_slow, 5)
     
-    # Remove None values for signal calculation
-    valid_macd = [m for m in macd_line if m is not None]
-    signal_line = [None] * (len(macd_line) - len(valid_macd))
-    signal_line.extend(_calculate_ema(valid_macd, signal))
+    macd_line = _pad_leading_nones(valid_macd.tolist(), n)
     
-    histogram = []
-    for m, s in zip(macd_line, signal_line):
-        if m is None or s is None:
-            histogram.append(None)
-        else:
-            histogram.append(round(m - s, 5))
+    if valid_len < signal:
+        return {"macd": macd_line, "signal": [None] * n, "histogram": [None] * n}
+        
+    valid_signal = _ema_values(valid_macd, signal)
+    signal_line = _pad_leading_nones(valid_signal.tolist(), n)
+    histogram = _padded(valid_macd[signal - 1:] - valid_signal, n)
     
     return {
         "macd": macd_line,
@@ -317,25 +495,20 @@ def calculate_stochastic(
     
     if len(highs) < period:
         return {"k": [None] * len(highs), "d": [None] * len(highs)}
-    
-    k_values = [None] * (period - 1)
-    
-    for i in range(period - 1, len(closes)):
-        highest_high = max(highs[i - period + 1:i + 1])
-        lowest_low = min(lows[i - period + 1:i + 1])
         
-        if highest_high == lowest_low:
-            k_values.append(50.0)
-        else:
-            k = 100 * (closes[i] - lowest_low) / (highest_high - lowest_low)
-            k_values.append(round(k, 2))
+    highest_high = _rolling_max(highs, period)
+    lowest_low = _rolling_min(lows, period)
+    price_range = highest_high - lowest_low
+    raw_k = _safe_divide(100 * (closes[period - 1:] - lowest_low), price_range)
+    valid_k = np.where(price_range == 0, 50.0, _round(raw_k, 2))
+    
+    k_values = [None] * (period - 1) + valid_k.tolist()
     
     # Smooth %K if specified
     if smooth_k > 1:
-        valid_k = [v for v in k_values if v is not None]
         smoothed_k = _calculate_sma(valid_k, smooth_k)
         k_values = [None] * (period - 1) + smoothed_k
-    
+        
     # Calculate %D (SMA of %K)
     valid_k = [v for v in k_values if v is not None]
     d_values = _calculate_sma(valid_k, smooth_d)
@@ -363,13 +536,13 @@ def calculate_roc(ohlc_data: List[Dict[str, Any]], period: int = 12) -> List[Opt
     
     if len(closes) < period + 1:
         return [None] * len(closes)
-    
-    result = [None] * period
-    for i in range(period, len(closes)):
-        roc = ((closes[i] - closes[i - period]) / closes[i - period]) * 100
-        result.append(round(roc, 2))
-    
-    return result
+        
+    previous = closes[:-period]
+    if np.any(previous == 0):
+        raise ZeroDivisionError("float division by zero")
+        
+    roc = ((closes[period:] - previous) / previous) * 100
+    return _padded(roc, len(closes), 2)
 
 
 def calculate_cci(ohlc_data: List[Dict[str, Any]], period: int = 20) -> List[Optional[float]]:
@@ -391,27 +564,19 @@ def calculate_cci(ohlc_data: List[Dict[str, Any]], period: int = 20) -> List[Opt
     
     if len(closes) < period:
         return [None] * len(closes)
-    
+        
     # Calculate Typical Price (TP) = (High + Low + Close) / 3
-    tp = [(h + l + c) / 3 for h, l, c in zip(highs, lows, closes)]
+    tp = (highs + lows + closes) / 3
     
-    # Calculate SMA of TP
-    tp_sma = _calculate_sma(tp, period)
+    # Calculate SMA of TP and the Mean Deviation around it
+    tp_sma = _sma_values(tp, period)
+    windows = sliding_window_view(tp, period)
+    mean_dev = _column_sum(np.abs(windows - tp_sma[:, None])) / period
     
-    result = [None] * (period - 1)
+    cci = _safe_divide(tp[period - 1:] - tp_sma, 0.015 * mean_dev)
+    cci = np.where(mean_dev == 0, 0.0, _round(cci, 2))
     
-    for i in range(period - 1, len(tp)):
-        # Calculate Mean Deviation
-        tp_slice = tp[i - period + 1:i + 1]
-        mean_dev = sum(abs(x - tp_sma[i]) for x in tp_slice) / period
-        
-        if mean_dev == 0:
-            result.append(0.0)
-        else:
-            cci = (tp[i] - tp_sma[i]) / (0.015 * mean_dev)
-            result.append(round(cci, 2))
-    
-    return result
+    return [None] * (period - 1) + cci.tolist()
 
 
 def calculate_williams_r(ohlc_data: List[Dict[str, Any]], period: int = 14) -> List[Optional[float]]:
@@ -433,20 +598,15 @@ def calculate_williams_r(ohlc_data: List[Dict[str, Any]], period: int = 14) -> L
     
     if len(highs) < period:
         return [None] * len(highs)
-    
-    result = [None] * (period - 1)
-    
-    for i in range(period - 1, len(closes)):
-        highest_high = max(highs[i - period + 1:i + 1])
-        lowest_low = min(lows[i - period + 1:i + 1])
         
-        if highest_high == lowest_low:
-            result.append(-50.0)
-        else:
-            wr = (highest_high - closes[i]) / (highest_high - lowest_low) * -100
-            result.append(round(wr, 2))
+    highest_high = _rolling_max(highs, period)
+    lowest_low = _rolling_min(lows, period)
+    price_range = highest_high - lowest_low
     
-    return result
+    wr = _safe_divide(highest_high - closes[period - 1:], price_range) * -100
+    wr = np.where(price_range == 0, -50.0, _round(wr, 2))
+    
+    return [None] * (period - 1) + wr.tolist()
 
 
 # =============================================================================
@@ -555,72 +715,51 @@ def calculate_adx(
         Dictionary with 'plus_di', 'minus_di', and 'adx' lists
     """
     _, highs, lows, closes, _ = _validate_ohlc_data(ohlc_data)
+    n = len(highs)
     
-    if len(highs) < period + 1:
+    if n < period + 1:
         return {
-            "plus_di": [None] * len(highs),
-            "minus_di": [None] * len(highs),
-            "adx": [None] * len(highs)
+            "plus_di": [None] * n,
+            "minus_di": [None] * n,
+            "adx": [None] * n
         }
-    
-    # Calculate +DM and -DM
-    plus_dm = [0.0]
-    minus_dm = [0.0]
-    tr_list = [highs[0] - lows[0]]
-    
-    for i in range(1, len(highs)):
-        up_move = highs[i] - highs[i - 1]
-        down_move = lows[i - 1] - lows[i]
         
-        plus_dm.append(up_move if up_move > down_move and up_move > 0 else 0)
-        minus_dm.append(down_move if down_move > up_move and down_move > 0 else 0)
-        
-        tr = max(
-            highs[i] - lows[i],
-            abs(highs[i] - closes[i - 1]),
-            abs(lows[i] - closes[i - 1])
-        )
-        tr_list.append(tr)
+    # Calculate +DM, -DM and True Range (first bar: no previous close)
+    up_move = np.diff(highs)
+    down_move = lows[:-1] - lows[1:]
+    plus_dm = np.concatenate(([0.0], np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)))
+    minus_dm = np.concatenate(([0.0], np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)))
+    tr = np.concatenate((
+        [highs[0] - lows[0]],
+        np.maximum.reduce([
+            highs[1:] - lows[1:],
+            np.abs(highs[1:] - closes[:-1]),
+            np.abs(lows[1:] - closes[:-1]),
+        ]),
+    ))
     
     # Smooth using Wilder's method
-    atr = sum(tr_list[:period])
-    plus_di_sum = sum(plus_dm[:period])
-    minus_di_sum = sum(minus_dm[:period])
+    atr = _wilder_sum_filter(tr[period:], period, float(np.sum(tr[:period])))
+    plus_di_sum = _wilder_sum_filter(plus_dm[period:], period, float(np.sum(plus_dm[:period])))
+    minus_di_sum = _wilder_sum_filter(minus_dm[period:], period, float(np.sum(minus_dm[:period])))
     
-    plus_di = [None] * period
-    minus_di = [None] * period
-    dx_values = [None] * period
+    plus_di_val = np.where(atr > 0, _safe_divide(100 * plus_di_sum, atr), 0.0)
+    minus_di_val = np.where(atr > 0, _safe_divide(100 * minus_di_sum, atr), 0.0)
+    di_sum = plus_di_val + minus_di_val
+    dx = np.where(di_sum > 0, _safe_divide(100 * np.abs(plus_di_val - minus_di_val), di_sum), 0.0)
     
-    for i in range(period, len(highs)):
-        atr = atr - atr / period + tr_list[i]
-        plus_di_sum = plus_di_sum - plus_di_sum / period + plus_dm[i]
-        minus_di_sum = minus_di_sum - minus_di_sum / period + minus_dm[i]
-        
-        plus_di_val = 100 * plus_di_sum / atr if atr > 0 else 0
-        minus_di_val = 100 * minus_di_sum / atr if atr > 0 else 0
-        
-        plus_di.append(round(plus_di_val, 2))
-        minus_di.append(round(minus_di_val, 2))
-        
-        dx = 100 * abs(plus_di_val - minus_di_val) / (plus_di_val + minus_di_val) \
-            if (plus_di_val + minus_di_val) > 0 else 0
-        dx_values.append(dx)
-    
-    # Calculate ADX (smoothed DX)
+    # Calculate ADX (smoothed DX); each step builds on the rounded previous value
     adx = [None] * (2 * period - 1)
-    valid_dx = [d for d in dx_values if d is not None]
-    
-    if len(valid_dx) >= period:
-        adx_start = sum(valid_dx[:period]) / period
-        adx.append(round(adx_start, 2))
-        
-        for i in range(period, len(valid_dx)):
-            adx_val = (adx[-1] * (period - 1) + valid_dx[i]) / period
-            adx.append(round(adx_val, 2))
-    
+    if len(dx) >= period:
+        adx_val = round(float(np.sum(dx[:period])) / period, 2)
+        adx.append(adx_val)
+        for value in dx[period:].tolist():
+            adx_val = round((adx_val * (period - 1) + value) / period, 2)
+            adx.append(adx_val)
+            
     return {
-        "plus_di": plus_di,
-        "minus_di": minus_di,
+        "plus_di": _padded(plus_di_val, n, 2),
+        "minus_di": _padded(minus_di_val, n, 2),
         "adx": adx
     }
 
@@ -643,13 +782,13 @@ def calculate_ma_ribbon(
     """
     if periods is None:
         periods = [10, 20, 30, 40, 50]
-    
+        
     _, _, _, closes, _ = _validate_ohlc_data(ohlc_data)
     
     result = {}
     for period in periods:
         result[f"ema_{period}"] = _calculate_ema(closes, period)
-    
+        
     return result
 
 
@@ -676,29 +815,34 @@ def calculate_bollinger_bands(
         Dictionary with 'upper', 'middle', and 'lower' band lists
     """
     _, _, _, closes, _ = _validate_ohlc_data(ohlc_data)
+    n = len(closes)
     
-    sma = _calculate_sma(closes, period)
-    
-    upper = []
-    lower = []
-    
-    for i in range(len(closes)):
-        if i < period - 1:
-            upper.append(None)
-            lower.append(None)
-        else:
-            slice_data = closes[i - period + 1:i + 1]
-            std = np.std(slice_data)
-            upper.append(round(sma[i] + std_dev * std, 5))
-            lower.append(round(sma[i] - std_dev * std, 5))
+    if n < period:
+        empty = [None] * n
+        return {"upper": empty, "middle": list(empty), "lower": list(empty)}
+        
+    sma = _sma_values(closes, period)
+    std = _rolling_std(closes, period)
     
     return {
-        "upper": upper,
-        "middle": sma,
-        "lower": lower
+        "upper": _padded(sma + std_dev * std, n),
+        "middle": _pad_leading_nones(sma.tolist(), n),
+        "lower": _padded(sma - std_dev * std, n)
     }
 
 
+def _atr_values(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int) -> np.ndarray:
+    """Rounded Wilder ATR from bar ``period`` onwards (``len - period`` values)."""
+    true_ranges = np.maximum.reduce([
+        highs[1:] - lows[1:],
+        np.abs(highs[1:] - closes[:-1]),
+        np.abs(lows[1:] - closes[:-1]),
+    ])
+    seed = float(np.sum(true_ranges[:period])) / period
+    atr = np.concatenate(([seed], _wilder_filter(true_ranges[period:], period, seed)))
+    return _round(atr, 5)
+
+
 def calculate_atr(
     ohlc_data: List[Dict[str, Any]],
     period: int = 14
@@ -717,28 +861,10 @@ def calculate_atr(
     """
     _, highs, lows, closes, _ = _validate_ohlc_data(ohlc_data)
     
-    if len(highs) < 2:
-        return [None] * len(highs)
-    
-    true_ranges = []
-    for i in range(1, len(highs)):
-        tr1 = highs[i] - lows[i]
-        tr2 = abs(highs[i] - closes[i - 1])
-        tr3 = abs(lows[i] - closes[i - 1])
-        true_ranges.append(max(tr1, tr2, tr3))
-    
-    if len(true_ranges) < period:
+    if len(highs) < 2 or len(highs) - 1 < period:
         return [None] * len(highs)
-    
-    atr = sum(true_ranges[:period]) / period
-    result = [None] * period
-    result.append(round(atr, 5))
-    
-    for tr in true_ranges[period:]:
-        atr = (atr * (period - 1) + tr) / period
-        result.append(round(atr, 5))
-    
-    return result
+        
+    return _pad_leading_nones(_atr_values(highs, lows, closes, period).tolist(), len(highs))
 
 
 def calculate_keltner_channel(
@@ -760,29 +886,23 @@ def calculate_keltner_channel(
         Dictionary with 'upper', 'middle', and 'lower' channel lists
     """
     opens, highs, lows, closes, _ = _validate_ohlc_data(ohlc_data)
+    n = len(closes)
     
     # Middle line = EMA of typical price
-    typical_price = [(h + l + c) / 3 for h, l, c in zip(highs, lows, closes)]
+    typical_price = (highs + lows + closes) / 3
     middle = _calculate_ema(typical_price, period)
     
-    # ATR for bandwidth
-    atr_values = calculate_atr(ohlc_data, period)
-    
-    upper = []
-    lower = []
-    
-    for i in range(len(closes)):
-        if middle[i] is None or atr_values[i] is None:
-            upper.append(None)
-            lower.append(None)
-        else:
-            upper.append(round(middle[i] + offset_multiplier * atr_values[i], 5))
-            lower.append(round(middle[i] - offset_multiplier * atr_values[i], 5))
+    if n < 2 or n - 1 < period:
+        return {"upper": [None] * n, "middle": middle, "lower": [None] * n}
+        
+    # ATR for bandwidth (starts one bar after the EMA)
+    atr = _atr_values(highs, lows, closes, period)
+    center = _ema_values(typical_price, period)[1:]
     
     return {
-        "upper": upper,
+        "upper": _padded(center + offset_multiplier * atr, n),
         "middle": middle,
-        "lower": lower
+        "lower": _padded(center - offset_multiplier * atr, n)
     }
 
 
@@ -804,18 +924,15 @@ def calculate_natr(
     Returns:
         List of NATR percentage values with leading None values
     """
-    _, _, _, closes, _ = _validate_ohlc_data(ohlc_data)
-    atr_values = calculate_atr(ohlc_data, period)
-    
-    result = []
-    for atr, close in zip(atr_values, closes):
-        if atr is None or close == 0:
-            result.append(None)
-        else:
-            natr = (atr / close) * 100
-            result.append(round(natr, 2))
+    _, highs, lows, closes, _ = _validate_ohlc_data(ohlc_data)
+    n = len(closes)
     
-    return result
+    if n < 2 or n - 1 < period:
+        return [None] * n
+        
+    atr = np.concatenate((np.full(period, np.nan), _atr_values(highs, lows, closes, period)))
+    natr = _safe_divide(atr, closes) * 100
+    return _masked(natr, ~np.isnan(atr) & (closes != 0), 2)
 
 
 def calculate_historical_volatility(
@@ -840,32 +957,22 @@ def calculate_historical_volatility(
     
     if len(closes) < period + 1:
         return [None] * len(closes)
-    
-    # Calculate log returns
-    log_returns = []
-    for i in range(1, len(closes)):
-        if closes[i - 1] > 0:
-            log_returns.append(np.log(closes[i] / closes[i - 1]))
-        else:
-            log_returns.append(0.0)
-    
-    # Calculate rolling standard deviation
-    result = [None] * period
-    
-    for i in range(period, len(log_returns)):
-        returns_slice = log_returns[i - period + 1:i + 1]
-        vol = np.std(returns_slice)
         
-        if annualize:
-            # Assuming daily data, multiply by sqrt(252)
-            vol = vol * np.sqrt(252)
+    # Calculate log returns (0.0 where the previous close is not positive)
+    previous = closes[:-1]
+    ratio = np.ones_like(previous)
+    np.divide(closes[1:], previous, out=ratio, where=previous > 0)
+    log_returns = np.log(ratio)
+    
+    # Rolling standard deviation; the first full window is skipped and one more
+    # leading None accounts for the bar without a return
+    vol = _rolling_std(log_returns, period)[1:]
+    
+    if annualize:
+        # Assuming daily data, multiply by sqrt(252)
+        vol = vol * np.sqrt(252)
         
-        result.append(round(vol * 100, 2))  # As percentage
-    
-    # Add one more None for the first period (no return calculated)
-    result = [None] + result
-    
-    return _pad_leading_nones(result, len(closes))
+    return _padded(vol * 100, len(closes), 2)  # As percentage
 
 
 # =============================================================================
@@ -888,17 +995,11 @@ def calculate_obv(ohlc_data: List[Dict[str, Any]]) -> List[float]:
     
     if len(closes) < 2:
         return [0.0] * len(closes)
+        
+    signed_volume = np.sign(np.diff(closes)) * volumes[1:]
+    obv = np.concatenate(([0.0], np.cumsum(signed_volume)))
     
-    obv = [0.0]
-    for i in range(1, len(closes)):
-        if closes[i] > closes[i - 1]:
-            obv.append(obv[-1] + volumes[i])
-        elif closes[i] < closes[i - 1]:
-            obv.append(obv[-1] - volumes[i])
-        else:
-            obv.append(obv[-1])
-    
-    return [round(o, 0) for o in obv]
+    return _round(obv, 0).tolist()
 
 
 def calculate_vwap(ohlc_data: List[Dict[str, Any]]) -> List[Optional[float]]:
@@ -917,25 +1018,16 @@ def calculate_vwap(ohlc_data: List[Dict[str, Any]]) -> List[Optional[float]]:
     """
     _, highs, lows, closes, volumes = _validate_ohlc_data(ohlc_data)
     
-    if not volumes or sum(volumes) == 0:
+    if not len(volumes) or volumes.sum() == 0:
         return [None] * len(closes)
-    
-    typical_prices = [(h + l + c) / 3 for h, l, c in zip(highs, lows, closes)]
-    
-    cumulative_tp_vol = 0.0
-    cumulative_vol = 0.0
-    result = []
-    
-    for tp, vol in zip(typical_prices, volumes):
-        cumulative_tp_vol += tp * vol
-        cumulative_vol += vol
         
-        if cumulative_vol > 0:
-            result.append(round(cumulative_tp_vol / cumulative_vol, 5))
-        else:
-            result.append(None)
+    typical_prices = (highs + lows + closes) / 3
     
-    return result
+    cumulative_tp_vol = np.cumsum(typical_prices * volumes)
+    cumulative_vol = np.cumsum(volumes)
+    
+    vwap = _safe_divide(cumulative_tp_vol, cumulative_vol)
+    return _masked(vwap, cumulative_vol > 0, 5)
 
 
 def calculate_volume_roc(
@@ -960,16 +1052,12 @@ def calculate_volume_roc(
     
     if len(volumes) < period + 1:
         return [None] * len(volumes)
+        
+    previous = volumes[:-period]
+    vroc = _safe_divide(volumes[period:] - previous, previous) * 100
+    vroc = np.where(previous == 0, 0.0, _round(vroc, 2))
     
-    result = [None] * period
-    for i in range(period, len(volumes)):
-        if volumes[i - period] == 0:
-            result.append(0.0)
-        else:
-            vroc = ((volumes[i] - volumes[i - period]) / volumes[i - period]) * 100
-            result.append(round(vroc, 2))
-    
-    return result
+    return [None] * period + vroc.tolist()
 
 
 def calculate_accumulation_distribution(ohlc_data: List[Dict[str, Any]]) -> List[float]:
@@ -988,22 +1076,10 @@ def calculate_accumulation_distribution(ohlc_data: List[Dict[str, Any]]) -> List
     """
     _, highs, lows, closes, volumes = _validate_ohlc_data(ohlc_data)
     
-    ad_line = [0.0]
+    mf_multiplier = _safe_divide((closes - lows) - (highs - closes), highs - lows)
+    ad_line = np.cumsum(mf_multiplier * volumes)
     
-    for i in range(len(closes)):
-        if highs[i] == lows[i]:
-            mf_multiplier = 0.0
-        else:
-            mf_multiplier = ((closes[i] - lows[i]) - (highs[i] - closes[i])) / (highs[i] - lows[i])
-        
-        mf_volume = mf_multiplier * volumes[i]
-        
-        if i == 0:
-            ad_line[0] = mf_volume
-        else:
-            ad_line.append(ad_line[-1] + mf_volume)
-    
-    return [round(ad, 2) for ad in ad_line]
+    return _round(ad_line, 2).tolist()
 
 
 def calculate_mfi(
@@ -1026,40 +1102,23 @@ def calculate_mfi(
     
     if len(closes) < period + 1:
         return [None] * len(closes)
-    
+        
     # Calculate Typical Price and Raw Money Flow
-    typical_prices = [(h + l + c) / 3 for h, l, c in zip(highs, lows, closes)]
-    raw_money_flows = [tp * v for tp, v in zip(typical_prices, volumes)]
+    typical_prices = (highs + lows + closes) / 3
+    raw_money_flows = typical_prices * volumes
     
     # Determine positive and negative money flow
-    positive_flows = []
-    negative_flows = []
-    
-    for i in range(1, len(typical_prices)):
-        if typical_prices[i] > typical_prices[i - 1]:
-            positive_flows.append(raw_money_flows[i])
-            negative_flows.append(0)
-        elif typical_prices[i] < typical_prices[i - 1]:
-            positive_flows.append(0)
-            negative_flows.append(raw_money_flows[i])
-        else:
-            positive_flows.append(0)
-            negative_flows.append(0)
+    change = np.diff(typical_prices)
+    positive_flows = np.where(change > 0, raw_money_flows[1:], 0.0)
+    negative_flows = np.where(change < 0, raw_money_flows[1:], 0.0)
     
-    result = [None] * period
+    pos_sum = _rolling_sum(positive_flows, period)
+    neg_sum = _rolling_sum(negative_flows, period)
     
-    for i in range(period - 1, len(positive_flows)):
-        pos_sum = sum(positive_flows[i - period + 1:i + 1])
-        neg_sum = sum(negative_flows[i - period + 1:i + 1])
-        
-        if neg_sum == 0:
-            result.append(100.0)
-        else:
-            money_ratio = pos_sum / neg_sum
-            mfi = 100 - (100 / (1 + money_ratio))
-            result.append(round(mfi, 2))
+    money_ratio = _safe_divide(pos_sum, neg_sum)
+    mfi = np.where(neg_sum == 0, 100.0, _round(100 - (100 / (1 + money_ratio)), 2))
     
-    return result
+    return [None] * period + mfi.tolist()
 
 
 # =============================================================================
@@ -1086,10 +1145,7 @@ def calculate_qstick(
     """
     opens, _, _, closes, _ = _validate_ohlc_data(ohlc_data)
     
-    # Calculate Close - Open for each bar
-    co_diff = [c - o for c, o in zip(closes, opens)]
-    
-    return _calculate_sma(co_diff, period)
+    return _calculate_sma(closes - opens, period)
 
 
 def calculate_vhf(
@@ -1114,30 +1170,17 @@ def calculate_vhf(
     
     if len(closes) < period:
         return [None] * len(closes)
+        
+    # Absolute difference between highest high and lowest low in the period
+    numerator = np.abs(_rolling_max(highs, period) - _rolling_min(lows, period))
     
-    result = [None] * (period - 1)
+    # Sum of absolute changes in close prices (period - 1 changes per window)
+    denominator = _rolling_sum(np.abs(np.diff(closes)), period - 1)[:len(numerator)]
     
-    for i in range(period - 1, len(closes)):
-        # Highest high and lowest low in the period
-        highest_high = max(highs[i - period + 1:i + 1])
-        lowest_low = min(lows[i - period + 1:i + 1])
-        
-        # Absolute difference between highest high and lowest low
-        numerator = abs(highest_high - lowest_low)
-        
-        # Sum of absolute changes in close prices
-        denominator = sum(
-            abs(closes[j] - closes[j - 1])
-            for j in range(i - period + 2, i + 1)
-        )
-        
-        if denominator == 0:
-            result.append(0.0)
-        else:
-            vhf = numerator / denominator
-            result.append(round(vhf, 4))
+    vhf = _safe_divide(numerator, denominator)
+    vhf = np.where(denominator == 0, 0.0, _round(vhf, 4))
     
-    return result
+    return [None] * (period - 1) + vhf.tolist()
 
 
 def calculate_mass_index(
@@ -1160,40 +1203,23 @@ def calculate_mass_index(
     """
     _, highs, lows, _, _ = _validate_ohlc_data(ohlc_data)
     
-    # Calculate High - Low (range)
-    hl_range = [h - l for h, l in zip(highs, lows)]
-    
-    # Single EMA of range
-    ema1 = _calculate_ema(hl_range, period)
-    ema1_valid = [v for v in ema1 if v is not None]
-    
-    # Double EMA of range
-    ema2 = _calculate_ema(ema1_valid, period)
-    ema2_valid = [v for v in ema2 if v is not None]
+    # Sum over 25 periods (standard Mass Index period)
+    mi_period = 25
     
-    # Both EMAs need valid values at the same index
-    min_len = min(len(ema1_valid), len(ema2_valid))
+    # Single and double EMA of the range; both need valid values at the same index
+    if len(highs) < 2 * period:
+        return [None] * len(highs)
+        
+    ema1 = _ema_values(highs - lows, period)
+    ema2 = _ema_values(ema1, period)
     
     # Ratio of EMAs (only where both are valid)
-    ratios = []
-    for i in range(min_len):
-        if ema2_valid[i] == 0:
-            ratios.append(0.0)
-        else:
-            ratios.append(ema1_valid[i] / ema2_valid[i])
-    
-    # Sum over 25 periods (standard Mass Index period)
-    mi_period = 25
+    ratios = _safe_divide(ema1[:len(ema2)], ema2)
     if len(ratios) < mi_period:
         return [None] * len(highs)
-    
-    result = [None] * (len(highs) - len(ratios) + mi_period - 1)
-    
-    for i in range(mi_period - 1, len(ratios)):
-        mi = sum(ratios[i - mi_period + 1:i + 1])
-        result.append(round(mi, 2))
-    
-    return result
+        
+    mass_index = _rolling_sum(ratios, mi_period)
+    return _padded(mass_index, len(highs), 2)
 
 
 # =============================================================================
@@ -1429,7 +1455,7 @@ def calculate_indicator(
     parameter validation and provides consistent output format.
     
     Args:
-        ohlc_data: List of OHLC candle dictionaries
+        ohlc_data: List of OHLC candle dictionaries (or ``OHLCArrays``)
         indicator_name: Name of the indicator to calculate
         params: Dictionary of parameters for the indicator
         
@@ -1631,6 +1657,8 @@ def get_indicator_info(indicator_name: str) -> Optional[Dict[str, Any]]:
 # =============================================================================
 
 __all__ = [
+    "OHLCArrays",
+    
     # Momentum Indicators
     "calculate_rsi",
     "calculate_macd",
@@ -0,0 +1,132 @@
+"""Parity tests: NumPy indicator kernels against the original pure-Python implementations."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.layer5.services import indicators_library as lib
+from src.layer5.services.tests import reference_indicators as ref
+
+
+def make_candles(n, seed=0, decimals=5, flat=False):
+    """OANDA-like candles: quotes on a 5-dp grid, some zero-volume and flat bars."""
+    rng = np.random.RandomState(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.001, n))
+    open_ = np.r_[close[0], close[:-1]]
+    spread = np.abs(rng.normal(0, 0.0008, n))
+    if flat:
+        spread[::7] = 0.0
+        close[5:15] = open_[5:15] = close[min(5, n - 1)]
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    volume = rng.randint(0, 1000, n)
+    volume[:3] = 0
+    return [
+        {
+            "open": round(float(o), decimals),
+            "high": round(float(h), decimals),
+            "low": round(float(lo), decimals),
+            "close": round(float(c), decimals),
+            "volume": int(v),
+        }
+        for o, h, lo, c, v in zip(open_, high, low, close, volume)
+    ]
+
+
+def outcome(func, candles, params):
+    try:
+        return func(candles, **params)
+    except Exception as exc:  # the error type is part of the contract (surfaced by calculate_indicator)
+        return type(exc)
+
+
+INDICATORS = sorted(lib._INDICATOR_REGISTRY)
+SIZES = [1, 2, 9, 14, 15, 27, 28, 29, 40, 52, 60, 75, 600]
+
+
+@pytest.mark.parametrize("flat", [False, True], ids=["trending", "flat"])
+@pytest.mark.parametrize("name", INDICATORS)
+def test_kernels_match_reference_exactly(name, flat):
+    info = lib._INDICATOR_REGISTRY[name]
+    func = info["function"]
+    reference = getattr(ref, func.__name__)
+    for n in SIZES:
+        candles = make_candles(n, seed=n, flat=flat)
+        want = outcome(reference, candles, info["params"])
+        assert outcome(func, candles, info["params"]) == want, (name, n)
+        assert outcome(func, lib.OHLCArrays.from_candles(candles), info["params"]) == want, (name, n)
+
+
+@pytest.mark.parametrize("name, params", [
+    ("sma", {"period": 200}),
+    ("sma", {"period": 1}),
+    ("ema", {"period": 3}),
+    ("wma", {"period": 50}),
+    ("tema", {"period": 30}),
+    ("dema", {"period": 5}),
+    ("rsi", {"period": 2}),
+    ("macd", {"fast": 26, "slow": 12, "signal": 9}),
+    ("macd", {"fast": 5, "slow": 35, "signal": 5}),
+    ("stochastic", {"period": 5, "smooth_k": 1, "smooth_d": 4}),
+    ("bollinger_bands", {"period": 50, "std_dev": 2.5}),
+    ("keltner_channel", {"period": 10, "offset_multiplier": 1.5}),
+    ("historical_volatility", {"period": 10, "annualize": False}),
+    ("vhf", {"period": 1}),
+    ("vhf", {"period": 2}),
+    ("mfi", {"period": 1}),
+    ("ma_ribbon", {"periods": [5, 8, 13]}),
+])
+def test_kernels_match_reference_with_non_default_params(name, params):
+    func = lib._INDICATOR_REGISTRY[name]["function"]
+    reference = getattr(ref, func.__name__)
+    for n in (3, 30, 400):
+        candles = make_candles(n, seed=7)
+        assert outcome(func, candles, params) == outcome(reference, candles, params), n
+
+
+def test_dashboard_refresh_on_5k_candles_matches_reference():
+    candles = make_candles(5000, seed=11)
+    arrays = lib.OHLCArrays.from_candles(candles)
+    for name in INDICATORS:
+        want = lib._INDICATOR_REGISTRY[name]
+        result = lib.calculate_indicator(arrays, name)
+        assert result["error"] is None
+        assert result["values"] == getattr(ref, want["function"].__name__)(candles, **want["params"]), name
+
+
+def test_output_is_plain_python_lists():
+    result = lib.calculate_bollinger_bands(make_candles(50))
+    for values in result.values():
+        assert isinstance(values, list)
+        assert values[0] is None
+        assert type(values[-1]) is float
+
+
+@pytest.mark.parametrize("decimals", [0, 2, 4, 5])
+def test_round_matches_builtin_round(decimals):
+    rng = np.random.RandomState(decimals)
+    grid = np.round(rng.uniform(0.5, 2.0, 20000), 7)  # many values sit on (or next to) a half-way point
+    values = np.concatenate([
+        grid,
+        grid / 3,
+        -grid,
+        rng.normal(0, 100, 2000),
+        [0.0, -0.0, 0.5, 1.5, 2.5, -2.5, 1.125, 0.125, 1e-12],
+    ])
+    got = lib._round(values, decimals).tolist()
+    assert got == [round(v, decimals) for v in values.tolist()]
+
+
+def test_rolling_sum_matches_builtin_sum_order():
+    x = np.round(np.random.RandomState(3).uniform(1.0, 1.2, 500), 5)
+    for period in (1, 3, 20, 64):
+        want = [sum(x.tolist()[i:i + period]) for i in range(len(x) - period + 1)]
+        assert lib._rolling_sum(x, period).tolist() == want
+
+
+def test_empty_input_raises():
+    with pytest.raises(ValueError):
+        lib.calculate_rsi([])
+    with pytest.raises(ValueError):
+        lib.calculate_rsi(lib.OHLCArrays.from_candles([]))
+    assert lib.calculate_indicator([], "sma")["error"] == "Calculation error: OHLC data is empty"
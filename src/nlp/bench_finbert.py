@@ -0,0 +1,140 @@
+"""Throughput benchmark: FinBERT dynamic batching vs the legacy fixed batches of 8.
+
+Runs offline against a tiny, randomly initialised BERT classifier built locally
+(word-level vocab, 2 layers, hidden 64), installed via ``finbert.install``. The
+corpus mixes short calendar titles / headlines with a few long speeches that
+get chunked. The legacy path re-implements the old ``batch_features``
+inference (``encode`` then a second ``tokenizer(...)`` call, fixed mini-batches
+of 8 in input order); both paths' sentiment scores are compared.
+
+    python -m src.nlp.bench_finbert --texts 2000 --threads 1 4
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import List
+
+import numpy as np
+
+from . import finbert
+from .finbert import ScalableBrainFinBERT
+
+_SPECIALS = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
+_ID2LABEL = {0: "positive", 1: "negative", 2: "neutral"}  # ProsusAI/finbert order
+
+
+def _tiny_backend(vocab_size: int, seed: int):
+    import torch
+    from transformers import BertConfig, BertForSequenceClassification, BertTokenizerFast
+
+    words = [f"w{i}" for i in range(vocab_size)]
+    vocab_dir = tempfile.mkdtemp(prefix="finbert_bench_")
+    vocab_file = os.path.join(vocab_dir, "vocab.txt")
+    with open(vocab_file, "w") as fh:
+        fh.write("\n".join(_SPECIALS + words + ["."]) + "\n")
+    tokenizer = BertTokenizerFast(vocab_file, do_lower_case=True)
+    config = BertConfig(
+        vocab_size=len(_SPECIALS) + vocab_size + 1,
+        hidden_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=128,
+        max_position_embeddings=finbert.MAX_LENGTH,
+        num_labels=3,
+        id2label=_ID2LABEL,
+        label2id={v: k for k, v in _ID2LABEL.items()},
+    )
+    torch.manual_seed(seed)
+    return tokenizer, BertForSequenceClassification(config), words
+
+
+def _corpus(words: List[str], n_texts: int, long_fraction: float, seed: int) -> List[str]:
+    rng = np.random.default_rng(seed)
+    texts = []
+    for _ in range(n_texts):
+        n_words = rng.integers(600, 1500) if rng.random() < long_fraction else rng.integers(5, 60)
+        texts.append(" ".join(rng.choice(words, n_words)) + ".")
+    return texts
+
+
+def _legacy_probs(texts: List[str]) -> List[np.ndarray]:
+    """The pre-dynamic-batching inference path; per-chunk probs grouped by text."""
+    import torch
+
+    tokenizer, model = finbert.load()
+    chunk_list, owner = [], []
+    for i, text in enumerate(texts):
+        tokens = tokenizer.encode(text, add_special_tokens=False)
+        if len(tokens) < 3:
+            continue
+        chunks = ScalableBrainFinBERT._chunk_text(text) if len(tokens) > finbert.MAX_LENGTH else [text]
+        chunk_list.extend(chunks)
+        owner.extend([i] * len(chunks))
+    probs = []
+    for start in range(0, len(chunk_list), 8):
+        inputs = tokenizer(
+            chunk_list[start:start + 8], padding=True, truncation=True,
+            max_length=finbert.MAX_LENGTH, return_tensors="pt",
+        )
+        with torch.no_grad():
+            probs.extend(torch.nn.functional.softmax(model(**inputs).logits, dim=-1).numpy())
+    grouped = [[] for _ in texts]
+    for p, i in zip(probs, owner):
+        grouped[i].append(p)
+    return grouped
+
+
+def bench(texts: List[str], threads: int) -> dict:
+    finbert.set_num_threads(threads)
+    t0 = time.perf_counter()
+    grouped = _legacy_probs(texts)
+    legacy = time.perf_counter() - t0
+    legacy_scores = np.array([
+        ScalableBrainFinBERT._aggregate_chunks([ScalableBrainFinBERT._chunk_features(p) for p in g])["sentiment_score"]
+        for g in grouped
+    ])
+
+    t0 = time.perf_counter()
+    features = ScalableBrainFinBERT.batch_features(texts)
+    elapsed = time.perf_counter() - t0
+    scores = np.array([f["sentiment_score"] for f in features])
+    return {
+        "texts": len(texts),
+        "threads": threads,
+        "token_budget": ScalableBrainFinBERT.TOKEN_BUDGET,
+        "max_batch": ScalableBrainFinBERT.BATCH_SIZE,
+        "seconds": round(elapsed, 3),
+        "texts_per_s": round(len(texts) / elapsed, 1),
+        "legacy_seconds": round(legacy, 3),
+        "speedup": round(legacy / elapsed, 2) if elapsed else None,
+        "max_score_diff": float(np.abs(scores - legacy_scores).max()),
+    }
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--texts", type=int, default=2000)
+    ap.add_argument("--long-fraction", type=float, default=0.02)
+    ap.add_argument("--threads", type=int, nargs="+", default=[1])
+    ap.add_argument("--token-budget", type=int, default=ScalableBrainFinBERT.TOKEN_BUDGET)
+    ap.add_argument("--max-batch", type=int, default=ScalableBrainFinBERT.BATCH_SIZE)
+    ap.add_argument("--vocab", type=int, default=2000)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args(argv)
+
+    tokenizer, model, words = _tiny_backend(args.vocab, args.seed)
+    finbert.install(tokenizer, model)
+    ScalableBrainFinBERT.TOKEN_BUDGET = args.token_budget
+    ScalableBrainFinBERT.BATCH_SIZE = args.max_batch
+    texts = _corpus(words, args.texts, args.long_fraction, args.seed)
+    for threads in args.threads:
+        print(json.dumps(bench(texts, threads)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
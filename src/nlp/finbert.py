@@ -1,25 +1,158 @@
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
-import torch
-import numpy as np
-from typing import Dict, List
+import logging
 import math
+import os
+import threading
 from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
-# ==================== ONE-TIME LOAD AT SYSTEM STARTUP (CPU ONLY) ====================
-tokenizer = AutoTokenizer.from_pretrained("ProsusAI/finbert")
-model = AutoModelForSequenceClassification.from_pretrained("ProsusAI/finbert")
+logger = logging.getLogger(__name__)
 
-LABEL2ID = model.config.label2id
-NEG_IDX = LABEL2ID["negative"]
-NEU_IDX = LABEL2ID["neutral"]
-POS_IDX = LABEL2ID["positive"]
+MODEL_NAME = os.getenv("FINBERT_MODEL", "ProsusAI/finbert")
+MODEL_REVISION = os.getenv("FINBERT_REVISION", "main")
+MAX_LENGTH = 512
+# Bump when the text -> features computation changes (chunking, truncation,
+# aggregation) so cached features keyed by ``model_revision()`` are not reused.
+FEATURES_VERSION = 1
 
 MAX_ENTROPY = math.log2(3)
 
+# ==================== LAZY, THREAD-SAFE LOAD (CPU ONLY) ====================
+# The tokenizer and model are loaded on first use, not at import, so processes
+# that import this module (e.g. via macro_scraper) but never score anything do
+# not pay for torch/transformers start-up and the checkpoint load.
+_load_lock = threading.Lock()
+# Fast tokenizers mutate their truncation/padding state on every call, so
+# concurrent calls from several threads are serialised.
+_tokenizer_lock = threading.Lock()
+_backend: Optional[Tuple[Any, Any]] = None
+_label_idx: Dict[str, int] = {}
+_affixes: Tuple[List[int], List[int]] = ([], [])
+_installed_revision: Optional[str] = None
+
+
+def _env_int(name: str) -> Optional[int]:
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
+def set_num_threads(num_threads: Optional[int]) -> None:
+    """Cap torch's intra-op CPU threads (None leaves torch's default)."""
+    if num_threads:
+        import torch
+
+        torch.set_num_threads(int(num_threads))
+
+
+def _special_affixes(tokenizer: Any) -> Tuple[List[int], List[int]]:
+    """Ids the tokenizer adds before / after a single sequence ([CLS] / [SEP] for BERT)."""
+    body = tokenizer("a", add_special_tokens=False)["input_ids"]
+    full = tokenizer("a", add_special_tokens=True)["input_ids"]
+    for lead in range(len(full) - len(body) + 1):
+        if full[lead:lead + len(body)] == body:
+            return full[:lead], full[lead + len(body):]
+    raise ValueError("Cannot locate the special tokens added by the FinBERT tokenizer")
+
+
+def _activate(tokenizer: Any, model: Any, num_threads: Optional[int]) -> None:
+    global _backend, _affixes
+    model.eval()
+    _affixes = _special_affixes(tokenizer)
+    label2id = model.config.label2id
+    _label_idx.update({k: int(label2id[k]) for k in ("negative", "neutral", "positive")})
+    set_num_threads(num_threads)
+    _backend = (tokenizer, model)
+
+
+def install(
+    tokenizer: Any, model: Any, num_threads: Optional[int] = None, revision: str = "local"
+) -> None:
+    """Use an already constructed tokenizer/model pair instead of ``MODEL_NAME``.
+
+    The model must be a sequence classifier whose ``config.label2id`` has
+    ``negative``, ``neutral`` and ``positive`` entries. ``revision`` names it
+    in :func:`model_revision`.
+    """
+    global _installed_revision
+    with _load_lock:
+        _activate(tokenizer, model, num_threads)
+        _installed_revision = revision
+
+
+def model_revision() -> str:
+    """Identifier of the weights and feature code producing the scores, without loading them."""
+    revision = _installed_revision or f"{MODEL_NAME}@{MODEL_REVISION}"
+    return f"{revision}/features-v{FEATURES_VERSION}"
+
+
+def load(model_name: Optional[str] = None, num_threads: Optional[int] = None) -> Tuple[Any, Any]:
+    """Return the (tokenizer, model) pair, loading it once on first call.
+
+    ``model_name`` (default: ``MODEL_NAME``) is loaded at ``MODEL_REVISION``
+    and reported by :func:`model_revision`. ``num_threads`` (default:
+    ``FINBERT_NUM_THREADS``) is applied with ``torch.set_num_threads`` when
+    the model is loaded.
+    """
+    global _installed_revision
+    if _backend is None:
+        with _load_lock:
+            if _backend is None:
+                from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+                name = model_name or MODEL_NAME
+                logger.info(f"Loading FinBERT ({name}@{MODEL_REVISION})")
+                _activate(
+                    AutoTokenizer.from_pretrained(name, revision=MODEL_REVISION),
+                    AutoModelForSequenceClassification.from_pretrained(name, revision=MODEL_REVISION),
+                    num_threads or _env_int("FINBERT_NUM_THREADS"),
+                )
+                _installed_revision = f"{name}@{MODEL_REVISION}"
+    return _backend
+
+
+def __getattr__(name: str):
+    # Backwards compatibility for the former import-time globals.
+    if name == "tokenizer":
+        return load()[0]
+    if name == "model":
+        return load()[1]
+    if name == "LABEL2ID":
+        return load()[1].config.label2id
+    if name in ("NEG_IDX", "NEU_IDX", "POS_IDX"):
+        load()
+        return _label_idx[{"NEG_IDX": "negative", "NEU_IDX": "neutral", "POS_IDX": "positive"}[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def plan_batches(lengths: Sequence[int], token_budget: int, max_batch: int) -> List[Tuple[int, int]]:
+    """Split ascending ``lengths`` into contiguous ``[start, end)`` batches.
+
+    A batch is padded to its last (longest) member, so it is closed as soon as
+    ``size * longest`` would exceed ``token_budget`` or it holds ``max_batch``
+    items. A single sequence longer than the budget still gets its own batch.
+    """
+    batches = []
+    start = 0
+    for i, length in enumerate(lengths):
+        size = i - start + 1
+        if size > 1 and (size > max_batch or size * length > token_budget):
+            batches.append((start, i))
+            start = i
+    if start < len(lengths):
+        batches.append((start, len(lengths)))
+    return batches
+
+
 class ScalableBrainFinBERT:
     """Institutional-grade FinBERT – MVP-ready, CPU-optimized, bug-free"""
 
-    BATCH_SIZE = 8  # CPU cache-friendly (was 32 → hostile)
+    # Dynamic batching: sequences are sorted by length and packed until the
+    # padded batch would exceed TOKEN_BUDGET tokens (8 x 512 = the old worst
+    # case) or BATCH_SIZE items, so short headlines share large batches while
+    # long speeches keep the memory bound of the old fixed batches of 8.
+    BATCH_SIZE = int(os.getenv("FINBERT_MAX_BATCH", "64"))
+    TOKEN_BUDGET = int(os.getenv("FINBERT_TOKEN_BUDGET", str(8 * MAX_LENGTH)))
 
     @staticmethod
     def _shannon_entropy(probs: np.ndarray) -> float:
@@ -27,16 +160,58 @@ class ScalableBrainFinBERT:
         entropy = -np.sum(probs * np.log2(probs))
         return entropy / MAX_ENTROPY
 
+    @staticmethod
+    def _encode(texts: List[str]) -> List[List[int]]:
+        """Token ids without special tokens, one tokenizer call for the whole list."""
+        tokenizer, _ = load()
+        with _tokenizer_lock:
+            return tokenizer(texts, add_special_tokens=False, truncation=False, verbose=False)["input_ids"]
+
+    @staticmethod
+    def _chunk_ids(ids: List[int], chunk_size: int = 450, overlap: int = 50) -> List[List[int]]:
+        if len(ids) <= chunk_size:
+            return [ids]
+        return [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size - overlap)]
+
     @staticmethod
     def _chunk_text(text: str, chunk_size: int = 450, overlap: int = 50) -> List[str]:
-        tokens = tokenizer.encode(text, add_special_tokens=False)
+        tokenizer, _ = load()
+        tokens = ScalableBrainFinBERT._encode([text])[0]
         if len(tokens) <= chunk_size:
             return [text]
-        chunks = []
-        for i in range(0, len(tokens), chunk_size - overlap):
-            chunk_tokens = tokens[i:i + chunk_size]
-            chunks.append(tokenizer.decode(chunk_tokens, skip_special_tokens=True))
-        return chunks
+        return [
+            tokenizer.decode(chunk, skip_special_tokens=True)
+            for chunk in ScalableBrainFinBERT._chunk_ids(tokens, chunk_size, overlap)
+        ]
+
+    @staticmethod
+    def _infer(sequences: List[List[int]]) -> np.ndarray:
+        """Class probabilities, shape ``(len(sequences), n_labels)``, in input order.
+
+        Each sequence of token ids (without special tokens) is wrapped in the
+        tokenizer's special tokens and truncated to ``MAX_LENGTH``, exactly as
+        ``tokenizer(text, truncation=True, max_length=MAX_LENGTH)`` would, then
+        scored in length-sorted dynamic batches padded to their longest member.
+        """
+        import torch
+
+        tokenizer, model = load()
+        prefix, suffix = _affixes
+        body = MAX_LENGTH - len(prefix) - len(suffix)
+        inputs = [prefix + list(s[:body]) + suffix for s in sequences]
+        lengths = np.array([len(x) for x in inputs])
+        order = np.argsort(lengths, kind="stable")
+        probs = np.empty((len(inputs), model.config.num_labels), dtype=np.float32)
+        for start, end in plan_batches(
+            lengths[order], ScalableBrainFinBERT.TOKEN_BUDGET, ScalableBrainFinBERT.BATCH_SIZE
+        ):
+            idx = order[start:end]
+            with _tokenizer_lock:
+                batch = tokenizer.pad({"input_ids": [inputs[i] for i in idx]}, return_tensors="pt")
+            with torch.no_grad():
+                logits = model(**batch).logits
+                probs[idx] = torch.nn.functional.softmax(logits, dim=-1).numpy()
+        return probs
 
     @staticmethod
     def _fallback() -> Dict:
@@ -54,24 +229,28 @@ class ScalableBrainFinBERT:
     def get_features(text: str, auto_chunk: bool = True) -> Dict:
         if not text or len(text.strip()) == 0:
             return ScalableBrainFinBERT._fallback()
-        tokens = tokenizer.encode(text, add_special_tokens=False)
+        tokens = ScalableBrainFinBERT._encode([text])[0]
         if len(tokens) < 3:
             return ScalableBrainFinBERT._fallback()
-        if auto_chunk and len(tokens) > 512:
-            chunks = ScalableBrainFinBERT._chunk_text(text)
-            chunk_features = [ScalableBrainFinBERT._process_single_chunk(c) for c in chunks]
-            return ScalableBrainFinBERT._aggregate_chunks(chunk_features)
-        return ScalableBrainFinBERT._process_single_chunk(text)
+        if auto_chunk and len(tokens) > MAX_LENGTH:
+            chunks = ScalableBrainFinBERT._chunk_ids(tokens)
+            probs = ScalableBrainFinBERT._infer(chunks)
+            return ScalableBrainFinBERT._aggregate_chunks(
+                [ScalableBrainFinBERT._chunk_features(p) for p in probs]
+            )
+        return ScalableBrainFinBERT._probs_to_features(ScalableBrainFinBERT._infer([tokens])[0])
 
     @staticmethod
     def _process_single_chunk(text: str) -> Dict:
-        inputs = tokenizer(text, padding=True, truncation=True, max_length=512, return_tensors="pt")
-        with torch.no_grad():
-            outputs = model(**inputs)
-            probs = torch.nn.functional.softmax(outputs.logits, dim=-1)[0].numpy()
-        neg_p = float(probs[NEG_IDX])
-        neu_p = float(probs[NEU_IDX])
-        pos_p = float(probs[POS_IDX])
+        tokens = ScalableBrainFinBERT._encode([text])[0]
+        return ScalableBrainFinBERT._probs_to_features(ScalableBrainFinBERT._infer([tokens])[0])
+
+    @staticmethod
+    def _probs_to_features(probs: np.ndarray) -> Dict:
+        _, model = load()
+        neg_p = float(probs[_label_idx["negative"]])
+        neu_p = float(probs[_label_idx["neutral"]])
+        pos_p = float(probs[_label_idx["positive"]])
         sentiment_score = pos_p - neg_p
         dispersion = ScalableBrainFinBERT._shannon_entropy(probs)
         dominant_idx = int(np.argmax(probs))
@@ -86,18 +265,33 @@ class ScalableBrainFinBERT:
             'raw_label': dominant
         }
 
+    @staticmethod
+    def _chunk_features(p: np.ndarray) -> Dict:
+        """Unrounded per-chunk features, the input of ``_aggregate_chunks``."""
+        neg_p = float(p[_label_idx["negative"]])
+        neu_p = float(p[_label_idx["neutral"]])
+        pos_p = float(p[_label_idx["positive"]])
+        return {
+            'sentiment_score': pos_p - neg_p,
+            'positive_prob': pos_p,
+            'negative_prob': neg_p,
+            'neutral_prob': neu_p,
+            'dispersion': ScalableBrainFinBERT._shannon_entropy(p)
+        }
+
     @staticmethod
     def _aggregate_chunks(chunk_features: List[Dict]) -> Dict:
         if not chunk_features:
             return ScalableBrainFinBERT._fallback()
+        _, model = load()
         avg_sent = np.mean([f['sentiment_score'] for f in chunk_features])
         avg_pos = np.mean([f['positive_prob'] for f in chunk_features])
         avg_neg = np.mean([f['negative_prob'] for f in chunk_features])
         avg_neu = np.mean([f['neutral_prob'] for f in chunk_features])
         mean_probs = np.zeros(3)
-        mean_probs[NEG_IDX] = avg_neg
-        mean_probs[NEU_IDX] = avg_neu
-        mean_probs[POS_IDX] = avg_pos
+        mean_probs[_label_idx["negative"]] = avg_neg
+        mean_probs[_label_idx["neutral"]] = avg_neu
+        mean_probs[_label_idx["positive"]] = avg_pos
         dominant_idx = int(np.argmax(mean_probs))
         dominant = model.config.id2label[dominant_idx]
         max_disp = max(f['dispersion'] for f in chunk_features)
@@ -116,63 +310,48 @@ class ScalableBrainFinBERT:
         """MVP-FIXED: no desync, no overwrite, CPU-safe"""
         if not text_list:
             return []
-        
-        # PHASE 1: Collect chunks + map (single tokenization)
-        chunk_list = []
-        chunk_orig_map = []          # which original text each chunk belongs to
+
+        # PHASE 1: Collect chunks + map (one tokenizer call for every text;
+        # long texts are chunked on the token ids, not re-tokenized)
         results = [None] * len(text_list)
-        
+        candidates = []
         for i, text in enumerate(text_list):
             if not text or len(text.strip()) == 0:
                 results[i] = ScalableBrainFinBERT._fallback()
-                continue
-            tokens = tokenizer.encode(text, add_special_tokens=False)
+            else:
+                candidates.append(i)
+        if not candidates:
+            return results
+
+        chunk_list = []
+        chunk_orig_map = []          # which original text each chunk belongs to
+        token_ids = ScalableBrainFinBERT._encode([text_list[i] for i in candidates])
+        for i, tokens in zip(candidates, token_ids):
             if len(tokens) < 3:
                 results[i] = ScalableBrainFinBERT._fallback()
                 continue
-            chunks = ScalableBrainFinBERT._chunk_text(text) if len(tokens) > 512 else [text]
+            chunks = ScalableBrainFinBERT._chunk_ids(tokens) if len(tokens) > MAX_LENGTH else [tokens]
             chunk_list.extend(chunks)
             chunk_orig_map.extend([i] * len(chunks))
-        
+
         if not chunk_list:
             return results
-        
-        # PHASE 2: Mini-batch inference (CPU-safe)
-        all_chunk_probs = []
-        for start in range(0, len(chunk_list), ScalableBrainFinBERT.BATCH_SIZE):
-            batch_texts = chunk_list[start : start + ScalableBrainFinBERT.BATCH_SIZE]
-            inputs = tokenizer(batch_texts, padding=True, truncation=True, max_length=512, return_tensors="pt")
-            with torch.no_grad():
-                outputs = model(**inputs)
-                probs_batch = torch.nn.functional.softmax(outputs.logits, dim=-1).numpy()
-            all_chunk_probs.extend(probs_batch.tolist())  # list for easy grouping
-        
+
+        # PHASE 2: Length-sorted dynamic batches under the token budget
+        all_chunk_probs = ScalableBrainFinBERT._infer(chunk_list)
+
         # PHASE 3: Post-aggregation (fixes overwrite + desync)
         grouped_probs = defaultdict(list)
         for chunk_idx, orig_i in enumerate(chunk_orig_map):
-            grouped_probs[orig_i].append(np.array(all_chunk_probs[chunk_idx]))
-        
+            grouped_probs[orig_i].append(all_chunk_probs[chunk_idx])
+
         for orig_i, probs_list in grouped_probs.items():
-            # Build temporary feature list for aggregation
-            temp_features = []
-            for p in probs_list:
-                neg_p = float(p[NEG_IDX])
-                neu_p = float(p[NEU_IDX])
-                pos_p = float(p[POS_IDX])
-                temp_features.append({
-                    'sentiment_score': pos_p - neg_p,
-                    'positive_prob': pos_p,
-                    'negative_prob': neg_p,
-                    'neutral_prob': neu_p,
-                    'dispersion': ScalableBrainFinBERT._shannon_entropy(p)
-                })
+            temp_features = [ScalableBrainFinBERT._chunk_features(p) for p in probs_list]
             results[orig_i] = ScalableBrainFinBERT._aggregate_chunks(temp_features)
-        
+
         # Fill any remaining None (should never happen)
         for i in range(len(results)):
             if results[i] is None:
                 results[i] = ScalableBrainFinBERT._fallback()
-        
-        return results
-    
 
+        return results
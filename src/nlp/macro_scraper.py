@@ -1,13 +1,19 @@
-from finbert import ScalableBrainFinBERT
+from finbert import ScalableBrainFinBERT, model_revision
 import asyncio
 import aiohttp
+import hashlib
+import re
 import sys
+import threading
+import unicodedata
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 import numpy as np
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 import logging
+import sqlalchemy as sa
 from sqlalchemy import Column, Integer, Float, DateTime, String, Text
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -48,6 +54,167 @@ class FactMacroEvents(Base):
     created_at = Column(DateTime(timezone=True))
 
 
+class FinbertSentimentCache(Base):
+    """Persistent FinBERT features keyed by normalized-text hash and model revision."""
+
+    __tablename__ = "finbert_sentiment_cache"
+
+    text_hash = Column(String(64), primary_key=True)
+    model_revision = Column(String(200), primary_key=True)
+    sentiment_score = Column(Float, nullable=False)
+    positive_prob = Column(Float, nullable=False)
+    negative_prob = Column(Float, nullable=False)
+    neutral_prob = Column(Float, nullable=False)
+    dispersion = Column(Float, nullable=False)
+    dominant = Column(String(20), nullable=False)
+    raw_label = Column(String(20), nullable=False)
+    created_at = Column(DateTime(timezone=True))
+
+
+DEFAULT_LRU_SIZE = int(os.getenv("MACRO_SENTIMENT_LRU_SIZE", "10000"))
+
+FEATURE_COLUMNS = (
+    "sentiment_score",
+    "positive_prob",
+    "negative_prob",
+    "neutral_prob",
+    "dispersion",
+    "dominant",
+    "raw_label",
+)
+
+
+class SentimentCache:
+    """Content-addressed FinBERT feature cache.
+
+    Texts are keyed by the SHA-256 of their normalized form (Unicode NFC,
+    whitespace collapsed) plus ``model_revision()``. Lookups go to an
+    in-process LRU first, then to ``finbert_sentiment_cache``; only texts
+    found in neither are scored, in one ``scorer`` call, and written back.
+    The table is an optimization: database errors are logged and the texts
+    are scored as if the cache were empty.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[sa.engine.Engine] = None,
+        scorer: Callable[[List[str]], List[Dict]] = ScalableBrainFinBERT.batch_features,
+        revision: Optional[str] = None,
+        lru_size: int = DEFAULT_LRU_SIZE,
+    ):
+        self.engine = engine
+        self.scorer = scorer
+        self.revision = revision or model_revision()
+        self.lru_size = lru_size
+        self._lru: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.lru_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(text: Optional[str]) -> str:
+        return re.sub(r"\s+", " ", unicodedata.normalize("NFC", text or "")).strip()
+
+    @staticmethod
+    def text_hash(normalized: str) -> str:
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def batch_features(self, texts: List[str]) -> List[Dict]:
+        """Drop-in for ``ScalableBrainFinBERT.batch_features`` that scores only unseen texts."""
+        normalized = [self.normalize(t) for t in texts]
+        keys = [self.text_hash(t) for t in normalized]
+        found: Dict[str, Dict] = {}
+        pending: Dict[str, str] = {}          # hash -> normalized text, first occurrence
+        with self._lock:
+            for key, text in zip(keys, normalized):
+                entry = self._lru.get(key)
+                if entry is not None:
+                    self._lru.move_to_end(key)
+                    found[key] = entry
+                elif key not in pending:
+                    pending[key] = text
+        lru_hits = len(texts) - len(pending)  # repeats within the batch count as LRU hits
+
+        stored = self._fetch(list(pending)) if pending else {}
+        unseen = [k for k in pending if k not in stored]
+        scored = {}
+        if unseen:
+            features = self.scorer([pending[k] for k in unseen])
+            scored = {k: {c: f[c] for c in FEATURE_COLUMNS} for k, f in zip(unseen, features)}
+            self._store(scored)
+
+        with self._lock:
+            for key, entry in {**stored, **scored}.items():
+                self._lru[key] = entry
+                self._lru.move_to_end(key)
+                found[key] = entry
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+            self.requests += len(texts)
+            self.lru_hits += lru_hits
+            self.db_hits += len(stored)
+            self.misses += len(unseen)
+        return [dict(found[k]) for k in keys]
+
+    def _fetch(self, keys: List[str]) -> Dict[str, Dict]:
+        if self.engine is None:
+            return {}
+        table = FinbertSentimentCache.__table__
+        columns = [table.c[c] for c in FEATURE_COLUMNS]
+        out = {}
+        try:
+            with self.engine.connect() as conn:
+                for start in range(0, len(keys), 1000):
+                    query = sa.select(table.c.text_hash, *columns).where(
+                        table.c.model_revision == self.revision,
+                        table.c.text_hash.in_(keys[start:start + 1000]),
+                    )
+                    for row in conn.execute(query):
+                        out[row[0]] = dict(zip(FEATURE_COLUMNS, row[1:]))
+        except Exception as e:
+            logger.warning(f"Sentiment cache lookup failed, scoring {len(keys)} texts: {e}")
+            return {}
+        return out
+
+    def _store(self, entries: Dict[str, Dict]) -> None:
+        if self.engine is None or not entries:
+            return
+        now_utc = datetime.now(timezone.utc)
+        rows = [
+            {"text_hash": k, "model_revision": self.revision, "created_at": now_utc, **v}
+            for k, v in entries.items()
+        ]
+        table = FinbertSentimentCache.__table__
+        dialect = self.engine.dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            insert = None
+        # Another run may have stored the same text in the meantime.
+        stmt = insert(table).on_conflict_do_nothing() if insert else table.insert()
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(stmt, rows)
+        except Exception as e:
+            logger.warning(f"Sentiment cache write of {len(rows)} entries failed: {e}")
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            hits = self.lru_hits + self.db_hits
+            return {
+                "requests": self.requests,
+                "lru_hits": self.lru_hits,
+                "db_hits": self.db_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / self.requests, 4) if self.requests else 0.0,
+                "lru_entries": len(self._lru),
+            }
+
+
 class MacroIngestionPipeline:
     """Institutional-grade async macro pipeline – all 5 bugs fixed"""
 
@@ -59,6 +226,9 @@ class MacroIngestionPipeline:
         Base.metadata.create_all(self.engine)
         self.Session = sessionmaker(bind=self.engine)
         self.finbert = ScalableBrainFinBERT
+        # Repeated RSS items / calendar titles are served from the cache, so
+        # only new texts reach (and lazily load) the model.
+        self.sentiment_cache = SentimentCache(self.engine, self.finbert.batch_features)
 
     @staticmethod
     def _cyclical_encode(dt: datetime) -> Dict[str, float]:
@@ -209,7 +379,7 @@ class MacroIngestionPipeline:
 
             # 2. FINBERT – ONE BATCH FOR ALL NEWS
             news_features = (
-                self.finbert.batch_features(all_news_texts) if all_news_texts else []
+                self.sentiment_cache.batch_features(all_news_texts) if all_news_texts else []
             )
 
             # 3. MACRO CALENDAR (real timestamps + surprise)
@@ -218,7 +388,13 @@ class MacroIngestionPipeline:
             # 4. FINBERT – ONE SINGLE BATCH FOR ALL CALENDAR TITLES
             calendar_titles = [ev["event_title"] for ev in calendar_events]
             calendar_finbert = (
-                self.finbert.batch_features(calendar_titles) if calendar_titles else []
+                self.sentiment_cache.batch_features(calendar_titles) if calendar_titles else []
+            )
+            cache = self.sentiment_cache.stats()
+            logger.info(
+                f"Sentiment cache: {cache['requests']} texts, {cache['lru_hits']} LRU hits, "
+                f"{cache['db_hits']} table hits, {cache['misses']} scored "
+                f"(hit rate {cache['hit_rate']:.1%})"
             )
 
             # 5. BUILD RECORDS (context-managed DB)
@@ -0,0 +1,260 @@
+"""FinBERT batching tests: plan_batches, token-id chunking and the sort/scatter in _infer.
+
+The scheduling helpers are pure; the inference tests install a stub tokenizer
+and a stub classifier whose logits depend only on each unpadded row, so batch
+composition can never change a result (no checkpoint download).
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.nlp import finbert
+from src.nlp.finbert import MAX_LENGTH, ScalableBrainFinBERT, plan_batches
+
+CLS, SEP, PAD, UNK = 101, 102, 0, 100
+ID2LABEL = {0: "positive", 1: "negative", 2: "neutral"}  # ProsusAI/finbert order
+
+
+class StubTokenizer:
+    """Whitespace tokenizer: ``w<n>`` -> id ``1000 + n`` (else [UNK]), BERT-style [CLS] ... [SEP]."""
+
+    def __call__(self, text, add_special_tokens=True, **kwargs):
+        def encode(t):
+            ids = [1000 + int(w[1:]) if w[1:].isdigit() else UNK for w in t.split()]
+            return [CLS] + ids + [SEP] if add_special_tokens else ids
+
+        if isinstance(text, str):
+            return {"input_ids": encode(text)}
+        return {"input_ids": [encode(t) for t in text]}
+
+    def pad(self, encoded, return_tensors=None):
+        import torch
+
+        rows = encoded["input_ids"]
+        width = max(len(r) for r in rows)
+        return {
+            "input_ids": torch.tensor([r + [PAD] * (width - len(r)) for r in rows]),
+            "attention_mask": torch.tensor([[1] * len(r) + [0] * (width - len(r)) for r in rows]),
+        }
+
+
+class StubModel:
+    """Records every padded batch and the unpadded rows it scored."""
+
+    config = SimpleNamespace(
+        num_labels=3, id2label=ID2LABEL, label2id={v: k for k, v in ID2LABEL.items()}
+    )
+
+    def __init__(self):
+        self.batches = []
+        self.rows = []
+
+    def eval(self):
+        return self
+
+    @staticmethod
+    def logits_for(row):
+        return [(sum(row) % 89) / 20.0, len(row) / 128.0, (row[len(row) // 2] % 7) / 3.0]
+
+    def __call__(self, input_ids, attention_mask):
+        import torch
+
+        self.batches.append(tuple(input_ids.shape))
+        rows = [
+            [i for i, m in zip(ids, mask) if m]
+            for ids, mask in zip(input_ids.tolist(), attention_mask.tolist())
+        ]
+        self.rows.extend(rows)
+        return SimpleNamespace(logits=torch.tensor([self.logits_for(r) for r in rows], dtype=torch.float32))
+
+
+def _softmax(logits):
+    e = np.exp(np.asarray(logits, dtype=np.float64) - np.max(logits))
+    return e / e.sum()
+
+
+def _text(n_words, seed):
+    rng = np.random.default_rng(seed)
+    return " ".join(f"w{i}" for i in rng.integers(0, 500, n_words))
+
+
+@pytest.fixture
+def unloaded(monkeypatch):
+    """A never-loaded module state for one test, restored afterwards."""
+    for name, value in [("_backend", None), ("_affixes", ([], [])), ("_label_idx", {}), ("_installed_revision", None)]:
+        monkeypatch.setattr(finbert, name, value)
+
+
+@pytest.fixture
+def backend(unloaded, monkeypatch):
+    """Install stubs for one test."""
+    pytest.importorskip("torch")
+    monkeypatch.setattr(ScalableBrainFinBERT, "TOKEN_BUDGET", 8 * MAX_LENGTH)
+    monkeypatch.setattr(ScalableBrainFinBERT, "BATCH_SIZE", 64)
+
+    def install(tokenizer):
+        model = StubModel()
+        finbert.install(tokenizer, model, revision="stub")
+        return model
+
+    return install
+
+
+def test_load_uses_the_requested_model_name(unloaded, monkeypatch):
+    transformers = pytest.importorskip("transformers")
+    loaded = []
+
+    def auto(result):
+        return SimpleNamespace(from_pretrained=lambda name, revision: loaded.append((name, revision)) or result)
+
+    monkeypatch.setattr(transformers, "AutoTokenizer", auto(StubTokenizer()))
+    monkeypatch.setattr(transformers, "AutoModelForSequenceClassification", auto(StubModel()))
+    assert finbert.model_revision().startswith(f"{finbert.MODEL_NAME}@{finbert.MODEL_REVISION}/")
+
+    tokenizer, model = finbert.load("yiyanghkust/finbert-tone")
+
+    assert isinstance(tokenizer, StubTokenizer) and isinstance(model, StubModel)
+    assert loaded == [("yiyanghkust/finbert-tone", finbert.MODEL_REVISION)] * 2
+    # Cached features are keyed by the weights actually loaded.
+    assert finbert.model_revision().startswith(f"yiyanghkust/finbert-tone@{finbert.MODEL_REVISION}/")
+    assert finbert.load() == (tokenizer, model) and len(loaded) == 2
+
+
+@pytest.mark.parametrize("budget,max_batch", [(4096, 64), (1000, 8), (300, 3)])
+def test_plan_batches_respects_budget_and_schedules_each_item_once(budget, max_batch):
+    rng = np.random.default_rng(budget)
+    for _ in range(50):
+        lengths = np.sort(rng.integers(3, 600, rng.integers(0, 200)))
+        batches = plan_batches(lengths, budget, max_batch)
+
+        # Contiguous, in order, covering [0, n) exactly once.
+        assert [s for s, _ in batches] == [0] + [e for _, e in batches[:-1]]
+        assert (batches[-1][1] if batches else 0) == len(lengths)
+        for start, end in batches:
+            size = end - start
+            assert 1 <= size <= max_batch
+            # Padded to the longest (last) member; only a lone sequence may exceed the budget.
+            assert size == 1 or size * lengths[end - 1] <= budget
+            # Greedy: the next sequence would have broken a limit.
+            if end < len(lengths):
+                assert size + 1 > max_batch or (size + 1) * lengths[end] > budget
+
+
+def test_plan_batches_packs_short_sequences_into_fewer_batches_than_fixed_eights():
+    lengths = np.sort(np.r_[np.full(500, 20), np.full(12, MAX_LENGTH)])
+    batches = plan_batches(lengths, 8 * MAX_LENGTH, 64)
+    assert len(batches) < -(-len(lengths) // 8)
+    assert max((e - s) * lengths[e - 1] for s, e in batches) <= 8 * MAX_LENGTH
+
+
+def test_chunk_ids_covers_every_token_with_overlap():
+    ids = list(range(1300))
+    chunks = ScalableBrainFinBERT._chunk_ids(ids)
+
+    assert [c[0] for c in chunks] == [0, 400, 800, 1200]
+    assert all(len(c) <= 450 for c in chunks)
+    assert all(a[-50:] == b[:50] for a, b in zip(chunks, chunks[1:]))
+    assert sorted(set(i for c in chunks for i in c)) == ids and chunks[-1][-1] == ids[-1]
+    # [CLS] + chunk + [SEP] fits the model without truncation.
+    assert max(len(c) for c in chunks) + 2 <= MAX_LENGTH
+    assert ScalableBrainFinBERT._chunk_ids(ids[:450]) == [ids[:450]]
+
+
+def test_special_affixes_are_taken_from_the_tokenizer():
+    assert finbert._special_affixes(StubTokenizer()) == ([CLS], [SEP])
+
+    class PairedSep(StubTokenizer):  # RoBERTa-style <s> ... </s></s>
+        def __call__(self, text, add_special_tokens=True, **kwargs):
+            ids = super().__call__(text, add_special_tokens=False)["input_ids"]
+            return {"input_ids": [0] + ids + [2, 2] if add_special_tokens else ids}
+
+    class NoSpecials(StubTokenizer):
+        def __call__(self, text, add_special_tokens=True, **kwargs):
+            return super().__call__(text, add_special_tokens=False)
+
+    class Rewrites(StubTokenizer):
+        def __call__(self, text, add_special_tokens=True, **kwargs):
+            return {"input_ids": [CLS, 7, SEP] if add_special_tokens else [1000]}
+
+    assert finbert._special_affixes(PairedSep()) == ([0], [2, 2])
+    assert finbert._special_affixes(NoSpecials()) == ([], [])
+    with pytest.raises(ValueError):
+        finbert._special_affixes(Rewrites())
+
+
+def test_infer_returns_probabilities_in_input_order(backend, monkeypatch):
+    model = backend(StubTokenizer())
+    monkeypatch.setattr(ScalableBrainFinBERT, "TOKEN_BUDGET", 600)
+    rng = np.random.default_rng(3)
+    sequences = [list(1000 + rng.integers(0, 500, n)) for n in rng.integers(1, 700, 120)]
+
+    probs = ScalableBrainFinBERT._infer(sequences)
+
+    expected = [[CLS] + s[:MAX_LENGTH - 2] + [SEP] for s in sequences]
+    assert probs.shape == (len(sequences), 3)
+    for p, row in zip(probs, expected):
+        np.testing.assert_allclose(p, _softmax(StubModel.logits_for(row)), rtol=1e-5)
+    # Every sequence is scored exactly once, truncated to MAX_LENGTH with its special tokens.
+    assert sorted(map(tuple, model.rows)) == sorted(map(tuple, expected))
+    assert max(len(r) for r in model.rows) == MAX_LENGTH
+    assert all(n == 1 or n * width <= 600 for n, width in model.batches)
+    assert all(n <= ScalableBrainFinBERT.BATCH_SIZE for n, _ in model.batches)
+
+
+def test_long_text_features_match_per_chunk_scoring(backend):
+    model = backend(StubTokenizer())
+    texts = [_text(20, 1), _text(1300, 2), "", "w1 w2", _text(700, 3), _text(40, 4)]
+
+    got = ScalableBrainFinBERT.batch_features(texts)
+
+    # 1 + 4 + 2 + 1 chunks (empty and two-token texts are never scored), all in one batch.
+    assert [len(model.batches), len(model.rows)] == [1, 8]
+    for text, features in zip(texts, got):
+        ids = StubTokenizer()(text, add_special_tokens=False)["input_ids"]
+        if len(ids) < 3:
+            assert features == ScalableBrainFinBERT._fallback()
+            continue
+        chunks = ScalableBrainFinBERT._chunk_ids(ids) if len(ids) > MAX_LENGTH else [ids]
+        reference = [
+            ScalableBrainFinBERT._chunk_features(_softmax(StubModel.logits_for([CLS] + c + [SEP])))
+            for c in chunks
+        ]
+        expected = ScalableBrainFinBERT._aggregate_chunks(reference)
+        assert features["dominant"] == expected["dominant"]
+        for key in ("sentiment_score", "positive_prob", "negative_prob", "neutral_prob", "dispersion"):
+            assert features[key] == pytest.approx(expected[key], abs=1e-4)
+        assert ScalableBrainFinBERT.get_features(text) == features
+
+
+def test_long_text_chunks_match_the_legacy_decode_and_reencode_path(backend):
+    """Chunking token ids feeds the model the same rows as the old decode/re-encode path."""
+    transformers = pytest.importorskip("transformers")
+    words = [f"w{i}" for i in range(500)]
+    vocab_file = os.path.join(tempfile.mkdtemp(prefix="finbert_test_"), "vocab.txt")
+    with open(vocab_file, "w") as fh:
+        fh.write("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + words + ["."]) + "\n")
+    tokenizer = transformers.BertTokenizerFast(vocab_file, do_lower_case=True)
+    model = backend(tokenizer)
+    texts = [_text(1300, 5) + ".", _text(30, 6) + ".", _text(2000, 7) + "."]
+
+    got = ScalableBrainFinBERT.batch_features(texts)
+
+    legacy_rows = []
+    for text in texts:
+        ids = tokenizer(text, add_special_tokens=False)["input_ids"]
+        chunks = [
+            tokenizer.decode(c, skip_special_tokens=True) for c in ScalableBrainFinBERT._chunk_ids(ids)
+        ] if len(ids) > MAX_LENGTH else [text]
+        legacy_rows.append([tokenizer(c, truncation=True, max_length=MAX_LENGTH)["input_ids"] for c in chunks])
+    assert sorted(map(tuple, model.rows)) == sorted(tuple(r) for rows in legacy_rows for r in rows)
+    for features, rows in zip(got, legacy_rows):
+        expected = ScalableBrainFinBERT._aggregate_chunks(
+            [ScalableBrainFinBERT._chunk_features(_softmax(StubModel.logits_for(r))) for r in rows]
+        )
+        assert features["sentiment_score"] == pytest.approx(expected["sentiment_score"], abs=1e-4)
+        assert features["dominant"] == expected["dominant"]
@@ -0,0 +1,121 @@
+"""SentimentCache tests: normalized keys, LRU, the finbert_sentiment_cache table (SQLite, stub scorer)."""
+from __future__ import annotations
+
+import logging
+import os
+import sys
+
+import pytest
+import sqlalchemy as sa
+
+pytest.importorskip("aiohttp")
+
+# macro_scraper imports finbert as a top-level module, as when run from src/nlp.
+_NLP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _NLP_DIR not in sys.path:
+    sys.path.insert(0, _NLP_DIR)
+
+import macro_scraper as ms  # noqa: E402
+
+
+class FakeScorer:
+    """Stands in for ``batch_features``: a score derived from the text, every call recorded."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [
+            dict(ms.ScalableBrainFinBERT._fallback(), sentiment_score=round(len(t) / 100, 4), dispersion=0.5)
+            for t in texts
+        ]
+
+
+def _fail(texts):
+    raise AssertionError(f"scored {texts!r}")
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'cache.db'}")
+    ms.Base.metadata.create_all(engine)
+    return engine
+
+
+def test_whitespace_and_nfc_variants_share_one_key():
+    scorer = FakeScorer()
+    cache = ms.SentimentCache(None, scorer, revision="r1")
+    composed, decomposed = "Caf\u00e9 PMI", "Cafe\u0301 PMI"
+    assert composed != decomposed
+
+    out = cache.batch_features(["ECB  raises\nrates. ", "ECB raises rates.", composed, decomposed])
+
+    assert scorer.calls == [["ECB raises rates.", composed]]
+    assert out[0] == out[1] and out[2] == out[3]
+
+
+def test_in_batch_repeats_count_as_lru_hits():
+    scorer = FakeScorer()
+    cache = ms.SentimentCache(None, scorer, revision="r1")
+
+    cache.batch_features(["Fed holds", "Fed holds", "NFP beats", "Fed  holds"])
+    assert cache.stats() == {
+        "requests": 4, "lru_hits": 2, "db_hits": 0, "misses": 2, "hit_rate": 0.5, "lru_entries": 2,
+    }
+
+    cache.batch_features(["NFP beats"])
+    assert len(scorer.calls) == 1
+    assert cache.stats()["lru_hits"] == 3
+
+
+def test_second_instance_is_served_from_the_table(engine):
+    first = ms.SentimentCache(engine, FakeScorer(), revision="r1")
+    expected = first.batch_features(["Fed holds", "ECB raises rates."])
+
+    second = ms.SentimentCache(engine, _fail, revision="r1")
+    assert second.batch_features(["ECB raises rates.", "Fed  holds"]) == expected[::-1]
+    assert second.stats()["db_hits"] == 2 and second.stats()["misses"] == 0
+
+
+def test_different_revision_misses(engine):
+    ms.SentimentCache(engine, FakeScorer(), revision="r1").batch_features(["Fed holds"])
+    scorer = FakeScorer()
+    other = ms.SentimentCache(engine, scorer, revision="r2")
+
+    other.batch_features(["Fed holds"])
+
+    assert scorer.calls == [["Fed holds"]]
+    assert other.stats()["db_hits"] == 0
+    with engine.connect() as conn:
+        revisions = conn.execute(sa.text("SELECT model_revision FROM finbert_sentiment_cache")).scalars().all()
+    assert sorted(revisions) == ["r1", "r2"]
+
+
+def test_lru_evicts_least_recently_used_beyond_lru_size():
+    scorer = FakeScorer()
+    cache = ms.SentimentCache(None, scorer, revision="r1", lru_size=2)
+
+    cache.batch_features(["a b c", "d e f"])
+    cache.batch_features(["a b c"])       # refreshes "a b c"
+    cache.batch_features(["g h i"])       # evicts "d e f"
+    assert cache.stats()["lru_entries"] == 2
+
+    cache.batch_features(["a b c", "d e f"])
+    assert scorer.calls == [["a b c", "d e f"], ["g h i"], ["d e f"]]
+
+
+def test_database_failure_degrades_to_scoring(tmp_path, caplog):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'empty.db'}")  # no cache table
+    scorer = FakeScorer()
+    cache = ms.SentimentCache(engine, scorer, revision="r1")
+
+    with caplog.at_level(logging.WARNING, logger=ms.logger.name):
+        out = cache.batch_features(["Fed holds", "NFP beats"])
+
+    assert scorer.calls == [["Fed holds", "NFP beats"]]
+    assert [f["sentiment_score"] for f in out] == [0.09, 0.09]
+    assert "lookup failed" in caplog.text and "write of 2 entries failed" in caplog.text
+    # The in-process LRU still serves the texts.
+    cache.batch_features(["Fed holds"])
+    assert len(scorer.calls) == 1
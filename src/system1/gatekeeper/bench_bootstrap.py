@@ -0,0 +1,66 @@
+"""Micro-benchmark: chunked permutation bootstrap vs the legacy per-resample shuffle loop.
+
+For each trade count, times ``oos_uplift_test`` (one line per ``--workers`` value)
+and the legacy loop it replaced. The legacy loop is run for at most
+``--legacy-resamples`` resamples and extrapolated, so 100k trades stays quick.
+
+    python -m src.system1.gatekeeper.bench_bootstrap --trades 1000 10000 100000 --workers 1 4
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from .thresholds import oos_uplift_test
+
+
+def _legacy_seconds(a: np.ndarray, rj: np.ndarray, n_bootstrap: int, resamples: int) -> float:
+    pooled = np.concatenate([a, rj])
+    n_a = len(a)
+    rng = np.random.RandomState(42)
+    runs = min(n_bootstrap, resamples)
+    t0 = time.perf_counter()
+    for _ in range(runs):
+        rng.shuffle(pooled)
+        pooled[:n_a].mean() - pooled[n_a:].mean()
+    return (time.perf_counter() - t0) * n_bootstrap / runs
+
+
+def bench(trades: int, n_bootstrap: int, workers: int, legacy_resamples: int) -> dict:
+    rng = np.random.RandomState(trades)
+    n_a = int(trades * 0.35)
+    a = rng.normal(0.05, 1.0, n_a)
+    rj = rng.normal(0.0, 1.0, trades - n_a)
+    t0 = time.perf_counter()
+    _, p_value, _ = oos_uplift_test(a, rj, n_bootstrap=n_bootstrap, workers=workers)
+    elapsed = time.perf_counter() - t0
+    legacy = _legacy_seconds(a, rj, n_bootstrap, legacy_resamples)
+    return {
+        "trades": trades,
+        "n_bootstrap": n_bootstrap,
+        "workers": workers,
+        "p_value": round(p_value, 6),
+        "seconds": round(elapsed, 3),
+        "legacy_seconds_est": round(legacy, 3),
+        "speedup": round(legacy / elapsed, 1) if elapsed else None,
+    }
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--trades", type=int, nargs="+", default=[1000, 10000, 100000])
+    ap.add_argument("--n-bootstrap", type=int, default=10000)
+    ap.add_argument("--workers", type=int, nargs="+", default=[1])
+    ap.add_argument("--legacy-resamples", type=int, default=1000)
+    args = ap.parse_args(argv)
+    for trades in args.trades:
+        for workers in args.workers:
+            print(json.dumps(bench(trades, args.n_bootstrap, workers, args.legacy_resamples)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -39,3 +39,36 @@ def test_degenerate_detection():
     assert TH.is_degenerate(0.0, 0.05, 0.60)   # approves none
     assert TH.is_degenerate(1.0, 0.05, 0.60)   # approves all
     assert not TH.is_degenerate(0.3, 0.05, 0.60)
+
+
+def test_uplift_p_value_depends_only_on_seed(monkeypatch):
+    rng = np.random.RandomState(3)
+    a, b = rng.normal(0.05, 1.0, 300), rng.normal(0.0, 1.0, 700)
+    first = TH.oos_uplift_test(a, b, n_bootstrap=3000, seed=7)
+    assert TH.oos_uplift_test(a, b, n_bootstrap=3000, seed=7) == first
+    monkeypatch.setattr(TH, "_MIN_SHARD_ELEMENTS", 0)  # force the process pool
+    assert TH.oos_uplift_test(a, b, n_bootstrap=3000, seed=7, workers=3) == first
+
+
+def test_null_diffs_match_permutation_moments(monkeypatch):
+    # Both resampling paths (whole-matrix permute / per-row index draw) sample the
+    # same permutation null: mean 0, variance s^2 * (1/n_a + 1/n_r) with s^2 the
+    # pooled variance (ddof=1).
+    rng = np.random.RandomState(4)
+    pooled = rng.normal(0.0, 1.0, 600)
+    expected_sd = np.sqrt(pooled.var(ddof=1) * (1 / 200 + 1 / 400))
+    seq = np.random.SeedSequence(0)
+    for full_permute_max in (10000, 0):
+        monkeypatch.setattr(TH, "_FULL_PERMUTE_MAX", full_permute_max)
+        for n_a in (200, 400):  # approved group smaller / larger than rejected
+            diffs = TH._null_diffs_chunk(pooled, n_a, 20000, seq)
+            assert abs(diffs.mean()) < 0.01
+            assert abs(diffs.std() / expected_sd - 1) < 0.03
+
+
+def test_key_selection_picks_exactly_k_per_resample(monkeypatch):
+    # Constant trades: any resample that selected more or fewer than k trades (e.g. a
+    # tie at the k-th key left in) would show up as a non-zero null difference.
+    monkeypatch.setattr(TH, "_FULL_PERMUTE_MAX", 0)
+    diffs = TH._null_diffs_chunk(np.ones(3000), 700, 500, np.random.SeedSequence(1))
+    np.testing.assert_allclose(diffs, 0.0, atol=1e-12)
@@ -0,0 +1,84 @@
+"""MODEL-006 walk-forward scheduler tests: parallel folds == serial folds (no DB/network)."""
+from __future__ import annotations
+
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src.system1.gatekeeper import train as T
+
+
+def _frame(n=1800, seed=0):
+    rng = np.random.RandomState(seed)
+    probs = rng.dirichlet(np.ones(4), n)
+    df = pd.DataFrame(
+        {
+            "atr_value": rng.uniform(0.0005, 0.003, n),
+            "adx_value": rng.uniform(10, 50, n),
+            "prob_causal_trending_up": probs[:, 0],
+            "prob_causal_trending_down": probs[:, 1],
+            "prob_causal_ranging": probs[:, 2],
+            "prob_causal_high_vol": probs[:, 3],
+            "regime_causal": rng.choice(["trending_up", "trending_down", "ranging", "high_vol"], n),
+            "strategy_id": rng.choice(["1", "2", "3"], n).astype(str),
+            "entry_signal_type": rng.choice(["BUY", "SELL"], n).astype(str),
+        }
+    )
+    edge = df["prob_causal_trending_up"] - df["prob_causal_trending_down"]
+    df["is_winner"] = (edge + rng.normal(0, 0.5, n) > 0.1).astype(int)
+    df["r_multiple"] = np.where(df["is_winner"] == 1, rng.uniform(0.5, 2.5, n), -1.0)
+    return T._derive_features(df)
+
+
+# Passed explicitly: patching T.PARAM_GRID would not reach spawn-started workers.
+SMALL_GRID = {"max_depth": [2, 3], "n_estimators": [20], "learning_rate": [0.1]}
+
+
+def test_split_cores(monkeypatch):
+    monkeypatch.setattr(T.os, "cpu_count", lambda: 16)
+    monkeypatch.delenv("GATEKEEPER_FOLD_WORKERS", raising=False)
+    assert T._split_cores(5) == (5, 3)
+    assert T._split_cores(5, fold_workers=2) == (2, 8)
+    monkeypatch.setenv("GATEKEEPER_FOLD_WORKERS", "1")
+    assert T._split_cores(5) == (1, 16)
+    monkeypatch.setattr(T.os, "cpu_count", lambda: 2)
+    assert T._split_cores(5, fold_workers=8) == (5, 1)
+
+
+def test_parallel_folds_match_serial():
+    frame = _frame()
+    serial = T._walk_forward(frame, fold_workers=1, param_grid=SMALL_GRID, n_folds=3)
+    parallel = T._walk_forward(frame, fold_workers=3, param_grid=SMALL_GRID, n_folds=3)
+    assert serial["approved"] == parallel["approved"] and serial["rejected"] == parallel["rejected"]
+    assert serial["thresholds"] == parallel["thresholds"]
+    assert len(serial["approved"]) + len(serial["rejected"]) > 0
+    assert parallel["schedule"]["fold_workers"] == 3
+    folds = parallel["schedule"]["folds"]
+    assert [f["fold"] for f in folds] == [1, 2, 3]
+    assert all(f["wall_s"] >= 0 for f in folds)
+
+
+def test_small_folds_are_skipped_and_reported():
+    wf = T._walk_forward(_frame(n=900), fold_workers=1, param_grid=SMALL_GRID, n_folds=3)  # fold 1 < 200 rows
+    folds = wf["schedule"]["folds"]
+    assert folds[0]["skipped"] and not folds[-1]["skipped"]
+    assert "approved" not in folds[-1]  # per-fold returns are merged, not duplicated in the manifest
+
+
+def test_spawned_fold_workers_search_the_requested_grid(monkeypatch):
+    spawn = functools.partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn"))
+    monkeypatch.setattr(T, "ProcessPoolExecutor", spawn)
+    frame = _frame()
+
+    parallel = T._walk_forward(frame, fold_workers=2, param_grid=SMALL_GRID, n_folds=3)
+    serial = T._walk_forward(frame, fold_workers=1, param_grid=SMALL_GRID, n_folds=3)
+
+    folds = [f for f in parallel["schedule"]["folds"] if not f["skipped"]]
+    assert folds and all(
+        f["best_params"]["max_depth"] in SMALL_GRID["max_depth"] and f["best_params"]["n_estimators"] == 20
+        for f in folds
+    )
+    assert parallel["approved"] == serial["approved"] and parallel["rejected"] == serial["rejected"]
@@ -1,10 +1,20 @@
 """MODEL-006 — pure threshold calibration + OOS uplift (no DB/network/model). Skill: financial-metrics.md."""
 from __future__ import annotations
 
-from typing import Optional, Sequence, Tuple
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
 
 import numpy as np
 
+# Resampling-matrix budget per chunk (elements; ~2 MiB of float64 stays cache-resident).
+_CHUNK_ELEMENTS = 1 << 18
+# Up to this many pooled trades a whole chunk is permuted in one call; above it the
+# smaller group of every resample is selected by random keys (one partition per chunk).
+_FULL_PERMUTE_MAX = 2048
+# Below this many permuted elements a process pool costs more than it saves.
+_MIN_SHARD_ELEMENTS = 1 << 26
+
 
 def approval_rate(scores: Sequence[float], threshold: float) -> float:
     s = np.asarray(scores, dtype="float64")
@@ -41,15 +51,67 @@ def calibrate_threshold(
     return best_thr, best_rate
 
 
+def _chunk_rows(n_pooled: int) -> int:
+    """Resamples per chunk. Depends only on the data size, never on the worker count."""
+    return max(1, _CHUNK_ELEMENTS // max(1, n_pooled))
+
+
+def _null_diffs_chunk(
+    pooled: np.ndarray, n_a: int, rows: int, seed_seq: np.random.SeedSequence
+) -> np.ndarray:
+    """``rows`` null-hypothesis mean differences (random relabelling of the pooled trades).
+
+    Only the sum of a random group of the smaller size ``k`` is needed; the other
+    group's mean follows from the pooled total. Small pools permute a ``rows x n``
+    value matrix in one call. Large pools draw a ``rows x n`` matrix of uniform 32-bit
+    keys straight from the bit generator and take each row's ``k`` smallest keys (one
+    ``np.partition`` and one mask-times-values product for the whole chunk). Keys are
+    i.i.d., so those ``k`` positions are a uniform random subset; the rare row with a
+    tie at the ``k``-th key is redrawn, which keeps the subset exactly uniform.
+    """
+    n = len(pooled)
+    k = min(n_a, n - n_a)
+    rng = np.random.Generator(np.random.PCG64(seed_seq))
+    if n <= _FULL_PERMUTE_MAX:
+        values = np.tile(pooled, (rows, 1))
+        rng.permuted(values, axis=1, out=values)
+        picked = values[:, :k].sum(axis=1)
+    else:
+        keys = rng.bit_generator.random_raw((rows * n + 1) // 2).view(np.uint32)
+        keys = keys[: rows * n].reshape(rows, n)
+        kth = np.partition(keys, k - 1, axis=1)[:, k - 1 : k]
+        mask = keys <= kth
+        picked = mask @ pooled
+        for r in np.flatnonzero(mask.sum(axis=1) != k):
+            picked[r] = pooled[rng.choice(n, k, replace=False, shuffle=False)].sum()
+    total = pooled.sum()
+    if k == n_a:
+        return picked / n_a - (total - picked) / (n - n_a)
+    return (total - picked) / n_a - picked / (n - n_a)
+
+
+def _null_diffs_shard(
+    pooled: np.ndarray, n_a: int, chunks: List[Tuple[int, np.random.SeedSequence]]
+) -> np.ndarray:
+    return np.concatenate([_null_diffs_chunk(pooled, n_a, rows, ss) for rows, ss in chunks])
+
+
 def oos_uplift_test(
     approved_returns: Sequence[float],
     rejected_returns: Sequence[float],
     n_bootstrap: int = 10000,
     alpha: float = 0.05,
     seed: int = 42,
+    workers: Optional[int] = None,
 ) -> Tuple[float, float, bool]:
     """Bootstrap test that approved per-trade return > rejected. Returns
-    (mean_uplift, p_value, is_significant)."""
+    (mean_uplift, p_value, is_significant).
+
+    Resamples are drawn in chunks of permuted index matrices; chunk ``c`` uses the
+    ``c``-th child of ``SeedSequence(seed)``, so the p-value depends only on the data
+    and ``seed`` — not on ``workers``. ``workers`` > 1 (default
+    ``GATEKEEPER_BOOTSTRAP_WORKERS``, else 1) shards chunks across processes once the
+    resampling work is large enough to pay for the pool."""
     a = np.asarray(approved_returns, dtype="float64")
     rj = np.asarray(rejected_returns, dtype="float64")
     if len(a) == 0 or len(rj) == 0:
@@ -57,11 +119,18 @@ def oos_uplift_test(
     observed = float(a.mean() - rj.mean())
     pooled = np.concatenate([a, rj])
     n_a = len(a)
-    rng = np.random.RandomState(seed)
-    diffs = np.empty(n_bootstrap)
-    for i in range(n_bootstrap):
-        rng.shuffle(pooled)  # permute group labels under the null of no difference
-        diffs[i] = pooled[:n_a].mean() - pooled[n_a:].mean()
+
+    rows = _chunk_rows(len(pooled))
+    sizes = [min(rows, n_bootstrap - start) for start in range(0, n_bootstrap, rows)]
+    chunks = list(zip(sizes, np.random.SeedSequence(seed).spawn(len(sizes))))
+    workers = int(workers if workers is not None else os.environ.get("GATEKEEPER_BOOTSTRAP_WORKERS", 1))
+    workers = max(1, min(workers, len(chunks)))
+    if workers > 1 and n_bootstrap * len(pooled) >= _MIN_SHARD_ELEMENTS:
+        shards = [chunks[w::workers] for w in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            diffs = np.concatenate(list(pool.map(_null_diffs_shard, [pooled] * workers, [n_a] * workers, shards)))
+    else:
+        diffs = _null_diffs_shard(pooled, n_a, chunks) if chunks else np.empty(0)
     # One-sided permutation p: how often the NULL diff reaches the observed uplift.
     p_value = float((np.sum(diffs >= observed) + 1) / (n_bootstrap + 1))
     return observed, p_value, bool(p_value < alpha and observed > 0)
@@ -19,8 +19,10 @@ from __future__ import annotations
 import argparse
 import logging
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -154,23 +156,36 @@ def _make_preprocessor() -> ColumnTransformer:
     )
 
 
-def _fit_model(pre: ColumnTransformer, X: pd.DataFrame, y: np.ndarray) -> XGBClassifier:
-    """Fit with hyperparameter search, using class-weight for imbalanced winners (~38%)."""
+def _fit_model(
+    pre: ColumnTransformer,
+    X: pd.DataFrame,
+    y: np.ndarray,
+    n_jobs: int = 4,
+    xgb_n_jobs: int = 4,
+    param_grid: Optional[Dict[str, List[Any]]] = None,
+) -> XGBClassifier:
+    """Fit with hyperparameter search, using class-weight for imbalanced winners (~38%).
+
+    ``n_jobs`` (GridSearchCV workers) and ``xgb_n_jobs`` (XGBoost threads) only change
+    wall time: every candidate fit is seeded, and XGBoost's hist trees are identical
+    across thread counts, so the selected model does not depend on them.
+    ``param_grid`` defaults to ``PARAM_GRID``.
+    """
     Xt = pre.transform(X)
     scale_pos = max(1.0, float((y == 0).sum() / max(1, (y == 1).sum())))
     base = XGBClassifier(
         eval_metric="logloss",
         random_state=SEED,
-        n_jobs=4,
+        n_jobs=xgb_n_jobs,
         verbosity=0,
         scale_pos_weight=scale_pos,
     )
     gs = GridSearchCV(
         base,
-        PARAM_GRID,
+        PARAM_GRID if param_grid is None else param_grid,
         scoring="neg_log_loss",
         cv=3,
-        n_jobs=4,
+        n_jobs=n_jobs,
         verbose=0,
     )
     gs.fit(Xt, y)
@@ -182,33 +197,140 @@ def _scores(model, pre, X) -> np.ndarray:
     return model.predict_proba(pre.transform(X))[:, 1]
 
 
-def _walk_forward(frame: pd.DataFrame) -> Dict[str, Any]:
-    """Expanding-window folds -> aggregated OOS approved/rejected returns + per-regime thresholds."""
-    blocks = np.array_split(frame, N_FOLDS + 1)
+def _split_cores(n_folds: int, fold_workers: Optional[int] = None) -> Tuple[int, int]:
+    """Split the CPU budget into (concurrent folds, GridSearchCV workers per fold).
+
+    ``GATEKEEPER_FOLD_WORKERS`` overrides the fold concurrency (default: one fold per
+    core, at most ``n_folds``); each fold gets an equal share of the remaining cores
+    for its grid search, with single-threaded XGBoost fits so the two levels of
+    parallelism never oversubscribe the box.
+    """
+    cores = os.cpu_count() or 1
+    workers = int(
+        fold_workers
+        if fold_workers is not None
+        else os.environ.get("GATEKEEPER_FOLD_WORKERS", min(n_folds, cores))
+    )
+    workers = max(1, min(workers, n_folds))
+    return workers, max(1, cores // workers)
+
+
+_FOLD_FRAME: Optional[pd.DataFrame] = None
+_FOLD_PARAM_GRID: Optional[Dict[str, List[Any]]] = None
+
+
+def _init_fold_worker(frame: pd.DataFrame, param_grid: Dict[str, List[Any]]) -> None:
+    """Process-pool initializer: ship the training frame and grid once per worker, not per fold.
+
+    The grid travels here rather than through the module global: under the ``spawn``
+    start method (macOS/Windows default) workers re-import this module and would
+    otherwise search the default ``PARAM_GRID``.
+    """
+    global _FOLD_FRAME, _FOLD_PARAM_GRID
+    _FOLD_FRAME = frame
+    _FOLD_PARAM_GRID = param_grid
+
+
+def _train_fold(
+    fold: int,
+    train_end: int,
+    oos_end: int,
+    inner_jobs: int,
+    frame: Optional[pd.DataFrame] = None,
+    param_grid: Optional[Dict[str, List[Any]]] = None,
+) -> Dict[str, Any]:
+    """Train one expanding fold on ``frame[:train_end]`` and score ``frame[train_end:oos_end]``.
+
+    ``frame`` / ``param_grid`` default to what ``_init_fold_worker`` shipped to this worker.
+    """
+    t0 = time.perf_counter()
+    frame = _FOLD_FRAME if frame is None else frame
+    param_grid = _FOLD_PARAM_GRID if param_grid is None else param_grid
+    feature_cols = NUMERIC_DERIVED + CATEGORICAL
+    train = frame.iloc[:train_end].reset_index(drop=True)
+    oos = frame.iloc[train_end:oos_end]
+    cut = int(len(train) * 0.8)
+    tr, val = train.iloc[:cut], train.iloc[cut:]
+    out: Dict[str, Any] = {
+        "fold": fold,
+        "n_train": len(tr),
+        "n_val": len(val),
+        "n_oos": len(oos),
+        "skipped": True,
+    }
+    if len(tr) < 200 or len(val) < 50 or len(oos) < 50:
+        out["wall_s"] = round(time.perf_counter() - t0, 3)
+        return out
+    pre = _make_preprocessor().fit(tr[feature_cols])
+    model = _fit_model(
+        pre, tr[feature_cols], tr["is_winner"].to_numpy(), n_jobs=inner_jobs, xgb_n_jobs=1,
+        param_grid=param_grid,
+    )
+    val_scores = _scores(model, pre, val[feature_cols])
+    thr_map = _calibrate_regime_thresholds(val, val_scores)
+    oos_scores = _scores(model, pre, oos[feature_cols])
+    approved_mask = _apply_thresholds(oos, oos_scores, thr_map)
+    out.update(
+        skipped=False,
+        best_params={k: model.get_params()[k] for k in param_grid},
+        thresholds=thr_map,
+        approved=oos["r_multiple"].to_numpy()[approved_mask].tolist(),
+        rejected=oos["r_multiple"].to_numpy()[~approved_mask].tolist(),
+        wall_s=round(time.perf_counter() - t0, 3),
+    )
+    return out
+
+
+def _walk_forward(
+    frame: pd.DataFrame,
+    fold_workers: Optional[int] = None,
+    param_grid: Optional[Dict[str, List[Any]]] = None,
+    n_folds: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Expanding-window folds -> aggregated OOS approved/rejected returns + per-regime thresholds.
+
+    Folds are independent, so they run concurrently on a process pool (see
+    ``_split_cores``); results are merged in fold order, which makes the output
+    identical to the serial path (``fold_workers=1``) for a given ``SEED``.
+    ``param_grid`` / ``n_folds`` default to ``PARAM_GRID`` / ``N_FOLDS`` and are
+    resolved here, in the parent, then passed to the workers explicitly.
+    """
+    t0 = time.perf_counter()
+    param_grid = PARAM_GRID if param_grid is None else param_grid
+    n_folds = N_FOLDS if n_folds is None else n_folds
+    bounds = np.cumsum([len(b) for b in np.array_split(np.arange(len(frame)), n_folds + 1)])
+    tasks = [(i, int(bounds[i - 1]), int(bounds[i])) for i in range(1, n_folds + 1)]
+    workers, inner_jobs = _split_cores(len(tasks), fold_workers)
+    if workers == 1:
+        folds = [_train_fold(*t, inner_jobs, frame=frame, param_grid=param_grid) for t in tasks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_fold_worker, initargs=(frame, param_grid)
+        ) as pool:
+            # Largest (latest) folds first so the longest fits start immediately.
+            futures = {t[0]: pool.submit(_train_fold, *t, inner_jobs) for t in reversed(tasks)}
+            folds = [futures[t[0]].result() for t in tasks]
+
     approved_all: List[float] = []
     rejected_all: List[float] = []
     last_thresholds: Dict[str, float] = {}
-    feature_cols = NUMERIC_DERIVED + CATEGORICAL
-    for i in range(1, N_FOLDS + 1):
-        train = pd.concat(blocks[:i]).reset_index(drop=True)
-        oos = blocks[i]
-        cut = int(len(train) * 0.8)
-        tr, val = train.iloc[:cut], train.iloc[cut:]
-        if len(tr) < 200 or len(val) < 50 or len(oos) < 50:
+    for f in folds:
+        if f["skipped"]:
             continue
-        pre = _make_preprocessor().fit(tr[feature_cols])
-        model = _fit_model(pre, tr[feature_cols], tr["is_winner"].to_numpy())
-        val_scores = _scores(model, pre, val[feature_cols])
-        thr_map = _calibrate_regime_thresholds(val, val_scores)
-        last_thresholds = thr_map
-        oos_scores = _scores(model, pre, oos[feature_cols])
-        approved_mask = _apply_thresholds(oos, oos_scores, thr_map)
-        approved_all.extend(oos["r_multiple"].to_numpy()[approved_mask].tolist())
-        rejected_all.extend(oos["r_multiple"].to_numpy()[~approved_mask].tolist())
+        approved_all.extend(f.pop("approved"))
+        rejected_all.extend(f.pop("rejected"))
+        last_thresholds = f.pop("thresholds")
+        logger.info("fold %d: n_train=%d n_oos=%d %.1fs", f["fold"], f["n_train"], f["n_oos"], f["wall_s"])
     return {
         "approved": approved_all,
         "rejected": rejected_all,
         "thresholds": last_thresholds,
+        "schedule": {
+            "fold_workers": workers,
+            "inner_jobs": inner_jobs,
+            "wall_s": round(time.perf_counter() - t0, 3),
+            "folds": folds,
+        },
     }
 
 
@@ -284,7 +406,9 @@ def run(register_mlflow: bool = True, dry_run: bool = False) -> Dict[str, Any]:
 
     feature_cols = NUMERIC_DERIVED + CATEGORICAL
     pre = _make_preprocessor().fit(frame[feature_cols])
-    model = _fit_model(pre, frame[feature_cols], frame["is_winner"].to_numpy())
+    model = _fit_model(
+        pre, frame[feature_cols], frame["is_winner"].to_numpy(), n_jobs=os.cpu_count() or 1, xgb_n_jobs=1
+    )
     dynamic_thresholds = wf["thresholds"]
 
     # FIX-S1-009 Fix 5: route the bundle write through the single governed
@@ -308,6 +432,7 @@ def run(register_mlflow: bool = True, dry_run: bool = False) -> Dict[str, Any]:
             "n_rejected": n_rej,
             "n_folds": N_FOLDS,
         },
+        "walk_forward": wf["schedule"],
         "regime_model_version": REGIME_MODEL_VERSION,
         "feature_set_version": FEATURE_SET_VERSION,
         "n_train": int(len(frame)),
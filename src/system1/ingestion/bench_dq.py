@@ -0,0 +1,115 @@
+"""Memory benchmark: streaming columnar DQ/gap detection vs accumulate-then-detect.
+
+Feeds a synthetic H1 series (weekends closed, ~0.1% random missing hours) page by
+page. The streaming path (``StreamingDQ.feed_columns``) holds one page plus the gap
+list; the legacy path (per-bar dict checks, every clean bar kept for one
+``detect_gaps`` call at the end) is run for at most ``--legacy-bars`` bars and its
+peak memory extrapolated per bar, so 10M bars stays feasible.
+
+    python -m src.system1.ingestion.bench_dq --bars 10000000 --legacy-bars 500000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Iterator, Tuple
+
+import numpy as np
+
+from . import dq
+from .dq_reference import detect_gaps_loop, run_dq_checks_loop
+
+_HOUR_US = 3_600_000_000
+_START_US = dq._to_us(datetime(2000, 1, 3))  # a Monday
+
+
+def _pages(bars: int, page: int, seed: int) -> Iterator[Tuple[np.ndarray, ...]]:
+    """Columnar pages of an hourly series with closed weekends and random holes."""
+    rng = np.random.default_rng(seed)
+    hour, emitted = 0, 0
+    while emitted < bars:
+        times = _START_US + np.arange(hour, hour + 2 * page, dtype=np.int64) * _HOUR_US
+        weekday = (times // (24 * _HOUR_US) + 3) % 7  # 1970-01-01 was a Thursday
+        keep = (weekday < 5) & (rng.random(len(times)) > 0.001)
+        times = times[keep][: min(page, bars - emitted)]
+        hour = int((times[-1] - _START_US) // _HOUR_US) + 1
+        emitted += len(times)
+        close = 1.1 + np.cumsum(rng.normal(0, 1e-3, len(times)))
+        open_ = np.concatenate(([close[0]], close[:-1]))
+        spread = np.abs(rng.normal(0, 5e-4, len(times)))
+        yield times, open_, np.maximum(open_, close) + spread, np.minimum(open_, close) - spread, close
+
+
+def bench_streaming(bars: int, page: int, seed: int) -> dict:
+    state = dq.StreamingDQ("H1", timedelta(hours=1))
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    quarantined = 0
+    for columns in _pages(bars, page, seed):
+        quarantined += int(np.count_nonzero(state.feed_columns(*columns)))
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    report = state.report()
+    return {
+        "mode": "streaming_columnar",
+        "bars": bars,
+        "page": page,
+        "seconds": round(elapsed, 2),
+        "peak_mb": round(peak / 2**20, 1),
+        "quarantined": quarantined,
+        "gaps": len(report["gaps"]),
+        "missing_expected_bar_ratio": report["missing_expected_bar_ratio"],
+    }
+
+
+def bench_legacy(bars: int, legacy_bars: int, page: int, seed: int) -> dict:
+    n = min(bars, legacy_bars)
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    all_clean = []
+    for times, open_, high, low, close in _pages(n, page, seed):
+        page_bars = [
+            {
+                "asset_id": 1, "granularity": "H1",
+                "bar_time_utc": dq._from_us(t, aware=True),
+                "open": o, "high": h, "low": lo, "close": c, "volume": 1, "complete": True,
+            }
+            for t, o, h, lo, c in zip(times.tolist(), open_.tolist(), high.tolist(), low.tolist(), close.tolist())
+        ]
+        ok, _ = run_dq_checks_loop(page_bars)
+        all_clean.extend(ok)
+    report = detect_gaps_loop(all_clean, "H1", timedelta(hours=1))
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "mode": "legacy_accumulate",
+        "bars": n,
+        "seconds": round(elapsed, 2),
+        "peak_mb": round(peak / 2**20, 1),
+        "gaps": len(report["gaps"]),
+        "est_seconds_at_bars": round(elapsed * bars / n, 1),
+        "est_peak_mb_at_bars": round(peak / n * bars / 2**20, 1),
+        "extrapolated_to": bars,
+    }
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--bars", type=int, default=10_000_000)
+    ap.add_argument("--page", type=int, default=5000, help="bars per page (OANDA max candles/request)")
+    ap.add_argument("--legacy-bars", type=int, default=500_000)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+    print(json.dumps(bench_streaming(args.bars, args.page, args.seed)))
+    if args.legacy_bars:
+        print(json.dumps(bench_legacy(args.bars, args.legacy_bars, args.page, args.seed)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
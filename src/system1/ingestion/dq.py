@@ -10,12 +10,18 @@ Operates on *normalized bar dicts* (one page, already filtered to complete candl
 
 DQ checks return ``(ok_bars, quarantined)`` where ``quarantined`` is a list of
 ``(bar, reason_code, detail)`` — rows are quarantined, never silently dropped.
+
+The checks run columnar (:func:`page_reasons` over NumPy arrays of bar times and
+OHLC). :class:`StreamingDQ` is the stateful form used by ingestion: it is fed one
+page at a time and carries only the last clean bar time across pages, so a decade
+of H1 (or years of M-level) bars is never held in memory to build the gap report.
 """
 from __future__ import annotations
 
-from collections import Counter
-from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 Bar = Dict[str, object]
 Quarantined = Tuple[Bar, str, str]
@@ -27,59 +33,124 @@ NON_MONOTONIC = "NON_MONOTONIC"
 DUPLICATE = "DUPLICATE"
 
 
+# Per-bar reason codes of the columnar kernel (0 = clean), in check order.
+_REASONS = (None, NON_POSITIVE_PRICE, OHLC_SANITY, NON_MONOTONIC, DUPLICATE)
+_CODE = {reason: code for code, reason in enumerate(_REASONS) if reason}
+
+_EPOCH = datetime(1970, 1, 1)
+_US = timedelta(microseconds=1)
+_WEEKEND_AWARE = ("H1", "H4", "D1")
+
+
 def _natural_key(b: Bar) -> tuple:
     return (b["asset_id"], b["granularity"], b["bar_time_utc"])
 
 
+def _to_us(t: datetime) -> int:
+    """Exact UTC epoch microseconds of a naive-UTC or tz-aware datetime."""
+    if t.tzinfo is not None:
+        t = t.astimezone(timezone.utc).replace(tzinfo=None)
+    return (t - _EPOCH) // _US
+
+
+def _from_us(us: int, aware: bool) -> datetime:
+    t = _EPOCH + timedelta(microseconds=int(us))
+    return t.replace(tzinfo=timezone.utc) if aware else t
+
+
+def page_reasons(
+    times_us: np.ndarray,
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    groups: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Columnar DQ kernel: one reason code per bar (index into ``_REASONS``; 0 = clean).
+
+    Same rules and precedence as the per-bar checks: non-positive price, then OHLC
+    sanity, then strictly-decreasing time vs the previous bar (of any status), then a
+    natural key already seen earlier in the page. ``groups`` distinguishes
+    (asset_id, granularity) pairs within a mixed page; omit it for a single series.
+    """
+    n = len(times_us)
+    codes = np.zeros(n, dtype=np.int8)
+    if n == 0:
+        return codes
+
+    non_positive = np.minimum(np.minimum(open_, high), np.minimum(low, close)) <= 0
+    sanity = ~non_positive & (
+        (low > np.minimum(open_, close)) | (high < np.maximum(open_, close)) | (low > high)
+    )
+    codes[non_positive] = _CODE[NON_POSITIVE_PRICE]
+    codes[sanity] = _CODE[OHLC_SANITY]
+
+    backwards = np.zeros(n, dtype=bool)
+    backwards[1:] = times_us[1:] < times_us[:-1]
+    codes[backwards & (codes == 0)] = _CODE[NON_MONOTONIC]
+
+    # Duplicate natural keys: stable sort by (group, time, position); a bar whose key
+    # equals its sorted predecessor's was seen earlier in the page.
+    group = groups if groups is not None else np.zeros(n, dtype=np.int64)
+    order = np.lexsort((np.arange(n), times_us, group))
+    repeat = np.zeros(n, dtype=bool)
+    repeat[1:] = (times_us[order][1:] == times_us[order][:-1]) & (group[order][1:] == group[order][:-1])
+    duplicate = np.zeros(n, dtype=bool)
+    duplicate[order] = repeat
+    codes[duplicate & (codes == 0)] = _CODE[DUPLICATE]
+    return codes
+
+
+def _columns(bars: List[Bar]) -> Tuple[np.ndarray, ...]:
+    times = np.fromiter((_to_us(b["bar_time_utc"]) for b in bars), dtype=np.int64, count=len(bars))
+    ohlc = np.array([(b["open"], b["high"], b["low"], b["close"]) for b in bars], dtype=np.float64)
+    ohlc = ohlc.reshape(len(bars), 4)
+    return times, ohlc[:, 0], ohlc[:, 1], ohlc[:, 2], ohlc[:, 3]
+
+
+def _detail(bars: List[Bar], i: int, reason: str) -> str:
+    b = bars[i]
+    o, h, l, c = b["open"], b["high"], b["low"], b["close"]
+    if reason == NON_POSITIVE_PRICE:
+        return f"min(OHLC)={min(o,h,l,c)} <= 0"
+    if reason == OHLC_SANITY:
+        return f"O={o} H={h} L={l} C={c} violates L<=O,C<=H"
+    if reason == NON_MONOTONIC:
+        return f"bar_time {b['bar_time_utc']} < previous {bars[i - 1]['bar_time_utc']}"
+    return f"duplicate natural key {_natural_key(b)}"
+
+
+def _split_page(bars: List[Bar], codes: np.ndarray) -> Tuple[List[Bar], List[Quarantined]]:
+    """``(ok, quarantined)`` in the per-bar checks' order (check phase, then bar order)."""
+    bad = np.flatnonzero(codes)
+    if not len(bad):
+        return list(bars), []
+    phase = np.where(codes[bad] <= _CODE[OHLC_SANITY], 0, codes[bad])
+    quarantined: List[Quarantined] = []
+    for i in bad[np.lexsort((bad, phase))]:
+        reason = _REASONS[codes[i]]
+        quarantined.append((bars[i], reason, _detail(bars, i, reason)))
+    ok = [bars[i] for i in np.flatnonzero(codes == 0)]
+    return ok, quarantined
+
+
 def run_dq_checks(bars: List[Bar]) -> Tuple[List[Bar], List[Quarantined]]:
     """Run pre-commit DQ checks on one page of bars.
 
     A bar failing any check is quarantined with the first reason it trips. Bars are
     assumed to arrive in OANDA ascending order; monotonic/duplicate checks are within
-    the page only.
+    the page only. Evaluated by the columnar :func:`page_reasons` kernel.
     """
-    quarantined: List[Quarantined] = []
-    bad_ids = set()  # id(bar) of any quarantined bar
-
-    # 1. OHLC sanity + 2. non-positive price (per-bar, independent)
-    for b in bars:
-        o, h, l, c = b["open"], b["high"], b["low"], b["close"]
-        if min(o, h, l, c) <= 0:
-            quarantined.append((b, NON_POSITIVE_PRICE, f"min(OHLC)={min(o,h,l,c)} <= 0"))
-            bad_ids.add(id(b))
-            continue
-        if l > min(o, c) or h < max(o, c) or l > h:
-            quarantined.append(
-                (b, OHLC_SANITY, f"O={o} H={h} L={l} C={c} violates L<=O,C<=H")
-            )
-            bad_ids.add(id(b))
-
-    # 3. Monotonic bar times within the page (strictly decreasing = out of order).
-    #    Equal timestamps are NOT flagged here — they are caught as DUPLICATE below so
-    #    they get the more specific reason code.
-    prev = None
-    for b in bars:
-        t = b["bar_time_utc"]
-        if prev is not None and t < prev and id(b) not in bad_ids:
-            quarantined.append((b, NON_MONOTONIC, f"bar_time {t} < previous {prev}"))
-            bad_ids.add(id(b))
-        prev = t
-
-    # 4. Duplicate natural keys within the page
-    key_counts = Counter(_natural_key(b) for b in bars)
-    dup_keys = {k for k, n in key_counts.items() if n > 1}
-    if dup_keys:
-        seen = set()
-        for b in bars:
-            k = _natural_key(b)
-            if k in dup_keys:
-                if k in seen and id(b) not in bad_ids:
-                    quarantined.append((b, DUPLICATE, f"duplicate natural key {k}"))
-                    bad_ids.add(id(b))
-                seen.add(k)
-
-    ok = [b for b in bars if id(b) not in bad_ids]
-    return ok, quarantined
+    if not bars:
+        return [], []
+    group_ids: Dict[tuple, int] = {}
+    groups = np.fromiter(
+        (group_ids.setdefault((b["asset_id"], b["granularity"]), len(group_ids)) for b in bars),
+        dtype=np.int64,
+        count=len(bars),
+    )
+    codes = page_reasons(*_columns(bars), groups=groups if len(group_ids) > 1 else None)
+    return _split_page(bars, codes)
 
 
 def _is_weekend_gap(prev_t: datetime, next_t: datetime) -> bool:
@@ -103,6 +174,102 @@ def _is_weekend_gap(prev_t: datetime, next_t: datetime) -> bool:
     return saw_weekend
 
 
+class StreamingDQ:
+    """Stateful, page-at-a-time DQ checks and gap detection for one series.
+
+    Each page is checked with :func:`page_reasons` (within-page rules, exactly as
+    :func:`run_dq_checks`) and its clean bar times are folded into the gap report.
+    Only the last clean bar time crosses pages, so memory is O(page) and
+    :meth:`report` equals :func:`detect_gaps` over every clean bar fed, provided
+    pages arrive in time order (OANDA windows do: each starts after the last bar of
+    the previous one).
+
+    Example:
+        state = StreamingDQ("H1", timedelta(hours=1))
+        for page in pages:
+            ok, quarantined = state.feed(page)
+        report = state.report()
+    """
+
+    def __init__(self, granularity: str, interval: timedelta):
+        self.granularity = granularity
+        self.interval = interval
+        self._interval_us = interval // _US
+        self._threshold_us = (interval * 1.5) // _US
+        self._last_us: Optional[int] = None
+        self._aware = True
+        self.bars_observed = 0
+        self.gaps: List[dict] = []
+        self.unexpected_missing = 0
+
+    def feed(self, bars: List[Bar]) -> Tuple[List[Bar], List[Quarantined]]:
+        """Check one page of bar dicts; returns ``(ok, quarantined)`` like run_dq_checks."""
+        if not bars:
+            return [], []
+        self._aware = bars[0]["bar_time_utc"].tzinfo is not None  # type: ignore[union-attr]
+        columns = _columns(bars)
+        codes = page_reasons(*columns)
+        self._observe(columns[0][codes == 0])
+        return _split_page(bars, codes)
+
+    def feed_columns(
+        self,
+        times_us: np.ndarray,
+        open_: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+    ) -> np.ndarray:
+        """Check one columnar page (UTC epoch microseconds + OHLC); returns reason codes."""
+        codes = page_reasons(times_us, open_, high, low, close)
+        self._observe(times_us[codes == 0])
+        return codes
+
+    def _observe(self, clean_us: np.ndarray) -> None:
+        if not len(clean_us):
+            return
+        clean_us = np.sort(clean_us)
+        self.bars_observed += len(clean_us)
+        if self._last_us is not None:
+            clean_us = np.concatenate(([self._last_us], clean_us))
+        self._last_us = int(clean_us[-1])
+
+        deltas = np.diff(clean_us)
+        for i in np.flatnonzero(deltas > self._threshold_us):
+            pt = _from_us(clean_us[i], self._aware)
+            nt = _from_us(clean_us[i + 1], self._aware)
+            delta = nt - pt
+            missing = max(int(delta / self.interval) - 1, 0)
+            if self.granularity in _WEEKEND_AWARE and _is_weekend_gap(pt, nt):
+                classification = "weekend"
+            else:
+                classification = "unexpected"
+                self.unexpected_missing += missing
+            self.gaps.append(
+                {
+                    "after_bar_utc": pt.isoformat(),
+                    "before_bar_utc": nt.isoformat(),
+                    "gap_seconds": delta.total_seconds(),
+                    "missing_intervals": missing,
+                    "classification": classification,
+                }
+            )
+
+    def report(self) -> Dict[str, object]:
+        """Gap report over every clean bar fed so far (same shape as detect_gaps)."""
+        expected_denom = max(self.bars_observed - 1, 0) + self.unexpected_missing
+        missing_ratio = (self.unexpected_missing / expected_denom) if expected_denom else 0.0
+        return {
+            "granularity": self.granularity,
+            "bars_observed": self.bars_observed,
+            "gaps": list(self.gaps),
+            "weekend_gaps": sum(1 for g in self.gaps if g["classification"] == "weekend"),
+            "unexpected_gaps": sum(1 for g in self.gaps if g["classification"] == "unexpected"),
+            "unexpected_missing_bars": self.unexpected_missing,
+            "missing_expected_bar_ratio": round(missing_ratio, 6),
+        }
+
+
 def detect_gaps(
     bars: List[Bar], granularity: str, interval: timedelta
 ) -> Dict[str, object]:
@@ -110,43 +277,10 @@ def detect_gaps(
 
     Returns a report dict with classified gaps and a coverage metric. Weekend/holiday
     gaps are logged (INFO) but not counted as errors; only unexpected intra-week gaps
-    count toward the missing-expected-bar ratio.
+    count toward the missing-expected-bar ratio. One-shot form of :class:`StreamingDQ`.
     """
-    ordered = sorted(bars, key=lambda b: b["bar_time_utc"])
-    gaps: List[dict] = []
-    unexpected_missing = 0
-    expected_total = max(len(ordered) - 1, 0)
-
-    for prev, nxt in zip(ordered, ordered[1:]):
-        pt: datetime = prev["bar_time_utc"]  # type: ignore[assignment]
-        nt: datetime = nxt["bar_time_utc"]  # type: ignore[assignment]
-        delta = nt - pt
-        if delta <= interval * 1.5:
-            continue
-        missing = max(int(delta / interval) - 1, 0)
-        if granularity in ("H1", "H4", "D1") and _is_weekend_gap(pt, nt):
-            classification = "weekend"
-        else:
-            classification = "unexpected"
-            unexpected_missing += missing
-        gaps.append(
-            {
-                "after_bar_utc": pt.isoformat(),
-                "before_bar_utc": nt.isoformat(),
-                "gap_seconds": delta.total_seconds(),
-                "missing_intervals": missing,
-                "classification": classification,
-            }
-        )
-
-    expected_denom = expected_total + unexpected_missing
-    missing_ratio = (unexpected_missing / expected_denom) if expected_denom else 0.0
-    return {
-        "granularity": granularity,
-        "bars_observed": len(ordered),
-        "gaps": gaps,
-        "weekend_gaps": sum(1 for g in gaps if g["classification"] == "weekend"),
-        "unexpected_gaps": sum(1 for g in gaps if g["classification"] == "unexpected"),
-        "unexpected_missing_bars": unexpected_missing,
-        "missing_expected_bar_ratio": round(missing_ratio, 6),
-    }
+    state = StreamingDQ(granularity, interval)
+    if bars:
+        state._aware = bars[0]["bar_time_utc"].tzinfo is not None  # type: ignore[union-attr]
+        state._observe(np.fromiter((_to_us(b["bar_time_utc"]) for b in bars), dtype=np.int64, count=len(bars)))
+    return state.report()
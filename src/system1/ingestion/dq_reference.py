@@ -0,0 +1,114 @@
+"""Per-bar reference implementations of the MODEL-001 DQ checks and gap report.
+
+These are the original loop-based versions of :func:`dq.run_dq_checks` and the
+accumulate-then-detect gap report. The unit tests check the columnar kernel and
+:class:`dq.StreamingDQ` against them, and ``bench_dq`` measures the legacy memory
+profile with them.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+from . import dq
+
+
+def run_dq_checks_loop(bars: List[dq.Bar]) -> Tuple[List[dq.Bar], List[dq.Quarantined]]:
+    """The original per-bar DQ checks, kept as the reference for the columnar kernel.
+
+    A bar failing any check is quarantined with the first reason it trips. Bars are
+    assumed to arrive in OANDA ascending order; monotonic/duplicate checks are within
+    the page only.
+    """
+    quarantined: List[dq.Quarantined] = []
+    bad_ids = set()  # id(bar) of any quarantined bar
+
+    # 1. OHLC sanity + 2. non-positive price (per-bar, independent)
+    for b in bars:
+        o, h, l, c = b["open"], b["high"], b["low"], b["close"]
+        if min(o, h, l, c) <= 0:
+            quarantined.append((b, dq.NON_POSITIVE_PRICE, f"min(OHLC)={min(o,h,l,c)} <= 0"))
+            bad_ids.add(id(b))
+            continue
+        if l > min(o, c) or h < max(o, c) or l > h:
+            quarantined.append(
+                (b, dq.OHLC_SANITY, f"O={o} H={h} L={l} C={c} violates L<=O,C<=H")
+            )
+            bad_ids.add(id(b))
+
+    # 3. Monotonic bar times within the page (strictly decreasing = out of order).
+    #    Equal timestamps are NOT flagged here — they are caught as dq.DUPLICATE below so
+    #    they get the more specific reason code.
+    prev = None
+    for b in bars:
+        t = b["bar_time_utc"]
+        if prev is not None and t < prev and id(b) not in bad_ids:
+            quarantined.append((b, dq.NON_MONOTONIC, f"bar_time {t} < previous {prev}"))
+            bad_ids.add(id(b))
+        prev = t
+
+    # 4. Duplicate natural keys within the page
+    key_counts = Counter(dq._natural_key(b) for b in bars)
+    dup_keys = {k for k, n in key_counts.items() if n > 1}
+    if dup_keys:
+        seen = set()
+        for b in bars:
+            k = dq._natural_key(b)
+            if k in dup_keys:
+                if k in seen and id(b) not in bad_ids:
+                    quarantined.append((b, dq.DUPLICATE, f"duplicate natural key {k}"))
+                    bad_ids.add(id(b))
+                seen.add(k)
+
+    ok = [b for b in bars if id(b) not in bad_ids]
+    return ok, quarantined
+
+
+def detect_gaps_loop(
+    bars: List[dq.Bar], granularity: str, interval: timedelta
+) -> Dict[str, object]:
+    """The original accumulate-then-detect gap report, kept as the reference for StreamingDQ.
+
+    Returns a report dict with classified gaps and a coverage metric. Weekend/holiday
+    gaps are logged (INFO) but not counted as errors; only unexpected intra-week gaps
+    count toward the missing-expected-bar ratio.
+    """
+    ordered = sorted(bars, key=lambda b: b["bar_time_utc"])
+    gaps: List[dict] = []
+    unexpected_missing = 0
+    expected_total = max(len(ordered) - 1, 0)
+
+    for prev, nxt in zip(ordered, ordered[1:]):
+        pt: datetime = prev["bar_time_utc"]  # type: ignore[assignment]
+        nt: datetime = nxt["bar_time_utc"]  # type: ignore[assignment]
+        delta = nt - pt
+        if delta <= interval * 1.5:
+            continue
+        missing = max(int(delta / interval) - 1, 0)
+        if granularity in ("H1", "H4", "D1") and dq._is_weekend_gap(pt, nt):
+            classification = "weekend"
+        else:
+            classification = "unexpected"
+            unexpected_missing += missing
+        gaps.append(
+            {
+                "after_bar_utc": pt.isoformat(),
+                "before_bar_utc": nt.isoformat(),
+                "gap_seconds": delta.total_seconds(),
+                "missing_intervals": missing,
+                "classification": classification,
+            }
+        )
+
+    expected_denom = expected_total + unexpected_missing
+    missing_ratio = (unexpected_missing / expected_denom) if expected_denom else 0.0
+    return {
+        "granularity": granularity,
+        "bars_observed": len(ordered),
+        "gaps": gaps,
+        "weekend_gaps": sum(1 for g in gaps if g["classification"] == "weekend"),
+        "unexpected_gaps": sum(1 for g in gaps if g["classification"] == "unexpected"),
+        "unexpected_missing_bars": unexpected_missing,
+        "missing_expected_bar_ratio": round(missing_ratio, 6),
+    }
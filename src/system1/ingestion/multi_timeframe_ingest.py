@@ -1,16 +1,17 @@
 """MODEL-001 — Multi-timeframe OANDA ingestion orchestrator (D1 / H4 / W1).
 
-Reuses the proven primitives in ``src/layer0/ingest_oanda_prices.py`` (OANDA client,
-paged fetch with exponential backoff, RFC3339 parsing, resume-from-MAX cursor) and adds
-the MODEL-001 contract on top:
+Reuses the proven primitives in ``src/layer0/ingest_data/ingest_oanda_prices.py`` (RFC3339 parsing,
+resume-from-MAX cursor, backoff) and the layer-0 concurrent ``IngestScheduler`` (global
+token-bucket rate limit, fetch pipelined with DB writes) and adds the MODEL-001 contract
+on top:
 
   * lineage on every row (source / ingest_run_id / ingested_at_utc / complete),
   * pre-commit DQ checks with quarantine (rows are never silently dropped),
   * FX-calendar-aware gap detection + per-run DQ/gap report,
   * per-run lineage manifest + resumable cursor state.
 
-Idempotent: re-running produces zero duplicate bars (``INSERT … ON CONFLICT`` on the
-natural key ``(asset_id, granularity, "timestamp")``).
+Idempotent: re-running produces zero duplicate bars (``COPY``-staged ``INSERT … ON
+CONFLICT`` on the natural key ``(asset_id, granularity, "timestamp")``).
 
 Usage:
     python -m src.system1.ingestion.multi_timeframe_ingest --granularity W1
@@ -22,23 +23,31 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
-import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 from psycopg2.extras import execute_values
 
-from src.layer0.ingest_oanda_prices import (
+from src.common.db import copy_upsert
+from src.layer0.ingest_data.ingest_scheduler import (
+    HttpCandleFetcher,
+    IngestScheduler,
+    SeriesProgress,
+    SeriesSpec,
+    TokenBucket,
+)
+from src.layer0.ingest_data.ingest_oanda_prices import (
     CONFIG,
     create_oanda_client,
-    fetch_candles_with_retry,
+    exponential_backoff_with_jitter,
     get_assets,
     get_db_connection,
     get_interval_delta,
     get_resume_timestamp,
     parse_rfc3339_to_datetime,
     read_env,
+    to_oanda_granularity,
 )
 from src.system1.ingestion import dq, reports, schema
 
@@ -48,6 +57,12 @@ logger = logging.getLogger("system1.ingestion.multi_timeframe")
 DEFAULT_GRANULARITIES = ["D1", "H4", "W1"]
 SOURCE = "OANDA"
 
+# fact_market_prices columns written by upsert_bars_with_lineage, in row-tuple order.
+LINEAGE_PRICE_COLUMNS = (
+    "asset_id", "timestamp", "Open", "high", "low", "Close", "volume", "granularity",
+    "complete", "source", "ingest_run_id", "ingested_at_utc",
+)
+
 # Per-instrument earliest-history overrides (OANDA practice depth varies). Forex majors
 # generally reach back to ~2005; override here if a pair starts later. Documented in
 # the manifest. Default backfill start is CONFIG.DEFAULT_START_DATE.
@@ -85,11 +100,15 @@ def _normalize_candle(c: dict, asset_id: int, granularity: str) -> Optional[dq.B
 
 
 def upsert_bars_with_lineage(conn, bars: List[dq.Bar], run_id: str) -> Tuple[int, int]:
-    """Idempotent upsert of clean bars into fact_market_prices, with lineage columns."""
+    """Idempotent upsert of clean bars into fact_market_prices, with lineage columns.
+
+    Bars are COPY-staged and merged in one statement (``src.common.db.copy_upsert``);
+    the insert/update split is counted in SQL.
+    """
     if not bars:
         return 0, 0
     now = datetime.now(timezone.utc)
-    rows = [
+    rows = (
         (
             b["asset_id"],
             b["bar_time_utc"],
@@ -105,29 +124,16 @@ def upsert_bars_with_lineage(conn, bars: List[dq.Bar], run_id: str) -> Tuple[int
             now,
         )
         for b in bars
-    ]
-    sql = """
-        INSERT INTO fact_market_prices
-            (asset_id, "timestamp", "Open", high, low, "Close", volume, granularity,
-             complete, source, ingest_run_id, ingested_at_utc)
-        VALUES %s
-        ON CONFLICT ("timestamp", asset_id, granularity) DO UPDATE SET
-            "Open" = EXCLUDED."Open",
-            high = EXCLUDED.high,
-            low = EXCLUDED.low,
-            "Close" = EXCLUDED."Close",
-            volume = EXCLUDED.volume,
-            complete = EXCLUDED.complete,
-            source = EXCLUDED.source,
-            ingest_run_id = EXCLUDED.ingest_run_id,
-            ingested_at_utc = EXCLUDED.ingested_at_utc
-        RETURNING (xmax = 0) AS inserted
-    """
-    cur = conn.cursor()
-    returned = execute_values(cur, sql, rows, page_size=1000, fetch=True)
+    )
+    inserted, updated = copy_upsert(
+        "fact_market_prices",
+        rows,
+        columns=LINEAGE_PRICE_COLUMNS,
+        conflict_columns=("timestamp", "asset_id", "granularity"),
+        conn=conn,
+    )
     conn.commit()
-    inserted = sum(1 for r in returned if r[0])
-    return inserted, len(returned) - inserted
+    return inserted, updated
 
 
 def write_quarantine(conn, quarantined: List[dq.Quarantined], run_id: str) -> int:
@@ -164,23 +170,8 @@ def write_quarantine(conn, quarantined: List[dq.Quarantined], run_id: str) -> in
     return len(rows)
 
 
-def ingest_instrument_granularity(
-    conn, client, asset: Dict[str, Any], granularity: str, run_id: str
-) -> Dict[str, Any]:
-    """Page through OANDA for one (instrument, granularity), DQ-check, upsert, report."""
-    symbol = asset["Symbol"]
-    asset_id = asset["Asset_ID"]
-    interval = get_interval_delta(granularity)
-    chunk_days = CONFIG.CHUNK_DAYS.get(granularity, 30)
-
-    from_ts = _as_utc(get_resume_timestamp(conn, asset_id, granularity))
-    override = HISTORY_START_OVERRIDE.get(symbol)
-    if override:
-        ov = _as_utc(datetime.fromisoformat(override))
-        from_ts = max(from_ts, ov)
-    now = datetime.now(timezone.utc)
-
-    stats = {
+def _series_stats(symbol: str, granularity: str, from_ts: datetime, override: Optional[str]) -> Dict[str, Any]:
+    return {
         "instrument": symbol,
         "granularity": granularity,
         "rows_inserted": 0,
@@ -193,71 +184,129 @@ def ingest_instrument_granularity(
         "quarantine_reason_counts": {},
         "history_start_override": override,
     }
-    all_clean: List[dq.Bar] = []
 
-    if from_ts >= now - interval:
-        logger.info("%s %s already up to date (cursor %s)", symbol, granularity, from_ts)
-        stats["end_cursor"] = from_ts.isoformat()
-        return stats
 
-    last_bar: Optional[datetime] = None
+def ingest_series(
+    conn,
+    fetcher,
+    assets: List[Dict[str, Any]],
+    granularities: List[str],
+    run_id: str,
+    workers: Optional[int] = None,
+    limiter: Optional[TokenBucket] = None,
+) -> List[Dict[str, Any]]:
+    """Page through OANDA for every (instrument, granularity), DQ-check, upsert, report.
+
+    Series are fetched concurrently by the layer-0 ``IngestScheduler`` under one global
+    token bucket; DQ, upserts and quarantine writes run on this thread (which owns
+    ``conn``) in per-series window order while later windows download. A failed window
+    is skipped (not retried forever) and counted in ``failed_windows``; its series is
+    then not marked ``backfill_complete``. ``limiter`` defaults to a token bucket at
+    ``CONFIG.MAX_REQUESTS_PER_SECOND``.
+    """
+    now = datetime.now(timezone.utc)
+    per_series: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    dq_state: Dict[Tuple[str, str], dq.StreamingDQ] = {}
+    last_bar: Dict[Tuple[str, str], Optional[datetime]] = {}
+    specs: List[SeriesSpec] = []
+
+    for asset in assets:
+        symbol = asset["Symbol"]
+        override = HISTORY_START_OVERRIDE.get(symbol)
+        for granularity in granularities:
+            key = (symbol, granularity)
+            interval = get_interval_delta(granularity)
+            from_ts = _as_utc(get_resume_timestamp(conn, asset["Asset_ID"], granularity))
+            if override:
+                from_ts = max(from_ts, _as_utc(datetime.fromisoformat(override)))
+            per_series[key] = _series_stats(symbol, granularity, from_ts, override)
+            if from_ts >= now - interval:
+                logger.info("%s %s already up to date (cursor %s)", symbol, granularity, from_ts)
+                per_series[key]["end_cursor"] = from_ts.isoformat()
+                continue
+            dq_state[key] = dq.StreamingDQ(granularity, interval)
+            last_bar[key] = None
+            specs.append(
+                SeriesSpec(
+                    asset_id=asset["Asset_ID"],
+                    symbol=symbol,
+                    granularity=granularity,
+                    oanda_granularity=to_oanda_granularity(granularity),
+                    start=from_ts,
+                    end=now,
+                    chunk=timedelta(days=CONFIG.CHUNK_DAYS.get(granularity, 30)),
+                    interval=interval,
+                )
+            )
 
-    while from_ts < now:
-        to_ts = min(from_ts + timedelta(days=chunk_days), now)
-        candles, success, attempts = fetch_candles_with_retry(
-            client, symbol, granularity, from_ts, to_ts
-        )
-        stats["api_requests"] += attempts
-        if not success:
-            logger.error("Failed window %s %s %s→%s", symbol, granularity, from_ts, to_ts)
-            stats["failed_windows"] += 1
-            from_ts = to_ts
-            continue
-
-        stats["candles_fetched"] += len(candles)
+    def prepare(spec: SeriesSpec, candles: List[dict]):
         bars = [
             nb
             for c in candles
-            if (nb := _normalize_candle(c, asset_id, granularity)) is not None
+            if (nb := _normalize_candle(c, spec.asset_id, spec.granularity)) is not None
         ]
-        if bars:
-            ok, quarantined = dq.run_dq_checks(bars)
+        return bars, (max(b["bar_time_utc"] for b in bars) if bars else None)
+
+    def write(spec: SeriesSpec, bars: List[dq.Bar], from_ts: datetime, to_ts: datetime) -> None:
+        if not bars:
+            return
+        stats = per_series[spec.key]
+        ok, quarantined = dq_state[spec.key].feed(bars)
+        try:
             ins, upd = upsert_bars_with_lineage(conn, ok, run_id)
             qn = write_quarantine(conn, quarantined, run_id)
-            stats["rows_inserted"] += ins
-            stats["rows_updated"] += upd
-            stats["rows_quarantined"] += qn
-            for (_, reason, _) in quarantined:
-                stats["quarantine_reason_counts"][reason] = (
-                    stats["quarantine_reason_counts"].get(reason, 0) + 1
-                )
-            all_clean.extend(ok)
-            last_bar = max(b["bar_time_utc"] for b in bars)
-            from_ts = last_bar + interval
-        else:
-            from_ts = to_ts
-        time.sleep(CONFIG.REQUEST_SLEEP_SECONDS)
-
-    # Gap detection over everything ingested this run for this series.
-    stats["gap_report"] = dq.detect_gaps(all_clean, granularity, interval)
-    stats["end_cursor"] = (last_bar or from_ts).isoformat()
-
-    reports.update_cursor(
-        symbol, granularity, last_bar, backfill_complete=True,
-        history_start_override=override,
-    )
-    logger.info(
-        "%s %s done: +%d ins, %d upd, %d quarantined, %d unexpected gaps",
-        symbol, granularity, stats["rows_inserted"], stats["rows_updated"],
-        stats["rows_quarantined"], stats["gap_report"]["unexpected_gaps"],
-    )
-    return stats
+        except Exception:
+            conn.rollback()
+            raise
+        stats["rows_inserted"] += ins
+        stats["rows_updated"] += upd
+        stats["rows_quarantined"] += qn
+        for (_, reason, _) in quarantined:
+            stats["quarantine_reason_counts"][reason] = (
+                stats["quarantine_reason_counts"].get(reason, 0) + 1
+            )
+        last_bar[spec.key] = max(b["bar_time_utc"] for b in bars)
+
+    def finish(spec: SeriesSpec, progress: SeriesProgress) -> None:
+        stats = per_series[spec.key]
+        stats["candles_fetched"] = progress.candles_fetched
+        stats["api_requests"] = progress.api_requests
+        stats["failed_windows"] = progress.failed_windows
+        if progress.error:
+            stats["error"] = progress.error
+        # Gap report over everything ingested this run for this series (streamed).
+        stats["gap_report"] = dq_state.pop(spec.key).report()
+        stats["end_cursor"] = (last_bar[spec.key] or progress.cursor).isoformat()
+        reports.update_cursor(
+            spec.symbol, spec.granularity, last_bar[spec.key],
+            # A skipped window is a hole behind the cursor: keep the series open.
+            backfill_complete=progress.error is None and progress.failed_windows == 0,
+            history_start_override=stats["history_start_override"],
+        )
+        logger.info(
+            "%s %s done: +%d ins, %d upd, %d quarantined, %d unexpected gaps",
+            spec.symbol, spec.granularity, stats["rows_inserted"], stats["rows_updated"],
+            stats["rows_quarantined"], stats["gap_report"]["unexpected_gaps"],
+        )
+
+    if specs:
+        IngestScheduler(
+            fetcher,
+            limiter=limiter or TokenBucket(CONFIG.MAX_REQUESTS_PER_SECOND),
+            workers=workers,
+            max_retries=CONFIG.MAX_RETRIES,
+            stop_on_failure=False,
+            backoff=exponential_backoff_with_jitter,
+            default_retry_after=CONFIG.RATE_LIMIT_RETRY_AFTER_DEFAULT,
+        ).run(specs, prepare=prepare, write=write, finish=finish)
+    return list(per_series.values())
 
 
 def run(
     symbol_filter: Optional[str] = None,
     granularity_filter: Optional[str] = None,
     dry_run: bool = False,
+    workers: Optional[int] = None,
 ) -> Dict[str, Any]:
     run_id = str(uuid.uuid4())
     started = datetime.now(timezone.utc)
@@ -293,14 +342,9 @@ def run(
         logger.info("Dry run OK: %d assets x %d granularities", len(assets), len(granularities))
         return result
 
-    client = create_oanda_client(env)
-    per_series: List[Dict[str, Any]] = []
+    fetcher = HttpCandleFetcher.from_env(env, price="M")
     try:
-        for asset in assets:
-            for g in granularities:
-                per_series.append(
-                    ingest_instrument_granularity(conn, client, asset, g, run_id)
-                )
+        per_series = ingest_series(conn, fetcher, assets, granularities, run_id, workers=workers)
     finally:
         conn.close()
 
@@ -381,6 +425,10 @@ def main() -> None:
         help="Single granularity (default: D1, H4, W1)",
     )
     parser.add_argument("--dry-run", action="store_true", help="Validate without ingesting")
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Series fetched concurrently (default: INGEST_WORKERS env or 4)",
+    )
     parser.add_argument("--log-file", default="model001_ingest.log")
     args = parser.parse_args()
 
@@ -390,7 +438,7 @@ def main() -> None:
         handlers=[logging.StreamHandler(sys.stdout), logging.FileHandler(args.log_file)],
     )
     try:
-        summary = run(args.symbol, args.granularity, args.dry_run)
+        summary = run(args.symbol, args.granularity, args.dry_run, workers=args.workers)
         print(summary)
         sys.exit(0)
     except Exception as e:  # noqa: BLE001
@@ -4,6 +4,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 
 from src.system1.ingestion import dq
+from src.system1.ingestion.dq_reference import detect_gaps_loop, run_dq_checks_loop
 
 
 def _bar(t, o, h, l, c, asset_id=1, granularity="D1", volume=100):
@@ -84,3 +85,57 @@ def test_unexpected_midweek_gap_counted():
     assert rep["unexpected_gaps"] == 1
     assert rep["unexpected_missing_bars"] == 2
     assert rep["missing_expected_bar_ratio"] > 0
+
+
+def _random_page(rng, n, start, step, asset_ids=(1,)):
+    import numpy as np
+
+    bars, t = [], start
+    for _ in range(n):
+        r = rng.random()
+        if r < 0.05:
+            t -= step * int(rng.integers(1, 3))  # out of order
+        elif r < 0.10:
+            pass  # duplicate time
+        elif r < 0.20:
+            t += step * int(rng.integers(2, 60))  # gap (weekends included)
+        else:
+            t += step
+        o, c = 1.1 + rng.normal(0, 0.01, 2)
+        h, l = max(o, c) + abs(rng.normal(0, 0.005)), min(o, c) - abs(rng.normal(0, 0.005))
+        if rng.random() < 0.04:
+            h, l = l, h  # OHLC sanity
+        if rng.random() < 0.02:
+            o = -o if rng.random() < 0.5 else 0.0  # non-positive
+        bars.append(_bar(t, float(o), float(h), float(l), float(c),
+                         asset_id=int(rng.choice(asset_ids)), granularity="H1"))
+    return bars, t
+
+
+def test_columnar_checks_match_per_bar_reference():
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    for asset_ids in [(1,), (1, 2)]:
+        for n in (0, 1, 2, 500):
+            bars, _ = _random_page(rng, n, _dt(2021, 3, 1, 0), timedelta(hours=1), asset_ids)
+            assert dq.run_dq_checks(bars) == run_dq_checks_loop(bars)
+
+
+def test_streaming_pages_match_batch_gap_report():
+    import numpy as np
+
+    rng = np.random.default_rng(1)
+    state = dq.StreamingDQ("H1", timedelta(hours=1))
+    all_ok, t = [], _dt(2021, 3, 1, 0)
+    for _ in range(20):
+        page, _ = _random_page(rng, 300, t, timedelta(hours=1))
+        page = sorted(page, key=lambda b: b["bar_time_utc"])  # OANDA pages ascend ...
+        t = page[-1]["bar_time_utc"] + timedelta(hours=int(rng.integers(1, 80)))  # ... and never overlap
+        ok, q = state.feed(page)
+        assert (ok, q) == run_dq_checks_loop(page)
+        all_ok.extend(ok)
+    report = state.report()
+    assert report == detect_gaps_loop(all_ok, "H1", timedelta(hours=1))
+    assert report == dq.detect_gaps(all_ok, "H1", timedelta(hours=1))
+    assert report["weekend_gaps"] > 0 and report["unexpected_gaps"] > 0
@@ -0,0 +1,122 @@
+"""Unit tests for multi_timeframe_ingest.ingest_series with a fake fetcher/limiter (no DB / no network)."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("oandapyV20")
+
+from src.layer0.ingest_data.ingest_scheduler import FetchResult  # noqa: E402
+
+# ingest_oanda_prices (imported by mti) opens oanda_ingest.log in the working
+# directory at import; keep it out of the checkout.
+_cwd = os.getcwd()
+os.chdir(tempfile.mkdtemp(prefix="oanda_ingest_test_"))
+try:
+    from src.system1.ingestion import multi_timeframe_ingest as mti  # noqa: E402
+finally:
+    os.chdir(_cwd)
+
+D1 = timedelta(days=1)
+
+
+class FakeLimiter:
+    """Never blocks; counts tokens and records pauses."""
+
+    def __init__(self):
+        self.acquired = 0
+        self.pauses = []
+
+    def acquire(self) -> float:
+        self.acquired += 1
+        return 0.0
+
+    def pause(self, seconds: float) -> None:
+        self.pauses.append(seconds)
+
+
+class FakeFetcher:
+    """Complete daily mid candles for [from, to); windows starting in ``fail_from`` get HTTP 400."""
+
+    def __init__(self, fail_from=()):
+        self.fail_from = set(fail_from)
+        self.calls = []
+
+    def __call__(self, instrument, granularity, from_ts, to_ts):
+        self.calls.append((instrument, granularity, from_ts, to_ts))
+        if (instrument, from_ts) in self.fail_from:
+            return FetchResult([], 400)
+        candles, t = [], from_ts
+        while t < to_ts:
+            candles.append({
+                "time": t.strftime("%Y-%m-%dT%H:%M:%S.000000000Z"),
+                "complete": True,
+                "volume": 10,
+                "mid": {"o": "1.0", "h": "1.2", "l": "0.9", "c": "1.1"},
+            })
+            t += D1
+        return FetchResult(candles, 200)
+
+
+class FakeConn:
+    def rollback(self):
+        pass
+
+
+@pytest.fixture
+def patched(monkeypatch):
+    start = (datetime.now(timezone.utc) - 40 * D1).replace(hour=0, minute=0, second=0, microsecond=0)
+    upserted, cursors = [], {}
+    monkeypatch.setitem(mti.CONFIG.CHUNK_DAYS, "D1", 10)
+    monkeypatch.setattr(mti, "get_resume_timestamp", lambda conn, asset_id, g: start.replace(tzinfo=None))
+    monkeypatch.setattr(
+        mti, "upsert_bars_with_lineage", lambda conn, bars, run_id: (upserted.extend(bars), (len(bars), 0))[1]
+    )
+    monkeypatch.setattr(mti, "write_quarantine", lambda conn, rows, run_id: len(rows))
+    monkeypatch.setattr(
+        mti.reports, "update_cursor",
+        lambda instrument, granularity, last_bar, backfill_complete, history_start_override=None:
+            cursors.__setitem__((instrument, granularity), (last_bar, backfill_complete)),
+    )
+    return start, upserted, cursors
+
+
+ASSETS = [{"Asset_ID": 1, "Symbol": "EUR_USD"}, {"Asset_ID": 2, "Symbol": "GBP_USD"}]
+
+
+def test_failed_window_is_skipped_and_keeps_series_open(patched):
+    start, upserted, cursors = patched
+    fetcher = FakeFetcher(fail_from={("EUR_USD", start + 10 * D1)})
+    limiter = FakeLimiter()
+
+    stats = mti.ingest_series(FakeConn(), fetcher, ASSETS, ["D1"], "run-1", workers=2, limiter=limiter)
+    by_symbol = {s["instrument"]: s for s in stats}
+
+    eur, gbp = by_symbol["EUR_USD"], by_symbol["GBP_USD"]
+    assert eur["failed_windows"] == 1 and gbp["failed_windows"] == 0
+    # 4xx is not retried: one request per window, all through the shared limiter.
+    assert limiter.acquired == len(fetcher.calls) == eur["api_requests"] + gbp["api_requests"]
+    assert eur["rows_inserted"] == gbp["rows_inserted"] - 10
+    assert not any(
+        b["asset_id"] == 1 and start + 10 * D1 <= b["bar_time_utc"] < start + 20 * D1 for b in upserted
+    )
+    # The skipped window is a hole behind EUR_USD's cursor, so only GBP_USD is complete.
+    assert cursors[("EUR_USD", "D1")][1] is False
+    assert cursors[("GBP_USD", "D1")][1] is True
+    assert cursors[("EUR_USD", "D1")][0] == cursors[("GBP_USD", "D1")][0]
+
+
+def test_clean_run_marks_every_series_complete(patched):
+    _, upserted, cursors = patched
+    limiter = FakeLimiter()
+
+    stats = mti.ingest_series(FakeConn(), FakeFetcher(), ASSETS, ["D1"], "run-2", limiter=limiter)
+
+    assert all(s["failed_windows"] == 0 and "error" not in s for s in stats)
+    assert all(complete for _, complete in cursors.values())
+    assert len(upserted) == sum(s["rows_inserted"] for s in stats)
+    assert limiter.pauses == []
@@ -5,7 +5,8 @@ Publishes scored signals to ``Scored_Signal_Queue`` via the pluggable QueueBacke
   * deterministic idempotency keys (signal_id + score_run_id),
   * bounded depth + backpressure (block/retry with backoff, never silent drop),
   * DLQ routing for invalid / un-publishable messages,
-  * publisher confirms (at-least-once) + observability metrics.
+  * publisher confirms (at-least-once) + observability metrics,
+  * batched group-commit publishing (``PUBLISH_BATCH_SIZE`` / ``PUBLISH_LINGER_MS``).
 
 Source-agnostic: consumes an iterable of *scored signal* dicts so it has zero knowledge
 of how signals are produced and ZERO dependency on the execution layer (Layer 4).
@@ -64,6 +65,8 @@ class ScoredSignalProducer:
         queue_name: Optional[str] = None,
         backpressure_timeout_ms: int = None,
         backpressure_max_retries: int = None,
+        batch_size: int = None,
+        linger_ms: int = None,
     ):
         self.backend = backend or build_queue()
         self.queue = queue_name or os.environ.get("SCORED_SIGNAL_QUEUE", "scored_signal_queue")
@@ -77,6 +80,12 @@ class ScoredSignalProducer:
             if backpressure_max_retries is not None
             else os.environ.get("BACKPRESSURE_MAX_RETRIES", 3)
         )
+        # Group commit: buffer up to batch_size messages (or linger_ms since the first
+        # buffered one) and hand them to publish_batch in one durable write.
+        self.batch_size = max(
+            1, int(batch_size if batch_size is not None else os.environ.get("PUBLISH_BATCH_SIZE", 500))
+        )
+        self.linger_ms = int(linger_ms if linger_ms is not None else os.environ.get("PUBLISH_LINGER_MS", 50))
         self._validator = _load_validator()
 
     def _validate(self, message: Dict[str, Any]) -> Optional[str]:
@@ -90,57 +99,77 @@ class ScoredSignalProducer:
         return None
 
     def publish_signals(self, signals: Iterable[Dict[str, Any]], score_run_id: str) -> Dict[str, int]:
-        published = 0
-        dlq_count = 0
-        backpressure_events = 0
-        deduped = 0
+        counts = {"published": 0, "deduped": 0, "dlq": 0, "backpressure": 0, "batches": 0}
+        batch: List[Dict[str, Any]] = []
+        batch_started = 0.0
 
         for signal in signals:
             try:
                 message = build_message(signal, score_run_id)
             except (KeyError, ValueError, TypeError) as e:
                 self.backend.dead_letter({"raw": str(signal)[:500]}, f"BUILD_ERROR: {e}")
-                dlq_count += 1
+                counts["dlq"] += 1
                 continue
 
             reason = self._validate(message)
             if reason is not None:
                 self.backend.dead_letter(message, reason)
-                dlq_count += 1
+                counts["dlq"] += 1
                 continue
 
-            # Backpressure: never overflow, never silently drop.
-            if self.backend.at_capacity(self.queue):
-                backpressure_events += 1
-                if not self._await_capacity():
-                    self.backend.dead_letter(message, "QUEUE_FULL")
-                    dlq_count += 1
-                    continue
-
-            before = self.backend.depth(self.queue)
-            ok = self.backend.publish(self.queue, message, idempotency_key=message["message_id"])
-            if not ok:
-                self.backend.dead_letter(message, "PUBLISH_NACK")
-                dlq_count += 1
-                continue
-            after = self.backend.depth(self.queue)
-            if after > before:
-                published += 1
-            else:
-                deduped += 1  # idempotent no-op (already published)
+            if not batch:
+                batch_started = time.monotonic()
+            batch.append(message)
+            if (
+                len(batch) >= self.batch_size
+                or (time.monotonic() - batch_started) * 1000.0 >= self.linger_ms
+            ):
+                self._flush(batch, counts)
+                batch = []
+        if batch:
+            self._flush(batch, counts)
 
         metrics = {
-            "published_count": published,
-            "deduped_count": deduped,
-            "dlq_count": dlq_count,
-            "backpressure_events": backpressure_events,
+            "published_count": counts["published"],
+            "deduped_count": counts["deduped"],
+            "dlq_count": counts["dlq"],
+            "backpressure_events": counts["backpressure"],
+            "batches": counts["batches"],
             "queue_depth": self.backend.depth(self.queue),
         }
         logger.info(json.dumps({"event": "queue_publish", **metrics}))
-        if dlq_count > 0:
-            logger.warning("DLQ growth this run: %d messages", dlq_count)
+        if counts["dlq"] > 0:
+            logger.warning("DLQ growth this run: %d messages", counts["dlq"])
         return metrics
 
+    def _flush(self, batch: List[Dict[str, Any]], counts: Dict[str, int]) -> None:
+        """Publish validated messages in capacity-sized group commits."""
+        pending = batch
+        while pending:
+            # Backpressure: never overflow, never silently drop.
+            room = self.backend.remaining_capacity(self.queue)
+            if room <= 0:
+                counts["backpressure"] += 1
+                if not self._await_capacity():
+                    for message in pending:
+                        self.backend.dead_letter(message, "QUEUE_FULL")
+                    counts["dlq"] += len(pending)
+                    return
+                continue
+            chunk, pending = pending[:room], pending[room:]
+
+            # Counted by the backend: queue depth moves under concurrent consumers' acks.
+            receipt = self.backend.publish_batch(
+                self.queue, chunk, [m["message_id"] for m in chunk]
+            )
+            counts["batches"] += 1
+            nacked = [m for m, ok in zip(chunk, receipt.confirms) if not ok]
+            for message in nacked:
+                self.backend.dead_letter(message, "PUBLISH_NACK")
+            counts["dlq"] += len(nacked)
+            counts["published"] += receipt.published
+            counts["deduped"] += receipt.deduped  # idempotent no-ops
+
     def _await_capacity(self) -> bool:
         """Block/retry with linear backoff while the queue is full. True if drained."""
         for retry in range(self.bp_max_retries):
@@ -1,8 +1,6 @@
 """MODEL-008 tests: contract, idempotency, backpressure, DLQ, determinism, metrics."""
 from __future__ import annotations
 
-import json
-
 from src.common.queue.local_durable import LocalDurableBackend
 from src.system1.queue_producer import producer as P
 
@@ -27,9 +25,7 @@ def _backend(tmp_path, max_size=100000):
 
 
 def _read_queue(backend, queue):
-    p = backend._log(queue)
-    with open(p, encoding="utf-8") as fh:
-        return [json.loads(line)["message"] for line in fh if line.strip()]
+    return [msg for _, _, msg in backend.iter_messages(queue, start_offset=0)]
 
 
 def test_message_id_deterministic():
@@ -107,3 +103,45 @@ def test_metrics_present(tmp_path):
     m = prod.publish_signals([make_signal(1)], score_run_id="run-1")
     for k in ("published_count", "dlq_count", "backpressure_events", "queue_depth"):
         assert k in m
+
+
+def test_batched_publish_group_commits(tmp_path):
+    b = _backend(tmp_path)
+    prod = P.ScoredSignalProducer(
+        backend=b, queue_name="scored_signal_queue", batch_size=25, linger_ms=60000
+    )
+    sigs = [make_signal(i) for i in range(100)] + [make_signal(7)]  # one in-run duplicate
+    m = prod.publish_signals(sigs, score_run_id="run-1")
+    assert m["batches"] == 5
+    assert m["published_count"] == 100 and m["deduped_count"] == 1
+    assert [msg["signal_id"] for msg in _read_queue(b, "scored_signal_queue")] == [
+        f"sig-{i}" for i in range(100)
+    ]
+
+
+def test_linger_flushes_partial_batches(tmp_path):
+    b = _backend(tmp_path)
+    prod = P.ScoredSignalProducer(
+        backend=b, queue_name="scored_signal_queue", batch_size=1000, linger_ms=0
+    )
+    m = prod.publish_signals([make_signal(i) for i in range(3)], score_run_id="run-1")
+    assert m["batches"] == 3 and m["published_count"] == 3
+
+
+class _AckingBackend(LocalDurableBackend):
+    """A consumer acks everything published so far right after each batch lands."""
+
+    def publish_batch(self, queue, messages, keys):
+        receipt = super().publish_batch(queue, messages, keys)
+        if queue != self.dlq_name:
+            self.acknowledge(queue, self.end_offset(queue))
+        return receipt
+
+
+def test_counts_are_not_skewed_by_concurrent_acks(tmp_path):
+    b = _AckingBackend(root=str(tmp_path / "q"), dlq_name="scored_signal_dlq")
+    prod = P.ScoredSignalProducer(backend=b, queue_name="scored_signal_queue", batch_size=10)
+    sigs = [make_signal(i) for i in range(30)] + [make_signal(3)]
+    m = prod.publish_signals(sigs, score_run_id="run-1")
+    assert m["published_count"] == 30 and m["deduped_count"] == 1
+    assert m["queue_depth"] == 0 and b.end_offset("scored_signal_queue") == 30
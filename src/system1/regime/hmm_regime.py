@@ -11,6 +11,10 @@ For each regime granularity (D1 primary, H4, H1 legacy) the engine:
 Run detached (HMM EM is multi-minute on H1):
     python -m src.system1.regime.hmm_regime            # all granularities
     python -m src.system1.regime.hmm_regime --granularity D1
+    python -m src.system1.regime.hmm_regime --warm-start   # seed each fold's EM from the last
+
+Granularities run in parallel processes and each granularity's walk-forward folds on a
+process pool (``REGIME_GRANULARITY_WORKERS`` / ``REGIME_FOLD_WORKERS`` override the split).
 """
 
 from __future__ import annotations
@@ -18,8 +22,10 @@ from __future__ import annotations
 import argparse
 import logging
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import joblib
 import numpy as np
@@ -31,7 +37,6 @@ from sklearn.preprocessing import StandardScaler
 from sqlalchemy import text
 
 from src.common.db import get_engine
-from src.layer0.ingest_oanda_prices import get_db_connection, read_env
 from src.system1.features import definitions as D
 from src.system1.regime import mapping as M
 from src.system1.regime import schema as regime_schema
@@ -114,16 +119,25 @@ def _sequences(df: pd.DataFrame) -> Tuple[np.ndarray, List[int]]:
 # --------------------------------------------------------------------------- #
 # HMM fit + fallback
 # --------------------------------------------------------------------------- #
-def fit_hmm(Xs: np.ndarray, lengths: List[int]) -> GaussianHMM:
+def fit_hmm(
+    Xs: np.ndarray, lengths: List[int], init: Optional[Dict[str, np.ndarray]] = None
+) -> GaussianHMM:
+    """Fixed-seed 4-state diag HMM. ``init`` (startprob/transmat/means/covars, the latter
+    as per-state diagonals) seeds EM instead of the K-Means initialisation."""
     hmm = GaussianHMM(
         n_components=4,
         covariance_type="diag",
         n_iter=1000,
         tol=1e-4,
         random_state=SEED,
-        init_params="stmc",
+        init_params="stmc" if init is None else "",
         verbose=False,
     )
+    if init is not None:
+        hmm.startprob_ = init["startprob"]
+        hmm.transmat_ = init["transmat"]
+        hmm.means_ = init["means"]
+        hmm.covars_ = init["covars"]
     hmm.fit(Xs, lengths)
     return hmm
 
@@ -323,8 +337,30 @@ def _seq_matrix(
     return scaler.transform(raw) * weights
 
 
+def _warm_start_params(
+    prev_scaler: StandardScaler,
+    prev_hmm: GaussianHMM,
+    scaler: StandardScaler,
+    weights: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """Previous fold's HMM parameters re-expressed in this fold's scaled feature space.
+
+    Each fold refits its scaler on its own TRAIN bars, so the previous means/variances are
+    mapped through raw feature space: ``z = (x - mu) / s * w`` per fold.
+    """
+    raw_means = prev_hmm.means_ / weights * prev_scaler.scale_ + prev_scaler.mean_
+    return {
+        "startprob": prev_hmm.startprob_.copy(),
+        "transmat": prev_hmm.transmat_.copy(),
+        "means": (raw_means - scaler.mean_) / scaler.scale_ * weights,
+        "covars": prev_hmm._covars_ * (prev_scaler.scale_ / scaler.scale_) ** 2,
+    }
+
+
 def _fit_causal_model(
-    df_train: pd.DataFrame, weights: np.ndarray
+    df_train: pd.DataFrame,
+    weights: np.ndarray,
+    warm_start: Optional[Tuple[StandardScaler, Any]] = None,
 ) -> Tuple[StandardScaler, Any, str, bool, str]:
     """Fit a fresh regime model on TRAIN-ONLY bars (scaler fit train-only).
 
@@ -333,6 +369,10 @@ def _fit_causal_model(
     assignment is itself causal (it depends only on the bar's own features and the
     train-fit centroids), so the fold's emitted label stays causal either way.
 
+    ``warm_start`` = the previous fold's ``(scaler, model)``: when that model is an HMM,
+    EM starts from its parameters. A warm fit must pass the same quality gate; if it
+    does not (or raises) the fold falls through to the cold fit above.
+
     Returns ``(scaler, model, model_name, ok, reason)``.
     """
     scaler = StandardScaler().fit(df_train[FEATURE_NAMES].to_numpy(dtype="float64"))
@@ -344,6 +384,19 @@ def _fit_causal_model(
         mats.append(_seq_matrix(grp, scaler, weights))
         lengths.append(len(grp))
     Xtr = np.vstack(mats)
+    if warm_start is not None and isinstance(warm_start[1], GaussianHMM):
+        try:
+            init = _warm_start_params(warm_start[0], warm_start[1], scaler, weights)
+            hmm = fit_hmm(Xtr, lengths, init=init)
+            raw_state = hmm.predict(Xtr, lengths)
+            ok, reason = M.check_hmm_quality(
+                hmm.monitor_.converged, hmm.covars_, raw_state, 4
+            )
+            if ok:
+                return scaler, hmm, "HMM", True, "ok:warm_start"
+            logger.info("warm-started HMM failed the gate (%s) → cold fit", reason)
+        except Exception as e:  # noqa: BLE001
+            logger.info("warm-started HMM raised (%s) → cold fit", e)
     try:
         hmm = fit_hmm(Xtr, lengths)
         raw_state = hmm.predict(Xtr, lengths)
@@ -377,7 +430,8 @@ def _emit_fold_posteriors(
     computed once via :func:`mapping.filtered_posteriors` (the forward recursion is
     causal, so a single pass yields every prefix's filtered value). For K-Means it is
     the one-hot of the nearest centroid at each bar (already causal). Returns the
-    semantic-ordered probs and argmax labels for the OOS rows only, plus the mapping.
+    semantic-ordered probs and argmax label codes (indices into ``SEMANTIC_ORDER``) for
+    the OOS rows only, plus the mapping.
     """
     if model_name == "HMM":
         framelogprob = model._compute_log_likelihood(Xseq)
@@ -392,12 +446,138 @@ def _emit_fold_posteriors(
         )
     ordered = M.order_probabilities(post, mapping)  # (T, 4) in SEMANTIC_ORDER
     oos_probs = ordered[oos_local]
-    oos_labels = np.array([M.SEMANTIC_ORDER[i] for i in np.argmax(oos_probs, axis=1)])
-    return oos_probs, oos_labels, mapping
+    return oos_probs, np.argmax(oos_probs, axis=1), mapping
+
+
+def _fit_iterations(model: Any, model_name: str) -> Tuple[int, bool]:
+    """(iterations to converge, converged) of a fitted fold model."""
+    if model_name == "HMM":
+        return int(model.monitor_.iter), bool(model.monitor_.converged)
+    return int(model.n_iter_), True
+
+
+def _fold_workers(n_folds: int, fold_workers: Optional[int] = None) -> int:
+    """Concurrent fold fits: ``fold_workers`` / ``REGIME_FOLD_WORKERS``, else one per core."""
+    cores = os.cpu_count() or 1
+    workers = int(
+        fold_workers
+        if fold_workers is not None
+        else os.environ.get("REGIME_FOLD_WORKERS", min(n_folds, cores))
+    )
+    return max(1, min(workers, n_folds))
+
+
+_FOLD_FRAME: Optional[pd.DataFrame] = None
+
+
+def _init_fold_worker(frame: pd.DataFrame) -> None:
+    """Process-pool initializer: ship the granularity frame once per worker, not per fold."""
+    global _FOLD_FRAME
+    _FOLD_FRAME = frame
+
+
+def _label_fold(
+    f: WF.Fold,
+    weights: np.ndarray,
+    warm_start: Optional[Tuple[StandardScaler, Any]] = None,
+    frame: Optional[pd.DataFrame] = None,
+) -> Dict[str, Any]:
+    """Fit fold ``f`` on its TRAIN bars and emit causal posteriors for its OOS bars.
+
+    Self-contained (reads only the frame and the fold bounds), so folds can run in any
+    order or process and merge to the same result. Returns the OOS ``positions`` (into
+    ``frame``), their ``probs``/``labels``, the fitted ``(scaler, model)`` under ``fit``
+    and fit diagnostics (model, reason, iterations to converge, wall time).
+    """
+    t0 = time.perf_counter()
+    df = _FOLD_FRAME if frame is None else frame
+    bar_time = pd.to_datetime(df["bar_time_utc"], utc=True)
+    train_mask = (bar_time >= f.train_start) & (bar_time < f.oos_start)
+    oos_mask = (bar_time >= f.oos_start) & (bar_time < f.oos_end)
+    df_train = df[train_mask.to_numpy()]
+    out: Dict[str, Any] = {"fold_id": f.fold_id, "skipped": True}
+    if df_train.empty or not oos_mask.any():
+        return out
+
+    scaler, model, model_name, _, reason = _fit_causal_model(df_train, weights, warm_start)
+    n_iter, converged = _fit_iterations(model, model_name)
+    positions: List[np.ndarray] = []
+    fold_probs: List[np.ndarray] = []
+    fold_labels: List[np.ndarray] = []
+    for aid, grp_all in df.groupby("asset_id", sort=True):
+        bt = pd.to_datetime(grp_all["bar_time_utc"], utc=True)
+        visible = (bt >= f.train_start) & (bt < f.oos_end)
+        grp = grp_all[visible.to_numpy()]
+        if grp.empty:
+            continue
+        vbt = pd.to_datetime(grp["bar_time_utc"], utc=True)
+        oos_local = ((vbt >= f.oos_start) & (vbt < f.oos_end)).to_numpy()
+        if not oos_local.any():
+            continue
+        Xseq = _seq_matrix(grp, scaler, weights)
+        gprobs, glabels, _ = _emit_fold_posteriors(model, model_name, Xseq, oos_local)
+        oos_gidx = grp.index.to_numpy()[oos_local]
+        positions.append(df.index.get_indexer(oos_gidx))
+        fold_probs.append(gprobs)
+        fold_labels.append(glabels)
+    out.update(
+        skipped=False,
+        positions=np.concatenate(positions) if positions else np.empty(0, dtype=int),
+        probs=np.vstack(fold_probs) if fold_probs else np.empty((0, 4)),
+        labels=np.concatenate(fold_labels) if fold_labels else np.empty(0, dtype=int),
+        fit=(scaler, model),
+        model=model_name,
+        reason=reason,
+        n_train=int(len(df_train)),
+        n_iter=n_iter,
+        converged=converged,
+        wall_s=round(time.perf_counter() - t0, 3),
+    )
+    return out
+
+
+def _run_folds(
+    df: pd.DataFrame,
+    folds: List[WF.Fold],
+    weights: np.ndarray,
+    fold_workers: Optional[int] = None,
+    warm_start: bool = False,
+) -> List[Dict[str, Any]]:
+    """Label every fold, in fold order.
+
+    Cold folds are independent fixed-seed fits, so they run concurrently on a process
+    pool and the merged output is identical to the serial path (``fold_workers=1``).
+    Warm-started folds depend on the previous fold's fit and therefore run in sequence
+    (granularities still run in parallel, see :func:`run`).
+    """
+    if warm_start:
+        results: List[Dict[str, Any]] = []
+        prev: Optional[Tuple[StandardScaler, Any]] = None
+        for f in folds:
+            r = _label_fold(f, weights, warm_start=prev, frame=df)
+            if not r["skipped"]:
+                prev = r["fit"]
+            results.append(r)
+        return results
+
+    workers = _fold_workers(len(folds), fold_workers)
+    if workers == 1:
+        return [_label_fold(f, weights, frame=df) for f in folds]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_fold_worker, initargs=(df,)
+    ) as pool:
+        # Latest (largest-train) folds first so the longest fits start immediately.
+        futures = {f.fold_id: pool.submit(_label_fold, f, weights) for f in reversed(folds)}
+        return [futures[f.fold_id].result() for f in folds]
 
 
 def causal_labels(
-    df: pd.DataFrame, granularity: str, weights: np.ndarray
+    df: pd.DataFrame,
+    granularity: str,
+    weights: np.ndarray,
+    fold_workers: Optional[int] = None,
+    warm_start: bool = False,
+    fold_report: Optional[List[Dict[str, Any]]] = None,
 ) -> pd.DataFrame:
     """Walk-forward causal regime labels (FIX-S1-005), aligned to ``df.index``.
 
@@ -414,13 +594,20 @@ def causal_labels(
     every bar with the filtered forward-only posterior of a single full-history fit
     (method ``filtered``, ``fold_id NULL``) — still causal in the *inference* sense.
 
+    Folds are fitted concurrently (``fold_workers``, see :func:`_run_folds`); with
+    ``warm_start`` each fold's EM is seeded from the previous fold's HMM. Per-fold fit
+    diagnostics (model, reason, iterations to converge, wall time) are appended to
+    ``fold_report`` when given.
+
     Returns a frame indexed like ``df`` with: ``regime_causal_raw``, ``regime_causal``,
     the four ``prob_causal_*`` columns, ``causal_fold_id`` (Int64), ``causal_label_method``.
     """
     n = len(df)
-    raw: np.ndarray = np.array([None] * n, dtype=object)
+    # Labels are carried as SEMANTIC_ORDER codes (-1 = unlabelled) and fold ids as
+    # int64 (-1 = NA) until the output frame is assembled.
+    raw_codes: np.ndarray = np.full(n, -1, dtype=np.int64)
     probs: np.ndarray = np.full((n, 4), np.nan, dtype="float64")
-    fold_ids: np.ndarray = np.array([pd.NA] * n, dtype=object)
+    fold_codes: np.ndarray = np.full(n, -1, dtype=np.int64)
     method: np.ndarray = np.array([None] * n, dtype=object)
 
     bar_time = pd.to_datetime(df["bar_time_utc"], utc=True)
@@ -442,7 +629,7 @@ def causal_labels(
                 model, model_name, Xseq, all_local
             )
             positions = df.index.get_indexer(gidx)
-            raw[positions] = glabels
+            raw_codes[positions] = glabels
             probs[positions] = gprobs
             method[positions] = CAUSAL_METHOD_FILTERED
         logger.info(
@@ -453,78 +640,67 @@ def causal_labels(
             reason,
         )
     else:
-        for f in folds:
-            train_mask = (bar_time >= f.train_start) & (bar_time < f.oos_start)
-            oos_mask = (bar_time >= f.oos_start) & (bar_time < f.oos_end)
-            df_train = df[train_mask.to_numpy()]
-            if df_train.empty or not oos_mask.any():
+        for r in _run_folds(df, folds, weights, fold_workers, warm_start):
+            if r["skipped"]:
                 logger.info(
-                    "[%s] fold %d skipped (empty train/oos)", granularity, f.fold_id
+                    "[%s] fold %d skipped (empty train/oos)", granularity, r["fold_id"]
                 )
                 continue
-            scaler, model, model_name, _, reason = _fit_causal_model(df_train, weights)
-            n_oos_fold = 0
-            fold_positions: List[int] = []
-            for aid, grp_all in df.groupby("asset_id", sort=True):
-                bt = pd.to_datetime(grp_all["bar_time_utc"], utc=True)
-                visible = (bt >= f.train_start) & (bt < f.oos_end)
-                grp = grp_all[visible.to_numpy()]
-                if grp.empty:
-                    continue
-                vbt = pd.to_datetime(grp["bar_time_utc"], utc=True)
-                oos_local = ((vbt >= f.oos_start) & (vbt < f.oos_end)).to_numpy()
-                if not oos_local.any():
-                    continue
-                Xseq = _seq_matrix(grp, scaler, weights)
-                gprobs, glabels, _ = _emit_fold_posteriors(
-                    model, model_name, Xseq, oos_local
-                )
-                oos_gidx = grp.index.to_numpy()[oos_local]
-                positions = df.index.get_indexer(oos_gidx)
-                raw[positions] = glabels
-                probs[positions] = gprobs
-                for p in positions:
-                    fold_ids[p] = f.fold_id
-                method[positions] = CAUSAL_METHOD_WALK_FORWARD
-                fold_positions.extend(int(p) for p in positions)
-                n_oos_fold += int(oos_local.sum())
+            fold_pos = r["positions"]
+            raw_codes[fold_pos] = r["labels"]
+            probs[fold_pos] = r["probs"]
+            fold_codes[fold_pos] = r["fold_id"]
+            method[fold_pos] = CAUSAL_METHOD_WALK_FORWARD
+            n_oos_fold = int(len(fold_pos))
             # Guard (global rule #3): every OOS bar this fold labelled must carry all
             # four causal probabilities and a recognised label — a fold that emits a
             # partially-populated label is a bug, not a silently-acceptable state.
-            fold_pos = np.array(fold_positions, dtype=int)
-            assert fold_pos.size == n_oos_fold, "fold OOS bar count mismatch"
+            assert len(np.unique(fold_pos)) == n_oos_fold, "fold OOS bar count mismatch"
             assert np.isfinite(
                 probs[fold_pos]
             ).all(), "causal probs not fully populated"
-            assert all(
-                lbl in M.SEMANTIC_ORDER for lbl in raw[fold_pos]
-            ), "bad causal label"
+            fold_labels = raw_codes[fold_pos]
+            assert (
+                (fold_labels >= 0) & (fold_labels < len(M.SEMANTIC_ORDER))
+            ).all(), "bad causal label"
             logger.info(
-                "[%s] fold %d: model=%s reason=%s labelled %d OOS bars",
+                "[%s] fold %d: model=%s reason=%s iters=%d labelled %d OOS bars (%.1fs)",
                 granularity,
-                f.fold_id,
-                model_name,
-                reason,
+                r["fold_id"],
+                r["model"],
+                r["reason"],
+                r["n_iter"],
                 n_oos_fold,
+                r["wall_s"],
             )
+            if fold_report is not None:
+                fold_report.append(
+                    {
+                        k: r[k]
+                        for k in (
+                            "fold_id", "model", "reason", "n_train", "n_iter", "converged", "wall_s",
+                        )
+                    }
+                )
 
-    # Causal persistence smoothing per instrument over the labelled (post-cutoff) bars.
-    smoothed = np.array([None] * n, dtype=object)
-    for _, grp in df.groupby("asset_id", sort=True):
-        gpos = df.index.get_indexer(grp.index.to_numpy())
-        labelled = [p for p in gpos if raw[p] is not None]
-        if not labelled:
-            continue
-        seq = [raw[p] for p in labelled]
-        sm = M.persistence_smooth(seq, min_bars=3)
-        for p, lab in zip(labelled, sm):
-            smoothed[p] = lab
+    # Causal persistence smoothing per instrument over the labelled (post-cutoff) bars:
+    # one vectorised pass over every instrument's labelled bars in row order, with runs
+    # split at instrument boundaries.
+    smoothed_codes: np.ndarray = np.full(n, -1, dtype=np.int64)
+    asset_ids = df["asset_id"].to_numpy()
+    labelled = np.flatnonzero(raw_codes >= 0)
+    labelled = labelled[np.argsort(asset_ids[labelled], kind="stable")]
+    if len(labelled):
+        smoothed_codes[labelled] = M.persistence_smooth_codes(
+            raw_codes[labelled], min_bars=3, groups=asset_ids[labelled]
+        )
 
+    names = np.array(M.SEMANTIC_ORDER + [None], dtype=object)  # code -1 → None
     out = pd.DataFrame(
         {
-            "regime_causal_raw": raw,
-            "regime_causal": smoothed,
-            "causal_fold_id": pd.array(fold_ids, dtype="Int64"),
+            "regime_causal_raw": names[raw_codes],
+            "regime_causal": names[smoothed_codes],
+            "causal_fold_id": pd.arrays.IntegerArray(fold_codes, fold_codes < 0),
             "causal_label_method": method,
         },
         index=df.index,
@@ -534,7 +710,12 @@ def causal_labels(
     return out
 
 
-def process_granularity(conn, granularity: str) -> Dict[str, Any]:
+def process_granularity(
+    conn,
+    granularity: str,
+    fold_workers: Optional[int] = None,
+    warm_start: bool = False,
+) -> Dict[str, Any]:
     logger.info("[%s] loading features…", granularity)
     df = load_features(conn, granularity)
     n = len(df)
@@ -600,7 +781,15 @@ def process_granularity(conn, granularity: str) -> Dict[str, Any]:
 
     # FIX-S1-005: causal (walk-forward, filtered forward-only) labels for the consumed
     # columns. The smoothed/prob_* columns above are kept UNCHANGED (reporting only).
-    causal = causal_labels(df, granularity, weights)
+    fold_report: List[Dict[str, Any]] = []
+    causal = causal_labels(
+        df,
+        granularity,
+        weights,
+        fold_workers=fold_workers,
+        warm_start=warm_start,
+        fold_report=fold_report,
+    )
     rows_df = rows_df.join(causal)
     n_causal = int(rows_df["regime_causal"].notna().sum())
     n_unknown = int(rows_df["regime_causal"].isna().sum())
@@ -630,6 +819,8 @@ def process_granularity(conn, granularity: str) -> Dict[str, Any]:
         "flicker_smoothed": round(flick["flicker_smoothed"], 5),
         "label_distribution": {k: int(v) for k, v in state_counts.items()},
         "mapping": {int(k): v for k, v in mapping.items()},
+        "causal_warm_start": bool(warm_start),
+        "causal_folds": fold_report,
     }
     result["_model_obj"] = {
         "model": fitted,
@@ -648,22 +839,85 @@ def process_granularity(conn, granularity: str) -> Dict[str, Any]:
     return result
 
 
+def _split_cores(
+    n_granularities: int, granularity_workers: Optional[int] = None
+) -> Tuple[int, int]:
+    """Split the CPU budget into (concurrent granularities, fold workers per granularity).
+
+    ``REGIME_GRANULARITY_WORKERS`` overrides the granularity concurrency (default: all
+    requested granularities at once, at most one per core); each gets an equal share of
+    the cores for its fold pool (``REGIME_FOLD_WORKERS`` overrides that share).
+    """
+    cores = os.cpu_count() or 1
+    workers = int(
+        granularity_workers
+        if granularity_workers is not None
+        else os.environ.get("REGIME_GRANULARITY_WORKERS", min(n_granularities, cores))
+    )
+    workers = max(1, min(workers, n_granularities))
+    fold_workers = os.environ.get("REGIME_FOLD_WORKERS")
+    return workers, int(fold_workers) if fold_workers else max(1, cores // workers)
+
+
+def _connect():
+    """UTC psycopg2 connection via the layer-0 ingest helpers."""
+    # Imported here: the ingest module pulls in the OANDA client, which the model
+    # code (and its tests) never needs.
+    from src.layer0.ingest_data.ingest_oanda_prices import get_db_connection, read_env
+
+    return get_db_connection(read_env())
+
+
+def _process_granularity_job(
+    granularity: str, fold_workers: int, warm_start: bool
+) -> Dict[str, Any]:
+    """Process-pool entry point: one granularity on its own DB connection."""
+    conn = _connect()
+    try:
+        return process_granularity(conn, granularity, fold_workers, warm_start)
+    finally:
+        conn.close()
+
+
 def run(
-    granularities: List[str] = None, register_mlflow: bool = True
+    granularities: List[str] = None,
+    register_mlflow: bool = True,
+    warm_start: bool = False,
+    granularity_workers: Optional[int] = None,
 ) -> Dict[str, Any]:
     granularities = granularities or REGIME_GRANULARITIES
     regime_schema.ensure_regime_columns()
-    env = read_env()
-    conn = get_db_connection(env)
+    workers, fold_workers = _split_cores(len(granularities), granularity_workers)
+    logger.info(
+        "MODEL-003: %d granularities on %d worker(s), %d fold worker(s) each, warm_start=%s",
+        len(granularities),
+        workers,
+        fold_workers,
+        warm_start,
+    )
+    if workers == 1:
+        conn = _connect()
+        try:
+            per_g = [
+                process_granularity(conn, g, fold_workers, warm_start)
+                for g in granularities
+            ]
+        finally:
+            conn.close()
+    else:
+        # Each granularity is independent (own rows, own models); results are merged in
+        # the requested order so the bundle and summary match the serial path.
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_process_granularity_job, g, fold_workers, warm_start)
+                for g in granularities
+            ]
+            per_g = [fut.result() for fut in futures]
     results: List[Dict[str, Any]] = []
     model_bundle: Dict[str, Any] = {}
-    try:
-        for g in granularities:
-            r = process_granularity(conn, g)
-            model_bundle[g] = r.pop("_model_obj")
-            results.append(r)
-    finally:
-        conn.close()
+    for g, r in zip(granularities, per_g):
+        model_bundle[g] = r.pop("_model_obj")
+        results.append(r)
 
     # Serialize HMM package (per-granularity models + scalers + mappings).
     os.makedirs(os.path.dirname(MODEL_PATH), exist_ok=True)
@@ -714,6 +968,8 @@ def _register_mlflow(summary) -> str:
                 mlflow.log_metric(f"acc_{g}", r["holdout_accuracy"])
                 mlflow.log_metric(f"flicker_raw_{g}", r["flicker_raw"])
                 mlflow.log_metric(f"flicker_smoothed_{g}", r["flicker_smoothed"])
+                for fold in r.get("causal_folds", []):
+                    mlflow.log_metric(f"causal_iters_{g}", fold["n_iter"], step=fold["fold_id"])
             mlflow.log_artifact(MODEL_PATH)
             return run.info.run_id
     except Exception as e:  # noqa: BLE001
@@ -725,6 +981,17 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="MODEL-003 HMM regime engine")
     parser.add_argument("--granularity", choices=REGIME_GRANULARITIES, default=None)
     parser.add_argument("--no-mlflow", action="store_true")
+    parser.add_argument(
+        "--warm-start",
+        action="store_true",
+        help="Seed each walk-forward fold's HMM EM from the previous fold's fit",
+    )
+    parser.add_argument(
+        "--granularity-workers",
+        type=int,
+        default=None,
+        help="Granularities processed concurrently (default: $REGIME_GRANULARITY_WORKERS or all)",
+    )
     parser.add_argument("--log-file", default="model003_regime.log")
     args = parser.parse_args()
     logging.basicConfig(
@@ -733,7 +1000,12 @@ def main() -> None:
         handlers=[logging.StreamHandler(), logging.FileHandler(args.log_file)],
     )
     gr = [args.granularity] if args.granularity else None
-    summary = run(gr, register_mlflow=not args.no_mlflow)
+    summary = run(
+        gr,
+        register_mlflow=not args.no_mlflow,
+        warm_start=args.warm_start,
+        granularity_workers=args.granularity_workers,
+    )
     print({k: v for k, v in summary.items() if k != "per_granularity"})
     for r in summary["per_granularity"]:
         print(r)
@@ -0,0 +1,247 @@
+"""Incremental causal regime inference for live bars.
+
+``causal_labels`` recomputes the filtered posterior over an instrument's whole visible
+history. Live, the regime at each H4/D1 close only needs one more step of the forward
+recursion: :class:`RegimeFilter` keeps the last log forward row per instrument and
+advances it in O(K²) per bar with the model fitted by ``hmm_regime`` (loaded from the
+serialized ``hmm_model.joblib`` bundle).
+
+Bit-for-bit parity with the batch :func:`mapping.filtered_posteriors` over the same
+bars is by construction, not by tolerance: the carried state is the unnormalized log
+forward row (renormalizing between bars would change the rounding of every later
+step), each step runs through the same ``forward_log`` kernel via
+:func:`mapping.forward_lattice`, and the posterior is read out with the same
+:func:`mapping.normalize_forward`. K-Means bundles (the fallback model) are stateless:
+each bar is the one-hot of its nearest centroid, as in the batch path.
+
+State survives restarts via :meth:`RegimeFilter.checkpoint` / :meth:`RegimeFilter.restore`
+(plain JSON-serializable dicts; floats round-trip exactly).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from src.system1.regime import mapping as M
+
+logger = logging.getLogger("system1.regime.live")
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+DEFAULT_BUNDLE_PATH = os.path.join(_REPO_ROOT, "models", "hmm_model.joblib")
+CHECKPOINT_VERSION = 1
+
+
+class RegimeFilter:
+    """Per-instrument forward filter for one granularity's fitted regime model."""
+
+    def __init__(
+        self,
+        model: Any,
+        scaler: Any,
+        weights: np.ndarray,
+        mapping: Dict[int, str],
+        feature_names: List[str],
+        granularity: Optional[str] = None,
+    ):
+        self.model = model
+        self.scaler = scaler
+        self.weights = np.asarray(weights, dtype="float64")
+        self.mapping = {int(k): v for k, v in mapping.items()}
+        self.feature_names = list(feature_names)
+        self.granularity = granularity
+        self.is_hmm = hasattr(model, "transmat_")
+        self.model_name = "HMM" if self.is_hmm else "KMeans"
+        self.n_states = len(self.mapping)
+        self._forward: Dict[Hashable, np.ndarray] = {}
+        self._probs: Dict[Hashable, np.ndarray] = {}
+        self._last_bar: Dict[Hashable, Optional[pd.Timestamp]] = {}
+        self._bars: Dict[Hashable, int] = {}
+
+    @classmethod
+    def from_bundle(
+        cls,
+        granularity: str,
+        bundle: Union[str, Dict[str, Any], None] = None,
+    ) -> "RegimeFilter":
+        """Build a filter from the ``hmm_regime`` bundle (a path, a loaded dict, or the
+        default ``models/hmm_model.joblib``)."""
+        if bundle is None or isinstance(bundle, str):
+            bundle = joblib.load(bundle or DEFAULT_BUNDLE_PATH)
+        if granularity not in bundle["models"]:
+            raise KeyError(f"No regime model for granularity {granularity!r} in bundle")
+        entry = bundle["models"][granularity]
+        return cls(
+            model=entry["model"],
+            scaler=entry["scaler"],
+            weights=np.asarray(entry["weights"], dtype="float64"),
+            mapping=entry["mapping"],
+            feature_names=bundle["feature_names"],
+            granularity=granularity,
+        )
+
+    # ------------------------------------------------------------------ inference
+
+    def _design(self, features: Any) -> np.ndarray:
+        """Scaled + weighted feature matrix, shape ``(T, F)`` (as ``hmm_regime._seq_matrix``)."""
+        if isinstance(features, pd.DataFrame):
+            raw = features[self.feature_names].to_numpy(dtype="float64")
+        elif isinstance(features, (pd.Series, dict)):
+            raw = np.array([[float(features[f]) for f in self.feature_names]])
+        else:
+            raw = np.atleast_2d(np.asarray(features, dtype="float64"))
+        if raw.shape[1] != len(self.feature_names):
+            raise ValueError(
+                f"Expected {len(self.feature_names)} regime features, got {raw.shape[1]}"
+            )
+        return self._scale(raw) * self.weights
+
+    def _scale(self, raw: np.ndarray) -> np.ndarray:
+        """``scaler.transform`` without sklearn's per-call validation (most of a live
+        update's cost). Same in-place ops as ``StandardScaler.transform``, so identical
+        values; any other scaler goes through ``transform``."""
+        sc = self.scaler
+        if not (hasattr(sc, "mean_") and hasattr(sc, "scale_") and hasattr(sc, "with_mean")):
+            return sc.transform(raw)
+        X = np.array(raw, dtype="float64", copy=True)
+        if sc.with_mean:
+            X -= sc.mean_
+        if sc.with_std:
+            X /= sc.scale_
+        return X
+
+    def _advance(self, key: Hashable, X: np.ndarray) -> np.ndarray:
+        """Raw-state posteriors for the new rows, advancing ``key``'s forward state."""
+        if not self.is_hmm:
+            assign = self.model.predict(X)
+            post = np.zeros((len(X), self.n_states))
+            post[np.arange(len(X)), assign] = 1.0
+            return post
+        framelogprob = self.model._compute_log_likelihood(X)
+        fwd = M.forward_lattice(
+            self.model.startprob_,
+            self.model.transmat_,
+            framelogprob,
+            prev_forward=self._forward.get(key),
+        )
+        self._forward[key] = fwd[-1].copy()
+        return M.normalize_forward(fwd)
+
+    def extend(
+        self, key: Hashable, features: Any, bar_times: Optional[Any] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Advance ``key`` over a block of bars (e.g. history warm-up after a cold start).
+
+        Returns the semantic-ordered probabilities ``(T, 4)`` and argmax labels for the
+        block. Equivalent, bar for bar, to calling :meth:`update` on each row.
+        """
+        X = self._design(features)
+        if len(X) == 0:
+            return np.empty((0, len(M.SEMANTIC_ORDER))), np.array([], dtype=object)
+        ordered = M.order_probabilities(self._advance(key, X), self.mapping)
+        labels = np.array([M.SEMANTIC_ORDER[i] for i in np.argmax(ordered, axis=1)])
+        self._probs[key] = ordered[-1].copy()
+        self._bars[key] = self._bars.get(key, 0) + len(X)
+        if bar_times is not None:
+            self._last_bar[key] = pd.Timestamp(pd.Index(bar_times)[-1])
+        return ordered, labels
+
+    def update(
+        self, key: Hashable, features: Any, bar_time: Optional[Any] = None
+    ) -> Tuple[np.ndarray, str]:
+        """Advance ``key`` by one closed bar; returns (semantic-ordered probs, label).
+
+        A ``bar_time`` at or before the last applied bar is not applied again (e.g. a
+        replayed close after a restart); the current posterior is returned instead.
+        """
+        if bar_time is not None:
+            bar_time = pd.Timestamp(bar_time)
+            last = self._last_bar.get(key)
+            if last is not None and bar_time <= last:
+                logger.debug("[%s] bar %s already applied for %s", self.granularity, bar_time, key)
+                return self.posterior(key)
+        ordered, labels = self.extend(key, features)
+        if bar_time is not None:
+            self._last_bar[key] = bar_time
+        return ordered[-1], str(labels[-1])
+
+    def posterior(self, key: Hashable) -> Tuple[np.ndarray, str]:
+        """Current semantic-ordered posterior and label for ``key``."""
+        if key not in self._probs:
+            raise KeyError(f"No regime state for {key!r}")
+        probs = self._probs[key]
+        return probs.copy(), M.SEMANTIC_ORDER[int(np.argmax(probs))]
+
+    def reset(self, key: Optional[Hashable] = None) -> None:
+        """Drop the state of one instrument (or all) — the next bar starts from ``startprob``."""
+        for store in (self._forward, self._probs, self._last_bar, self._bars):
+            if key is None:
+                store.clear()
+            else:
+                store.pop(key, None)
+
+    @property
+    def instruments(self) -> List[Hashable]:
+        return list(self._probs)
+
+    # ------------------------------------------------------------------ persistence
+
+    def checkpoint(self) -> Dict[str, Any]:
+        """JSON-serializable snapshot of every instrument's filter state."""
+        states = []
+        for key in self._probs:
+            fwd = self._forward.get(key)
+            last = self._last_bar.get(key)
+            states.append(
+                {
+                    "key": key.item() if isinstance(key, np.generic) else key,
+                    "log_forward": None if fwd is None else [float(v) for v in fwd],
+                    "probs": [float(v) for v in self._probs[key]],
+                    "bars": int(self._bars.get(key, 0)),
+                    "last_bar": None if last is None else last.isoformat(),
+                }
+            )
+        return {
+            "version": CHECKPOINT_VERSION,
+            "granularity": self.granularity,
+            "model_name": self.model_name,
+            "n_states": self.n_states,
+            "mapping": {str(k): v for k, v in self.mapping.items()},
+            "states": states,
+        }
+
+    def restore(self, checkpoint: Dict[str, Any]) -> None:
+        """Load a :meth:`checkpoint` snapshot, replacing the current state.
+
+        Raises:
+            ValueError: if the snapshot was taken with a different model (granularity,
+                model kind, state count or state→label mapping).
+        """
+        expected = {
+            "version": CHECKPOINT_VERSION,
+            "granularity": self.granularity,
+            "model_name": self.model_name,
+            "n_states": self.n_states,
+            "mapping": {str(k): v for k, v in self.mapping.items()},
+        }
+        for field, want in expected.items():
+            if checkpoint.get(field) != want:
+                raise ValueError(
+                    f"Regime checkpoint {field}={checkpoint.get(field)!r} does not match "
+                    f"this filter ({want!r})"
+                )
+        self.reset()
+        for state in checkpoint["states"]:
+            key = state["key"]
+            key = tuple(key) if isinstance(key, list) else key  # JSON turns tuples into lists
+            if state["log_forward"] is not None:
+                self._forward[key] = np.array(state["log_forward"], dtype="float64")
+            self._probs[key] = np.array(state["probs"], dtype="float64")
+            self._bars[key] = int(state["bars"])
+            if state["last_bar"] is not None:
+                self._last_bar[key] = pd.Timestamp(state["last_bar"])
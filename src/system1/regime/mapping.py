@@ -85,14 +85,42 @@ def filtered_posteriors(
     Returns:
         Filtered posteriors, shape ``(T, K)``; every row sums to 1.0 (within fp error).
     """
+    return normalize_forward(forward_lattice(startprob, transmat, framelogprob))
+
+
+def forward_lattice(
+    startprob: np.ndarray,
+    transmat: np.ndarray,
+    framelogprob: np.ndarray,
+    prev_forward: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Log forward lattice ``log P(x_1..x_t, state_t)`` — the recursion behind
+    :func:`filtered_posteriors`, exposed so live inference can continue it bar by bar.
+
+    With ``prev_forward`` (the last lattice row of an earlier call) the recursion resumes
+    from that row instead of ``startprob``: the row is fed to ``forward_log`` as frame 0
+    under a unit start vector (``log 1 + a == a`` exactly), so every continued row is
+    produced by the same arithmetic as one long call over the concatenated sequence.
+
+    Returns:
+        Log forward lattice, shape ``(T, K)`` (``prev_forward`` itself is not included).
+    """
     from hmmlearn import _hmmc  # private API — isolated to this single wrapper.
 
+    framelogprob = np.asarray(framelogprob, dtype="float64")
+    if prev_forward is not None:
+        startprob = np.ones(framelogprob.shape[1])
+        framelogprob = np.vstack([np.asarray(prev_forward, dtype="float64"), framelogprob])
     _, fwdlattice = _hmmc.forward_log(
         np.asarray(startprob, dtype="float64"),
         np.asarray(transmat, dtype="float64"),
-        np.ascontiguousarray(framelogprob, dtype="float64"),
+        np.ascontiguousarray(framelogprob),
     )
-    # Stable per-row log-normalize, then exponentiate -> filtered posterior per bar.
+    return fwdlattice[1:] if prev_forward is not None else fwdlattice
+
+
+def normalize_forward(fwdlattice: np.ndarray) -> np.ndarray:
+    """Row-normalize a log forward lattice into filtered posteriors (stable log-sum-exp)."""
     row_max = fwdlattice.max(axis=1, keepdims=True)
     log_norm = row_max + np.log(np.exp(fwdlattice - row_max).sum(axis=1, keepdims=True))
     return np.exp(fwdlattice - log_norm)
@@ -103,25 +131,57 @@ def persistence_smooth(labels: List[str], min_bars: int = 3) -> List[str]:
 
     The smoothed label at bar t depends only on bars 0..t (never future).
     """
-    smoothed = list(labels)
-    n = len(labels)
-    i = 0
-    while i < n:
-        j = i
-        while j < n and labels[j] == labels[i]:
-            j += 1
-        if (j - i) < min_bars and i > 0:
-            smoothed[i:j] = [smoothed[i - 1]] * (j - i)
-        i = j
-    # Leading boundary: a short opening segment has no prior to absorb into, so it
-    # adopts the next confirmed regime (one-time fixup at the very start of history).
-    if n:
-        k = 0
-        while k < n and smoothed[k] == smoothed[0]:
-            k += 1
-        if k < min_bars and k < n:
-            smoothed[:k] = [smoothed[k]] * k
-    return smoothed
+    index: Dict[str, int] = {}
+    codes = np.fromiter(
+        (index.setdefault(label, len(index)) for label in labels), dtype=np.int64, count=len(labels)
+    )
+    uniques = list(index)
+    return [uniques[c] for c in persistence_smooth_codes(codes, min_bars)]
+
+
+def persistence_smooth_codes(
+    codes: np.ndarray, min_bars: int = 3, groups: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """:func:`persistence_smooth` on integer label codes, vectorised over segments.
+
+    Works on runs instead of bars: a run shorter than ``min_bars`` takes the smoothed
+    value of the run before it (so it forward-fills the last confirmed regime), except
+    the first run, which has no prior. Then, if the opening smoothed segment is still
+    shorter than ``min_bars`` and is not the whole sequence, it adopts the next segment's
+    regime (the same one-time leading fixup).
+
+    ``groups`` (same length, each group contiguous — e.g. asset ids of rows sorted by
+    instrument) smooths several independent sequences in one call; runs never cross a
+    group boundary, and each group gets its own leading fixup.
+    """
+    codes = np.asarray(codes)
+    n = len(codes)
+    if n == 0:
+        return codes.copy()
+    new_group = np.zeros(n, dtype=bool)
+    new_group[0] = True
+    if groups is not None:
+        groups = np.asarray(groups)
+        new_group[1:] = groups[1:] != groups[:-1]
+
+    # Runs of equal raw codes (split at group boundaries).
+    starts = np.flatnonzero(new_group | np.r_[True, codes[1:] != codes[:-1]])
+    lengths = np.diff(np.r_[starts, n])
+    values = codes[starts]
+    first_in_group = new_group[starts]
+    keep = (lengths >= min_bars) | first_in_group
+    carried = np.maximum.accumulate(np.where(keep, np.arange(len(starts)), 0))
+    values = values[carried]
+
+    # Leading fixup on the smoothed segments (consecutive runs now sharing a value).
+    seg_starts = np.flatnonzero(first_in_group | np.r_[True, values[1:] != values[:-1]])
+    seg_lengths = np.add.reduceat(lengths, seg_starts)
+    seg_values = values[seg_starts]
+    seg_first = first_in_group[seg_starts]
+    has_next = np.r_[~seg_first[1:], False]
+    fix = seg_first & (seg_lengths < min_bars) & has_next
+    seg_values[fix] = seg_values[np.flatnonzero(fix) + 1]
+    return np.repeat(seg_values, seg_lengths)
 
 
 def check_hmm_quality(
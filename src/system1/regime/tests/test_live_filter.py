@@ -0,0 +1,152 @@
+"""Incremental RegimeFilter vs the batch filtered posteriors (pure, no DB / no network)."""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from hmmlearn.hmm import GaussianHMM
+from sklearn.cluster import KMeans
+from sklearn.preprocessing import StandardScaler
+
+from src.system1.regime import mapping as M
+from src.system1.regime.live_filter import RegimeFilter
+
+FEATURES = ["atr_14", "adx_14", "volatility_20", "returns_1", "trend_20"]
+WEIGHTS = np.array([1.0, 1.0, 1.0, 0.5, 3.0])
+
+
+def _regime_features(n: int, seed: int) -> pd.DataFrame:
+    """Four alternating regimes with distinct volatility / trend signatures."""
+    rng = np.random.RandomState(seed)
+    centers = np.array(
+        [
+            [1.0, 30.0, 0.010, 0.002, 0.002],
+            [1.0, 30.0, 0.010, -0.002, -0.002],
+            [0.6, 12.0, 0.006, 0.0, 0.0],
+            [2.5, 25.0, 0.030, 0.0, 0.0],
+        ]
+    )
+    scale = np.array([0.15, 4.0, 0.002, 0.004, 0.0008])
+    regimes = np.repeat(rng.randint(0, 4, size=n // 25 + 1), 25)[:n]
+    return pd.DataFrame(centers[regimes] + rng.normal(0, 1, (n, 5)) * scale, columns=FEATURES)
+
+
+def _bundle(kind: str = "HMM"):
+    train = _regime_features(1200, seed=0)
+    scaler = StandardScaler().fit(train[FEATURES].to_numpy())
+    X = scaler.transform(train[FEATURES].to_numpy()) * WEIGHTS
+    if kind == "HMM":
+        model = GaussianHMM(n_components=4, covariance_type="diag", n_iter=200, random_state=42)
+        model.fit(X)
+        means = model.means_
+    else:
+        model = KMeans(n_clusters=4, random_state=42, n_init=10).fit(X)
+        means = model.cluster_centers_
+    mapping = M.map_states_to_labels(means, FEATURES, "trend_20")
+    return {
+        "models": {"H4": {"model": model, "scaler": scaler, "mapping": mapping, "weights": WEIGHTS.tolist()}},
+        "feature_names": FEATURES,
+    }, scaler, model, mapping
+
+
+def _batch(scaler, model, mapping, frame):
+    X = scaler.transform(frame[FEATURES].to_numpy(dtype="float64")) * WEIGHTS
+    post = M.filtered_posteriors(model.startprob_, model.transmat_, model._compute_log_likelihood(X))
+    return M.order_probabilities(post, mapping)
+
+
+def test_bar_by_bar_updates_match_batch_bit_for_bit():
+    bundle, scaler, model, mapping = _bundle()
+    live = _regime_features(800, seed=1)
+    expected = _batch(scaler, model, mapping, live)
+
+    filt = RegimeFilter.from_bundle("H4", bundle)
+    got = np.array([filt.update(7, live.iloc[t])[0] for t in range(len(live))])
+    np.testing.assert_array_equal(got, expected)
+    assert filt.posterior(7)[1] == M.SEMANTIC_ORDER[int(np.argmax(expected[-1]))]
+
+
+def test_block_warm_start_then_updates_match_batch():
+    bundle, scaler, model, mapping = _bundle()
+    live = _regime_features(500, seed=2)
+    expected = _batch(scaler, model, mapping, live)
+
+    filt = RegimeFilter.from_bundle("H4", bundle)
+    head, _ = filt.extend("EUR_USD", live.iloc[:300])
+    tail = [filt.update("EUR_USD", live.iloc[t].to_dict())[0] for t in range(300, 500)]
+    np.testing.assert_array_equal(np.vstack([head, tail]), expected)
+
+
+def test_instruments_are_independent():
+    bundle, scaler, model, mapping = _bundle()
+    a, b = _regime_features(200, seed=3), _regime_features(200, seed=4)
+    filt = RegimeFilter.from_bundle("H4", bundle)
+    for t in range(200):
+        filt.update(1, a.iloc[t])
+        filt.update(2, b.iloc[t])
+    np.testing.assert_array_equal(filt.posterior(1)[0], _batch(scaler, model, mapping, a)[-1])
+    np.testing.assert_array_equal(filt.posterior(2)[0], _batch(scaler, model, mapping, b)[-1])
+
+
+def test_checkpoint_restore_round_trips_through_json():
+    bundle, scaler, model, mapping = _bundle()
+    live = _regime_features(400, seed=5)
+    times = pd.date_range("2024-01-01", periods=400, freq="4h", tz="UTC")
+    expected = _batch(scaler, model, mapping, live)
+
+    filt = RegimeFilter.from_bundle("H4", bundle)
+    filt.extend((1, "H4"), live.iloc[:250], bar_times=times[:250])
+    snapshot = json.loads(json.dumps(filt.checkpoint()))
+
+    restored = RegimeFilter.from_bundle("H4", bundle)
+    restored.restore(snapshot)
+    got = [restored.update((1, "H4"), live.iloc[t], bar_time=times[t])[0] for t in range(250, 400)]
+    np.testing.assert_array_equal(np.array(got), expected[250:])
+
+
+def test_replayed_bar_is_not_applied_twice():
+    bundle, _, _, _ = _bundle()
+    live = _regime_features(50, seed=6)
+    times = pd.date_range("2024-01-01", periods=50, freq="4h", tz="UTC")
+    filt = RegimeFilter.from_bundle("H4", bundle)
+    for t in range(50):
+        filt.update(1, live.iloc[t], bar_time=times[t])
+    before = filt.checkpoint()
+    probs, _ = filt.update(1, live.iloc[10], bar_time=times[-1])
+    assert filt.checkpoint() == before
+    np.testing.assert_array_equal(probs, filt.posterior(1)[0])
+
+
+def test_restore_rejects_checkpoint_from_another_model():
+    bundle, _, _, _ = _bundle()
+    km_bundle, _, _, _ = _bundle("KMeans")
+    hmm_filter = RegimeFilter.from_bundle("H4", bundle)
+    hmm_filter.update(1, _regime_features(1, seed=7).iloc[0])
+    with pytest.raises(ValueError):
+        RegimeFilter.from_bundle("H4", km_bundle).restore(hmm_filter.checkpoint())
+
+
+def test_kmeans_bundle_emits_one_hot_nearest_centroid():
+    bundle, scaler, model, mapping = _bundle("KMeans")
+    live = _regime_features(100, seed=8)
+    X = scaler.transform(live[FEATURES].to_numpy()) * WEIGHTS
+    onehot = np.zeros((100, 4))
+    onehot[np.arange(100), model.predict(X)] = 1.0
+
+    filt = RegimeFilter.from_bundle("H4", bundle)
+    got = np.array([filt.update(3, live.iloc[t])[0] for t in range(100)])
+    np.testing.assert_array_equal(got, M.order_probabilities(onehot, mapping))
+
+
+def test_forward_lattice_continuation_matches_single_pass():
+    rng = np.random.RandomState(9)
+    startprob = np.array([0.5, 0.3, 0.2])
+    transmat = np.array([[0.6, 0.3, 0.1], [0.2, 0.6, 0.2], [0.1, 0.3, 0.6]])
+    flp = np.log(rng.uniform(0.05, 1.0, size=(40, 3)))
+    full = M.forward_lattice(startprob, transmat, flp)
+    head = M.forward_lattice(startprob, transmat, flp[:17])
+    tail = M.forward_lattice(startprob, transmat, flp[17:], prev_forward=head[-1])
+    np.testing.assert_array_equal(np.vstack([head, tail]), full)
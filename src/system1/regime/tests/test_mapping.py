@@ -69,6 +69,43 @@ def test_persistence_smooth_is_causal():
     assert sm == sm_ext[: len(sm)]  # appending a bar does not rewrite the past
 
 
+def _loop_persistence_smooth(labels, min_bars):
+    """The original bar-by-bar debounce, kept as the reference for the vectorised one."""
+    smoothed = list(labels)
+    n = len(labels)
+    i = 0
+    while i < n:
+        j = i
+        while j < n and labels[j] == labels[i]:
+            j += 1
+        if (j - i) < min_bars and i > 0:
+            smoothed[i:j] = [smoothed[i - 1]] * (j - i)
+        i = j
+    if n:
+        k = 0
+        while k < n and smoothed[k] == smoothed[0]:
+            k += 1
+        if k < min_bars and k < n:
+            smoothed[:k] = [smoothed[k]] * k
+    return smoothed
+
+
+def test_persistence_smooth_codes_matches_loop_reference_per_group():
+    rng = np.random.RandomState(0)
+    for _ in range(300):
+        sizes = rng.randint(0, 40, size=rng.randint(1, 5))
+        groups = np.repeat(np.arange(len(sizes)), sizes)
+        codes = rng.randint(0, 4, size=len(groups))
+        min_bars = int(rng.randint(1, 5))
+        expected = []
+        for g in range(len(sizes)):
+            expected += _loop_persistence_smooth(list(codes[groups == g]), min_bars)
+        got = M.persistence_smooth_codes(codes, min_bars, groups=groups)
+        assert got.tolist() == expected
+        labels = [M.SEMANTIC_ORDER[c] for c in codes]
+        assert M.persistence_smooth(labels, min_bars) == _loop_persistence_smooth(labels, min_bars)
+
+
 def test_flicker_rate_monotonic():
     raw = ["A", "B", "A", "B", "A"]
     sm = ["A", "A", "A", "A", "A"]